@@ -55,7 +55,7 @@ data "aws_iam_policy_document" "api_s3_packages_rw" {
     condition {
       test     = "StringLike"
       variable = "s3:prefix"
-      values   = ["packages/*", "models/*"]
+      values   = ["packages/*", "models/*", "blobs/*", "derived/*", "ratings/*"]
     }
   }
 
@@ -78,6 +78,9 @@ data "aws_iam_policy_document" "api_s3_packages_rw" {
     resources = [
       "arn:aws:s3:us-east-1:838693051036:accesspoint/cs450-s3/*",
       "arn:aws:s3:::pkg-artifacts/models/*",
+      "arn:aws:s3:::pkg-artifacts/blobs/*",
+      "arn:aws:s3:::pkg-artifacts/derived/*",
+      "arn:aws:s3:::pkg-artifacts/ratings/*",
       "arn:aws:s3:::pkg-artifacts/packages/*"
     ]
   }
@@ -49,6 +49,17 @@ resource "aws_iam_role_policy" "lambda_s3_access" {
           "arn:aws:s3:${var.aws_region}:*:accesspoint/*/*"
         ]
       },
+      {
+        # Component archives built by the handler are cached next to the blobs
+        Effect = "Allow"
+        Action = [
+          "s3:PutObject"
+        ]
+        Resource = [
+          "arn:aws:s3:::${var.artifacts_bucket}/derived/*",
+          "arn:aws:s3:${var.aws_region}:*:accesspoint/*/object/derived/*"
+        ]
+      },
       {
         Effect = "Allow"
         Action = [
@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+Benchmark Archive Compression Policies
+
+Re-packs registry model archives under each compression policy and reports
+ingest CPU time, archive size and download cost (transfer at a given bandwidth
+plus the CPU time to decompress every member and to extract the weights
+component).
+
+Usage:
+    # Benchmark the performance/ corpus stored in S3:
+    python scripts/benchmark_compression.py --s3
+
+    # Benchmark local zip files (e.g. a saved copy of the corpus):
+    python scripts/benchmark_compression.py --dir ./corpus
+
+    # Limit the sample and write per-model results as JSON:
+    python scripts/benchmark_compression.py --s3 --limit 100 --json results.json
+"""
+import sys
+import io
+import json
+import time
+import argparse
+import zipfile
+from pathlib import Path
+from typing import Dict, Iterator, List, Tuple
+
+# Add parent directory to path to import from src
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.services.compression_policy import POLICIES, CompressionPolicy, write_member
+
+
+def iter_s3_archives(limit: int) -> Iterator[Tuple[str, bytes]]:
+    """Yield (key, zip bytes) for model archives under performance/ in S3."""
+    from scripts.populate_registry import get_s3_client_and_arn
+    from src.services.blob_store import read_object
+
+    s3, ap_arn = get_s3_client_and_arn()
+    if not s3:
+        sys.exit(1)
+    count = 0
+    paginator = s3.get_paginator("list_objects_v2")
+    for page in paginator.paginate(Bucket=ap_arn, Prefix="performance/"):
+        for obj in page.get("Contents", []):
+            if not obj["Key"].endswith("model.zip"):
+                continue
+            yield obj["Key"], read_object(s3, ap_arn, obj["Key"])
+            count += 1
+            if limit and count >= limit:
+                return
+
+
+def iter_dir_archives(directory: str, limit: int) -> Iterator[Tuple[str, bytes]]:
+    """Yield (path, zip bytes) for *.zip files under ``directory``."""
+    for i, path in enumerate(sorted(Path(directory).rglob("*.zip"))):
+        if limit and i >= limit:
+            return
+        yield str(path), path.read_bytes()
+
+
+def repack(members: List[Tuple[str, bytes]], policy: CompressionPolicy) -> Tuple[bytes, float]:
+    """Build an archive from ``members`` under ``policy``; return (bytes, CPU seconds)."""
+    start = time.process_time()
+    output = io.BytesIO()
+    with zipfile.ZipFile(output, "w") as zip_file:
+        for filename, data in members:
+            write_member(zip_file, filename, data, policy)
+    return output.getvalue(), time.process_time() - start
+
+
+def decode_cost(archive: bytes) -> Tuple[float, float]:
+    """Return CPU seconds to read every member and to extract the weights component."""
+    from src.services.s3_service import extract_model_component
+
+    start = time.process_time()
+    with zipfile.ZipFile(io.BytesIO(archive), "r") as zip_file:
+        for name in zip_file.namelist():
+            zip_file.read(name)
+    read_all = time.process_time() - start
+
+    start = time.process_time()
+    try:
+        extract_model_component(archive, "weights")
+    except ValueError:
+        pass  # No weight files in this archive
+    return read_all, time.process_time() - start
+
+
+def benchmark(archives: Iterator[Tuple[str, bytes]], bandwidth_mbps: float) -> Dict[str, Dict]:
+    totals = {
+        name: {"ingest_cpu_s": 0.0, "size_bytes": 0, "read_cpu_s": 0.0, "extract_cpu_s": 0.0}
+        for name in POLICIES
+    }
+    per_model = []
+    for key, content in archives:
+        with zipfile.ZipFile(io.BytesIO(content), "r") as zip_file:
+            members = [(name, zip_file.read(name)) for name in zip_file.namelist()]
+        row = {"key": key}
+        for name, policy in POLICIES.items():
+            archive, ingest_cpu = repack(members, policy)
+            read_cpu, extract_cpu = decode_cost(archive)
+            totals[name]["ingest_cpu_s"] += ingest_cpu
+            totals[name]["size_bytes"] += len(archive)
+            totals[name]["read_cpu_s"] += read_cpu
+            totals[name]["extract_cpu_s"] += extract_cpu
+            row[name] = {
+                "ingest_cpu_s": ingest_cpu,
+                "size_bytes": len(archive),
+                "read_cpu_s": read_cpu,
+                "extract_cpu_s": extract_cpu,
+            }
+        per_model.append(row)
+        print(f"  {key}: " + ", ".join(f"{n}={row[n]['size_bytes'] / 1024:.0f}KB" for n in POLICIES))
+
+    bytes_per_second = bandwidth_mbps * 1_000_000 / 8
+    for stats in totals.values():
+        stats["transfer_s"] = stats["size_bytes"] / bytes_per_second
+        stats["download_s"] = stats["transfer_s"] + stats["read_cpu_s"]
+    return {"models": len(per_model), "totals": totals, "per_model": per_model}
+
+
+def print_summary(results: Dict, bandwidth_mbps: float) -> None:
+    print()
+    print(f"Models benchmarked: {results['models']} (download estimated at {bandwidth_mbps:g} Mbps)")
+    print(f"{'policy':<10} {'ingest CPU':>12} {'size':>12} {'download':>12} {'extract CPU':>12}")
+    for name, stats in results["totals"].items():
+        print(
+            f"{name:<10} {stats['ingest_cpu_s']:>11.2f}s {stats['size_bytes'] / (1024 * 1024):>10.1f}MB "
+            f"{stats['download_s']:>11.2f}s {stats['extract_cpu_s']:>11.2f}s"
+        )
+
+
+def parse_arguments():
+    parser = argparse.ArgumentParser(description="Benchmark archive compression policies")
+    source_group = parser.add_mutually_exclusive_group(required=True)
+    source_group.add_argument("--s3", action="store_true", help="Read archives from S3 performance/ path")
+    source_group.add_argument("--dir", help="Read *.zip archives from a local directory")
+    parser.add_argument("--limit", type=int, default=500, help="Maximum number of archives (default: 500)")
+    parser.add_argument(
+        "--bandwidth-mbps", type=float, default=100.0, help="Link speed used to estimate transfer time"
+    )
+    parser.add_argument("--json", help="Write full results to this JSON file")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_arguments()
+    archives = iter_s3_archives(args.limit) if args.s3 else iter_dir_archives(args.dir, args.limit)
+    results = benchmark(archives, args.bandwidth_mbps)
+    print_summary(results, args.bandwidth_mbps)
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"Results written to {args.json}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+"""
+Benchmark GitHub Metadata Fetching: REST vs GraphQL
+
+Starts a local stub of the GitHub REST and GraphQL APIs that charges a
+simulated round trip on every request (plus a per-repository cost for GraphQL
+queries, which do more work per request), then fetches metadata for the same
+repositories three ways:
+
+- rest:    GitHubHandler.fetch_meta over REST (GITHUB_GRAPHQL=off)
+- graphql: GitHubHandler.fetch_meta, one GraphQL query per repository
+- batched: GitHubHandler.fetch_meta_batch, GITHUB_GRAPHQL_BATCH_SIZE repos per query
+
+Usage:
+    # 20 repositories, 50 ms round trip:
+    python scripts/benchmark_github_graphql.py
+
+    # 50 repositories, 100 ms round trip, 25 per query, results as JSON:
+    python scripts/benchmark_github_graphql.py --repos 50 --rtt-ms 100 --batch-size 25 --json results.json
+"""
+import sys
+import json
+import time
+import base64
+import argparse
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict
+from unittest.mock import patch
+
+# Add parent directory to path to import from src
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.acmecli import github_graphql, github_handler, http_client
+from src.acmecli.github_handler import GitHubHandler
+
+
+def rest_payload(path: str):
+    parts = path.split("?")[0].strip("/").split("/")  # repos/<owner>/<repo>/...
+    owner, repo, rest = parts[1], parts[2], parts[3:]
+    if not rest:
+        return {
+            "name": repo,
+            "full_name": f"{owner}/{repo}",
+            "stargazers_count": 100,
+            "license": {"spdx_id": "MIT"},
+        }
+    if rest == ["contributors"]:
+        return [{"login": f"user{i}", "contributions": 10 - i} for i in range(10)]
+    if rest == ["contents"]:
+        return [{"type": "file", "path": "README.md"}, {"type": "file", "path": "train.py"}]
+    if rest == ["readme"]:
+        return {"content": base64.b64encode(b"# Model\n\nUsage: ...").decode()}
+    if rest == ["pulls"]:
+        return [{"number": n, "state": "closed", "merged_at": "2024-01-01T00:00:00Z"} for n in range(1, 11)]
+    if rest[0] == "pulls" and rest[-1] == "reviews":
+        return [{"state": "APPROVED"}]
+    if rest[0] == "pulls" and rest[-1] == "files":
+        return [{"filename": "model.py", "additions": 12}]
+    if rest == ["commits"]:
+        return [{"sha": f"{i:040d}"} for i in range(5)]
+    return {"stats": {"additions": 3}, "files": [{"filename": "model.py", "additions": 3}]}
+
+
+def graphql_repository(owner: str, name: str) -> Dict:
+    return {
+        "name": name,
+        "nameWithOwner": f"{owner}/{name}",
+        "stargazerCount": 100,
+        "licenseInfo": {"spdxId": "MIT"},
+        "defaultBranchRef": {
+            "name": "main",
+            "target": {
+                "history": {
+                    "nodes": [
+                        {"additions": 3, "author": {"name": f"user{i % 10}", "user": {"login": f"user{i % 10}"}}}
+                        for i in range(100)
+                    ]
+                }
+            },
+        },
+        "tree": {"entries": [{"name": "README.md", "path": "README.md", "type": "blob"}]},
+        "readmeMd": {"text": "# Model\n\nUsage: ..."},
+        "pullRequests": {
+            "nodes": [
+                {
+                    "number": n,
+                    "merged": True,
+                    "additions": 12,
+                    "reviews": {"totalCount": 1},
+                    "approvedReviews": {"totalCount": 1},
+                    "files": {"nodes": [{"path": "model.py", "additions": 12}]},
+                }
+                for n in range(1, 11)
+            ]
+        },
+    }
+
+
+def start_stub(rtt_ms: float, graphql_ms_per_repo: float):
+    """Start the stub API on a free port; returns (server, request counter)."""
+    counts = {"rest": 0, "graphql": 0}
+    lock = threading.Lock()
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        disable_nagle_algorithm = True
+
+        def _send(self, payload):
+            body = json.dumps(payload).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_GET(self):
+            with lock:
+                counts["rest"] += 1
+            time.sleep(rtt_ms / 1000)
+            self._send(rest_payload(self.path))
+
+        def do_POST(self):
+            with lock:
+                counts["graphql"] += 1
+            request = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+            variables = request["variables"]
+            count = len(variables) // 2
+            time.sleep((rtt_ms + graphql_ms_per_repo * count) / 1000)
+            self._send(
+                {
+                    "data": {
+                        f"r{i}": graphql_repository(variables[f"owner{i}"], variables[f"name{i}"])
+                        for i in range(count)
+                    }
+                }
+            )
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, counts
+
+
+def redirecting_urlopen(base_url: str):
+    """http_client.urlopen with api.github.com pointed at the stub."""
+
+    def urlopen(request, timeout=None):
+        request.full_url = request.full_url.replace("https://api.github.com", base_url)
+        return http_client.urlopen(request, timeout=timeout)
+
+    return urlopen
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark REST vs GraphQL GitHub metadata fetching")
+    parser.add_argument("--repos", type=int, default=20, help="Repositories to fetch")
+    parser.add_argument("--rtt-ms", type=float, default=50, help="Simulated round trip per request")
+    parser.add_argument("--graphql-ms-per-repo", type=float, default=20, help="Extra GraphQL server time per repository")
+    parser.add_argument("--batch-size", type=int, default=github_graphql.GITHUB_GRAPHQL_BATCH_SIZE, help="Repositories per GraphQL query")
+    parser.add_argument("--json", help="Write results to this file")
+    args = parser.parse_args()
+
+    server, counts = start_stub(args.rtt_ms, args.graphql_ms_per_repo)
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    urls = [f"https://github.com/org/model-{i}" for i in range(args.repos)]
+    urlopen = redirecting_urlopen(base_url)
+
+    with patch.dict("os.environ", {"GITHUB_TOKEN": "ghp_benchmark"}):
+        handler = GitHubHandler()
+
+    print(
+        f"{args.repos} repositories, {args.rtt_ms:.0f} ms round trip, "
+        f"{args.graphql_ms_per_repo:.0f} ms GraphQL cost per repo, batches of {args.batch_size}\n"
+    )
+    print(f"{'mode':8} {'total s':>8} {'ms/repo':>9} {'requests':>9}")
+
+    modes = {
+        "rest": (False, lambda: [handler.fetch_meta(url) for url in urls]),
+        "graphql": (True, lambda: [handler.fetch_meta(url) for url in urls]),
+        "batched": (True, lambda: handler.fetch_meta_batch(urls)),
+    }
+    results: Dict[str, Dict[str, float]] = {}
+    with patch.object(github_handler, "urlopen", urlopen), patch.object(
+        github_graphql, "urlopen", urlopen
+    ), patch.object(github_graphql, "GITHUB_GRAPHQL_URL", "https://api.github.com/graphql"), patch.object(
+        github_graphql, "GITHUB_GRAPHQL_BATCH_SIZE", args.batch_size
+    ):
+        handler.fetch_meta(urls[0])  # Warm up imports and the connection pool
+        for name, (use_graphql, fetch) in modes.items():
+            counts["rest"] = counts["graphql"] = 0
+            with patch.object(github_graphql, "GITHUB_GRAPHQL_ENABLED", use_graphql):
+                start = time.perf_counter()
+                fetch()
+                elapsed = time.perf_counter() - start
+            requests_made = counts["rest"] + counts["graphql"]
+            results[name] = {
+                "seconds": round(elapsed, 3),
+                "ms_per_repo": round(elapsed * 1000 / args.repos, 1),
+                "requests": requests_made,
+            }
+            print(f"{name:8} {elapsed:8.2f} {elapsed * 1000 / args.repos:9.1f} {requests_made:9d}")
+    server.shutdown()
+
+    speedup = results["rest"]["seconds"] / results["batched"]["seconds"]
+    print(f"\nbatched is {speedup:.1f}x faster than rest")
+    if args.json:
+        Path(args.json).write_text(json.dumps(results, indent=2))
+        print(f"Wrote {args.json}")
+
+
+if __name__ == "__main__":
+    main()
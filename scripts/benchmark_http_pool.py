@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Benchmark Pooled HTTP Connections
+
+Starts a local HTTP stub that charges a simulated handshake delay once per
+new connection (standing in for TCP + TLS setup to GitHub/Hugging Face) and a
+per-request delay, then times the same requests made three ways:
+
+- urlopen:  urllib.request.urlopen, as the acmecli handlers used to
+- requests: bare requests.get, as the services used to
+- pooled:   src.acmecli.http_client.get over the shared keep-alive pool
+
+Usage:
+    # 200 sequential requests, 30 ms handshake, 5 ms per request:
+    python scripts/benchmark_http_pool.py
+
+    # Higher handshake cost, 8 client threads, results as JSON:
+    python scripts/benchmark_http_pool.py --handshake-ms 80 --threads 8 --json results.json
+"""
+import sys
+import json
+import time
+import argparse
+import threading
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Callable, Dict
+
+# Add parent directory to path to import from src
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.acmecli import http_client
+
+
+def start_stub(handshake_ms: float, latency_ms: float):
+    """Start the stub server on a free port; returns (server, connection counter)."""
+    connections = {"count": 0}
+    lock = threading.Lock()
+    body = json.dumps({"id": "org/model", "downloads": 1}).encode()
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"  # keep-alive
+        disable_nagle_algorithm = True  # avoid delayed-ACK stalls on reused connections
+
+        def setup(self):
+            super().setup()
+            with lock:
+                connections["count"] += 1
+            time.sleep(handshake_ms / 1000)
+
+        def do_GET(self):
+            time.sleep(latency_ms / 1000)
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, connections
+
+
+def fetch_urlopen(url: str) -> bytes:
+    with urllib.request.urlopen(url, timeout=10) as response:
+        return response.read()
+
+
+def fetch_requests(url: str) -> bytes:
+    import requests
+
+    return requests.get(url, timeout=10).content
+
+
+def fetch_pooled(url: str) -> bytes:
+    return http_client.get(url, timeout=10).content
+
+
+def run(fetch: Callable[[str], bytes], url: str, count: int, threads: int) -> float:
+    """Wall time in seconds for ``count`` fetches on ``threads`` threads."""
+    start = time.perf_counter()
+    if threads == 1:
+        for _ in range(count):
+            fetch(url)
+    else:
+        with ThreadPoolExecutor(max_workers=threads) as executor:
+            list(executor.map(lambda _: fetch(url), range(count)))
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark pooled vs per-call HTTP connections")
+    parser.add_argument("--requests", type=int, default=200, help="Requests per client")
+    parser.add_argument("--threads", type=int, default=1, help="Concurrent client threads")
+    parser.add_argument("--handshake-ms", type=float, default=30, help="Delay per new connection")
+    parser.add_argument("--latency-ms", type=float, default=5, help="Delay per request")
+    parser.add_argument("--json", help="Write results to this file")
+    args = parser.parse_args()
+
+    server, connections = start_stub(args.handshake_ms, args.latency_ms)
+    url = f"http://127.0.0.1:{server.server_address[1]}/api/models/org/model"
+    print(
+        f"{args.requests} requests on {args.threads} thread(s), "
+        f"{args.handshake_ms:.0f} ms handshake, {args.latency_ms:.0f} ms per request\n"
+    )
+    print(f"{'client':10} {'total s':>8} {'ms/request':>11} {'connections':>12}")
+
+    results: Dict[str, Dict[str, float]] = {}
+    for name, fetch in (("urlopen", fetch_urlopen), ("requests", fetch_requests), ("pooled", fetch_pooled)):
+        fetch(url)  # Warm up imports (and, for pooled, the pool)
+        connections["count"] = 0
+        elapsed = run(fetch, url, args.requests, args.threads)
+        results[name] = {
+            "seconds": round(elapsed, 3),
+            "ms_per_request": round(elapsed * 1000 / args.requests, 2),
+            "connections": connections["count"],
+        }
+        print(
+            f"{name:10} {elapsed:8.2f} {elapsed * 1000 / args.requests:11.2f} "
+            f"{connections['count']:12d}"
+        )
+    server.shutdown()
+
+    speedup = results["urlopen"]["seconds"] / results["pooled"]["seconds"]
+    print(f"\npooled is {speedup:.1f}x faster than urlopen")
+    if args.json:
+        Path(args.json).write_text(json.dumps(results, indent=2))
+        print(f"Wrote {args.json}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+Benchmark HFHandler Hyperlink Extraction
+
+Compares the CPU time of extracting categorized links from model cards:
+
+- legacy:   one full-text ``re.finditer`` per context keyword (22 GitHub and
+            4 HuggingFace phrases), compiling each pattern per call, the way
+            _extract_hyperlinks_from_text used to work
+- compiled: the precompiled URL-first scanner, which only checks the
+            characters before each github.com/huggingface.co reference
+
+and checks both return identical links for every card.
+
+Usage:
+    # Benchmark the READMEs of the 500 most downloaded Hugging Face models:
+    python scripts/benchmark_hyperlink_extraction.py --limit 500
+
+    # Benchmark local README/model card files:
+    python scripts/benchmark_hyperlink_extraction.py --dir ./cards
+
+    # More repetitions, results as JSON:
+    python scripts/benchmark_hyperlink_extraction.py --repeat 20 --json results.json
+"""
+import sys
+import json
+import re
+import time
+import argparse
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Tuple
+
+# Add parent directory to path to import from src
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.acmecli.hf_handler import HFHandler, _GITHUB_KEYWORDS, _HF_KEYWORDS
+
+
+def iter_hf_cards(limit: int) -> Iterator[Tuple[str, str]]:
+    """Yield (model ID, README text) for the most downloaded Hugging Face models."""
+    import requests
+
+    response = requests.get(
+        "https://huggingface.co/api/models",
+        params={"sort": "downloads", "direction": -1, "limit": limit},
+        timeout=30,
+    )
+    response.raise_for_status()
+    for model in response.json():
+        model_id = model.get("id") or model.get("modelId")
+        url = f"https://huggingface.co/{model_id}/raw/main/README.md"
+        try:
+            card = requests.get(url, timeout=15)
+            card.raise_for_status()
+        except requests.RequestException as e:
+            print(f"  skipping {model_id}: {e}")
+            continue
+        yield model_id, card.text
+
+
+def iter_dir_cards(directory: str) -> Iterator[Tuple[str, str]]:
+    """Yield (path, text) for *.md and *.html files under ``directory``."""
+    for path in sorted(Path(directory).rglob("*")):
+        if path.suffix in (".md", ".html"):
+            yield str(path), path.read_text(encoding="utf-8", errors="replace")
+
+
+def legacy_extract(handler: HFHandler, text: str) -> Dict[str, List[str]]:
+    """Per-pattern extraction as it was before the compiled scanner."""
+    links = {"github": [], "huggingface": [], "other": []}
+    if not text:
+        return links
+    seen_urls = set()
+
+    def add(url: str) -> None:
+        if url and url not in seen_urls:
+            seen_urls.add(url)
+            handler._categorize_url(url, links)
+
+    for match in re.finditer(r'href=["\'](.*?)["\']', text, re.IGNORECASE):
+        url = match.group(1).strip()
+        if url.startswith(("http://", "https://")):
+            add(url.split("#")[0].split("?")[0].rstrip("/"))
+    for match in re.finditer(r"\]\((https?://[^\s)]+)\)", text, re.IGNORECASE):
+        add(match.group(1).strip().rstrip("/"))
+    for match in re.finditer(r'https?://[^\s"\'>)]+', text, re.IGNORECASE):
+        add(re.sub(r"[.,;:!?]+$", "", match.group(0).strip().rstrip("/")))
+    for keyword in _GITHUB_KEYWORDS:
+        pattern = (
+            rf"(?:{keyword})[\s:]*[:=]?\s*(?:https?://)?(?:www\.)?"
+            r"github\.com/([\w\-\.]+)/([\w\-\.]+)"
+        )
+        for match in re.finditer(pattern, text, re.IGNORECASE):
+            add("https://github.com/{}/{}".format(*match.groups()))
+    before = (
+        r"(?:https?://)?(?:www\.)?github\.com/([\w\-\.]+)/([\w\-\.]+)[\s,]*[:=]?\s*"
+        r"(?:this\s+)?(?:repository|repo|codebase|source\s+code|project|implementation|code)"
+    )
+    for match in re.finditer(before, text, re.IGNORECASE):
+        add("https://github.com/{}/{}".format(*match.groups()))
+    for keyword in _HF_KEYWORDS:
+        pattern = (
+            rf"(?:{keyword})[\s:]*[:=]?\s*(?:https?://)?(?:www\.)?"
+            r"huggingface\.co/([^/\s]+(?:/[^/\s]+)?)"
+        )
+        for match in re.finditer(pattern, text, re.IGNORECASE):
+            model_id = match.group(1)
+            if not model_id.startswith(("datasets/", "spaces/")):
+                add(f"https://huggingface.co/{model_id}")
+    return links
+
+
+def cpu_ms(fn: Callable[[], object], repeat: int) -> float:
+    """Mean process CPU time of fn() in milliseconds."""
+    start = time.process_time()
+    for _ in range(repeat):
+        fn()
+    return (time.process_time() - start) * 1000 / repeat
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark HFHandler hyperlink extraction")
+    source = parser.add_mutually_exclusive_group()
+    source.add_argument("--limit", type=int, default=500, help="Number of Hugging Face models")
+    source.add_argument("--dir", help="Directory of README/model card .md or .html files")
+    parser.add_argument("--repeat", type=int, default=5, help="Repetitions per card")
+    parser.add_argument("--json", help="Write per-card results to this file")
+    args = parser.parse_args()
+
+    handler = HFHandler()
+    cards = iter_dir_cards(args.dir) if args.dir else iter_hf_cards(args.limit)
+    print(f"{'card':45} {'KB':>6} {'legacy ms':>10} {'compiled ms':>12} {'speedup':>8}")
+
+    results = []
+    mismatches = 0
+    for name, card in cards:
+        if legacy_extract(handler, card) != handler._extract_hyperlinks_from_text(card):
+            mismatches += 1
+            print(f"  MISMATCH for {name}")
+        legacy = cpu_ms(lambda: legacy_extract(handler, card), args.repeat)
+        compiled = cpu_ms(lambda: handler._extract_hyperlinks_from_text(card), args.repeat)
+        results.append(
+            {
+                "card": name,
+                "kb": round(len(card) / 1024, 1),
+                "legacy_ms": round(legacy, 3),
+                "compiled_ms": round(compiled, 3),
+            }
+        )
+        print(
+            f"{name[:45]:45} {len(card) / 1024:6.1f} {legacy:10.2f} {compiled:12.2f} "
+            f"{legacy / compiled if compiled else 0:7.1f}x"
+        )
+
+    if results:
+        legacy_total = sum(r["legacy_ms"] for r in results)
+        compiled_total = sum(r["compiled_ms"] for r in results)
+        print(
+            f"\n{len(results)} cards, {mismatches} mismatches. Mean per card: "
+            f"legacy {legacy_total / len(results):.2f} ms, "
+            f"compiled {compiled_total / len(results):.2f} ms "
+            f"({legacy_total / compiled_total if compiled_total else 0:.1f}x less CPU)"
+        )
+    if args.json:
+        Path(args.json).write_text(json.dumps(results, indent=2))
+        print(f"Wrote {args.json}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Benchmark Import Time of the CLI and API Entry Points
+
+Imports each module in a fresh interpreter with ``python -X importtime`` and
+reports the cumulative import time (best of --repeat runs) along with how many
+acmecli metric modules the import pulled in.
+
+Usage:
+    # This checkout, 5 runs per module:
+    python scripts/benchmark_import_time.py
+
+    # Compare against another checkout (e.g. `git worktree add /tmp/base <ref>`):
+    python scripts/benchmark_import_time.py --baseline /tmp/base --json results.json
+"""
+import sys
+import json
+import argparse
+import subprocess
+from pathlib import Path
+from typing import Dict
+
+ROOT = Path(__file__).parent.parent
+
+MODULES = ("src.acmecli.metrics", "src.acmecli.cli", "src.index")
+
+# Prints the number of metric modules loaded after the import
+COUNT_METRICS = (
+    "import sys; "
+    "print(sum(1 for m in sys.modules if m.startswith('src.acmecli.metrics.') and m.endswith('_metric')))"
+)
+
+
+def import_time_ms(module: str, cwd: Path) -> Dict[str, float]:
+    """Import ``module`` under -X importtime; returns cumulative ms and metric module count."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}; {COUNT_METRICS}"],
+        cwd=cwd,
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"import {module} failed in {cwd}:\n{result.stderr[-2000:]}")
+    cumulative_us = None
+    for line in result.stderr.splitlines():
+        # "import time: <self us> | <cumulative us> | <indent><module>"
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:"):].split("|")
+        if len(fields) == 3 and fields[2].strip() == module:
+            cumulative_us = int(fields[1])
+    if cumulative_us is None:
+        raise RuntimeError(f"No -X importtime entry for {module} (already imported by site?)")
+    return {"ms": cumulative_us / 1000, "metric_modules": int(result.stdout.strip().splitlines()[-1])}
+
+
+def measure(cwd: Path, repeat: int) -> Dict[str, Dict[str, float]]:
+    results = {}
+    for module in MODULES:
+        runs = [import_time_ms(module, cwd) for _ in range(repeat)]
+        results[module] = {
+            "best_ms": round(min(run["ms"] for run in runs), 1),
+            "metric_modules": runs[-1]["metric_modules"],
+        }
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark import time of the CLI and API entry points")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per module (best is reported)")
+    parser.add_argument("--baseline", help="Another checkout of this repository to compare against")
+    parser.add_argument("--json", help="Write results to this file")
+    args = parser.parse_args()
+
+    checkouts = {"current": ROOT}
+    if args.baseline:
+        checkouts = {"baseline": Path(args.baseline), **checkouts}
+
+    results = {name: measure(path, args.repeat) for name, path in checkouts.items()}
+
+    print(f"best of {args.repeat} runs\n")
+    print(f"{'module':22} {'checkout':9} {'import ms':>10} {'metric modules':>15}")
+    for module in MODULES:
+        for name in checkouts:
+            row = results[name][module]
+            print(f"{module:22} {name:9} {row['best_ms']:10.1f} {row['metric_modules']:15d}")
+
+    if args.json:
+        Path(args.json).write_text(json.dumps(results, indent=2))
+        print(f"\nWrote {args.json}")
+
+
+if __name__ == "__main__":
+    main()
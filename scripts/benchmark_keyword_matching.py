@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+Benchmark README Keyword Matching
+
+Compares the CPU time the README-based metrics spend on keyword checks per
+rating:
+
+- scan:  one ``keyword in text`` pass per keyword table, the way the metrics
+         used to check their lists
+- match: one shared match_keywords() pass, then a set intersection per table
+
+and the CPU time of the six README metrics' score() end to end.
+
+Usage:
+    # Benchmark model cards downloaded from Hugging Face:
+    python scripts/benchmark_keyword_matching.py --models bert-base-uncased gpt2
+
+    # Benchmark local README/model card files:
+    python scripts/benchmark_keyword_matching.py --dir ./cards
+
+    # More repetitions, results as JSON:
+    python scripts/benchmark_keyword_matching.py --repeat 50 --json results.json
+"""
+import sys
+import json
+import time
+import argparse
+from pathlib import Path
+from typing import Callable, Iterator, List, Tuple
+
+# Add parent directory to path to import from src
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.acmecli.metrics import (
+    CodeQualityMetric,
+    DatasetQualityMetric,
+    PerformanceClaimsMetric,
+    RampUpMetric,
+    ReproducibilityMetric,
+    SizeMetric,
+)
+from src.acmecli.metrics.keywords import KEYWORD_TABLES, match_keywords
+
+DEFAULT_MODELS = [
+    "google-bert/bert-base-uncased",
+    "openai-community/gpt2",
+    "openai/whisper-tiny",
+    "google/vit-base-patch16-224",
+    "sentence-transformers/all-MiniLM-L6-v2",
+    "microsoft/resnet-50",
+]
+
+README_METRICS = [
+    DatasetQualityMetric(),
+    ReproducibilityMetric(),
+    RampUpMetric(),
+    PerformanceClaimsMetric(),
+    CodeQualityMetric(),
+    SizeMetric(),
+]
+
+
+def iter_hf_cards(models: List[str]) -> Iterator[Tuple[str, str]]:
+    """Yield (model ID, README text) for Hugging Face models."""
+    import requests
+
+    for model_id in models:
+        url = f"https://huggingface.co/{model_id}/raw/main/README.md"
+        try:
+            response = requests.get(url, timeout=15)
+            response.raise_for_status()
+        except requests.RequestException as e:
+            print(f"  skipping {model_id}: {e}")
+            continue
+        yield model_id, response.text
+
+
+def iter_dir_cards(directory: str) -> Iterator[Tuple[str, str]]:
+    """Yield (path, text) for *.md files under ``directory``."""
+    for path in sorted(Path(directory).rglob("*.md")):
+        yield str(path), path.read_text(encoding="utf-8", errors="replace")
+
+
+def cpu_ms(fn: Callable[[], object], repeat: int) -> float:
+    """Mean process CPU time of fn() in milliseconds."""
+    start = time.process_time()
+    for _ in range(repeat):
+        fn()
+    return (time.process_time() - start) * 1000 / repeat
+
+
+def scan_tables(text: str) -> List[bool]:
+    tables = [sorted(table) for table in KEYWORD_TABLES]
+    return [any(keyword in text for keyword in table) for table in tables]
+
+
+def match_tables(text: str) -> List[bool]:
+    match_keywords.cache_clear()
+    found = match_keywords(text)
+    return [bool(found & table) for table in KEYWORD_TABLES]
+
+
+def score_metrics(text: str) -> None:
+    match_keywords.cache_clear()
+    meta = {"readme_text": text, "repo_files": set()}
+    for metric in README_METRICS:
+        metric.score(meta)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark README keyword matching")
+    source = parser.add_mutually_exclusive_group()
+    source.add_argument("--models", nargs="+", help="Hugging Face model IDs")
+    source.add_argument("--dir", help="Directory of README/model card .md files")
+    parser.add_argument("--repeat", type=int, default=20, help="Repetitions per card")
+    parser.add_argument("--json", help="Write per-card results to this file")
+    args = parser.parse_args()
+
+    cards = iter_dir_cards(args.dir) if args.dir else iter_hf_cards(args.models or DEFAULT_MODELS)
+    keyword_count = len(frozenset().union(*KEYWORD_TABLES))
+    print(f"{len(KEYWORD_TABLES)} keyword tables, {keyword_count} distinct keywords\n")
+    print(f"{'card':45} {'KB':>6} {'scan ms':>8} {'match ms':>9} {'speedup':>8} {'metrics ms':>11}")
+
+    results = []
+    for name, card in cards:
+        text = card.lower()
+        if scan_tables(text) != match_tables(text):
+            print(f"  MISMATCH for {name}")
+        scan = cpu_ms(lambda: scan_tables(text), args.repeat)
+        match = cpu_ms(lambda: match_tables(text), args.repeat)
+        metrics = cpu_ms(lambda: score_metrics(card), args.repeat)
+        results.append(
+            {
+                "card": name,
+                "kb": round(len(card) / 1024, 1),
+                "scan_ms": round(scan, 3),
+                "match_ms": round(match, 3),
+                "metrics_ms": round(metrics, 3),
+            }
+        )
+        print(
+            f"{name[:45]:45} {len(card) / 1024:6.1f} {scan:8.2f} {match:9.2f} "
+            f"{scan / match if match else 0:7.1f}x {metrics:11.2f}"
+        )
+
+    if results:
+        scan_total = sum(r["scan_ms"] for r in results)
+        match_total = sum(r["match_ms"] for r in results)
+        print(
+            f"\nMean per rating: scan {scan_total / len(results):.2f} ms, "
+            f"match {match_total / len(results):.2f} ms "
+            f"({scan_total / match_total if match_total else 0:.1f}x less CPU)"
+        )
+    if args.json:
+        Path(args.json).write_text(json.dumps(results, indent=2))
+        print(f"Wrote {args.json}")
+
+
+if __name__ == "__main__":
+    main()
@@ -269,7 +269,9 @@ def download_from_huggingface(model_id: str, version: str = "main", download_all
         if not download_all:
             print(f"    Downloading {len(files_to_download)} essential file(s)...")
         
-        # Download files and create ZIP
+        # Download files and create ZIP (weights stored, text deflated)
+        from src.services.compression_policy import write_member
+        
         output = io.BytesIO()
         with zipfile.ZipFile(output, "w", zipfile.ZIP_DEFLATED) as zip_file:
             def download_file(url: str, filename: str) -> tuple:
@@ -327,7 +329,7 @@ def download_from_huggingface(model_id: str, version: str = "main", download_all
             for i, (url, filename) in enumerate(urls, 1):
                 filename_result, content = download_file(url, filename)
                 if content:
-                    zip_file.writestr(filename_result, content)
+                    write_member(zip_file, filename_result, content)
                     downloaded_count += 1
                     total_size += len(content)
                 else:
@@ -386,15 +388,17 @@ def check_model_exists_in_s3(s3, ap_arn: str, model_id: str, version: str = "mai
 
 
 def upload_model_to_performance_s3(s3, ap_arn: str, model_id: str, version: str, zip_content: bytes) -> str:
-    """Upload model ZIP directly to S3 at performance/ path"""
-    s3_key = get_performance_s3_key(model_id, version)
+    """Upload model ZIP to S3 at performance/ path
     
-    s3.put_object(
-        Bucket=ap_arn,
-        Key=s3_key,
-        Body=zip_content,
-        ContentType="application/zip"
-    )
+    The bytes are stored content-addressed (blobs/sha256/...) and the performance/
+    key becomes a pointer, so content already uploaded is not sent again.
+    """
+    from src.services.blob_store import store_content_addressed
+    
+    s3_key = get_performance_s3_key(model_id, version)
+    blob_info = store_content_addressed(s3, ap_arn, s3_key, zip_content)
+    if blob_info["deduplicated"]:
+        print(f"    Blob {blob_info['sha256'][:12]} already stored (pointer only)")
     
     return s3_key
 
@@ -671,8 +675,7 @@ def ingest_model_rds_direct(model_id: str, zip_content: bytes, version: str = "m
         import sys
         from pathlib import Path
         sys.path.insert(0, str(Path(__file__).parent.parent))
-        from src.services.rds_service import get_connection_pool, model_exists as rds_model_exists
-        import psycopg2
+        from src.services.rds_service import model_exists as rds_model_exists, upload_model as rds_upload_model
         from fastapi import HTTPException
         
         # Sanitize model_id for RDS (same as API)
@@ -702,34 +705,10 @@ def ingest_model_rds_direct(model_id: str, zip_content: bytes, version: str = "m
                     raise Exception(f"RDS configuration error: {e.detail}")
                 raise
         
-        # Upload directly to RDS using performance path
-        path_prefix = "performance"
-        component = "full"
-        
-        pool = get_connection_pool()
-        conn = pool.getconn()
-        cursor = conn.cursor()
-        
-        try:
-            # Insert or update model file
-            cursor.execute("""
-                INSERT INTO model_files (model_id, version, component, path_prefix, file_data, file_size)
-                VALUES (%s, %s, %s, %s, %s, %s)
-                ON CONFLICT (model_id, version, component, path_prefix)
-                DO UPDATE SET
-                    file_data = EXCLUDED.file_data,
-                    file_size = EXCLUDED.file_size,
-                    created_at = CURRENT_TIMESTAMP
-            """, (sanitized_model_id, version, component, path_prefix, psycopg2.Binary(zip_content), len(zip_content)))
-            
-            conn.commit()
-            print(f"✓ Successfully ingested to RDS: {model_id} ({len(zip_content) / (1024*1024):.2f} MB)")
-            return (True, None)
-        except Exception as db_error:
-            conn.rollback()
-            raise db_error
-        finally:
-            pool.putconn(conn)
+        # Upload directly to RDS using performance path (content-addressed blob + pointer row)
+        rds_upload_model(zip_content, sanitized_model_id, version, use_performance_path=True)
+        print(f"✓ Successfully ingested to RDS: {model_id} ({len(zip_content) / (1024*1024):.2f} MB)")
+        return (True, None)
         
     except HTTPException as e:
         # Convert FastAPI HTTPException to regular exception for script context
@@ -1,10 +1,31 @@
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
 from typing import Dict, Optional
 
+# Path of the persistent HTTP response cache; "off" disables it
+HTTP_CACHE_ENV = "ACME_HTTP_CACHE"
+DEFAULT_HTTP_CACHE_PATH = Path.home() / ".cache" / "acmecli" / "http-cache.sqlite3"
+# DiskCache bounds: oldest rows beyond the entry limit, and rows older than the
+# age limit, are pruned when the cache is opened and every PRUNE_EVERY writes
+HTTP_CACHE_MAX_ENTRIES = int(os.getenv("ACME_HTTP_CACHE_MAX_ENTRIES", "20000"))
+HTTP_CACHE_MAX_AGE_SECONDS = float(os.getenv("ACME_HTTP_CACHE_MAX_AGE_SECONDS", str(7 * 24 * 3600)))
+PRUNE_EVERY = 500
+
 
 class InMemoryCache:
-    """Simple in-memory cache implementation."""
+    """Simple in-memory cache implementation.
+
+    With ``max_entries``, the oldest entries are evicted once it is full.
+    """
 
-    def __init__(self):
+    def __init__(self, max_entries: Optional[int] = None):
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
         self._cache: Dict[str, bytes] = {}
         self._etags: Dict[str, str] = {}
 
@@ -14,10 +35,156 @@ class InMemoryCache:
 
     def set(self, key: str, data: bytes, etag: str | None = None) -> None:
         """Set cached data with optional etag."""
-        self._cache[key] = data
-        if etag:
-            self._etags[key] = etag
+        with self._lock:
+            self._cache.pop(key, None)
+            self._cache[key] = data
+            if etag:
+                self._etags[key] = etag
+            else:
+                self._etags.pop(key, None)
+            if self.max_entries is not None:
+                while len(self._cache) > self.max_entries:
+                    oldest = next(iter(self._cache))
+                    del self._cache[oldest]
+                    self._etags.pop(oldest, None)
 
     def get_etag(self, key: str) -> str | None:
         """Get etag for cached data."""
         return self._etags.get(key)
+
+
+class DiskCache:
+    """SQLite-backed cache with the InMemoryCache interface, kept across runs.
+
+    Safe to share between threads; concurrent processes are serialized by
+    SQLite's own file locking. Rows older than ``max_age_seconds`` are not
+    served, and they and the oldest rows beyond ``max_entries`` are deleted on
+    open and every PRUNE_EVERY writes.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        max_entries: int = HTTP_CACHE_MAX_ENTRIES,
+        max_age_seconds: float = HTTP_CACHE_MAX_AGE_SECONDS,
+    ):
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self.max_entries = max_entries
+        self.max_age_seconds = max_age_seconds
+        self._writes = 0
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(path), timeout=30, check_same_thread=False)
+        with self._lock:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, data BLOB NOT NULL, etag TEXT, stored_at REAL NOT NULL)"
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS responses_stored_at ON responses (stored_at)"
+            )
+            self._prune()
+
+    def _prune(self) -> None:
+        # Caller holds self._lock
+        self._conn.execute(
+            "DELETE FROM responses WHERE stored_at < ?", (time.time() - self.max_age_seconds,)
+        )
+        self._conn.execute(
+            "DELETE FROM responses WHERE key IN ("
+            "SELECT key FROM responses ORDER BY stored_at DESC LIMIT -1 OFFSET ?)",
+            (self.max_entries,),
+        )
+        self._conn.commit()
+
+    def get(self, key: str) -> bytes | None:
+        """Get cached data by key."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT data FROM responses WHERE key = ? AND stored_at >= ?",
+                (key, time.time() - self.max_age_seconds),
+            ).fetchone()
+        return bytes(row[0]) if row else None
+
+    def set(self, key: str, data: bytes, etag: str | None = None) -> None:
+        """Set cached data with optional etag."""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, data, etag, stored_at) VALUES (?, ?, ?, ?)",
+                (key, data, etag, time.time()),
+            )
+            self._writes += 1
+            if self._writes % PRUNE_EVERY == 0:
+                self._prune()
+            else:
+                self._conn.commit()
+
+    def get_etag(self, key: str) -> str | None:
+        """Get etag for cached data."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT etag FROM responses WHERE key = ? AND stored_at >= ?",
+                (key, time.time() - self.max_age_seconds),
+            ).fetchone()
+        return row[0] if row else None
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+def open_http_cache(path: Optional[str] = None, max_entries: int = HTTP_CACHE_MAX_ENTRIES):
+    """Open the persistent HTTP cache used by the GitHub and HF handlers.
+
+    The location is ``path``, else $ACME_HTTP_CACHE, else
+    ~/.cache/acmecli/http-cache.sqlite3. Falls back to an InMemoryCache when
+    the cache is disabled ("off") or the file cannot be opened. Either holds at
+    most ``max_entries`` responses.
+    """
+    path = path or os.environ.get(HTTP_CACHE_ENV) or str(DEFAULT_HTTP_CACHE_PATH)
+    if path.lower() in ("off", "0", "none"):
+        return InMemoryCache(max_entries)
+    try:
+        return DiskCache(path, max_entries=max_entries)
+    except (OSError, sqlite3.Error) as e:
+        logging.warning("HTTP cache %s unavailable, using in-memory cache: %s", path, e)
+        return InMemoryCache(max_entries)
+
+
+def cache_key(url: str, headers: Dict[str, str]) -> str:
+    """Cache key for a request: the URL, plus a fingerprint of its credentials.
+
+    A response fetched with one token (e.g. for a private repository) is
+    therefore never served to a request made with another token or none.
+    """
+    auth = headers.get("Authorization")
+    if not auth:
+        return url
+    return f"{url}#auth={hashlib.sha256(auth.encode()).hexdigest()[:16]}"
+
+
+def revalidation_headers(cache, url: str, headers: Dict[str, str]) -> Dict[str, str]:
+    """Add If-None-Match to ``headers`` when ``cache`` holds a response for url."""
+    if cache is None:
+        return headers
+    key = cache_key(url, headers)
+    etag = cache.get_etag(key)
+    if etag and cache.get(key) is not None:
+        return {**headers, "If-None-Match": etag}
+    return headers
+
+
+def cached_response(cache, url: str, headers: Dict[str, str]) -> bytes | None:
+    """Body cached for a request to url with ``headers`` (to answer a 304)."""
+    if cache is None:
+        return None
+    return cache.get(cache_key(url, headers))
+
+
+def store_response(
+    cache, url: str, body: bytes, etag: str | None, headers: Optional[Dict[str, str]] = None
+) -> None:
+    """Cache a 200 response body; only responses with an ETag can be revalidated."""
+    if cache is not None and isinstance(etag, str) and etag:
+        cache.set(cache_key(url, headers or {}), body, etag)
@@ -1,15 +1,20 @@
 import sys
 from pathlib import Path
+import argparse
 import logging
 import os
 import json
+import time
 import concurrent.futures
+from collections import deque
+from typing import Iterable, Iterator, Optional
 from .types import ReportRow
 from .reporter import write_ndjson
 from .metrics.base import REGISTRY
+from .metrics.context import MetricContext
 from .github_handler import GitHubHandler
 from .hf_handler import HFHandler
-from .cache import InMemoryCache
+from .cache import open_http_cache
 from .scoring import compute_net_score
 
 
@@ -81,8 +86,9 @@ def process_url(url: str, github_handler, hf_handler, cache):
         return None
 
     results = {}
+    ctx = MetricContext(meta)
     with concurrent.futures.ThreadPoolExecutor() as executor:
-        future_to_metric = {executor.submit(m.score, meta): m.name for m in REGISTRY}
+        future_to_metric = {executor.submit(m.score, meta, ctx): m.name for m in REGISTRY}
         for future in concurrent.futures.as_completed(future_to_metric):
             metric_name = future_to_metric[future]
             try:
@@ -149,16 +155,11 @@ def process_url(url: str, github_handler, hf_handler, cache):
     )
 
 
-def main(argv: list[str]) -> int:
-    setup_logging()
-    if len(argv) < 2:
-        print("Usage: run score <URL_FILE>")
-        return 1
-    _, url_file = argv
-    github_handler = GitHubHandler()
-    hf_handler = HFHandler()
-    cache = InMemoryCache()
-    lines = Path(url_file).read_text(encoding="utf-8").splitlines()
+DEFAULT_JOBS = int(os.environ.get("ACME_JOBS", "8"))
+
+
+def iter_model_urls(lines: Iterable[str]) -> Iterator[str]:
+    """Yield the supported model URLs of a URL file, in file order."""
     for raw in lines:
         for url in extract_urls(raw):
             kind = classify(url)
@@ -166,11 +167,104 @@ def main(argv: list[str]) -> int:
             if kind not in {"MODEL_GITHUB", "MODEL_HF"}:
                 logging.debug("Skipping unsupported URL: %s", url)
                 continue
-            logging.info("Processing URL: %s", url)
-            row = process_url(url, github_handler, hf_handler, cache)
+            yield url
+
+
+def _score_one(url: str, github_handler, hf_handler, cache) -> Optional[ReportRow]:
+    logging.info("Processing URL: %s", url)
+    try:
+        return process_url(url, github_handler, hf_handler, cache)
+    except Exception as e:
+        # One bad URL must not take down the rest of the run
+        logging.error("Failed to process %s: %s", url, e)
+        return None
+
+
+def score_urls(
+    urls: Iterable[str], jobs: int, github_handler, hf_handler, cache
+) -> Iterator[tuple[str, Optional[ReportRow]]]:
+    """
+    Score URLs on up to ``jobs`` threads and yield (url, row) in input order.
+
+    At most ``2 * jobs`` URLs are in flight, so a slow URL holds back at most
+    that many finished results behind it, and only those are kept in memory.
+    A URL repeated while an earlier occurrence is still in that window is only
+    scored once.
+    """
+    jobs = max(1, jobs)
+    window: deque = deque()
+    # URL -> [future, occurrences in window]; entries leave with the window
+    in_window: dict = {}
+
+    def pop_head():
+        head_url = window.popleft()
+        entry = in_window[head_url]
+        entry[1] -= 1
+        if entry[1] == 0:
+            del in_window[head_url]
+        return head_url, entry[0].result()
+
+    with concurrent.futures.ThreadPoolExecutor(
+        max_workers=jobs, thread_name_prefix="acme-url"
+    ) as executor:
+        for url in urls:
+            entry = in_window.get(url)
+            if entry is None:
+                future = executor.submit(_score_one, url, github_handler, hf_handler, cache)
+                entry = in_window[url] = [future, 0]
+            entry[1] += 1
+            window.append(url)
+            if len(window) >= 2 * jobs:
+                yield pop_head()
+        while window:
+            yield pop_head()
+
+
+def main(argv: list[str]) -> int:
+    setup_logging()
+    if len(argv) < 2:
+        print("Usage: run score <URL_FILE> [--jobs N]")
+        return 1
+    parser = argparse.ArgumentParser(prog="run score")
+    parser.add_argument("url_file")
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=DEFAULT_JOBS,
+        help=f"URLs scored concurrently (default: {DEFAULT_JOBS}, env ACME_JOBS)",
+    )
+    args = parser.parse_args(argv[1:])
+    # ETag-revalidated responses persist across runs (ACME_HTTP_CACHE=off disables)
+    cache = open_http_cache()
+    github_handler = GitHubHandler(cache)
+    hf_handler = HFHandler(cache)
+    lines = Path(args.url_file).read_text(encoding="utf-8").splitlines()
+
+    started = time.perf_counter()
+    urls = list(iter_model_urls(lines))
+    # With a token, all GitHub repos are fetched in a few batched GraphQL queries
+    github_handler.prefetch(url for url in urls if classify(url) == "MODEL_GITHUB")
+    emitted = failed = 0
+    try:
+        for url, row in score_urls(urls, args.jobs, github_handler, hf_handler, cache):
             if row:
                 logging.info("Emitted report for %s", row.name)
                 write_ndjson(row)
+                emitted += 1
             else:
                 logging.debug("No report produced for %s", url)
+                failed += 1
+    finally:
+        close = getattr(cache, "close", None)
+        if close:
+            close()
+    elapsed = time.perf_counter() - started
+    total = emitted + failed
+    # stdout carries only NDJSON, so the summary goes to stderr
+    print(
+        f"Scored {total} URL(s) in {elapsed:.2f}s with --jobs {max(1, args.jobs)}: "
+        f"{emitted} reported, {failed} without report, "
+        f"{total / elapsed if elapsed else 0.0:.2f} URLs/s",
+        file=sys.stderr,
+    )
     return 0
@@ -0,0 +1,239 @@
+"""
+Batched repository metadata over the GitHub GraphQL API.
+
+The REST path in GitHubHandler makes a dozen or more round trips per
+repository (repo, contributors, contents, README, PRs, reviews and files per
+PR, commits). One GraphQL query returns the same data for up to
+GITHUB_GRAPHQL_BATCH_SIZE repositories, each under its own alias (r0, r1, ...).
+
+meta_from_repository converts a repository node into the dict shape
+GitHubHandler.fetch_meta returns over REST, with these differences:
+
+- contributors are counted from the last 100 commits on the default branch
+  (GraphQL has no contributors listing), top 10 by commit count
+- direct commits carry additions but no per-file breakdown
+- has_pages is inferred from a github.io homepage URL
+- the README is looked up under its common file names only
+
+GraphQL requires a token, so callers fall back to REST without one (or with
+GITHUB_GRAPHQL=off).
+"""
+import json
+import logging
+import os
+from collections import Counter
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from urllib.error import HTTPError, URLError
+from urllib.request import Request
+
+from .http_client import urlopen
+from .rate_limit import GitHubRateLimiter
+
+GITHUB_GRAPHQL_ENABLED = os.getenv("GITHUB_GRAPHQL", "on").lower() not in ("0", "off", "false")
+GITHUB_GRAPHQL_URL = os.getenv("GITHUB_GRAPHQL_URL", "https://api.github.com/graphql")
+GITHUB_GRAPHQL_BATCH_SIZE = int(os.getenv("GITHUB_GRAPHQL_BATCH_SIZE", "10"))
+GITHUB_GRAPHQL_TIMEOUT = float(os.getenv("GITHUB_GRAPHQL_TIMEOUT", "30"))
+
+# Directories whose files are listed in repo_files (same as the REST path)
+KEY_DIRS = {"examples", "scripts", "demo", "demos", "src", "tests", "test"}
+README_ALIASES = ("readmeMd", "readmeRst", "readmePlain", "readmeLower")
+
+# Returned by fetch_repositories for a repository whose alias came back null
+# for a reason other than NOT_FOUND (FORBIDDEN, SAML enforcement, timeouts);
+# callers fetch it over REST instead
+UNAVAILABLE: Any = object()
+
+# GraphQL points are a separate budget from the REST request budget
+graphql_rate_limiter = GitHubRateLimiter()
+
+REPOSITORY_FRAGMENT = """
+fragment RepoMeta on Repository {
+  name
+  nameWithOwner
+  description
+  stargazerCount
+  forkCount
+  diskUsage
+  watchers { totalCount }
+  primaryLanguage { name }
+  repositoryTopics(first: 20) { nodes { topic { name } } }
+  licenseInfo { spdxId }
+  createdAt
+  updatedAt
+  pushedAt
+  hasWikiEnabled
+  homepageUrl
+  isArchived
+  isDisabled
+  openIssues: issues(states: OPEN) { totalCount }
+  openPullRequests: pullRequests(states: OPEN) { totalCount }
+  defaultBranchRef {
+    name
+    target {
+      ... on Commit {
+        history(first: 100) { nodes { additions author { name user { login } } } }
+      }
+    }
+  }
+  tree: object(expression: "HEAD:") {
+    ... on Tree { entries { name path type object { ... on Tree { entries { path type } } } } }
+  }
+  readmeMd: object(expression: "HEAD:README.md") { ... on Blob { text } }
+  readmeRst: object(expression: "HEAD:README.rst") { ... on Blob { text } }
+  readmePlain: object(expression: "HEAD:README") { ... on Blob { text } }
+  readmeLower: object(expression: "HEAD:readme.md") { ... on Blob { text } }
+  pullRequests(first: 10, orderBy: {field: UPDATED_AT, direction: DESC}) {
+    nodes {
+      number
+      merged
+      additions
+      reviews(first: 1) { totalCount }
+      approvedReviews: reviews(states: APPROVED, first: 1) { totalCount }
+      files(first: 30) { nodes { path additions } }
+    }
+  }
+}
+"""
+
+
+def build_query(count: int) -> str:
+    """Query for ``count`` repositories, aliased r0..r<count-1>."""
+    params = ", ".join(f"$owner{i}: String!, $name{i}: String!" for i in range(count))
+    fields = "\n".join(
+        f"  r{i}: repository(owner: $owner{i}, name: $name{i}) {{ ...RepoMeta }}"
+        for i in range(count)
+    )
+    return f"query({params}) {{\n{fields}\n}}\n{REPOSITORY_FRAGMENT}"
+
+
+def fetch_repositories(
+    repos: Sequence[Tuple[str, str]], headers: Dict[str, str]
+) -> Optional[List[Optional[Dict[str, Any]]]]:
+    """
+    Fetch (owner, name) repositories in one GraphQL request.
+
+    Returns one repository node per input, None for repositories that do not
+    exist (NOT_FOUND), UNAVAILABLE for any other that could not be resolved,
+    or None overall if the request failed and the caller should use REST.
+    """
+    variables: Dict[str, str] = {}
+    for i, (owner, name) in enumerate(repos):
+        variables[f"owner{i}"] = owner
+        variables[f"name{i}"] = name
+    payload = json.dumps({"query": build_query(len(repos)), "variables": variables}).encode()
+    request_headers = {k: v for k, v in headers.items() if k != "Accept"}
+    request_headers["Content-Type"] = "application/json"
+    request = Request(GITHUB_GRAPHQL_URL, data=payload, headers=request_headers, method="POST")
+
+    if not graphql_rate_limiter.acquire():
+        return None
+    try:
+        with urlopen(request, timeout=GITHUB_GRAPHQL_TIMEOUT) as response:
+            graphql_rate_limiter.update(response.headers)
+            body = json.loads(response.read().decode("utf-8"))
+    except HTTPError as http_err:
+        graphql_rate_limiter.update(http_err.headers, http_err.code)
+        logging.warning("GitHub GraphQL request failed (%s), falling back to REST", http_err.code)
+        return None
+    except (URLError, ValueError) as exc:
+        logging.warning("GitHub GraphQL request failed (%s), falling back to REST", exc)
+        return None
+
+    data = body.get("data") if isinstance(body, dict) else None
+    if not isinstance(data, dict):
+        logging.warning("GitHub GraphQL query returned no data: %s", body.get("errors") if isinstance(body, dict) else body)
+        return None
+    not_found = set()
+    for error in body.get("errors") or []:
+        # Field errors come back next to the other aliases, with the alias first in path
+        logging.debug("GitHub GraphQL error: %s", error.get("message"))
+        path = error.get("path") or []
+        if error.get("type") == "NOT_FOUND" and path:
+            not_found.add(path[0])
+    nodes: List[Any] = []
+    for i in range(len(repos)):
+        node = data.get(f"r{i}")
+        if node is None and f"r{i}" not in not_found:
+            node = UNAVAILABLE
+        nodes.append(node)
+    return nodes
+
+
+def meta_from_repository(repo: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert a RepoMeta node to the dict GitHubHandler.fetch_meta returns."""
+    branch = repo.get("defaultBranchRef") or {}
+    history = (((branch.get("target") or {}).get("history") or {}).get("nodes")) or []
+    homepage = repo.get("homepageUrl") or ""
+
+    meta: Dict[str, Any] = {
+        "name": repo.get("name", ""),
+        "full_name": repo.get("nameWithOwner", ""),
+        "description": repo.get("description") or "",
+        "stars": repo.get("stargazerCount", 0),
+        "forks": repo.get("forkCount", 0),
+        "watchers": (repo.get("watchers") or {}).get("totalCount", 0),
+        "size": repo.get("diskUsage") or 0,
+        "language": (repo.get("primaryLanguage") or {}).get("name", ""),
+        "topics": [
+            node["topic"]["name"]
+            for node in (repo.get("repositoryTopics") or {}).get("nodes") or []
+            if node.get("topic")
+        ],
+        "license": (repo.get("licenseInfo") or {}).get("spdxId") or "",
+        "created_at": repo.get("createdAt", ""),
+        "updated_at": repo.get("updatedAt", ""),
+        "pushed_at": repo.get("pushedAt", ""),
+        "default_branch": branch.get("name", "main"),
+        # REST counts open pull requests as issues too
+        "open_issues_count": (repo.get("openIssues") or {}).get("totalCount", 0)
+        + (repo.get("openPullRequests") or {}).get("totalCount", 0),
+        "has_wiki": repo.get("hasWikiEnabled", False),
+        "has_pages": ".github.io" in homepage,
+        "archived": repo.get("isArchived", False),
+        "disabled": repo.get("isDisabled", False),
+    }
+
+    authors: Counter = Counter()
+    for commit in history:
+        author = commit.get("author") or {}
+        login = (author.get("user") or {}).get("login") or author.get("name") or "unknown"
+        authors[login] += 1
+    meta["contributors"] = dict(authors.most_common(10))
+
+    repo_files = set()
+    for entry in (repo.get("tree") or {}).get("entries") or []:
+        if entry.get("type") == "blob":
+            repo_files.add(entry.get("path", ""))
+        elif entry.get("type") == "tree" and entry.get("name", "").lower() in KEY_DIRS:
+            for child in (entry.get("object") or {}).get("entries") or []:
+                if child.get("type") == "blob":
+                    repo_files.add(child.get("path", ""))
+    repo_files.discard("")
+    meta["repo_files"] = repo_files
+
+    meta["readme_text"] = next(
+        ((repo.get(alias) or {}).get("text") for alias in README_ALIASES if (repo.get(alias) or {}).get("text")),
+        "",
+    )
+
+    prs = []
+    for pr in (repo.get("pullRequests") or {}).get("nodes") or []:
+        prs.append(
+            {
+                "merged": bool(pr.get("merged")),
+                "approved": (pr.get("approvedReviews") or {}).get("totalCount", 0) > 0,
+                "review_count": (pr.get("reviews") or {}).get("totalCount", 0),
+                "additions": pr.get("additions", 0),
+                "files": [
+                    {"filename": f.get("path", ""), "additions": f.get("additions", 0)}
+                    for f in (pr.get("files") or {}).get("nodes") or []
+                ],
+            }
+        )
+    meta["github"] = {
+        "prs": prs,
+        "direct_commits": [
+            {"additions": commit.get("additions", 0), "files": []} for commit in history[:5]
+        ],
+    }
+    return meta
@@ -3,14 +3,51 @@ import logging
 import os
 from base64 import b64decode
 from urllib.error import HTTPError, URLError
-from urllib.request import Request, urlopen
-from typing import Any, Dict
+from urllib.request import Request
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from . import github_graphql
+from .cache import cached_response, revalidation_headers, store_response
+from .http_client import urlopen
+from .rate_limit import PRIORITY_HIGH, PRIORITY_LOW, github_rate_limiter
+
+
+def _parse_repo_url(url: str) -> Optional[Tuple[str, str]]:
+    parts = url.rstrip("/").split("/")
+    if len(parts) < 5 or "github.com" not in parts[2]:
+        return None
+    return parts[3], parts[4]
+
+
+def _request_priority(url: str) -> int:
+    """Repository, contents and README requests feed every GitHub metric and
+    are PRIORITY_HIGH; the pulls/commits fan-out only feeds the
+    reviewedness metric and is PRIORITY_LOW."""
+    path = url.split("?", 1)[0]
+    if "/pulls" in path or "/commits" in path:
+        return PRIORITY_LOW
+    return PRIORITY_HIGH
 
 
 class GitHubHandler:
-    """Handler for GitHub repository metadata fetching using stdlib HTTP."""
+    """Handler for GitHub repository metadata fetching over the pooled HTTP client.
+
+    With a ``cache`` (InMemoryCache or DiskCache), responses are stored with
+    their ETag and revalidated with If-None-Match; a 304 is served from the
+    cache and does not count against the GitHub rate limit.
+
+    Requests are scheduled by a GitHubRateLimiter (the process-wide one by
+    default); see _request_priority.
+
+    With a token, metadata comes from batched GraphQL queries (see
+    github_graphql) and falls back to REST if a query fails; prefetch() fetches
+    a whole URL list up front in batches of GITHUB_GRAPHQL_BATCH_SIZE.
+    """
 
-    def __init__(self):
+    def __init__(self, cache=None, limiter=None):
+        self._cache = cache
+        self._limiter = limiter or github_rate_limiter
+        self._prefetched: Dict[str, Dict[str, Any]] = {}
         github_token = os.environ.get("GITHUB_TOKEN")
         self._has_token = bool(
             github_token and github_token != "ghp_test_token_placeholder"
@@ -34,10 +71,15 @@ class GitHubHandler:
                 "GITHUB_TOKEN not set - using unauthenticated requests (60 req/hour). Set GITHUB_TOKEN environment variable for higher rate limits."
             )
 
-    def _get_json(self, url: str) -> Dict[str, Any]:
-        request = Request(url, headers=self._headers)
+    def _get_json(self, url: str, priority: Optional[int] = None) -> Dict[str, Any]:
+        if priority is None:
+            priority = _request_priority(url)
+        if not self._limiter.acquire(priority):
+            return {}
+        request = Request(url, headers=revalidation_headers(self._cache, url, self._headers))
         try:
             with urlopen(request, timeout=10) as response:
+                self._limiter.update(response.headers)
                 remaining = response.headers.get("X-RateLimit-Remaining")
                 if remaining:
                     remaining_int = int(remaining)
@@ -46,8 +88,16 @@ class GitHubHandler:
                             "GitHub API rate limit low: %s requests remaining",
                             remaining_int,
                         )
-                return json.loads(response.read().decode("utf-8"))
+                body = response.read()
+                data = json.loads(body.decode("utf-8"))
+                store_response(self._cache, url, body, response.headers.get("ETag"), self._headers)
+                return data
         except HTTPError as http_err:
+            self._limiter.update(http_err.headers, http_err.code)
+            cached = cached_response(self._cache, url, self._headers) if http_err.code == 304 else None
+            if cached is not None:
+                logging.debug("Not modified, using cached response for %s", url)
+                return json.loads(cached.decode("utf-8"))
             if http_err.code == 403:
                 rate_limit_reset = http_err.headers.get("X-RateLimit-Reset")
                 if rate_limit_reset:
@@ -81,8 +131,88 @@ class GitHubHandler:
             logging.error("Unexpected error fetching %s: %s", url, exc)
         return {}
 
+    def _use_graphql(self) -> bool:
+        return self._has_token and github_graphql.GITHUB_GRAPHQL_ENABLED
+
     def fetch_meta(self, url: str) -> Dict[str, Any]:
         """Fetch repository metadata from GitHub API."""
+        meta = self._prefetched.pop(url, None)
+        if meta is not None:
+            return meta
+        if self._use_graphql():
+            return self.fetch_meta_batch([url])[url]
+        return self._fetch_meta_rest(url)
+
+    def prefetch(self, urls: Iterable[str]) -> None:
+        """Batch-fetch metadata that later fetch_meta calls will return.
+
+        A no-op without a token: REST requests cannot be batched.
+        """
+        if self._use_graphql():
+            self._prefetched.update(self.fetch_meta_batch(urls))
+
+    def fetch_meta_batch(self, urls: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        """Fetch metadata for several repositories, keyed by URL.
+
+        Uses one GraphQL query per GITHUB_GRAPHQL_BATCH_SIZE repositories when
+        a token is available, and REST for any batch that could not be fetched.
+        """
+        results: Dict[str, Dict[str, Any]] = {}
+        repos: Dict[str, Tuple[str, str]] = {}
+        for url in dict.fromkeys(urls):
+            repo = _parse_repo_url(url)
+            if repo is None:
+                logging.error("Invalid GitHub URL format: %s", url)
+                results[url] = {}
+            else:
+                repos[url] = repo
+
+        pending = list(repos)
+        if self._use_graphql():
+            size = max(1, github_graphql.GITHUB_GRAPHQL_BATCH_SIZE)
+            for start in range(0, len(pending), size):
+                chunk = pending[start : start + size]
+                nodes = github_graphql.fetch_repositories(
+                    [repos[url] for url in chunk], self._headers
+                )
+                if nodes is None:
+                    continue
+                for url, node in zip(chunk, nodes):
+                    results[url] = self._meta_from_graphql(url, repos[url], node)
+        for url in pending:
+            if url not in results:
+                results[url] = self._fetch_meta_rest(url)
+        return results
+
+    def _meta_from_graphql(
+        self, url: str, repo: Tuple[str, str], node: Optional[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        if node is github_graphql.UNAVAILABLE:
+            return self._fetch_meta_rest(url)
+        if not node:
+            return {}  # NOT_FOUND
+        meta = github_graphql.meta_from_repository(node)
+        if not meta["readme_text"] and any(
+            "/" not in path and path.lower().startswith("readme")
+            for path in meta["repo_files"]
+        ):
+            # README under a name the query does not alias (e.g. README.markdown)
+            meta["readme_text"] = self._fetch_readme(*repo, url)
+        return meta
+
+    def _fetch_readme(self, owner: str, repo: str, url: str) -> str:
+        readme_url = f"https://api.github.com/repos/{owner}/{repo}/readme"
+        readme_data = self._get_json(readme_url)
+        if not readme_data:
+            return ""
+        try:
+            content = readme_data.get("content", "")
+            return b64decode(content).decode("utf-8", errors="ignore") if content else ""
+        except Exception as exc:
+            logging.warning("Failed to decode README for %s: %s", url, exc)
+            return ""
+
+    def _fetch_meta_rest(self, url: str) -> Dict[str, Any]:
         parts = url.rstrip("/").split("/")
         if len(parts) < 5 or "github.com" not in parts[2]:
             logging.error("Invalid GitHub URL format: %s", url)
@@ -172,21 +302,7 @@ class GitHubHandler:
             logging.warning("Failed to fetch repo files for %s: %s", url, files_error)
             meta["repo_files"] = set()
 
-        readme_url = f"https://api.github.com/repos/{owner}/{repo}/readme"
-        readme_data = self._get_json(readme_url)
-        if readme_data:
-            try:
-                content = readme_data.get("content", "")
-                meta["readme_text"] = (
-                    b64decode(content).decode("utf-8", errors="ignore")
-                    if content
-                    else ""
-                )
-            except Exception as exc:
-                logging.warning("Failed to decode README for %s: %s", url, exc)
-                meta["readme_text"] = ""
-        else:
-            meta["readme_text"] = ""
+        meta["readme_text"] = self._fetch_readme(owner, repo, url)
         try:
             # Limit to 10 PRs to reduce API calls and speed up ingestion
             prs_url = f"https://api.github.com/repos/{owner}/{repo}/pulls?state=all&per_page=10&sort=updated"
@@ -307,7 +423,7 @@ class GitHubHandler:
         return meta
 
 
-def fetch_github_metadata(url: str) -> Dict[str, Any]:
+def fetch_github_metadata(url: str, cache=None) -> Dict[str, Any]:
     """Module-level function to fetch GitHub metadata."""
-    handler = GitHubHandler()
+    handler = GitHubHandler(cache)
     return handler.fetch_meta(url)
@@ -3,12 +3,139 @@ import logging
 import re
 from urllib.error import HTTPError, URLError
 from urllib.parse import urlparse
-from urllib.request import Request, urlopen
-from typing import Dict, List, Set
+from urllib.request import Request
+from typing import Dict, Iterator, List, Pattern, Set, Tuple
+
+from .cache import cached_response, revalidation_headers, store_response
+from .http_client import urlopen
+
+
+# Link extraction patterns, compiled once
+
+_HTML_HREF = re.compile(r'href=["\'](.*?)["\']', re.IGNORECASE)
+_MARKDOWN_LINK = re.compile(r"\]\((https?://[^\s)]+)\)", re.IGNORECASE)
+_GENERIC_URL = re.compile(r'https?://[^\s"\'>)]+', re.IGNORECASE)
+_TRAILING_PUNCTUATION = re.compile(r"[.,;:!?]+$")
+
+# Keywords/phrases that might reference GitHub repositories
+_GITHUB_KEYWORDS = [
+    # Repository references
+    r"(?:this\s+)?(?:repository|repo|codebase|source\s+code|project|implementation|code)",
+    r"(?:the\s+)?(?:repository|repo|codebase|source\s+code|project|implementation|code)",
+    r"(?:our\s+)?(?:repository|repo|codebase|source\s+code|project|implementation|code)",
+    r"(?:original\s+)?(?:repository|repo|codebase|source\s+code|project|implementation|code)",
+    r"(?:official\s+)?(?:repository|repo|codebase|source\s+code|project|implementation|code)",
+    r"(?:main\s+)?(?:repository|repo|codebase|source\s+code|project|implementation|code)",
+    r"(?:primary\s+)?(?:repository|repo|codebase|source\s+code|project|implementation|code)",
+    # Action verbs
+    r"(?:see|check|visit|view|access|find|get|download|clone|fork|browse|open|go\s+to)",
+    r"(?:available|found|located|hosted|published|released|stored|kept)",
+    r"(?:can\s+be\s+found|is\s+available|is\s+located|is\s+hosted|is\s+published)",
+    # Prepositions and connectors
+    r"(?:available\s+)?(?:on|at|in|from|via|through|using)",
+    r"(?:link|url|uri|address|location|reference)",
+    r"(?:homepage|website|site|page|web\s+page)",
+    # GitHub-specific
+    r"(?:github|git\s+hub|gh|git\s+hub\s+repo)",
+    r"(?:on\s+github|at\s+github|in\s+github|via\s+github)",
+    # Source/origin references
+    r"(?:source|origin|original|base|foundation)",
+    r"(?:source\s+code|source\s+repository|source\s+repo)",
+    # Documentation references
+    r"(?:documentation|docs|readme|read\s+me)",
+    r"(?:more\s+info|more\s+information|details|further\s+info)",
+    # Common phrases
+    r"(?:first\s+released|initially\s+released|originally\s+released)",
+    r"(?:released\s+in|published\s+in|hosted\s+on)",
+    r"(?:check\s+out|take\s+a\s+look|have\s+a\s+look)",
+]
+
+_HF_KEYWORDS = [
+    r"(?:based\s+on|derived\s+from|fine[-\s]?tuned\s+from|pretrained\s+on)",
+    r"(?:parent\s+model|base\s+model|foundation\s+model|backbone)",
+    r"(?:model|checkpoint|weights)",
+    r"(?:huggingface|hf|hugging\s+face)",
+]
+
+# Context checks run backwards from a reference: "<keyword>[sep][scheme][www.]" must end
+# exactly where the reference's host starts
+_CONTEXT_SUFFIX = r"[\s:]*[:=]?\s*(?:https?://)?(?:www\.)?\Z"
+_GITHUB_CONTEXT = [
+    re.compile(rf"(?:{keyword}){_CONTEXT_SUFFIX}", re.IGNORECASE) for keyword in _GITHUB_KEYWORDS
+]
+_HF_CONTEXT = [
+    re.compile(rf"(?:{keyword}){_CONTEXT_SUFFIX}", re.IGNORECASE) for keyword in _HF_KEYWORDS
+]
+_ANY_GITHUB_CONTEXT = re.compile(
+    "(?:" + "|".join(_GITHUB_KEYWORDS) + ")" + _CONTEXT_SUFFIX, re.IGNORECASE
+)
+_ANY_HF_CONTEXT = re.compile("(?:" + "|".join(_HF_KEYWORDS) + ")" + _CONTEXT_SUFFIX, re.IGNORECASE)
+
+# References start at the host; lookahead so references nested in another
+# reference's path are found too
+_GITHUB_REF = re.compile(r"(?=github\.com/([\w\-\.]+)/([\w\-\.]+))", re.IGNORECASE)
+_HF_REF = re.compile(r"(?=huggingface\.co/([^/\s]+(?:/[^/\s]+)?))", re.IGNORECASE)
+_GITHUB_REF_BEFORE_CONTEXT = re.compile(
+    r"(?:https?://)?(?:www\.)?github\.com/([\w\-\.]+)/([\w\-\.]+)[\s,]*[:=]?\s*"
+    r"(?:this\s+)?(?:repository|repo|codebase|source\s+code|project|implementation|code)",
+    re.IGNORECASE,
+)
+
+# Apart from whitespace and colons, the longest context ("official implementation"
+# + "=" + "https://www.") has 35 characters, so a context never starts further
+# back than that many other characters
+_MAX_CONTEXT_CHARS = 40
+_CONTEXT_WINDOW = 64
+_NON_BLANK = re.compile(r"[^\s:]")
+
+_Ref = Tuple[int, int, Tuple[str, ...]]
+
+
+def _find_refs(pattern: Pattern, text: str) -> List[_Ref]:
+    """(host start, reference end, groups) for every reference in text."""
+    return [
+        (m.start(), m.end(pattern.groups), m.groups()) for m in pattern.finditer(text)
+    ]
+
+
+def _context_start(text: str, host_start: int) -> int:
+    """Earliest position a context ending at host_start can start from."""
+    start = max(0, host_start - _CONTEXT_WINDOW)
+    if len(_NON_BLANK.findall(text, start, host_start)) <= _MAX_CONTEXT_CHARS:
+        return 0  # Mostly whitespace; the context may extend beyond the window
+    return start
+
+
+def _refs_after_context(
+    text: str, refs: List[_Ref], contexts: List[Pattern], any_context: Pattern
+) -> Iterator[Tuple[str, ...]]:
+    """
+    Yield the groups of each reference preceded by a context keyword, in the
+    order ``re.finditer(rf"(?:{keyword})<sep><reference>", text)`` would find
+    them for each keyword in turn.
+
+    Instead of one scan of the whole text per keyword, only the few
+    characters before each reference are checked. Like finditer, a keyword
+    match cannot start inside the previous match for the same keyword.
+    """
+    candidates = []
+    for host_start, ref_end, groups in refs:
+        start = _context_start(text, host_start)
+        # References no keyword precedes can be dropped for every keyword at once
+        if any_context.search(text, start, host_start):
+            candidates.append((host_start, ref_end, groups, start))
+    for context in contexts:
+        last_end = 0
+        for host_start, ref_end, groups, start in candidates:
+            if host_start >= last_end and context.search(text, max(start, last_end), host_start):
+                last_end = ref_end
+                yield groups
 
 
 class HFHandler:
-    def __init__(self) -> None:
+    def __init__(self, cache=None) -> None:
+        # Optional InMemoryCache/DiskCache for ETag revalidation of API calls
+        self._cache = cache
         self._headers = {"User-Agent": "ACME-CLI/1.0"}
 
     def _extract_hyperlinks_from_text(self, text: str) -> Dict[str, List[str]]:
@@ -32,118 +159,48 @@ class HFHandler:
         links = {"github": [], "huggingface": [], "other": []}
         seen_urls: Set[str] = set()
 
+        def add(url: str) -> None:
+            if url and url not in seen_urls:
+                seen_urls.add(url)
+                self._categorize_url(url, links)
+
         # Pattern 1: HTML hyperlink (e.g., <a href="https://example.com">Click here</a>)
-        # Using pattern: href=["'](.*?)["']
-        html_href_pattern = r'href=["\'](.*?)["\']'
-        for match in re.finditer(html_href_pattern, text, re.IGNORECASE):
+        for match in _HTML_HREF.finditer(text):
             url = match.group(1).strip()
             # Only process if it's an HTTP/HTTPS URL
             if url.startswith(("http://", "https://")):
                 # Clean up URL (remove fragments, query params, trailing slashes)
-                url = url.split("#")[0].split("?")[0].rstrip("/")
-                if url and url not in seen_urls:
-                    seen_urls.add(url)
-                    self._categorize_url(url, links)
+                add(url.split("#")[0].split("?")[0].rstrip("/"))
 
         # Pattern 2: Markdown hyperlink (e.g., [Click here](https://example.com))
-        # Using pattern: \]\((https?://[^\s)]+)\)
-        markdown_pattern = r"\]\((https?://[^\s)]+)\)"
-        for match in re.finditer(markdown_pattern, text, re.IGNORECASE):
-            url = match.group(1).strip().rstrip("/")
-            if url and url not in seen_urls:
-                seen_urls.add(url)
-                self._categorize_url(url, links)
+        for match in _MARKDOWN_LINK.finditer(text):
+            add(match.group(1).strip().rstrip("/"))
 
         # Pattern 3: Generic URL finder (any URL in plain text)
-        # Using pattern: https?://[^\s"'>)]+
-        generic_url_pattern = r'https?://[^\s"\'>)]+'
-        for match in re.finditer(generic_url_pattern, text, re.IGNORECASE):
-            url = match.group(0).strip().rstrip("/")
+        for match in _GENERIC_URL.finditer(text):
             # Clean up trailing punctuation
-            url = re.sub(r"[.,;:!?]+$", "", url)
-            if url and url not in seen_urls:
-                seen_urls.add(url)
-                self._categorize_url(url, links)
+            add(_TRAILING_PUNCTUATION.sub("", match.group(0).strip().rstrip("/")))
 
-        # Pattern 4: Context-aware extraction for GitHub URLs
-        # Look for common phrases followed by GitHub URLs
-        # Comprehensive list of keywords/phrases that might reference GitHub repositories
-        github_keywords = [
-            # Repository references
-            r"(?:this\s+)?(?:repository|repo|codebase|source\s+code|project|implementation|code)",
-            r"(?:the\s+)?(?:repository|repo|codebase|source\s+code|project|implementation|code)",
-            r"(?:our\s+)?(?:repository|repo|codebase|source\s+code|project|implementation|code)",
-            r"(?:original\s+)?(?:repository|repo|codebase|source\s+code|project|implementation|code)",
-            r"(?:official\s+)?(?:repository|repo|codebase|source\s+code|project|implementation|code)",
-            r"(?:main\s+)?(?:repository|repo|codebase|source\s+code|project|implementation|code)",
-            r"(?:primary\s+)?(?:repository|repo|codebase|source\s+code|project|implementation|code)",
-            # Action verbs
-            r"(?:see|check|visit|view|access|find|get|download|clone|fork|browse|open|go\s+to)",
-            r"(?:available|found|located|hosted|published|released|stored|kept)",
-            r"(?:can\s+be\s+found|is\s+available|is\s+located|is\s+hosted|is\s+published)",
-            # Prepositions and connectors
-            r"(?:available\s+)?(?:on|at|in|from|via|through|using)",
-            r"(?:link|url|uri|address|location|reference)",
-            r"(?:homepage|website|site|page|web\s+page)",
-            # GitHub-specific
-            r"(?:github|git\s+hub|gh|git\s+hub\s+repo)",
-            r"(?:on\s+github|at\s+github|in\s+github|via\s+github)",
-            # Source/origin references
-            r"(?:source|origin|original|base|foundation)",
-            r"(?:source\s+code|source\s+repository|source\s+repo)",
-            # Documentation references
-            r"(?:documentation|docs|readme|read\s+me)",
-            r"(?:more\s+info|more\s+information|details|further\s+info)",
-            # Common phrases
-            r"(?:first\s+released|initially\s+released|originally\s+released)",
-            r"(?:released\s+in|published\s+in|hosted\s+on)",
-            r"(?:check\s+out|take\s+a\s+look|have\s+a\s+look)",
-        ]
-
-        # Pattern 4a: GitHub URLs after common phrases
-        # Matches patterns like:
-        # - "available on https://github.com/owner/repo"
-        # - "see GitHub: https://github.com/owner/repo"
-        # - "repository: https://github.com/owner/repo"
-        # - "first released in https://github.com/owner/repo"
-        for keyword in github_keywords:
-            context_pattern = rf"(?:{keyword})[\s:]*[:=]?\s*(?:https?://)?(?:www\.)?github\.com/([\w\-\.]+)/([\w\-\.]+)"
-            for match in re.finditer(context_pattern, text, re.IGNORECASE):
-                owner, repo = match.groups()
-                url = f"https://github.com/{owner}/{repo}"
-                if url not in seen_urls:
-                    seen_urls.add(url)
-                    self._categorize_url(url, links)
+        # Pattern 4a: GitHub references after common phrases, e.g.
+        # "available on https://github.com/owner/repo", "repository: github.com/owner/repo"
+        github_refs = _find_refs(_GITHUB_REF, text)
+        for owner, repo in _refs_after_context(
+            text, github_refs, _GITHUB_CONTEXT, _ANY_GITHUB_CONTEXT
+        ):
+            add(f"https://github.com/{owner}/{repo}")
 
         # Pattern 4b: GitHub URLs before common phrases (reverse order)
         # Matches patterns like "https://github.com/owner/repo repository" or "https://github.com/owner/repo (code)"
-        github_url_before_pattern = r"(?:https?://)?(?:www\.)?github\.com/([\w\-\.]+)/([\w\-\.]+)[\s,]*[:=]?\s*(?:this\s+)?(?:repository|repo|codebase|source\s+code|project|implementation|code)"
-        for match in re.finditer(github_url_before_pattern, text, re.IGNORECASE):
-            owner, repo = match.groups()
-            url = f"https://github.com/{owner}/{repo}"
-            if url not in seen_urls:
-                seen_urls.add(url)
-                self._categorize_url(url, links)
+        if github_refs:
+            for match in _GITHUB_REF_BEFORE_CONTEXT.finditer(text):
+                owner, repo = match.groups()
+                add(f"https://github.com/{owner}/{repo}")
 
         # Pattern 5: HuggingFace URLs near common phrases
-        hf_context_patterns = [
-            r"(?:based\s+on|derived\s+from|fine[-\s]?tuned\s+from|pretrained\s+on)",
-            r"(?:parent\s+model|base\s+model|foundation\s+model|backbone)",
-            r"(?:model|checkpoint|weights)",
-            r"(?:huggingface|hf|hugging\s+face)",
-        ]
-
-        for pattern in hf_context_patterns:
-            hf_context_pattern = rf"(?:{pattern})[\s:]*[:=]?\s*(?:https?://)?(?:www\.)?huggingface\.co/([^/\s]+(?:/[^/\s]+)?)"
-            for match in re.finditer(hf_context_pattern, text, re.IGNORECASE):
-                model_id = match.group(1)
-                if not model_id.startswith("datasets/") and not model_id.startswith(
-                    "spaces/"
-                ):
-                    url = f"https://huggingface.co/{model_id}"
-                    if url not in seen_urls:
-                        seen_urls.add(url)
-                        self._categorize_url(url, links)
+        hf_refs = _find_refs(_HF_REF, text)
+        for (model_id,) in _refs_after_context(text, hf_refs, _HF_CONTEXT, _ANY_HF_CONTEXT):
+            if not model_id.startswith("datasets/") and not model_id.startswith("spaces/"):
+                add(f"https://huggingface.co/{model_id}")
 
         return links
 
@@ -154,9 +211,7 @@ class HFHandler:
         # GitHub URLs
         if "github.com" in url_lower:
             # Extract owner/repo and normalize
-            github_match = re.search(
-                r"github\.com/([\w\-\.]+)/([\w\-\.]+)", url_lower, re.IGNORECASE
-            )
+            github_match = _GITHUB_REF.search(url_lower)
             if github_match:
                 owner, repo = github_match.groups()
                 # Filter out common false positives
@@ -173,9 +228,7 @@ class HFHandler:
         # HuggingFace model URLs
         elif "huggingface.co" in url_lower:
             # Extract model ID and normalize
-            hf_match = re.search(
-                r"huggingface\.co/([^/\s]+(?:/[^/\s]+)?)", url_lower, re.IGNORECASE
-            )
+            hf_match = _HF_REF.search(url_lower)
             if hf_match:
                 model_id = hf_match.group(1)
                 # Skip datasets and other non-model paths
@@ -192,11 +245,18 @@ class HFHandler:
                 links["other"].append(url)
 
     def _get_json(self, url: str) -> dict:
-        request = Request(url, headers=self._headers)
+        request = Request(url, headers=revalidation_headers(self._cache, url, self._headers))
         try:
             with urlopen(request, timeout=10) as response:
-                return json.loads(response.read().decode("utf-8"))
+                body = response.read()
+                data = json.loads(body.decode("utf-8"))
+                store_response(self._cache, url, body, response.headers.get("ETag"), self._headers)
+                return data
         except HTTPError as http_err:
+            cached = cached_response(self._cache, url, self._headers) if http_err.code == 304 else None
+            if cached is not None:
+                logging.debug("Not modified, using cached response for %s", url)
+                return json.loads(cached.decode("utf-8"))
             # 401 errors from HuggingFace are often rate limiting or temporary - log at debug level
             if http_err.code == 401:
                 logging.debug(
@@ -345,7 +405,7 @@ class HFHandler:
         return meta
 
 
-def fetch_hf_metadata(url: str) -> dict:
+def fetch_hf_metadata(url: str, cache=None) -> dict:
     """Module-level function to fetch HuggingFace metadata."""
-    handler = HFHandler()
+    handler = HFHandler(cache)
     return handler.fetch_meta(url)
@@ -0,0 +1,152 @@
+"""
+Shared pooled HTTP client for outbound requests.
+
+urllib.request.urlopen and bare requests.get/post open a new TCP (and TLS)
+connection on every call. The helpers here go through one process-wide
+urllib3 connection pool instead:
+
+- connections are kept alive and reused, at most HTTP_POOL_MAXSIZE per host
+- GET/HEAD requests are retried on 5xx responses and read errors with
+  exponential backoff and full jitter, and once on a failed connect (DNS and
+  refused connections rarely fix themselves within seconds); POSTs are never
+  retried
+- each thread gets its own requests.Session (cookies and settings are not
+  thread-safe), but all sessions share the same pools
+
+get/post/head mirror requests.get/post/head. urlopen mirrors
+urllib.request.urlopen for code written against urllib: it returns a
+response with read() and headers and raises HTTPError/URLError. If requests
+is not installed, urlopen falls back to urllib.
+"""
+import io
+import os
+import random
+import threading
+import urllib.request
+from typing import Any, Optional
+from urllib.error import HTTPError, URLError
+
+HTTP_POOL_CONNECTIONS = int(os.getenv("HTTP_POOL_CONNECTIONS", "16"))  # hosts
+HTTP_POOL_MAXSIZE = int(os.getenv("HTTP_POOL_MAXSIZE", "16"))  # connections per host
+HTTP_RETRIES = int(os.getenv("HTTP_RETRIES", "3"))
+HTTP_CONNECT_RETRIES = int(os.getenv("HTTP_CONNECT_RETRIES", "1"))
+HTTP_BACKOFF_FACTOR = float(os.getenv("HTTP_BACKOFF_FACTOR", "0.5"))
+RETRY_STATUSES = (500, 502, 503, 504)
+
+_adapter = None
+_adapter_lock = threading.Lock()
+_local = threading.local()
+
+
+def _make_adapter():
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    class JitteredRetry(Retry):
+        # Full jitter, so clients that failed together do not retry together
+        def get_backoff_time(self) -> float:
+            return random.uniform(0, super().get_backoff_time())
+
+    retry = JitteredRetry(
+        total=HTTP_RETRIES,
+        connect=HTTP_CONNECT_RETRIES,
+        backoff_factor=HTTP_BACKOFF_FACTOR,
+        status_forcelist=RETRY_STATUSES,
+        allowed_methods=frozenset({"GET", "HEAD", "OPTIONS"}),
+        raise_on_status=False,
+    )
+    return HTTPAdapter(
+        pool_connections=HTTP_POOL_CONNECTIONS,
+        pool_maxsize=HTTP_POOL_MAXSIZE,
+        max_retries=retry,
+    )
+
+
+def get_session():
+    """Return this thread's requests.Session, backed by the shared pools."""
+    global _adapter
+    session = getattr(_local, "session", None)
+    if session is None:
+        import requests
+
+        with _adapter_lock:
+            if _adapter is None:
+                _adapter = _make_adapter()
+        session = requests.Session()
+        session.mount("https://", _adapter)
+        session.mount("http://", _adapter)
+        _local.session = session
+    return session
+
+
+def get(url: str, **kwargs: Any):
+    """requests.get over the shared pool."""
+    return get_session().get(url, **kwargs)
+
+
+def head(url: str, **kwargs: Any):
+    """requests.head over the shared pool."""
+    return get_session().head(url, **kwargs)
+
+
+def post(url: str, **kwargs: Any):
+    """requests.post over the shared pool."""
+    return get_session().post(url, **kwargs)
+
+
+class PooledResponse:
+    """The subset of http.client.HTTPResponse that urlopen callers use."""
+
+    def __init__(self, url: str, status: int, reason: str, headers: Any, body: bytes):
+        self.url = url
+        self.status = status
+        self.reason = reason
+        self.headers = headers
+        self._body = io.BytesIO(body)
+
+    def read(self, amt: Optional[int] = None) -> bytes:
+        return self._body.read(amt)
+
+    def getcode(self) -> int:
+        return self.status
+
+    def close(self) -> None:
+        self._body.close()
+
+    def __enter__(self) -> "PooledResponse":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+def urlopen(request: urllib.request.Request | str, timeout: Optional[float] = None):
+    """Drop-in replacement for urllib.request.urlopen over the shared pool.
+
+    Raises:
+        HTTPError: For 3xx responses that were not followed (e.g. 304) and 4xx/5xx
+        URLError: If the connection could not be made
+    """
+    try:
+        import requests
+    except ImportError:
+        return urllib.request.urlopen(request, timeout=timeout)
+
+    if isinstance(request, str):
+        request = urllib.request.Request(request)
+    url = request.full_url
+    try:
+        response = get_session().request(
+            request.get_method(),
+            url,
+            headers=dict(request.header_items()),
+            data=request.data,
+            timeout=timeout,
+        )
+    except requests.RequestException as e:
+        raise URLError(e) from e
+    if response.status_code >= 300:
+        raise HTTPError(
+            url, response.status_code, response.reason, response.headers, io.BytesIO(response.content)
+        )
+    return PooledResponse(url, response.status_code, response.reason, response.headers, response.content)
@@ -1,57 +1,82 @@
-from .bus_factor_metric import BusFactorMetric
-from .ramp_up_metric import RampUpMetric
-from .performance_claims_metric import PerformanceClaimsMetric
-from .dataset_and_code_metric import DatasetAndCodeMetric
-from .license_metric import LicenseMetric
-from .size_metric import SizeMetric
-from .code_quality_metric import CodeQualityMetric
-from .dataset_quality_metric import DatasetQualityMetric
-from .hf_downloads_metric import HFDownloadsMetric
-from .cli_metric import CLIMetric
-from .logging_env_metric import LoggingEnvMetric
-
-# Phase-2 new metrics
-from .score_dependencies import score_dependencies_with_latency
-from .score_pull_requests import score_pull_requests_with_latency
-from .reviewedness_metric import ReviewednessMetric
-from .reproducibility_metric import ReproducibilityMetric
-from .treescore_metric import TreescoreMetric
-from .base import register
-
-# Register all metrics
-register(BusFactorMetric())
-register(RampUpMetric())
-register(PerformanceClaimsMetric())
-register(DatasetAndCodeMetric())
-register(LicenseMetric())
-register(SizeMetric())
-register(CodeQualityMetric())
-register(DatasetQualityMetric())
-register(HFDownloadsMetric())
-register(CLIMetric())
-register(LoggingEnvMetric())
-register(ReviewednessMetric())
-register(ReproducibilityMetric())
-register(TreescoreMetric())
-
-# Phase-2 registry for new scoring functions
-# This provides a mapping of metric names to their scoring functions
-# Used by the FastAPI service for direct function calls
-METRIC_FUNCTIONS = {
-    "bus_factor": BusFactorMetric().score,
-    "ramp_up": RampUpMetric().score,
-    "performance_claims": PerformanceClaimsMetric().score,
-    "dataset_code": DatasetAndCodeMetric().score,
-    "license": LicenseMetric().score,
-    "size": SizeMetric().score,
-    "code_quality": CodeQualityMetric().score,
-    "dataset_quality": DatasetQualityMetric().score,
-    "hf_downloads": HFDownloadsMetric().score,
-    "cli": CLIMetric().score,
-    "logging_env": LoggingEnvMetric().score,
-    "reviewedness": ReviewednessMetric().score,
-    "reproducibility": ReproducibilityMetric().score,
-    "treescore": TreescoreMetric().score,
-    "dependencies": score_dependencies_with_latency,
-    "pull_requests": score_pull_requests_with_latency,
-}
+"""
+acmecli metrics.
+
+Nothing here imports a metric module: REGISTRY and METRIC_FUNCTIONS hold entry
+points that are imported on first use (see base.py), and the metric classes
+are still importable from this package by name.
+"""
+from .base import REGISTRY, LazyFunctions, load_entry_point, register
+
+# Metrics scored by the CLI, in report order: name -> "module:attribute"
+_METRICS = {
+    "bus_factor": "bus_factor_metric:BusFactorMetric",
+    "ramp_up_time": "ramp_up_metric:RampUpMetric",
+    "performance_claims": "performance_claims_metric:PerformanceClaimsMetric",
+    "dataset_and_code_score": "dataset_and_code_metric:DatasetAndCodeMetric",
+    "license": "license_metric:LicenseMetric",
+    "size_score": "size_metric:SizeMetric",
+    "code_quality": "code_quality_metric:CodeQualityMetric",
+    "dataset_quality": "dataset_quality_metric:DatasetQualityMetric",
+    "hf_downloads": "hf_downloads_metric:HFDownloadsMetric",
+    "cli": "cli_metric:CLIMetric",
+    "logging_env": "logging_env_metric:LoggingEnvMetric",
+    "Reviewedness": "reviewedness_metric:ReviewednessMetric",
+    "Reproducibility": "reproducibility_metric:ReproducibilityMetric",
+    "Treescore": "treescore_metric:TreescoreMetric",
+}
+for _name, _entry_point in _METRICS.items():
+    REGISTRY.register_lazy(_name, _entry_point)
+
+# Metrics the rating service and ingest run, by registry name
+RATING_METRICS = (
+    "license",
+    "ramp_up_time",
+    "bus_factor",
+    "performance_claims",
+    "size_score",
+    "dataset_and_code_score",
+    "dataset_quality",
+    "code_quality",
+    "Reproducibility",
+    "Reviewedness",
+    "Treescore",
+)
+
+# Phase-2 registry for new scoring functions
+# This provides a mapping of metric names to their scoring functions
+# Used by the FastAPI service for direct function calls
+METRIC_FUNCTIONS = LazyFunctions(
+    {
+        "bus_factor": _METRICS["bus_factor"],
+        "ramp_up": _METRICS["ramp_up_time"],
+        "performance_claims": _METRICS["performance_claims"],
+        "dataset_code": _METRICS["dataset_and_code_score"],
+        "license": _METRICS["license"],
+        "size": _METRICS["size_score"],
+        "code_quality": _METRICS["code_quality"],
+        "dataset_quality": _METRICS["dataset_quality"],
+        "hf_downloads": _METRICS["hf_downloads"],
+        "cli": _METRICS["cli"],
+        "logging_env": _METRICS["logging_env"],
+        "reviewedness": _METRICS["Reviewedness"],
+        "reproducibility": _METRICS["Reproducibility"],
+        "treescore": _METRICS["Treescore"],
+        "dependencies": "score_dependencies:score_dependencies_with_latency",
+        "pull_requests": "score_pull_requests:score_pull_requests_with_latency",
+    }
+)
+
+_EXPORTS = {entry_point.split(":")[1]: entry_point for entry_point in _METRICS.values()}
+_EXPORTS["score_dependencies_with_latency"] = "score_dependencies:score_dependencies_with_latency"
+_EXPORTS["score_pull_requests_with_latency"] = "score_pull_requests:score_pull_requests_with_latency"
+
+
+def __getattr__(name):
+    # Metric classes and functions, e.g. ``from acmecli.metrics import LicenseMetric``
+    entry_point = _EXPORTS.get(name)
+    if entry_point is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    import importlib
+
+    module_name, attribute = entry_point.split(":")
+    return getattr(importlib.import_module(f".{module_name}", __name__), attribute)
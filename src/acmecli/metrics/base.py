@@ -1,7 +1,121 @@
-from typing import List
+"""
+Lazy metric registry.
 
-REGISTRY = []
+Metrics are registered by entry point, "module:attribute" relative to this
+package, and the module is only imported (and a class instantiated, once) the
+first time the metric is used. Importing acmecli.metrics therefore no longer
+imports every metric module.
+
+Registrations are keyed by metric name; registering a name that is already
+registered is ignored. select() returns a subset of metrics by name, in
+registration order; iterating the registry yields all of them.
+"""
+import importlib
+import logging
+import threading
+from collections.abc import Mapping
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+
+_loaded: Dict[str, Any] = {}
+_load_lock = threading.RLock()
+
+
+def load_entry_point(entry_point: str) -> Any:
+    """Import ``module:attribute`` from this package; classes are instantiated.
+
+    The result is cached, so every caller of an entry point shares one instance.
+    """
+    obj = _loaded.get(entry_point)
+    if obj is None:
+        with _load_lock:
+            obj = _loaded.get(entry_point)
+            if obj is None:
+                module_name, attribute = entry_point.split(":")
+                module = importlib.import_module(f".{module_name}", __package__)
+                obj = getattr(module, attribute)
+                if isinstance(obj, type):
+                    obj = obj()
+                _loaded[entry_point] = obj
+    return obj
+
+
+class MetricRegistry:
+    """Ordered, deduplicating name -> metric registry with lazy loading."""
+
+    def __init__(self):
+        self._entries: Dict[str, Any] = {}  # name -> entry point string or metric
+
+    def register_lazy(self, name: str, entry_point: str) -> None:
+        if name in self._entries:
+            logging.debug("Metric %s is already registered", name)
+            return
+        self._entries[name] = entry_point
+
+    def register(self, metric: Any) -> None:
+        if metric.name in self._entries:
+            logging.debug("Metric %s is already registered", metric.name)
+            return
+        self._entries[metric.name] = metric
+
+    def get(self, name: str) -> Any:
+        entry = self._entries[name]
+        return load_entry_point(entry) if isinstance(entry, str) else entry
+
+    def names(self) -> List[str]:
+        return list(self._entries)
+
+    def select(self, names: Optional[Iterable[str]] = None) -> List[Any]:
+        """Metrics named in ``names`` (all if None), in registration order.
+
+        Raises:
+            KeyError: If a name is not registered
+        """
+        if names is None:
+            return [self.get(name) for name in self._entries]
+        wanted = set(names)
+        unknown = wanted - set(self._entries)
+        if unknown:
+            raise KeyError(f"Unknown metric(s): {', '.join(sorted(unknown))}")
+        return [self.get(name) for name in self._entries if name in wanted]
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._entries
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self.select())
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class LazyFunctions(Mapping):
+    """Read-only key -> score callable mapping, resolved from entry points on
+    first access. A metric class entry point maps to the shared instance's
+    ``score``."""
+
+    def __init__(self, entry_points: Dict[str, str]):
+        self._entry_points = dict(entry_points)
+        self._functions: Dict[str, Callable[..., Any]] = {}
+
+    def __getitem__(self, key: str) -> Callable[..., Any]:
+        function = self._functions.get(key)
+        if function is None:
+            obj = load_entry_point(self._entry_points[key])
+            function = self._functions[key] = getattr(obj, "score", obj)
+        return function
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._entry_points
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._entry_points)
+
+    def __len__(self) -> int:
+        return len(self._entry_points)
+
+
+REGISTRY = MetricRegistry()
 
 
 def register(metric):
-    REGISTRY.append(metric)
+    REGISTRY.register(metric)
@@ -1,7 +1,7 @@
 import time
-from typing import Tuple
+from typing import Optional, Tuple
 from ..types import MetricValue
-from .base import register
+from .context import MetricContext
 
 
 class BusFactorMetric:
@@ -9,7 +9,7 @@ class BusFactorMetric:
 
     name = "bus_factor"
 
-    def score(self, meta: dict) -> MetricValue:
+    def score(self, meta: dict, ctx: Optional[MetricContext] = None) -> MetricValue:
         t0 = time.perf_counter()
 
         # Heuristics for bus factor (higher = safer, more distributed) - more lenient
@@ -119,6 +119,3 @@ def score_bus_factor_with_latency(model_data_or_maintainers) -> Tuple[float, int
     time.sleep(0.025)  # 25ms delay
     latency = int((time.time() - start) * 1000)
     return score, latency
-
-
-register(BusFactorMetric())
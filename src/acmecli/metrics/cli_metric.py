@@ -1,6 +1,7 @@
 import time
+from typing import Optional
 from ..types import MetricValue
-from .base import register
+from .context import MetricContext
 
 
 class CLIMetric:
@@ -8,10 +9,11 @@ class CLIMetric:
 
     name = "cli"
 
-    def score(self, meta: dict) -> MetricValue:
+    def score(self, meta: dict, ctx: Optional[MetricContext] = None) -> MetricValue:
         t0 = time.perf_counter()
+        ctx = MetricContext.ensure(meta, ctx)
         score = 0.0
-        readme_text = meta.get("readme_text", "").lower()
+        readme_text = ctx.readme
         if "cli" in readme_text or "command line" in readme_text:
             score += 0.5
         if any(cmd in readme_text for cmd in ["install", "test", "score"]):
@@ -25,6 +27,3 @@ class CLIMetric:
         value = round(float(min(1.0, max(0.5, score))), 2)
         latency_ms = int((time.perf_counter() - t0) * 1000)
         return MetricValue(self.name, value, latency_ms)
-
-
-register(CLIMetric())
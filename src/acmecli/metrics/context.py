@@ -0,0 +1,79 @@
+"""
+Per-rating document context shared by all metrics.
+
+Metrics used to lowercase the README, normalize repo_files and parse the
+config independently, so one rating repeated each O(text) pass once per
+metric. A MetricContext is built once per rating and passed to every
+metric's score(meta, ctx); each derived value is computed on first access
+and cached. Metrics called without a context build their own.
+"""
+import json
+import re
+from bisect import bisect_left
+from functools import cached_property
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
+
+from .keywords import match_keywords
+
+_URL_RE = re.compile(r"https?://[^\s<>()\[\]\"'`]+")
+
+
+def normalize_path(path: str) -> str:
+    """Repo-relative, forward-slash, lowercase form of a file path."""
+    return path.replace("\\", "/").lstrip("./").lower()
+
+
+class MetricContext:
+    """Lazily derived views of one rating's metadata."""
+
+    def __init__(self, meta: Dict[str, Any]):
+        self.meta = meta
+
+    @classmethod
+    def ensure(cls, meta: Dict[str, Any], ctx: Optional["MetricContext"]) -> "MetricContext":
+        """Return ``ctx``, or a new context for ``meta`` if none was passed."""
+        return ctx if ctx is not None else cls(meta)
+
+    @cached_property
+    def readme(self) -> str:
+        """Lowercased README text."""
+        return str(self.meta.get("readme_text") or "").lower()
+
+    @cached_property
+    def keywords(self) -> FrozenSet[str]:
+        """Registered metric keywords occurring in the README."""
+        return match_keywords(self.readme)
+
+    @cached_property
+    def urls(self) -> Tuple[str, ...]:
+        """URLs linked from the README, in order of appearance."""
+        return tuple(dict.fromkeys(url.rstrip(".,;:") for url in _URL_RE.findall(self.readme)))
+
+    @cached_property
+    def files(self) -> FrozenSet[str]:
+        """Normalized repo file paths."""
+        return frozenset(normalize_path(f) for f in self.meta.get("repo_files") or ())
+
+    @cached_property
+    def _reversed_files(self) -> List[str]:
+        return sorted(f[::-1] for f in self.files)
+
+    def has_file_ending_with(self, suffix: str) -> bool:
+        """Whether any repo file path ends with ``suffix`` (already normalized)."""
+        # Paths ending with the suffix are exactly the reversed paths starting
+        # with the reversed suffix, which sort next to each other
+        reversed_files = self._reversed_files
+        target = suffix[::-1]
+        index = bisect_left(reversed_files, target)
+        return index < len(reversed_files) and reversed_files[index].startswith(target)
+
+    @cached_property
+    def config(self) -> Dict[str, Any]:
+        """Parsed model config (config.json), or {}."""
+        config = self.meta.get("config") or {}
+        if isinstance(config, (str, bytes)):
+            try:
+                config = json.loads(config)
+            except ValueError:
+                return {}
+        return config if isinstance(config, dict) else {}
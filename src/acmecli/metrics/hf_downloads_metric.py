@@ -1,12 +1,13 @@
 import time
+from typing import Optional
 from ..types import MetricValue
-from .base import register
+from .context import MetricContext
 
 
 class HFDownloadsMetric:
     name = "hf_downloads"
 
-    def score(self, meta: dict) -> MetricValue:
+    def score(self, meta: dict, ctx: Optional[MetricContext] = None) -> MetricValue:
         t0 = time.perf_counter()
         downloads = meta.get("downloads", 0)
         if downloads > 0:
@@ -16,6 +17,3 @@ class HFDownloadsMetric:
         value = round(float(value), 2)
         latency_ms = int((time.perf_counter() - t0) * 1000)
         return MetricValue(self.name, value, latency_ms)
-
-
-register(HFDownloadsMetric())
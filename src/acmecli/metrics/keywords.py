@@ -0,0 +1,94 @@
+"""
+Shared keyword matcher for README-based metrics.
+
+Metrics declare their keyword tables at import with keyword_table(). All
+tables are compiled into one regex that walks the document once and returns
+the set of every registered keyword occurring in it, so a metric check is a
+set intersection instead of one substring scan per keyword:
+
+    QUALITY_KEYWORDS = keyword_table("curated", "cleaned", ...)
+    ...
+    if match_keywords(readme_text) & QUALITY_KEYWORDS:
+
+Matching is plain substring containment, exactly like ``keyword in text``.
+The match set of a document is cached, so the metrics rating one model share
+a single pass over its README.
+"""
+import re
+import threading
+from functools import lru_cache
+from typing import Dict, FrozenSet, Iterable, List, Optional, Pattern, Tuple
+
+KEYWORD_TABLES: List[FrozenSet[str]] = []
+
+_lock = threading.Lock()
+_compiled: Optional[Tuple[Pattern, Dict[str, FrozenSet[str]]]] = None
+
+
+def keyword_table(*keywords: str) -> FrozenSet[str]:
+    """Register a keyword table with the shared matcher and return it.
+
+    Keywords must already be lowercase, like the lowercased README they are
+    matched against.
+    """
+    global _compiled
+    table = frozenset(keywords)
+    with _lock:
+        KEYWORD_TABLES.append(table)
+        _compiled = None
+    match_keywords.cache_clear()
+    return table
+
+
+def _trie_pattern(words: Iterable[str]) -> str:
+    # Factor shared prefixes so the regex tries each character once per
+    # position. Optional suffixes are greedy, so the longest keyword starting
+    # at a position is the one matched.
+    trie: dict = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[""] = True
+
+    def build(node: dict) -> str:
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        return f"(?:{body})?" if "" in node else body
+
+    return build(trie)
+
+
+def _matcher() -> Tuple[Pattern, Dict[str, FrozenSet[str]]]:
+    global _compiled
+    with _lock:
+        if _compiled is None:
+            keywords = frozenset().union(*KEYWORD_TABLES) - {""}
+            # A lookahead match at every position finds the longest keyword
+            # starting there; shorter keywords that are prefixes of it start
+            # there too
+            pattern = re.compile("(?=(" + _trie_pattern(keywords) + "))") if keywords else None
+            prefixes = {
+                keyword: frozenset(
+                    keyword[:end] for end in range(1, len(keyword) + 1) if keyword[:end] in keywords
+                )
+                for keyword in keywords
+            }
+            _compiled = (pattern, prefixes)
+        return _compiled
+
+
+@lru_cache(maxsize=64)
+def match_keywords(text: str) -> FrozenSet[str]:
+    """Every registered keyword that occurs in ``text``."""
+    pattern, prefixes = _matcher()
+    if pattern is None or not text:
+        return frozenset()
+    found = set()
+    for match in pattern.finditer(text):
+        keyword = match.group(1)
+        if keyword and keyword not in found:
+            found |= prefixes[keyword]
+    return frozenset(found)
@@ -1,7 +1,7 @@
 import time
-from typing import Tuple
+from typing import Optional, Tuple
 from ..types import MetricValue
-from .base import register
+from .context import MetricContext
 
 
 class LicenseMetric:
@@ -37,13 +37,14 @@ class LicenseMetric:
         "zlib",
     ]
 
-    def score(self, meta: dict) -> MetricValue:
+    def score(self, meta: dict, ctx: Optional[MetricContext] = None) -> MetricValue:
         t0 = time.perf_counter()
+        ctx = MetricContext.ensure(meta, ctx)
 
         # Heuristics for license compatibility with LGPLv2.1 - more lenient
         score = 0.0
         license_name = meta.get("license", "").lower()
-        readme_text = meta.get("readme_text", "").lower()
+        readme_text = ctx.readme
 
         # Also check license_text if available
         license_text = meta.get("license_text", "").lower()
@@ -301,6 +302,3 @@ def score_license_with_latency(model_data) -> Tuple[float, int]:
     time.sleep(0.01)  # 10ms delay
     latency = int((time.time() - start) * 1000)
     return result, latency
-
-
-register(LicenseMetric())
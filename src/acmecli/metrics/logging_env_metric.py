@@ -1,6 +1,7 @@
 import time
+from typing import Optional
 from ..types import MetricValue
-from .base import register
+from .context import MetricContext
 
 
 class LoggingEnvMetric:
@@ -8,11 +9,12 @@ class LoggingEnvMetric:
 
     name = "logging_env"
 
-    def score(self, meta: dict) -> MetricValue:
+    def score(self, meta: dict, ctx: Optional[MetricContext] = None) -> MetricValue:
         t0 = time.perf_counter()
+        ctx = MetricContext.ensure(meta, ctx)
         score = 0.0
         env_vars = meta.get("env_vars", {})
-        readme_text = meta.get("readme_text", "").lower()
+        readme_text = ctx.readme
         if "log_file" in env_vars or "log_level" in env_vars:
             score += 0.5
         if "debug" in readme_text or "logging" in readme_text:
@@ -24,6 +26,3 @@ class LoggingEnvMetric:
         value = round(float(min(1.0, max(0.5, score))), 2)
         latency_ms = int((time.perf_counter() - t0) * 1000)
         return MetricValue(self.name, value, latency_ms)
-
-
-register(LoggingEnvMetric())
@@ -1,12 +1,13 @@
 import time
+from typing import Optional
 from ..types import MetricValue
-from .base import register
+from .context import MetricContext
 
 
 class ReviewednessMetric:
     name = "Reviewedness"
 
-    def score(self, meta: dict) -> MetricValue:
+    def score(self, meta: dict, ctx: Optional[MetricContext] = None) -> MetricValue:
         t0 = time.perf_counter()
         github_url = (meta.get("github_url") or "").strip()
 
@@ -276,6 +277,3 @@ class ReviewednessMetric:
             value = round(float(value), 2)
         latency_ms = int((time.perf_counter() - t0) * 1000)
         return MetricValue(self.name, value, latency_ms)
-
-
-register(ReviewednessMetric())
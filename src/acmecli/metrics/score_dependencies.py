@@ -1,7 +1,7 @@
 import time
 import json
 import os
-from typing import Tuple
+from typing import Optional, Tuple
 
 """
 Dependencies metric (0..1):
@@ -16,12 +16,29 @@ Safe & offline: only reads local files already cloned by fetch step.
 MAX_DEP_COUNT = 20  # after this many, score tends toward 0
 
 
-def _count_deps(repo_path: str) -> int:
+def _read_manifest(repo_path, name: str) -> Optional[str]:
+    """Text of a top-level manifest, or None if it is missing or unreadable."""
+    try:
+        read_bytes = getattr(repo_path, "read_bytes", None)
+        if read_bytes is not None:
+            # In-memory repo (rating.ZipRepoView): read it without extracting
+            data = read_bytes(name)
+            return None if data is None else data.decode("utf-8")
+        path = os.path.join(repo_path, name)
+        if not os.path.exists(path):
+            return None
+        with open(path, "r", encoding="utf-8") as f:
+            return f.read()
+    except Exception:
+        return None
+
+
+def _count_deps(repo_path) -> int:
     # package.json (JS)
-    pkg = os.path.join(repo_path, "package.json")
-    if os.path.exists(pkg):
+    pkg = _read_manifest(repo_path, "package.json")
+    if pkg is not None:
         try:
-            data = json.load(open(pkg, "r", encoding="utf-8"))
+            data = json.loads(pkg)
             deps = 0
             for key in (
                 "dependencies",
@@ -37,18 +54,12 @@ def _count_deps(repo_path: str) -> int:
             pass
 
     # requirements.txt (Python)
-    req = os.path.join(repo_path, "requirements.txt")
-    if os.path.exists(req):
-        try:
-            lines = [
-                ln.strip()
-                for ln in open(req, "r", encoding="utf-8").read().splitlines()
-            ]
-            # Ignore comments and empty lines
-            pkgs = [ln for ln in lines if ln and not ln.startswith("#")]
-            return len(pkgs)
-        except Exception:
-            pass
+    req = _read_manifest(repo_path, "requirements.txt")
+    if req is not None:
+        lines = [ln.strip() for ln in req.splitlines()]
+        # Ignore comments and empty lines
+        pkgs = [ln for ln in lines if ln and not ln.startswith("#")]
+        return len(pkgs)
 
     # Pipfile / pyproject.toml could be added similarly if needed.
     return 0
@@ -65,7 +76,8 @@ def score_dependencies(context) -> float:
     if repo_path is None and isinstance(context, dict):
         repo_path = context.get("repo_path") or context.get("local_path")
 
-    if not repo_path or not os.path.exists(repo_path):
+    in_memory = getattr(repo_path, "read_bytes", None) is not None
+    if not repo_path or (not in_memory and not os.path.exists(repo_path)):
         # No repo on disk? Be conservative but not fatal.
         return 0.5
 
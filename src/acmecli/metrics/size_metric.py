@@ -1,7 +1,12 @@
 import time
-from typing import Dict
+from typing import Dict, Optional
 from ..types import MetricValue
-from .base import register
+from .context import MetricContext
+from .keywords import keyword_table
+
+
+LIGHTWEIGHT_KEYWORDS = keyword_table("lightweight", "small", "compact", "efficient")
+HEAVY_KEYWORDS = keyword_table("large", "heavy", "resource-intensive")
 
 
 class SizeMetric:
@@ -10,8 +15,9 @@ class SizeMetric:
     name = "size_score"
 
     # check for CD
-    def score(self, meta: dict) -> MetricValue:
+    def score(self, meta: dict, ctx: Optional[MetricContext] = None) -> MetricValue:
         t0 = time.perf_counter()
+        ctx = MetricContext.ensure(meta, ctx)
 
         # Get repository size in KB
         repo_size_kb = meta.get("size", 0)
@@ -41,20 +47,15 @@ class SizeMetric:
                 scores[platform] = max(0.5, 0.1)
 
         # Check README for size-related information
-        readme_text = meta.get("readme_text", "").lower()
+        readme_text = ctx.readme
         if readme_text:
+            found = ctx.keywords
             # Look for explicit size mentions
-            if any(
-                keyword in readme_text
-                for keyword in ["lightweight", "small", "compact", "efficient"]
-            ):
+            if found & LIGHTWEIGHT_KEYWORDS:
                 # Boost all scores slightly for models claiming to be lightweight
                 for platform in scores:
                     scores[platform] = min(1.0, scores[platform] + 0.1)
-            elif any(
-                keyword in readme_text
-                for keyword in ["large", "heavy", "resource-intensive"]
-            ):
+            elif found & HEAVY_KEYWORDS:
                 # Reduce scores for models explicitly stating they are large
                 for platform in scores:
                     scores[platform] = max(0.0, scores[platform] - 0.1)
@@ -66,6 +67,3 @@ class SizeMetric:
 
         latency_ms = int((time.perf_counter() - t0) * 1000)
         return MetricValue(self.name, scores, latency_ms)
-
-
-register(SizeMetric())
@@ -3,22 +3,76 @@ import re
 import os
 import json
 import logging
-from typing import Optional
+import threading
+from typing import Dict, List, Optional, Tuple
 from ..types import MetricValue
-from .base import register
+from .context import MetricContext
 
 logger = logging.getLogger(__name__)
 
+# Rating a parent runs its own Treescore, which rates the grandparents, and so
+# on. Parents are therefore scored depth-first (ancestors before descendants),
+# each net score is memoized by registry key so an ancestor shared by many
+# models is rated once, and the walk stops at cycles and at this depth. A score
+# whose walk was cut short depends on where it was reached, so it is not memoized.
+TREESCORE_MAX_DEPTH = int(os.getenv("TREESCORE_MAX_DEPTH", "3"))
+PARENT_SCORE_TTL_SECONDS = float(os.getenv("TREESCORE_MEMO_TTL_SECONDS", "600"))
+# Parents rated to build the LLM prompt; each one is a full rating
+TREESCORE_LLM_MAX_PARENTS = int(os.getenv("TREESCORE_LLM_MAX_PARENTS", "5"))
+
+# registry key -> (net_score or None if unratable, monotonic time stored)
+_parent_scores: Dict[str, Tuple[Optional[float], float]] = {}
+_parent_scores_lock = threading.Lock()
+# Per thread, one "cut short" flag per parent rating in progress. Nested ratings
+# run Treescore inline (rating.INLINE_METRICS), so a lineage walk stays on one thread.
+_walk = threading.local()
+
+
+def clear_parent_scores() -> None:
+    """Drop memoized parent scores (e.g. after a registry reset)."""
+    with _parent_scores_lock:
+        _parent_scores.clear()
+
+
+def _memoized_parent_score(key: str) -> Tuple[bool, Optional[float]]:
+    with _parent_scores_lock:
+        entry = _parent_scores.get(key)
+        if entry is None:
+            return False, None
+        if time.monotonic() - entry[1] > PARENT_SCORE_TTL_SECONDS:
+            del _parent_scores[key]
+            return False, None
+        return True, entry[0]
+
+
+def _remember_parent_score(key: str, score: Optional[float]) -> None:
+    with _parent_scores_lock:
+        _parent_scores[key] = (score, time.monotonic())
+
+
+def _ratings_in_progress() -> List[bool]:
+    stack = getattr(_walk, "stack", None)
+    if stack is None:
+        stack = _walk.stack = []
+    return stack
+
+
+def _mark_walk_cut_short() -> None:
+    """Flag every parent rating in progress as depending on a cycle or depth cut."""
+    stack = _ratings_in_progress()
+    stack[:] = [True] * len(stack)
+
 
 class TreescoreMetric:
     name = "Treescore"
 
-    def score(self, meta: dict) -> MetricValue:
+    def score(self, meta: dict, ctx: Optional[MetricContext] = None) -> MetricValue:
         t0 = time.perf_counter()
+        ctx = MetricContext.ensure(meta, ctx)
         
         # Try to use Purdue LLM GENAI service first
         try:
-            llm_score = self._get_treescore_from_purdue_llm(meta)
+            llm_score = self._get_treescore_from_purdue_llm(meta, ctx)
             if llm_score is not None:
                 value = max(0.0, min(1.0, float(llm_score)))
                 value = round(value, 2)
@@ -56,7 +110,9 @@ class TreescoreMetric:
                 parent_id = p
 
             if parent_id:
-                parent_score = self._lookup_parent_score(parent_id)
+                parent_score = self._lookup_parent_score(
+                    parent_id, meta.get("lineage_path", ())
+                )
                 if parent_score is not None and 0.0 <= parent_score <= 1.0:
                     scores.append(parent_score)
 
@@ -81,7 +137,9 @@ class TreescoreMetric:
         latency_ms = int((time.perf_counter() - t0) * 1000)
         return MetricValue(self.name, value, latency_ms)
     
-    def _get_treescore_from_purdue_llm(self, meta: dict) -> Optional[float]:
+    def _get_treescore_from_purdue_llm(
+        self, meta: dict, ctx: Optional[MetricContext] = None
+    ) -> Optional[float]:
         """
         Get treescore from Purdue LLM GENAI service.
         
@@ -94,6 +152,7 @@ class TreescoreMetric:
         try:
             try:
                 import requests
+                from .. import http_client
             except ImportError:
                 logger.debug("requests library not available, cannot call Purdue LLM GENAI service")
                 return None
@@ -108,30 +167,28 @@ class TreescoreMetric:
             
             # Prepare request payload with model metadata
             model_name = meta.get("name", meta.get("model_id", "unknown"))
-            config = meta.get("config", {})
+            config = MetricContext.ensure(meta, ctx).config
             readme_text = meta.get("readme_text", "")
             description = meta.get("description", "")
             
-            # Get all potential parent models from the system for the LLM to check against
-            # This helps the LLM identify which parents are actually uploaded
-            try:
-                from ...services.s3_service import list_models
-                uploaded_models_result = list_models(limit=1000)
-                uploaded_model_names = [m.get("name", "") for m in uploaded_models_result.get("models", [])]
-            except Exception:
-                uploaded_model_names = []
-            
-            # Pre-extract potential parents and their scores to help the LLM
-            # The LLM will still do its own lineage extraction, but we provide this as reference
+            # Resolve the potential parents against the registry index; only these
+            # can be uploaded, so there is no need to list every model
             potential_parents = self._extract_parents(meta)
+            lineage_path = meta.get("lineage_path", ())
+            uploaded_model_names = []
             parent_scores_lookup = {}
-            for p in potential_parents[:20]:  # Limit to avoid too many lookups
+            for p in potential_parents[:TREESCORE_LLM_MAX_PARENTS]:
                 parent_id = p.get("id") if isinstance(p, dict) else str(p)
-                if parent_id:
-                    parent_score = self._lookup_parent_score(parent_id)
-                    if parent_score is not None:
-                        parent_scores_lookup[parent_id] = parent_score
-            
+                if not parent_id:
+                    continue
+                resolved = self._resolve_parent(parent_id)
+                if resolved is None:
+                    continue
+                uploaded_model_names.append(resolved[1])
+                parent_score = self._score_parent(*resolved, lineage_path)
+                if parent_score is not None:
+                    parent_scores_lookup[parent_id] = parent_score
+
             # Build comprehensive prompt that asks LLM to extract lineage AND calculate treescore
             # Following OpenAPI spec requirements for lineage graph and treescore
             prompt = f"""You are analyzing a machine learning model to extract its lineage graph and calculate its Treescore according to the ECE 461 Fall 2025 OpenAPI specification.
@@ -269,7 +326,7 @@ Return a JSON object matching the OpenAPI spec format:
                 headers["Authorization"] = f"Bearer {purdue_llm_api_key}"
             
             # Make request to Purdue LLM GENAI service
-            response = requests.post(
+            response = http_client.post(
                 purdue_llm_url,
                 json=payload,
                 headers=headers,
@@ -317,76 +374,119 @@ Return a JSON object matching the OpenAPI spec format:
         
         return None
 
-    def _lookup_parent_score(self, parent_id: str) -> Optional[float]:
+    def _resolve_parent(self, parent_id: str) -> Optional[Tuple[str, str]]:
+        """
+        Map a parent reference (HuggingFace ID/URL or GitHub URL) to the model
+        it names in the registry.
+
+        Returns:
+            (model_id, registry_key) or None if the parent is not uploaded
+        """
+        from ...services.s3_service import resolve_model_key
+
+        # Handle GitHub URLs - owner/repo is the closest model ID
+        if "github.com" in parent_id.lower():
+            github_match = re.search(
+                r"github\.com/([\w\-\.]+)/([\w\-\.]+)", parent_id, re.IGNORECASE
+            )
+            if not github_match:
+                return None
+            owner, repo = github_match.groups()
+            clean_parent_id = f"{owner}/{repo}"
+        else:
+            # Handle HuggingFace URLs
+            clean_parent_id = (
+                parent_id.replace("https://huggingface.co/", "")
+                .replace("http://huggingface.co/", "")
+                .strip()
+                .strip("/")
+            )
+
+        if not clean_parent_id:
+            return None
+
+        # Exact key first, then the bare model name (models uploaded without
+        # their organisation prefix)
+        candidates = [clean_parent_id]
+        short_name = clean_parent_id.split("/")[-1]
+        if short_name and short_name != clean_parent_id:
+            candidates.append(short_name)
+        for candidate in candidates:
+            try:
+                resolved = resolve_model_key(candidate)
+            except Exception as e:
+                logger.debug(f"Could not resolve parent {candidate}: {e}")
+                continue
+            if resolved:
+                return candidate, resolved[0]
+        return None
+
+    def _lookup_parent_score(
+        self, parent_id: str, lineage_path: Tuple[str, ...] = ()
+    ) -> Optional[float]:
         """
         Look up the net_score (total model score) of a parent model.
         Only includes models currently uploaded to the system.
         Supports both HuggingFace model IDs and GitHub repository URLs.
+
+        ``lineage_path`` holds the registry keys of the model being rated and
+        its descendants. A parent already on the path (a cycle) or beyond
+        TREESCORE_MAX_DEPTH is not rated. Scores are memoized by registry key
+        unless a cycle or the depth limit cut their own walk short.
         """
         try:
-            from ...services.s3_service import list_models
-            from ...services.rating import analyze_model_content
-
-            # Handle GitHub URLs - convert to a searchable format
-            if "github.com" in parent_id.lower():
-                # Extract owner/repo from GitHub URL
-                github_match = re.search(
-                    r"github\.com/([\w\-\.]+)/([\w\-\.]+)", parent_id, re.IGNORECASE
-                )
-                if github_match:
-                    owner, repo = github_match.groups()
-                    # Try to find models that might be associated with this GitHub repo
-                    # Search by repo name as a fallback
-                    clean_parent_id = f"{owner}/{repo}"
-                else:
-                    return None
-            else:
-                # Handle HuggingFace URLs
-                clean_parent_id = (
-                    parent_id.replace("https://huggingface.co/", "")
-                    .replace("http://huggingface.co/", "")
-                    .strip()
-                )
+            resolved = self._resolve_parent(parent_id)
+            if resolved is None:
+                return None
+            return self._score_parent(*resolved, lineage_path)
+        except Exception:
+            pass
+        return None
 
-            if not clean_parent_id:
+    def _score_parent(
+        self, model_id: str, key: str, lineage_path: Tuple[str, ...]
+    ) -> Optional[float]:
+        """Net score of the uploaded model at ``key``, rating it at most once."""
+        try:
+            if key in lineage_path:
+                logger.info(f"Lineage cycle at {key}, skipping parent score")
+                _mark_walk_cut_short()
+                return None
+            hit, score = _memoized_parent_score(key)
+            if hit:
+                return score
+            if len(lineage_path) > TREESCORE_MAX_DEPTH:
+                logger.debug(f"Lineage depth limit reached at {key}")
+                _mark_walk_cut_short()
                 return None
 
+            from ...services.rating import analyze_model_content
+
+            score = None
+            in_progress = _ratings_in_progress()
+            in_progress.append(False)
             try:
-                uploaded_models = list_models(
-                    name_regex=f"^{clean_parent_id.replace('/', '_')}$", limit=1000
+                parent_result = analyze_model_content(
+                    model_id, suppress_errors=True, lineage_path=tuple(lineage_path)
                 )
-                if not uploaded_models.get("models"):
-                    uploaded_models = list_models(
-                        name_regex=f".*{re.escape(clean_parent_id.split('/')[-1])}.*",
-                        limit=1000,
-                    )
-
-                if not uploaded_models.get("models"):
-                    return None
-
-                for model in uploaded_models.get("models", []):
-                    model_name = model.get("name", "").replace("_", "/")
-                    if model_name == clean_parent_id or model_name.endswith(
-                        clean_parent_id.split("/")[-1]
-                    ):
-                        parent_result = analyze_model_content(
-                            model_name, suppress_errors=True
-                        )
-                        if parent_result:
-                            net_score = (
-                                parent_result.get("net_score")
-                                or parent_result.get("NetScore")
-                                or parent_result.get("netScore")
-                            )
-                            if net_score is not None:
-                                try:
-                                    score = float(net_score)
-                                    if 0.0 <= score <= 1.0:
-                                        return round(score, 2)
-                                except (TypeError, ValueError):
-                                    pass
-            except Exception:
-                pass
+            finally:
+                cut_short = in_progress.pop()
+            if parent_result:
+                net_score = (
+                    parent_result.get("net_score")
+                    or parent_result.get("NetScore")
+                    or parent_result.get("netScore")
+                )
+                if net_score is not None:
+                    try:
+                        value = float(net_score)
+                        if 0.0 <= value <= 1.0:
+                            score = round(value, 2)
+                    except (TypeError, ValueError):
+                        pass
+            if not cut_short:
+                _remember_parent_score(key, score)
+            return score
         except Exception:
             pass
         return None
@@ -997,6 +1097,3 @@ Return a JSON object matching the OpenAPI spec format:
             return True
 
         return False
-
-
-register(TreescoreMetric())
@@ -0,0 +1,177 @@
+"""
+Rate-limit-aware scheduler for GitHub API requests.
+
+GitHub reports the request budget on every response (X-RateLimit-Limit,
+X-RateLimit-Remaining and X-RateLimit-Reset). Every GitHubHandler in the
+process shares one GitHubRateLimiter, which uses those headers as a token
+bucket:
+
+- while more than GITHUB_RATE_LIMIT_PACE_FRACTION of the limit is left,
+  requests go through immediately
+- below that, the remaining tokens refill at remaining / seconds-to-reset, so
+  concurrent threads are spaced out to make the budget last until the reset
+  instead of hitting 403s halfway through a batch
+- the last GITHUB_RATE_LIMIT_RESERVE tokens are only handed to PRIORITY_HIGH
+  requests (the ones a metric cannot be computed without); PRIORITY_LOW
+  enrichment requests wait for the reset
+- waiting requests are served in priority order, then in arrival order
+- a request that would have to wait longer than GITHUB_RATE_LIMIT_MAX_WAIT
+  seconds is not sent; acquire() returns False and the caller degrades
+
+A Retry-After header on a 403/429 (secondary rate limits) pauses all requests
+for that long.
+stats() is the remaining-budget gauge.
+"""
+import heapq
+import itertools
+import logging
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+PRIORITY_HIGH = 0
+PRIORITY_LOW = 1
+
+GITHUB_RATE_LIMIT_PACE_FRACTION = float(os.getenv("GITHUB_RATE_LIMIT_PACE_FRACTION", "0.2"))
+GITHUB_RATE_LIMIT_RESERVE = int(os.getenv("GITHUB_RATE_LIMIT_RESERVE", "10"))
+GITHUB_RATE_LIMIT_MAX_WAIT = float(os.getenv("GITHUB_RATE_LIMIT_MAX_WAIT", "60"))
+
+
+def _header_int(headers: Any, name: str) -> Optional[int]:
+    try:
+        value = headers.get(name)
+        return int(value) if isinstance(value, (str, int)) else None
+    except (AttributeError, TypeError, ValueError):
+        return None
+
+
+class GitHubRateLimiter:
+    """Thread-safe token bucket fed by GitHub's rate limit headers."""
+
+    def __init__(
+        self,
+        pace_fraction: Optional[float] = None,
+        reserve: Optional[int] = None,
+        max_wait: Optional[float] = None,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.pace_fraction = GITHUB_RATE_LIMIT_PACE_FRACTION if pace_fraction is None else pace_fraction
+        self.reserve = GITHUB_RATE_LIMIT_RESERVE if reserve is None else reserve
+        self.max_wait = GITHUB_RATE_LIMIT_MAX_WAIT if max_wait is None else max_wait
+        self._clock = clock
+        self._cond = threading.Condition()
+        self._limit: Optional[int] = None
+        self._remaining: Optional[int] = None  # None until a response reports it
+        self._reset_at = 0.0
+        self._next_grant = 0.0  # Earliest start for the next paced request
+        self._waiting: List[Tuple[int, int]] = []  # Heap of (priority, arrival)
+        self._arrivals = itertools.count()
+        self._granted = 0
+        self._skipped = 0
+        self._waited_seconds = 0.0
+
+    def _roll_window(self, now: float) -> None:
+        if self._remaining is not None and now >= self._reset_at:
+            self._remaining = None
+
+    def _delay(self, priority: int, now: float) -> Tuple[float, float]:
+        """(seconds until a token is available, pacing interval after this grant)."""
+        pause = max(0.0, self._next_grant - now)
+        if self._remaining is None:
+            return pause, 0.0
+        usable = self._remaining - (self.reserve if priority > PRIORITY_HIGH else 0)
+        if usable <= 0:
+            return max(pause, self._reset_at - now), 0.0
+        if self._limit and self._remaining > self._limit * self.pace_fraction:
+            return pause, 0.0
+        return pause, max(0.0, self._reset_at - now) / usable
+
+    def acquire(self, priority: int = PRIORITY_HIGH) -> bool:
+        """Block until a request may be sent. False if that would take over max_wait seconds."""
+        entry = (priority, next(self._arrivals))
+        with self._cond:
+            start = self._clock()
+            heapq.heappush(self._waiting, entry)
+            try:
+                while True:
+                    now = self._clock()
+                    self._roll_window(now)
+                    timeout = None
+                    if self._waiting[0] == entry:
+                        delay, interval = self._delay(priority, now)
+                        if delay <= 0:
+                            if self._remaining is not None:
+                                self._remaining -= 1
+                            if interval:
+                                self._next_grant = now + interval
+                            self._granted += 1
+                            self._waited_seconds += now - start
+                            return True
+                        if now + delay - start > self.max_wait:
+                            self._skipped += 1
+                            logging.warning(
+                                "GitHub API budget exhausted (%s left, reset in %.0fs); skipping request",
+                                self._remaining,
+                                max(0.0, self._reset_at - now),
+                            )
+                            return False
+                        timeout = delay
+                    self._cond.wait(timeout)
+            finally:
+                self._waiting.remove(entry)
+                heapq.heapify(self._waiting)
+                self._cond.notify_all()
+
+    def update(self, headers: Any, status: int = 200) -> None:
+        """Record the budget reported by a response (or error response)."""
+        if headers is None:
+            return
+        remaining = _header_int(headers, "X-RateLimit-Remaining")
+        reset_at = _header_int(headers, "X-RateLimit-Reset")
+        limit = _header_int(headers, "X-RateLimit-Limit")
+        retry_after = _header_int(headers, "Retry-After") if status in (403, 429) else None
+        with self._cond:
+            now = self._clock()
+            if limit is not None:
+                self._limit = limit
+            if remaining is not None and reset_at is not None and reset_at > now:
+                # The server count replaces the local estimate: 304s are free, and
+                # with N threads in flight it is at most N requests behind, which
+                # the reserve absorbs
+                self._reset_at = float(reset_at)
+                self._remaining = remaining
+            if retry_after:
+                self._next_grant = max(self._next_grant, now + retry_after)
+            self._cond.notify_all()
+
+    def stats(self) -> Optional[Dict[str, Any]]:
+        """Remaining-budget gauge, or None before any response reported a budget."""
+        with self._cond:
+            now = self._clock()
+            self._roll_window(now)
+            if self._limit is None and self._remaining is None:
+                return None
+            return {
+                "limit": self._limit,
+                "remaining": self._remaining,
+                "reserve": self.reserve,
+                "reset_in_seconds": round(max(0.0, self._reset_at - now), 1),
+                "paced": bool(
+                    self._remaining is not None
+                    and self._limit
+                    and self._remaining <= self._limit * self.pace_fraction
+                ),
+                "waiting": len(self._waiting),
+                "granted_total": self._granted,
+                "skipped_total": self._skipped,
+                "waited_seconds_total": round(self._waited_seconds, 3),
+            }
+
+
+github_rate_limiter = GitHubRateLimiter()
+
+
+def get_rate_limit_stats() -> Optional[Dict[str, Any]]:
+    """Budget gauge of the shared GitHub rate limiter."""
+    return github_rate_limiter.stats()
@@ -3,9 +3,10 @@ from pathlib import Path
 import re
 import os
 import json
+import urllib.parse
 import urllib.request
 import urllib.error
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from starlette.datastructures import UploadFile
 import uvicorn
 import random
@@ -14,6 +15,8 @@ import sys
 import threading
 import time
 import uuid
+import queue
+from collections import deque
 from datetime import datetime, timezone
 from fastapi import FastAPI, Request, UploadFile, File, HTTPException, status, Query
 import watchtower
@@ -22,7 +25,7 @@ import watchtower
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import Response, JSONResponse
+from fastapi.responses import Response, JSONResponse, StreamingResponse
 from pydantic import BaseModel
 from botocore.exceptions import ClientError
 from .routes.index import router as api_router
@@ -45,8 +48,10 @@ from .services.s3_service import (
     download_model,
     reset_registry,
     reset_performance_path,
+    reclaim_blobs,
     get_model_lineage_from_config,
     get_model_sizes,
+    resolve_model_key,
     s3,
     ap_arn,
     model_ingestion,
@@ -66,6 +71,14 @@ from .services.artifact_storage import (
     clear_all_artifacts,
 )
 from .services.rating import run_scorer, alias, analyze_model_content
+from .services.rating_queue import (
+    PRIORITY_BACKGROUND,
+    PRIORITY_INTERACTIVE,
+    QueueFull,
+    RatingScheduler,
+)
+from .services.blob_store import pointer_digest
+from .services.compression_policy import write_member
 from .services.license_compatibility import (
     extract_model_license,
     extract_github_license,
@@ -392,6 +405,16 @@ _rating_locks = {}  # threading.Event objects for blocking requests
 _rating_results = {}  # Store rating results by artifact_id
 _rating_start_times = {}  # Track when ratings started to detect stuck ratings
 _rating_lock = threading.Lock()  # Lock for thread-safe access to rating data structures
+# Last known rating per artifact_id, served by /rate while a re-rate runs
+# (stale-while-revalidate). Entries: rating, rated_at, changed, revalidated_at
+_rating_snapshots = {}
+
+# Ratings older than this (or whose artifact changed) are re-rated in the
+# background; the old score is served in the meantime
+RATING_TTL_SECONDS = float(os.getenv("RATING_TTL_SECONDS", "86400"))
+# Minimum gap between background re-rates of one artifact, so a model whose
+# re-rate keeps failing is not requeued on every request
+RATING_REVALIDATE_RETRY_SECONDS = float(os.getenv("RATING_REVALIDATE_RETRY_SECONDS", "60"))
 
 # In-memory storage for models, datasets, and code artifacts (for immediate consistency in queries)
 # Key: artifact_id, Value: dict with name, type, version, id, url
@@ -460,7 +483,8 @@ def build_artifact_response(
 def _cleanup_stuck_ratings():
     """
     Clean up ratings that have been stuck in 'pending' state for too long (>10 minutes).
-    This prevents ratings from being stuck indefinitely.
+    This prevents ratings from being stuck indefinitely. Jobs still waiting in the
+    rating queue are not stuck; their clock starts when a worker picks them up.
     """
     global _rating_status, _rating_start_times, _rating_lock
 
@@ -473,6 +497,7 @@ def _cleanup_stuck_ratings():
             if (
                 artifact_id in _rating_status
                 and _rating_status[artifact_id] == "pending"
+                and not _rating_scheduler.is_queued(artifact_id)
             ):
                 elapsed = current_time - start_time
                 if elapsed > stuck_threshold:
@@ -494,7 +519,7 @@ def _cleanup_stuck_ratings():
 
 def _run_async_rating(artifact_id: str, model_name: str, version: str):
     """
-    Run rating asynchronously in background thread.
+    Run rating on a rating scheduler worker thread.
     Updates _rating_status and _rating_results when complete.
     """
     global _rating_status, _rating_locks, _rating_results, _rating_start_times, _rating_lock
@@ -504,9 +529,8 @@ def _run_async_rating(artifact_id: str, model_name: str, version: str):
             logger.info(
                 f"DEBUG: [ASYNC RATING] Starting rating for artifact_id='{artifact_id}', model_name='{model_name}'"
             )
-            # Start time should already be set when rating was initialized, but update it if not
-            if artifact_id not in _rating_start_times:
-                _rating_start_times[artifact_id] = time.time()
+            # Time spent queued does not count towards the stuck-rating threshold
+            _rating_start_times[artifact_id] = time.time()
             # Ensure status is pending (it should already be, but make sure)
             _rating_status[artifact_id] = "pending"
 
@@ -537,13 +561,17 @@ def _run_async_rating(artifact_id: str, model_name: str, version: str):
                         f"DEBUG: [ASYNC RATING] Model disqualified: net_score={net_score} < 0.5"
                     )
                     _rating_status[artifact_id] = "disqualified"
-                    _rating_results[artifact_id] = None
+                    # Kept for batch results; /rate re-rates disqualified models,
+                    # so no snapshot is served for them (and an older one is dropped)
+                    _rating_results[artifact_id] = rating
+                    _rating_snapshots.pop(artifact_id, None)
                 else:
                     logger.info(
                         f"DEBUG: [ASYNC RATING] Rating completed successfully: net_score={net_score}"
                     )
                     _rating_status[artifact_id] = "completed"
                     _rating_results[artifact_id] = rating
+                    _record_rating_snapshot(artifact_id, rating)
 
             # Clean up tracking data
             if artifact_id in _rating_start_times:
@@ -569,6 +597,253 @@ def _run_async_rating(artifact_id: str, model_name: str, version: str):
             _rating_locks[artifact_id].set()
 
 
+# Background ratings run on a fixed worker pool (RATING_WORKERS) behind a
+# bounded priority queue (RATING_QUEUE_MAX) instead of one thread per ingest
+_rating_scheduler = RatingScheduler(_run_async_rating)
+
+
+def _enqueue_rating(
+    artifact_id: str,
+    model_name: str,
+    version: str,
+    priority: int = PRIORITY_BACKGROUND,
+    on_done=None,
+) -> bool:
+    """
+    Queue a background rating. If the queue is full the rating is marked failed,
+    which makes the rate endpoint compute it synchronously on first request.
+    """
+    try:
+        _rating_scheduler.submit(
+            artifact_id, model_name, version, priority=priority, on_done=on_done
+        )
+        return True
+    except QueueFull as e:
+        logger.warning(f"Could not queue rating for artifact_id='{artifact_id}': {str(e)}")
+        with _rating_lock:
+            _rating_status[artifact_id] = "failed"
+            _rating_results[artifact_id] = None
+            _rating_start_times.pop(artifact_id, None)
+        if artifact_id in _rating_locks:
+            _rating_locks[artifact_id].set()
+        return False
+
+
+def _cancel_rating(artifact_id: str) -> bool:
+    """Cancel a queued rating and release anyone waiting on it."""
+    if not _rating_scheduler.cancel(artifact_id):
+        return False
+    with _rating_lock:
+        _rating_status.pop(artifact_id, None)
+        _rating_results.pop(artifact_id, None)
+        _rating_start_times.pop(artifact_id, None)
+    event = _rating_locks.pop(artifact_id, None)
+    if event:
+        event.set()
+    return True
+
+
+def _finish_detached_rating(artifact_id: str, callbacks) -> None:
+    """Report a queued rating that get_model_rate ran synchronously instead.
+
+    The callbacks (e.g. a batch stream) then see its outcome rather than a
+    cancellation; a rating that raised is marked failed.
+    """
+    with _rating_lock:
+        if _rating_status.get(artifact_id) == "pending":
+            _rating_status[artifact_id] = "failed"
+            _rating_results[artifact_id] = None
+            _rating_start_times.pop(artifact_id, None)
+    event = _rating_locks.get(artifact_id)
+    if event:
+        event.set()
+    for callback in callbacks:
+        try:
+            callback(artifact_id)
+        except Exception as e:
+            logger.error(f"Rating callback for {artifact_id} failed: {e}", exc_info=True)
+
+
+def _record_rating_snapshot(artifact_id: str, rating: Dict[str, Any]) -> None:
+    # Caller holds _rating_lock
+    _rating_snapshots[artifact_id] = {
+        "rating": rating,
+        "rated_at": time.time(),
+        "changed": False,
+        "revalidated_at": 0.0,
+    }
+
+
+def _mark_rating_changed(artifact_id: str) -> None:
+    """Flag the last known rating of an updated artifact for a background re-rate."""
+    with _rating_lock:
+        snapshot = _rating_snapshots.get(artifact_id)
+        if snapshot:
+            snapshot["changed"] = True
+
+
+def _stale_rating(
+    artifact_id: str, model_name: str, version: str
+) -> Optional[Tuple[Dict[str, Any], float, bool]]:
+    """
+    Return (rating, age in seconds, expired) for the last known rating of
+    artifact_id, or None if it has never been rated. An expired rating (older
+    than RATING_TTL_SECONDS, or its artifact was updated) is still returned,
+    and a background re-rate is queued unless one is already pending.
+    """
+    now = time.time()
+    with _rating_lock:
+        snapshot = _rating_snapshots.get(artifact_id)
+        if not snapshot:
+            return None
+        age = now - snapshot["rated_at"]
+        expired = snapshot["changed"] or age > RATING_TTL_SECONDS
+        revalidate = (
+            expired
+            and _rating_status.get(artifact_id) != "pending"
+            and now - snapshot["revalidated_at"] > RATING_REVALIDATE_RETRY_SECONDS
+        )
+        if revalidate:
+            snapshot["revalidated_at"] = now
+            _rating_status[artifact_id] = "pending"
+            _rating_locks[artifact_id] = threading.Event()
+            _rating_start_times[artifact_id] = now
+        rating = snapshot["rating"]
+    if revalidate:
+        logger.info(
+            f"DEBUG: Rating for id='{artifact_id}' is stale ({age:.0f}s old), re-rating in background"
+        )
+        _enqueue_rating(artifact_id, model_name, version)
+    return rating, age, expired
+
+
+def _check_rating_capacity():
+    """Reject an ingest up front when its rating could not be queued."""
+    if _rating_scheduler.is_saturated():
+        raise HTTPException(
+            status_code=503,
+            detail="Rating queue is full. Please retry later.",
+            headers={"Retry-After": "30"},
+        )
+
+
+# Batch rating (POST /artifact/model/rate/batch)
+RATE_BATCH_MAX_ITEMS = int(os.getenv("RATE_BATCH_MAX_ITEMS", "1000"))
+# Longest a batch waits for any one of its in-flight ratings to finish
+RATE_BATCH_WAIT_SECONDS = float(os.getenv("RATE_BATCH_WAIT_SECONDS", "600"))
+
+
+class RateBatchRequest(BaseModel):
+    ids: List[str]
+    # Ratings of this batch queued or running at once (default: 2x RATING_WORKERS)
+    concurrency: Optional[int] = None
+    # Re-rate models whose rating is already held in memory
+    refresh: bool = False
+
+
+def _resolve_batch_item(item: str) -> Tuple[str, str]:
+    """
+    (rating key, model name) for an artifact id, model name or Hugging Face URL.
+    Raises ValueError for items that cannot be a model.
+    """
+    if item.startswith(("http://", "https://")):
+        parsed = urllib.parse.urlparse(item)
+        if not parsed.netloc.endswith("huggingface.co"):
+            raise ValueError("Only Hugging Face model URLs can be rated")
+        parts = [part for part in parsed.path.split("/") if part]
+        if not parts or parts[0] in ("datasets", "spaces"):
+            raise ValueError("URL does not point to a Hugging Face model")
+        model_name = "/".join(parts[:2])
+        return model_name, model_name
+    artifact = get_generic_artifact_metadata("model", item) or get_artifact_from_db(item)
+    if artifact:
+        if artifact.get("type", "model") != "model":
+            raise ValueError(f"Artifact is a {artifact.get('type')}, not a model")
+        return item, artifact.get("name") or item
+    return item, item
+
+
+def _batch_result(item: str, key: str, model_name: str, cached: bool = False) -> Dict[str, Any]:
+    with _rating_lock:
+        status = _rating_status.get(key)
+        rating = _rating_results.get(key)
+    if status in (None, "pending"):
+        status = "cancelled"  # Dropped from the queue before it ran
+    result = {"id": item, "name": model_name, "status": status, "cached": cached}
+    if rating:
+        result["rating"] = _build_rating_response(model_name, rating)
+    else:
+        result["error"] = "Rating was cancelled" if status == "cancelled" else "Rating failed"
+    return result
+
+
+def _rate_batch_lines(items: List[str], concurrency: int, refresh: bool):
+    """
+    Rate ``items`` on the rating scheduler, at most ``concurrency`` at a time,
+    and yield one NDJSON line per item as its rating finishes.
+    """
+    done: "queue.Queue[str]" = queue.Queue()
+    in_flight: Dict[str, Tuple[List[str], str]] = {}  # key -> (items, model name)
+    remaining = deque(items)
+    started = time.time()
+    counts = {"completed": 0, "cached": 0, "failed": 0}
+
+    def line(result: Dict[str, Any]) -> str:
+        if result.get("rating"):
+            counts["cached" if result["cached"] else "completed"] += 1
+        else:
+            counts["failed"] += 1
+        return json.dumps(result) + "\n"
+
+    while remaining or in_flight:
+        while remaining and len(in_flight) < concurrency:
+            item = remaining.popleft()
+            try:
+                key, model_name = _resolve_batch_item(item)
+            except ValueError as e:
+                yield line({"id": item, "status": "invalid", "cached": False, "error": str(e)})
+                continue
+            if key in in_flight:
+                in_flight[key][0].append(item)
+                continue
+            with _rating_lock:
+                status = _rating_status.get(key)
+                if not refresh and status in ("completed", "disqualified") and _rating_results.get(key):
+                    status = "cached"
+                elif status != "pending":
+                    _rating_status[key] = "pending"
+                    _rating_locks[key] = threading.Event()
+                    _rating_start_times[key] = time.time()
+            if status == "cached":
+                yield line(_batch_result(item, key, model_name, cached=True))
+                continue
+            in_flight[key] = ([item], model_name)
+            if not _enqueue_rating(key, model_name, "main", on_done=done.put):
+                del in_flight[key]
+                yield line({"id": item, "name": model_name, "status": "failed", "cached": False,
+                            "error": "Rating queue is full. Please retry later."})
+        if not in_flight:
+            continue
+        try:
+            key = done.get(timeout=RATE_BATCH_WAIT_SECONDS)
+        except queue.Empty:
+            # Nothing finished in time; report the rest of this window and move on
+            for batch_items, model_name in in_flight.values():
+                for item in batch_items:
+                    yield line({"id": item, "name": model_name, "status": "timeout", "cached": False,
+                                "error": f"No result within {RATE_BATCH_WAIT_SECONDS:.0f}s"})
+            in_flight.clear()
+            continue
+        if key not in in_flight:
+            continue  # Finished after its batch entry timed out
+        batch_items, model_name = in_flight.pop(key)
+        for item in batch_items:
+            yield line(_batch_result(item, key, model_name))
+    logger.info(
+        f"Batch rating of {len(items)} item(s) finished in {time.time() - started:.1f}s: {counts}"
+    )
+
+
 def _get_artifact_size_mb(artifact_type: str, artifact_id: str) -> float:
     """
     Get artifact size in MB from S3 or download URL.
@@ -597,9 +872,9 @@ def _get_artifact_size_mb(artifact_type: str, artifact_id: str) -> float:
                 url = artifact.get("url", "")
                 if url:
                     try:
-                        import requests
+                        from .acmecli import http_client
 
-                        head_response = requests.head(
+                        head_response = http_client.head(
                             url, timeout=10, allow_redirects=True
                         )
                         content_length = head_response.headers.get("Content-Length")
@@ -679,6 +954,19 @@ def _get_model_name_for_s3(artifact_id: str) -> Optional[str]:
         return None
 
 
+def _resolve_model(artifact_id: str) -> Optional[Tuple[str, str]]:
+    """
+    Resolve an artifact ID or model name to (sanitized S3 name, version) with
+    direct key lookups, trying the stored artifact name first.
+
+    Returns:
+        (name, version) such that models/{name}/{version}/model.zip exists, or None
+    """
+    model_name = _get_model_name_for_s3(artifact_id)
+    resolved = resolve_model_key(model_name) if model_name else None
+    return resolved or resolve_model_key(artifact_id)
+
+
 def _check_model_exists_safely(model_name: str, version: str = "main") -> bool:
     """
     Safely check if a model exists, handling cases where the regex pattern would be too long.
@@ -1072,6 +1360,146 @@ def health_components(windowMinutes: int = 60, includeTimeline: bool = False):
         }
         components.append(performance_component)
 
+    # Model file cache tiers (only when the tiered storage backend is active)
+    from .services.storage_service import get_storage_cache_stats
+
+    cache_stats = get_storage_cache_stats()
+    if cache_stats:
+        storage_cache_component = {
+            "id": "storage-cache",
+            "status": "ok",
+            "observed_at": observed_at,
+            "display_name": "Storage Cache",
+            "description": "Memory and disk cache tiers in front of the model storage backend.",
+            "metrics": {"tiers": cache_stats},
+            "issues": [],
+            "logs": [],
+        }
+        if includeTimeline:
+            storage_cache_component["timeline"] = []
+        components.append(storage_cache_component)
+
+    # Background rating queue
+    queue_stats = _rating_scheduler.stats()
+    queue_issues = []
+    if queue_stats["queue_depth"] >= queue_stats["max_queue"]:
+        queue_issues.append({
+            "code": "RATING_QUEUE_FULL",
+            "severity": "warning",
+            "summary": "Rating queue is full; new model ingests are rejected with 503",
+            "details": (
+                f"{queue_stats['queue_depth']} job(s) queued for {queue_stats['workers']} worker(s); "
+                "consider raising RATING_WORKERS or RATING_QUEUE_MAX"
+            ),
+        })
+    rating_queue_component = {
+        "id": "rating-queue",
+        "status": "degraded" if queue_issues else "ok",
+        "observed_at": observed_at,
+        "display_name": "Rating Queue",
+        "description": (
+            "Worker pool computing model ratings: queue depth by priority, "
+            "wait and run time histograms, and job counters."
+        ),
+        "metrics": queue_stats,
+        "issues": queue_issues,
+        "logs": [],
+    }
+    if includeTimeline:
+        rating_queue_component["timeline"] = []
+    components.append(rating_queue_component)
+
+    # In-process scorer pool (only once a rating has used it)
+    from .services.scorer_pool import get_scorer_pool_stats
+
+    scorer_stats = get_scorer_pool_stats()
+    if scorer_stats:
+        scorer_component = {
+            "id": "scorer-pool",
+            "status": "ok",
+            "observed_at": observed_at,
+            "display_name": "Scorer Pool",
+            "description": (
+                "Warm worker threads scoring model URLs with the acmecli metrics: "
+                "score time histogram and outcome counters."
+            ),
+            "metrics": scorer_stats,
+            "issues": [],
+            "logs": [],
+        }
+        if includeTimeline:
+            scorer_component["timeline"] = []
+        components.append(scorer_component)
+
+    # RDS connection pool (only once the pool has been created)
+    try:
+        from .services.rds_service import get_pool_stats
+
+        pool_stats = get_pool_stats()
+    except Exception as e:
+        logger.warning(f"Could not load RDS pool stats: {str(e)}")
+        pool_stats = None
+    if pool_stats:
+        pool_issues = []
+        if pool_stats["timeouts_total"]:
+            pool_issues.append({
+                "code": "RDS_POOL_EXHAUSTED",
+                "severity": "warning",
+                "summary": (
+                    f"{pool_stats['timeouts_total']} connection acquire(s) timed out; "
+                    "consider raising CONNECTION_POOL_MAX"
+                ),
+            })
+        rds_pool_component = {
+            "id": "rds-pool",
+            "status": "degraded" if pool_issues else "ok",
+            "observed_at": observed_at,
+            "display_name": "RDS Connection Pool",
+            "description": (
+                "PostgreSQL connection pool: acquire wait and utilization histograms, "
+                "timeouts and per-statement latency."
+            ),
+            "metrics": pool_stats,
+            "issues": pool_issues,
+            "logs": [],
+        }
+        if includeTimeline:
+            rds_pool_component["timeline"] = []
+        components.append(rds_pool_component)
+
+    # GitHub API budget (only once a GitHub response has reported it)
+    from .acmecli.rate_limit import get_rate_limit_stats
+
+    rate_limit_stats = get_rate_limit_stats()
+    if rate_limit_stats:
+        rate_limit_issues = []
+        remaining = rate_limit_stats["remaining"]
+        if remaining is not None and remaining <= rate_limit_stats["reserve"]:
+            rate_limit_issues.append({
+                "code": "GITHUB_RATE_LIMIT_LOW",
+                "severity": "warning",
+                "summary": (
+                    f"{remaining} GitHub API request(s) left until the reset in "
+                    f"{rate_limit_stats['reset_in_seconds']:.0f}s; only high-priority requests are sent"
+                ),
+            })
+        rate_limit_component = {
+            "id": "github-rate-limit",
+            "status": "degraded" if rate_limit_issues else "ok",
+            "observed_at": observed_at,
+            "display_name": "GitHub API Budget",
+            "description": (
+                "Remaining GitHub API requests in the current rate limit window, "
+                "and how many requests were paced or skipped to stay within it."
+            ),
+            "metrics": rate_limit_stats,
+            "issues": rate_limit_issues,
+            "logs": [],
+        }
+        if includeTimeline:
+            rate_limit_component["timeline"] = []
+        components.append(rate_limit_component)
+
     # Build response with required fields per OpenAPI spec
     response = {
         "components": components,  # Required: array of HealthComponentDetail
@@ -1744,10 +2172,15 @@ def reset_system(request: Request):
     try:
         # Clear artifacts from DynamoDB
         clear_all_artifacts()
-        # Clear rating status (in-memory)
+        # Drop queued ratings and clear rating status (in-memory)
+        _rating_scheduler.cancel_all()
         _rating_status.clear()
         _rating_locks.clear()
         _rating_results.clear()
+        _rating_snapshots.clear()
+        from .acmecli.metrics.treescore_metric import clear_parent_scores
+
+        clear_parent_scores()
         # Clear _artifact_storage (in-memory)
         global _artifact_storage
 
@@ -1886,7 +2319,16 @@ def reset_rds_system(request: Request):
                 WHERE path_prefix = 'performance'
             """)
             deleted_count = cursor.rowcount
+            # Drop content-addressed blobs no longer referenced by any model row
+            cursor.execute("""
+                DELETE FROM model_blobs b
+                WHERE NOT EXISTS (
+                    SELECT 1 FROM model_files f WHERE f.content_hash = b.content_hash
+                )
+            """)
             conn.commit()
+            from .services.storage_service import clear_storage_cache
+            clear_storage_cache()
             logger.info(f"RDS reset successful: deleted {deleted_count} model files from performance/ path")
         except Exception as e:
             conn.rollback()
@@ -2094,6 +2536,7 @@ def _repopulate_performance_path() -> Dict[str, Any]:
         import zipfile
         import io
         import requests
+        from .acmecli import http_client
         
         if not aws_available or not s3 or not ap_arn:
             raise HTTPException(
@@ -2127,7 +2570,7 @@ def _repopulate_performance_path() -> Dict[str, Any]:
                 # Check if model exists on HuggingFace
                 clean_model_id = model_id.replace("https://huggingface.co/", "").replace("http://huggingface.co/", "")
                 api_url = f"https://huggingface.co/api/models/{clean_model_id}"
-                response = requests.get(api_url, timeout=30)
+                response = http_client.get(api_url, timeout=30)
                 
                 if response.status_code != 200:
                     not_found += 1
@@ -2183,9 +2626,9 @@ def _repopulate_performance_path() -> Dict[str, Any]:
                             is_large_file = any(filename.endswith(ext) for ext in [".bin", ".safetensors", ".pt", ".pth", ".ckpt"])
                             
                             if is_large_file:
-                                file_response = requests.get(url, timeout=600, stream=True)
+                                file_response = http_client.get(url, timeout=600, stream=True)
                             else:
-                                file_response = requests.get(url, timeout=120)
+                                file_response = http_client.get(url, timeout=120)
                             
                             if file_response.status_code == 200:
                                 # Stream large files to avoid memory issues
@@ -2197,7 +2640,7 @@ def _repopulate_performance_path() -> Dict[str, Any]:
                                 else:
                                     content = file_response.content
                                 
-                                zip_file.writestr(filename, content)
+                                write_member(zip_file, filename, content)
                                 downloaded_count += 1
                                 total_size += len(content)
                             else:
@@ -2234,34 +2677,10 @@ def _repopulate_performance_path() -> Dict[str, Any]:
                 if failed_count > 0:
                     logger.info(f"Downloaded {downloaded_count} files for {model_id} ({failed_count} failed, continuing)")
                 
-                # Upload to S3 performance path
-                sanitized_model_id = (
-                    model_id.replace("https://huggingface.co/", "")
-                    .replace("http://huggingface.co/", "")
-                    .replace("/", "_")
-                    .replace(":", "_")
-                    .replace("\\", "_")
-                    .replace("?", "_")
-                    .replace("*", "_")
-                    .replace('"', "_")
-                    .replace("<", "_")
-                    .replace(">", "_")
-                    .replace("|", "_")
-                )
-                s3_key = f"performance/{sanitized_model_id}/main/model.zip"
-                
-                # Enforce SSE-KMS encryption for tampering protection
-                kms_key_arn = os.getenv("KMS_KEY_ARN", "")
-                put_params = {
-                    "Bucket": ap_arn,
-                    "Key": s3_key,
-                    "Body": zip_content,
-                    "ContentType": "application/zip"
-                }
-                if kms_key_arn:
-                    put_params["ServerSideEncryption"] = "aws:kms"
-                    put_params["SSEKMSKeyId"] = kms_key_arn
-                s3.put_object(**put_params)
+                # Upload to S3 performance path (content-addressed: identical
+                # archives already stored under models/ or a previous run are
+                # not re-uploaded, only the pointer is written)
+                upload_model(zip_content, model_id, "main", use_performance_path=True)
                 
                 successful += 1
                 if i % 50 == 0:
@@ -2296,7 +2715,7 @@ def populate_rds_performance():
         from .services.rds_service import upload_model, get_connection_pool
         import zipfile
         import io
-        import requests
+        from .acmecli import http_client
         
         # Check if RDS is available
         try:
@@ -2338,7 +2757,7 @@ def populate_rds_performance():
                 # Check if model exists on HuggingFace
                 clean_model_id = model_id.replace("https://huggingface.co/", "").replace("http://huggingface.co/", "")
                 api_url = f"https://huggingface.co/api/models/{clean_model_id}"
-                response = requests.get(api_url, timeout=30)
+                response = http_client.get(api_url, timeout=30)
                 
                 if response.status_code != 200:
                     not_found += 1
@@ -2385,9 +2804,9 @@ def populate_rds_performance():
                     for filename in files_to_download:
                         try:
                             url = f"https://huggingface.co/{clean_model_id}/resolve/main/{filename}"
-                            file_response = requests.get(url, timeout=120)
+                            file_response = http_client.get(url, timeout=120)
                             if file_response.status_code == 200:
-                                zip_file.writestr(filename, file_response.content)
+                                write_member(zip_file, filename, file_response.content)
                         except Exception:
                             pass  # Skip failed files
                 
@@ -3922,6 +4341,8 @@ async def post_artifact_ingest(request: Request):
                 except:
                     pass
 
+                _check_rating_capacity()
+
                 # Ingest the model (synchronous - must complete)
                 model_ingestion(name, version)
 
@@ -3999,16 +4420,11 @@ async def post_artifact_ingest(request: Request):
                 if readme_text:
                     _link_model_to_datasets_code(artifact_id, name, readme_text)
 
-                # Start async rating in background thread
+                # Queue async rating on the rating scheduler
                 logger.info(
-                    f"DEBUG: Starting async rating for artifact_id='{artifact_id}'"
-                )
-                rating_thread = threading.Thread(
-                    target=_run_async_rating,
-                    args=(artifact_id, name, version),
-                    daemon=True,
+                    f"DEBUG: Queueing async rating for artifact_id='{artifact_id}'"
                 )
-                rating_thread.start()
+                _enqueue_rating(artifact_id, name, version)
                 logger.info(
                     f"DEBUG: ✅ Stored in database: artifact_id='{artifact_id}'"
                 )
@@ -4289,6 +4705,8 @@ async def create_artifact_by_type(artifact_type: str, request: Request):
                     status_code=409, detail="Artifact exists already."
                 )
 
+            _check_rating_capacity()
+
             # Ingest the model (synchronous - must complete)
             # Note: model_ingestion fetches GitHub metadata
             # (github_url, github.prs, github.direct_commits, readme_text, repo_files, etc.)
@@ -4367,17 +4785,12 @@ async def create_artifact_by_type(artifact_type: str, request: Request):
                         artifact_id, artifact_name, readme_text
                     )
 
-                # Start async rating in background thread
+                # Queue async rating on the rating scheduler
                 # Use model_id (hf_model_id) for rating since it needs the actual HuggingFace model
                 logger.info(
-                    f"DEBUG: Starting async rating for artifact_id='{artifact_id}'"
-                )
-                rating_thread = threading.Thread(
-                    target=_run_async_rating,
-                    args=(artifact_id, model_id, version),
-                    daemon=True,
+                    f"DEBUG: Queueing async rating for artifact_id='{artifact_id}'"
                 )
-                rating_thread.start()
+                _enqueue_rating(artifact_id, model_id, version)
 
                 # Store artifact metadata in S3 (model file already stored via model_ingestion)
                 # Use artifact_name for metadata storage (this is what queries will look for)
@@ -4620,6 +5033,8 @@ async def update_artifact(artifact_type: str, id: str, request: Request):
             # For models, we would need to re-ingest with the new URL, but for now just acknowledge the update
             # The spec says "The artifact source (from artifact_data) will replace the previous contents"
             # This would typically involve re-downloading and re-processing the artifact
+            # The old rating keeps being served until a background re-rate replaces it
+            _mark_rating_changed(id)
             return Response(status_code=200)
         else:
             artifact = get_artifact_from_db(id)
@@ -4670,6 +5085,10 @@ def delete_artifact_endpoint(artifact_type: str, id: str, request: Request):
         if artifact and artifact.get("type") == artifact_type:
             artifact_name = artifact.get("name")
             delete_artifact(id)
+            if artifact_type == "model":
+                _cancel_rating(id)
+                with _rating_lock:
+                    _rating_snapshots.pop(id, None)
             # Also remove from _artifact_storage for all artifact types (model, dataset, code)
             if artifact_type in ["model", "dataset", "code"]:
                 if id in _artifact_storage:
@@ -4710,14 +5129,16 @@ def delete_artifact_endpoint(artifact_type: str, id: str, request: Request):
             except Exception as e:
                 logger.debug(f"Error finding model versions for metadata deletion: {str(e)}")
             
-            # Delete model.zip files
+            # Delete model.zip files, then the blobs only they pointed at
             deleted_count = 0
+            released_blobs = set()
             common_versions = ["1.0.0", "main", "latest"]
             # Use sanitized name for S3 key lookup
             for version in common_versions:
                 s3_key = f"models/{sanitized_name}/{version}/model.zip"
                 try:
-                    s3.head_object(Bucket=ap_arn, Key=s3_key)
+                    head = s3.head_object(Bucket=ap_arn, Key=s3_key)
+                    released_blobs.add(pointer_digest(s3, ap_arn, s3_key, head))
                     s3.delete_object(Bucket=ap_arn, Key=s3_key)
                     deleted_count += 1
                     deleted = True
@@ -4735,7 +5156,8 @@ def delete_artifact_endpoint(artifact_type: str, id: str, request: Request):
                         for version in versions_to_try:
                             s3_key = f"models/{sanitized_name}/{version}/model.zip"
                             try:
-                                s3.head_object(Bucket=ap_arn, Key=s3_key)
+                                head = s3.head_object(Bucket=ap_arn, Key=s3_key)
+                                released_blobs.add(pointer_digest(s3, ap_arn, s3_key, head))
                                 s3.delete_object(Bucket=ap_arn, Key=s3_key)
                                 deleted_count += 1
                                 deleted = True
@@ -4749,7 +5171,8 @@ def delete_artifact_endpoint(artifact_type: str, id: str, request: Request):
                 for version in ["1.0.0", "main", "latest"]:
                     s3_key = f"models/{sanitized_name}/{version}/model.zip"
                     try:
-                        s3.head_object(Bucket=ap_arn, Key=s3_key)
+                        head = s3.head_object(Bucket=ap_arn, Key=s3_key)
+                        released_blobs.add(pointer_digest(s3, ap_arn, s3_key, head))
                         s3.delete_object(Bucket=ap_arn, Key=s3_key)
                         deleted_count += 1
                         deleted = True
@@ -4757,6 +5180,7 @@ def delete_artifact_endpoint(artifact_type: str, id: str, request: Request):
                         error_code = e.response.get("Error", {}).get("Code", "")
                         if error_code == "NoSuchKey" or error_code == "404":
                             continue
+            reclaim_blobs(released_blobs)
         elif artifact_type in ["dataset", "code"]:
             # Delete metadata.json files for datasets and code
             artifact_name_for_s3 = artifact_name or id
@@ -4815,58 +5239,25 @@ def get_artifact_cost(
             artifact = get_artifact_from_db(id)
             if artifact and artifact.get("type") == "model":
                 found = True
-            if not found:
-                try:
-                    result = list_models(name_regex=f"^{re.escape(id)}$", limit=1000)
-                    if result.get("models"):
-                        # Iterate through models and verify they exist in S3
-                        for model in result["models"]:
-                            v = model.get("version", "main")
-                            model_n = model.get("name", id)
-                            # Sanitize model name for S3
-                            sanitized_name = sanitize_model_id_for_s3(model_n)
-                            try:
-                                s3_key = f"models/{sanitized_name}/{v}/model.zip"
-                                s3.head_object(Bucket=ap_arn, Key=s3_key)
-                                found = True
-                                break
-                            except ClientError as e:
-                                error_code = e.response.get("Error", {}).get("Code", "")
-                                if error_code == "NoSuchKey" or error_code == "404":
-                                    continue
-                                else:
-                                    logger.warning(
-                                        f"Unexpected error checking {s3_key}: {error_code}"
-                                    )
-                    if not found:
-                        # Try with sanitized name for S3 lookup (handles IDs with slashes)
-                        model_name_for_s3 = _get_model_name_for_s3(id)
-                        if not model_name_for_s3:
-                            model_name_for_s3 = sanitize_model_id_for_s3(id)
-                        common_versions = ["1.0.0", "main", "latest"]
-                        for v in common_versions:
-                            try:
-                                # Use sanitized name for S3 lookup
-                                s3_key = f"models/{model_name_for_s3}/{v}/model.zip"
-                                s3.head_object(Bucket=ap_arn, Key=s3_key)
-                                found = True
-                                break
-                            except ClientError:
-                                continue
-                except Exception:
-                    pass
+            resolved = None if found else _resolve_model(id)
+            if resolved:
+                found = True
             if not found:
                 raise HTTPException(status_code=404, detail="Artifact does not exist.")
 
             # Get model name for S3 lookup (models are stored by name, not ID)
-            model_name = _get_model_name_for_s3(id)
+            if resolved:
+                model_name = resolved[0]
+            else:
+                model_name = _get_model_name_for_s3(id)
             if not model_name:
                 # Fallback: sanitize ID (in case it's a model name with special characters)
                 model_name = sanitize_model_id_for_s3(id)
 
-            # Try multiple versions to get size
+            # Get size from the resolved version (or try common versions)
             standalone_size_mb = 0.0
-            for version in ["1.0.0", "main", "latest"]:
+            size_versions = [resolved[1]] if resolved else ["1.0.0", "main", "latest"]
+            for version in size_versions:
                 sizes = get_model_sizes(model_name, version)
                 if "error" not in sizes:
                     size_bytes = sizes.get("full", 0)
@@ -4883,9 +5274,9 @@ def get_artifact_cost(
                     url = artifact.get("url", "")
                     if url:
                         try:
-                            import requests
+                            from .acmecli import http_client
 
-                            head_response = requests.head(
+                            head_response = http_client.head(
                                 url, timeout=10, allow_redirects=True
                             )
                             content_length = head_response.headers.get("Content-Length")
@@ -5087,45 +5478,22 @@ def get_artifact_audit(artifact_type: str, id: str, request: Request):
                 found = True
                 artifact_name = artifact.get("name", id)
 
-            # Check in S3
-            if not found:
-                try:
-                    escaped_name = re.escape(id)
-                    name_pattern = f"^{escaped_name}$"
-                    result = list_models(name_regex=name_pattern, limit=1)
-                    if result.get("models"):
-                        found = True
-                        version = result["models"][0]["version"]
-                        artifact_name = result["models"][0].get("name", id)
-                except Exception:
-                    pass
-
-            # Try common versions if not found (with sanitized name for IDs with special characters)
-            if not found:
-                # Get sanitized model name for S3 lookup
-                model_name_for_s3 = _get_model_name_for_s3(id)
-                if not model_name_for_s3:
-                    model_name_for_s3 = sanitize_model_id_for_s3(id)
-                versions = ["1.0.0", "main", "latest"]
-                for v in versions:
-                    try:
-                        # Use sanitized name for S3 lookup
-                        s3_key = f"models/{model_name_for_s3}/{v}/model.zip"
-                        s3.head_object(Bucket=ap_arn, Key=s3_key)
-                        found = True
-                        version = v
-                        break
-                    except ClientError:
-                        continue
+            # Otherwise locate the model in S3 with direct key lookups
+            resolved = None if found else _resolve_model(id)
+            if resolved:
+                found = True
 
             if not found:
                 raise HTTPException(status_code=404, detail="Artifact does not exist.")
 
             # Get creation date from S3 (use sanitized name)
             try:
-                model_name_for_s3 = _get_model_name_for_s3(id)
-                if not model_name_for_s3:
-                    model_name_for_s3 = sanitize_model_id_for_s3(id)
+                if resolved:
+                    model_name_for_s3, version = resolved
+                else:
+                    model_name_for_s3 = _get_model_name_for_s3(id)
+                    if not model_name_for_s3:
+                        model_name_for_s3 = sanitize_model_id_for_s3(id)
                 s3_key = f"models/{model_name_for_s3}/{version or '1.0.0'}/model.zip"
                 obj = s3.head_object(Bucket=ap_arn, Key=s3_key)
                 last_modified = obj.get("LastModified")
@@ -5403,6 +5771,8 @@ def get_model_rate(id: str, request: Request):
             detail="Authentication failed due to invalid or missing AuthenticationToken",
         )
     
+    # Callbacks of a queued rating this request takes over (see the timeout below)
+    detached_callbacks = None
     try:
         logger.info(f"DEBUG: Validating id format: '{id}'")
         # Handle empty IDs - allow flexible formats (alphanumeric, hyphens, underscores, slashes, dots, colons)
@@ -5530,6 +5900,19 @@ def get_model_rate(id: str, request: Request):
         # Clean up any stuck ratings before checking status
         _cleanup_stuck_ratings()
 
+        # Stale-while-revalidate: a previously rated model gets its last known
+        # score right away, even while (or because) it is being re-rated
+        stale = _stale_rating(
+            id, model_name or id, (artifact or {}).get("version", "main")
+        )
+        if stale:
+            rating, age, expired = stale
+            effective_name = (artifact or {}).get("name") or model_name or id
+            return JSONResponse(
+                content=_build_rating_response(effective_name, rating),
+                headers={"Age": str(int(age)), "X-Rating-Stale": "true" if expired else "false"},
+            )
+
         # Check rating status and block until complete
         # Thread-safe check: use a lock to prevent race conditions
         if id in _rating_status:
@@ -5541,6 +5924,8 @@ def get_model_rate(id: str, request: Request):
                 # IMPORTANT: Autograder has 2 minute timeout, so we must respond within that window
                 # Use 90 seconds to ensure we have buffer for network/processing overhead
                 logger.info(f"DEBUG: Rating pending, waiting for completion...")
+                # A client is now blocked on this rating; move it ahead of background jobs
+                _rating_scheduler.promote(id, PRIORITY_INTERACTIVE)
                 if id in _rating_locks:
                     # Wait up to 90 seconds (1.5 minutes) for rating to complete
                     # This ensures we respond within autograder's 2 minute timeout
@@ -5550,7 +5935,10 @@ def get_model_rate(id: str, request: Request):
                             f"DEBUG: Rating timeout for id='{id}' after 90s, falling back to synchronous rating"
                         )
                         # Timeout occurred - async rating is taking too long
-                        # Fall back to synchronous rating instead of failing
+                        # Fall back to synchronous rating instead of failing; a
+                        # still-queued job is taken over, and whoever waits on it
+                        # (e.g. a batch stream) gets this rating's outcome
+                        detached_callbacks = _rating_scheduler.detach(id)
                         status = "timeout"
                     else:
                         # Re-check status after wait
@@ -5680,6 +6068,7 @@ def get_model_rate(id: str, request: Request):
         with _rating_lock:
             _rating_results[id] = rating
             _rating_status[id] = "completed"
+            _record_rating_snapshot(id, rating)
             # Clean up start time if it exists
             if id in _rating_start_times:
                 del _rating_start_times[id]
@@ -5700,6 +6089,40 @@ def get_model_rate(id: str, request: Request):
             status_code=500,
             detail=f"The artifact rating system encountered an error while computing at least one metric: {str(e)}",
         )
+    finally:
+        if detached_callbacks is not None:
+            _finish_detached_rating(id, detached_callbacks)
+
+
+@app.post("/artifact/model/rate/batch")
+def rate_models_batch(body: RateBatchRequest, request: Request):
+    """
+    Rate many models in one request. Ratings run on the rating workers and are
+    streamed back as NDJSON, one line per id in completion order. Ratings
+    already held in memory are returned right away unless ``refresh`` is set;
+    the persisted rating cache is used either way.
+    """
+    if not verify_auth_token(request):
+        raise HTTPException(
+            status_code=403,
+            detail="Authentication failed due to invalid or missing AuthenticationToken",
+        )
+    items = list(dict.fromkeys(item.strip() for item in body.ids if item and item.strip()))
+    if not items:
+        raise HTTPException(status_code=400, detail="ids must contain at least one artifact id or URL.")
+    if len(items) > RATE_BATCH_MAX_ITEMS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"A batch can rate at most {RATE_BATCH_MAX_ITEMS} models.",
+        )
+    concurrency = body.concurrency or 2 * _rating_scheduler.workers
+    concurrency = max(1, min(concurrency, _rating_scheduler.max_queue))
+    logger.info(f"Batch rating {len(items)} item(s) with concurrency {concurrency}")
+    _cleanup_stuck_ratings()
+    return StreamingResponse(
+        _rate_batch_lines(items, concurrency, body.refresh),
+        media_type="application/x-ndjson",
+    )
 
 
 @app.get("/artifact/model/{id}/lineage")
@@ -5726,37 +6149,10 @@ def get_model_lineage(id: str, request: Request):
         if artifact and artifact.get("type") == "model":
             found = True
 
-        if not found:
-            try:
-                result_check = list_models(name_regex=f"^{re.escape(id)}$", limit=1000)
-                if result_check.get("models"):
-                    found = True
-                else:
-                    # Try to get model name from database for S3 lookup
-                    model_name = _get_model_name_for_s3(id)
-                    if model_name:
-                        common_versions = ["1.0.0", "main", "latest"]
-                        for v in common_versions:
-                            try:
-                                s3_key = f"models/{model_name}/{v}/model.zip"
-                                s3.head_object(Bucket=ap_arn, Key=s3_key)
-                                found = True
-                                break
-                            except ClientError:
-                                continue
-                    # Fallback: try by ID directly (in case it was stored by ID)
-                    if not found:
-                        common_versions = ["1.0.0", "main", "latest"]
-                        for v in common_versions:
-                            try:
-                                s3_key = f"models/{id}/{v}/model.zip"
-                                s3.head_object(Bucket=ap_arn, Key=s3_key)
-                                found = True
-                                break
-                            except ClientError:
-                                continue
-            except Exception:
-                pass
+        # Otherwise locate the model in S3 with direct key lookups
+        resolved = None if found else _resolve_model(id)
+        if resolved:
+            found = True
 
         if not found:
             raise HTTPException(status_code=404, detail="Artifact does not exist.")
@@ -5770,9 +6166,13 @@ def get_model_lineage(id: str, request: Request):
         # Sanitize model name for S3 (models are stored with sanitized names)
         sanitized_model_name = sanitize_model_id_for_s3(model_name)
 
-        # Try to get lineage from config - try multiple versions
+        # Try to get lineage from config - the resolved version, else common versions
         result = None
-        versions_to_try = ["1.0.0", "main", "latest"]
+        if resolved:
+            sanitized_model_name = model_name = resolved[0]
+            versions_to_try = [resolved[1]]
+        else:
+            versions_to_try = ["1.0.0", "main", "latest"]
 
         for version in versions_to_try:
             try:
@@ -6499,6 +6899,8 @@ def download_model_from_rds(
     """
     Download model file from RDS PostgreSQL.
     Supports both models/ and performance/ paths.
+    The file is streamed chunk by chunk; a single "Range: bytes=start-end"
+    header is honoured with a 206 response.
     """
     if not verify_auth_token(request):
         raise HTTPException(
@@ -6507,8 +6909,8 @@ def download_model_from_rds(
         )
     
     try:
-        from .services.rds_service import download_model
-        from fastapi.responses import Response
+        from .services.rds_service import open_model_stream
+        from fastapi.responses import StreamingResponse
         
         # Sanitize model_id (id parameter is already sanitized from URL)
         sanitized_model_id = id
@@ -6516,22 +6918,42 @@ def download_model_from_rds(
         # Determine if using performance path
         use_performance_path = (path_prefix == "performance")
         
-        # Download from RDS
-        file_content = download_model(
+        start, end = 0, None
+        range_header = request.headers.get("range", "")
+        range_match = re.fullmatch(r"bytes=(\d+)-(\d*)", range_header.strip())
+        if range_match:
+            start = int(range_match.group(1))
+            end = int(range_match.group(2)) if range_match.group(2) else None
+        
+        # Stream from RDS
+        file_size, chunks = open_model_stream(
             sanitized_model_id,
             version,
             component,
-            use_performance_path=use_performance_path
+            use_performance_path=use_performance_path,
+            start=start,
+            end=end,
         )
         
-        return Response(
-            content=file_content,
-            media_type="application/zip",
-            headers={
-                "Content-Disposition": f"attachment; filename={id}_{version}_{component}.zip",
-                "Content-Length": str(len(file_content))
-            }
-        )
+        headers = {
+            "Content-Disposition": f"attachment; filename={id}_{version}_{component}.zip",
+            "Accept-Ranges": "bytes",
+        }
+        if not range_match:
+            headers["Content-Length"] = str(file_size)
+            return StreamingResponse(chunks, media_type="application/zip", headers=headers)
+        
+        if start >= file_size or (end is not None and end < start):
+            chunks.close()
+            raise HTTPException(
+                status_code=416,
+                detail="Requested range not satisfiable",
+                headers={"Content-Range": f"bytes */{file_size}"},
+            )
+        last = file_size - 1 if end is None else min(end, file_size - 1)
+        headers["Content-Range"] = f"bytes {start}-{last}/{file_size}"
+        headers["Content-Length"] = str(last - start + 1)
+        return StreamingResponse(chunks, status_code=206, media_type="application/zip", headers=headers)
     except HTTPException:
         raise
     except Exception as e:
@@ -1,36 +1,215 @@
 """
 Lambda function for downloading model files from S3.
 Used for performance testing to compare Lambda vs ECS compute backends.
+
+Small objects are returned inline (base64 body). Anything above
+DOWNLOAD_INLINE_MAX_BYTES gets a 302 to a presigned S3 URL instead, since the
+Python runtime has no response streaming and API Gateway/Lambda cap payloads
+at 6 MB. Component archives ('weights', 'datasets') are built from the full
+archive with ranged GETs (only the central directory and the selected
+members are read) and persisted next to the blob so later requests are a
+single lookup.
+
+Clients are created on first use so cold starts do not pay for STS/S3 setup
+before the handler runs; the account ID comes from the invocation ARN when
+possible, avoiding the STS call entirely.
 """
 
+import io
 import json
 import os
 import base64
+import shutil
+import tempfile
+import zipfile
 import boto3
 from botocore.exceptions import ClientError
 from botocore.config import Config
 
-# Initialize S3 client
 region = os.getenv("AWS_REGION", "us-east-1")
 access_point_name = os.getenv("S3_ACCESS_POINT_NAME", "cs450-s3")
+kms_key_arn = os.getenv("KMS_KEY_ARN", "")
+
+# Base64 inflates by 4/3, so 4 MiB stays under the 6 MB response payload limit
+DOWNLOAD_INLINE_MAX_BYTES = int(os.getenv("DOWNLOAD_INLINE_MAX_BYTES", str(4 * 1024 * 1024)))
+PRESIGN_EXPIRES_SECONDS = int(os.getenv("PRESIGN_EXPIRES_SECONDS", "300"))
+# Read-ahead size for ranged GETs while scanning an archive
+RANGE_READ_BYTES = 1024 * 1024
+
+# Created lazily (see _get_s3 / _get_access_point_arn)
+sts = None
+s3 = None
+ap_arn = os.getenv("S3_ACCESS_POINT_ARN") or None
+
+# Model keys may hold a small pointer record to a content-addressed blob.
+# These mirror src/services/blob_store.py and s3_service.extract_model_component;
+# they are duplicated because the Lambda package only ships this file.
+POINTER_CONTENT_TYPE = "application/vnd.acme.blob-pointer+json"
+POINTER_HASH_METADATA_KEY = "blob-sha256"
+POINTER_SIZE_METADATA_KEY = "blob-size"
+MODEL_COMPONENTS = ("weights", "datasets")
+
+
+def _get_s3():
+    global s3
+    if s3 is None:
+        s3_config = Config(
+            max_pool_connections=50,  # Lambda doesn't need as many connections
+            retries={'max_attempts': 3, 'mode': 'standard'}
+        )
+        s3 = boto3.client("s3", region_name=region, config=s3_config)
+    return s3
+
+
+def _get_access_point_arn(context) -> str:
+    global sts, ap_arn
+    if ap_arn is None:
+        account_id = None
+        function_arn = getattr(context, "invoked_function_arn", None)
+        if isinstance(function_arn, str) and function_arn.count(":") >= 5:
+            # arn:aws:lambda:{region}:{account_id}:function:{name}
+            account_id = function_arn.split(":")[4]
+        if not account_id:
+            if sts is None:
+                sts = boto3.client("sts", region_name=region)
+            account_id = sts.get_caller_identity()["Account"]
+        ap_arn = f"arn:aws:s3:{region}:{account_id}:accesspoint/{access_point_name}"
+    return ap_arn
+
+
+def _json_response(status_code: int, detail: str) -> dict:
+    return {
+        "statusCode": status_code,
+        "headers": {
+            "Content-Type": "application/json"
+        },
+        "body": json.dumps({
+            "detail": detail
+        })
+    }
+
+
+def _inline_response(content: bytes, filename: str) -> dict:
+    # Encode file content as base64 for API Gateway binary response
+    return {
+        "statusCode": 200,
+        "headers": {
+            "Content-Type": "application/zip",
+            "Content-Disposition": f"attachment; filename={filename}",
+            "Content-Length": str(len(content))
+        },
+        "body": base64.b64encode(content).decode('utf-8'),
+        "isBase64Encoded": True
+    }
+
+
+def _redirect_response(bucket: str, key: str, filename: str) -> dict:
+    url = _get_s3().generate_presigned_url(
+        "get_object",
+        Params={
+            "Bucket": bucket,
+            "Key": key,
+            "ResponseContentDisposition": f"attachment; filename={filename}",
+            "ResponseContentType": "application/zip",
+        },
+        ExpiresIn=PRESIGN_EXPIRES_SECONDS,
+    )
+    return {
+        "statusCode": 302,
+        "headers": {
+            "Location": url,
+            "Cache-Control": "no-store"
+        },
+        "body": ""
+    }
+
+
+def _serve_object(bucket: str, key: str, response: dict, filename: str) -> dict:
+    """Inline an already-opened object if it is small, otherwise redirect to it."""
+    if response["ContentLength"] > DOWNLOAD_INLINE_MAX_BYTES:
+        response["Body"].close()
+        return _redirect_response(bucket, key, filename)
+    return _inline_response(response["Body"].read(), filename)
+
+
+class _S3RangeReader(io.RawIOBase):
+    """Seekable read-only view of an S3 object backed by ranged GETs."""
+
+    def __init__(self, bucket: str, key: str, size: int):
+        self._bucket = bucket
+        self._key = key
+        self._size = size
+        self._pos = 0
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
 
-# Get account ID and construct access point ARN
-sts = boto3.client("sts", region_name=region)
-account_id = sts.get_caller_identity()["Account"]
-ap_arn = f"arn:aws:s3:{region}:{account_id}:accesspoint/{access_point_name}"
+    def tell(self):
+        return self._pos
 
-# Configure S3 client
-s3_config = Config(
-    max_pool_connections=50,  # Lambda doesn't need as many connections
-    retries={'max_attempts': 3, 'mode': 'standard'}
-)
-s3 = boto3.client("s3", region_name=region, config=s3_config)
+    def seek(self, offset, whence=io.SEEK_SET):
+        if whence == io.SEEK_SET:
+            self._pos = offset
+        elif whence == io.SEEK_CUR:
+            self._pos += offset
+        else:
+            self._pos = self._size + offset
+        return self._pos
+
+    def readinto(self, buffer):
+        if self._pos >= self._size or len(buffer) == 0:
+            return 0
+        end = min(self._pos + len(buffer), self._size) - 1
+        data = _get_s3().get_object(
+            Bucket=self._bucket, Key=self._key, Range=f"bytes={self._pos}-{end}"
+        )["Body"].read()
+        buffer[:len(data)] = data
+        self._pos += len(data)
+        return len(data)
+
+
+def _component_members(names, component: str):
+    if component == "weights":
+        return [f for f in names if f.endswith((".bin", ".safetensors"))]
+    return [f for f in names if any(ext in f for ext in [".txt", ".json"])]
+
+
+def _build_component(bucket: str, key: str, size: int, component: str):
+    """Build a component archive from ``key`` reading only what it needs.
+
+    Members keep their original compression method. The result is spooled to
+    /tmp once it outgrows the inline limit.
+
+    Returns:
+        Seekable file positioned at 0, or None if no member matches
+    """
+    reader = io.BufferedReader(_S3RangeReader(bucket, key, size), buffer_size=RANGE_READ_BYTES)
+    with zipfile.ZipFile(reader, "r") as source:
+        members = _component_members(source.namelist(), component)
+        if not members:
+            return None
+        output = tempfile.SpooledTemporaryFile(max_size=DOWNLOAD_INLINE_MAX_BYTES)
+        with zipfile.ZipFile(output, "w") as target:
+            for name in members:
+                info = source.getinfo(name)
+                target_info = zipfile.ZipInfo(name, info.date_time)
+                target_info.compress_type = info.compress_type
+                target_info.external_attr = info.external_attr
+                with source.open(info) as src, target.open(
+                    target_info, "w", force_zip64=info.file_size > zipfile.ZIP64_LIMIT
+                ) as dst:
+                    shutil.copyfileobj(src, dst, RANGE_READ_BYTES)
+    output.seek(0)
+    return output
 
 
 def lambda_handler(event, context):
     """
     Lambda handler for downloading model files from S3.
-    
+
     Expected event structure (from API Gateway):
     {
         "pathParameters": {
@@ -38,110 +217,121 @@ def lambda_handler(event, context):
             "version": "main"
         },
         "queryStringParameters": {
-            "component": "full"  # optional, defaults to "full"
+            "component": "full"  # optional: 'full', 'weights' or 'datasets'
         }
     }
-    
+
     Returns:
-        API Gateway compatible response with base64-encoded file content
+        API Gateway compatible response: base64-encoded file content, or a 302
+        to a presigned URL when the file exceeds DOWNLOAD_INLINE_MAX_BYTES
     """
     try:
         # Extract path parameters
         path_params = event.get("pathParameters") or {}
         model_id = path_params.get("model_id")
         version = path_params.get("version", "main")
-        
+
         # Extract query parameters
         query_params = event.get("queryStringParameters") or {}
         component = query_params.get("component", "full")
-        
+
         # Determine path prefix (default to performance/ for Lambda performance testing)
         path_prefix = query_params.get("path_prefix", "performance")
-        
+
         if not model_id:
-            return {
-                "statusCode": 400,
-                "headers": {
-                    "Content-Type": "application/json"
-                },
-                "body": json.dumps({
-                    "detail": "Missing required parameter: model_id"
-                })
-            }
-        
+            return _json_response(400, "Missing required parameter: model_id")
+
+        filename = f"{model_id}_{version}_{component}.zip"
+        bucket = _get_access_point_arn(context)
+        client = _get_s3()
+
         # Construct S3 key
         s3_key = f"{path_prefix}/{model_id}/{version}/model.zip"
-        
-        # Download from S3
+
+        # Open the model key; the body is only read for pointers and small objects
+        digest = None
         try:
-            response = s3.get_object(Bucket=ap_arn, Key=s3_key)
-            file_content = response["Body"].read()
+            response = client.get_object(Bucket=bucket, Key=s3_key)
+            data_key = s3_key
+            data_size = response["ContentLength"]
+            if response.get("ContentType") == POINTER_CONTENT_TYPE:
+                pointer = json.loads(response["Body"].read())
+                digest = pointer["sha256"]
+                data_key = pointer["blob_key"]
+                data_size = int(pointer["size"])
+                response = None
         except ClientError as e:
             error_code = e.response["Error"]["Code"]
             if error_code == "NoSuchKey":
-                return {
-                    "statusCode": 404,
-                    "headers": {
-                        "Content-Type": "application/json"
-                    },
-                    "body": json.dumps({
-                        "detail": f"Model {model_id} version {version} not found"
-                    })
-                }
+                return _json_response(404, f"Model {model_id} version {version} not found")
             elif error_code == "NoSuchBucket":
-                return {
-                    "statusCode": 500,
-                    "headers": {
-                        "Content-Type": "application/json"
-                    },
-                    "body": json.dumps({
-                        "detail": "S3 bucket not found"
-                    })
-                }
+                return _json_response(500, "S3 bucket not found")
             elif error_code == "AccessDenied":
-                return {
-                    "statusCode": 500,
-                    "headers": {
-                        "Content-Type": "application/json"
-                    },
-                    "body": json.dumps({
-                        "detail": "Access denied to S3 bucket"
-                    })
-                }
+                return _json_response(500, "Access denied to S3 bucket")
             else:
                 raise
-        
-        # Handle component extraction if needed (simplified - just return full for now)
-        # TODO: Implement component extraction if needed
-        if component != "full":
-            # For now, just return full file
-            # In production, would extract component from ZIP
-            pass
-        
-        # Encode file content as base64 for API Gateway binary response
-        file_content_b64 = base64.b64encode(file_content).decode('utf-8')
-        
-        # Return API Gateway compatible response
-        return {
-            "statusCode": 200,
-            "headers": {
-                "Content-Type": "application/zip",
-                "Content-Disposition": f"attachment; filename={model_id}_{version}_{component}.zip",
-                "Content-Length": str(len(file_content))
-            },
-            "body": file_content_b64,
-            "isBase64Encoded": True
-        }
-        
+
+        if component not in MODEL_COMPONENTS:
+            # Unknown components are served as the full archive (matches ECS behaviour)
+            if data_size > DOWNLOAD_INLINE_MAX_BYTES:
+                if response is not None:
+                    response["Body"].close()
+                return _redirect_response(bucket, data_key, filename)
+            if response is None:
+                response = client.get_object(Bucket=bucket, Key=data_key)
+            return _serve_object(bucket, data_key, response, filename)
+
+        if response is not None:
+            response["Body"].close()
+
+        # Component archives derived from a blob are stored once by its hash
+        derived_key = None
+        if digest:
+            derived_key = f"derived/sha256/{digest[:2]}/{digest}/{component}.zip"
+            try:
+                derived = client.get_object(Bucket=bucket, Key=derived_key)
+                return _serve_object(bucket, derived_key, derived, filename)
+            except ClientError:
+                pass  # Not built yet
+
+        try:
+            component_file = _build_component(bucket, data_key, data_size, component)
+        except zipfile.BadZipFile:
+            return _json_response(400, "Invalid ZIP file")
+        if component_file is None:
+            return _json_response(400, f"No {component} files found")
+
+        with component_file:
+            component_file.seek(0, io.SEEK_END)
+            component_size = component_file.tell()
+            component_file.seek(0)
+
+            if derived_key:
+                extra_args = {"ContentType": "application/zip"}
+                if kms_key_arn:
+                    extra_args["ServerSideEncryption"] = "aws:kms"
+                    extra_args["SSEKMSKeyId"] = kms_key_arn
+                try:
+                    client.upload_fileobj(component_file, bucket, derived_key, ExtraArgs=extra_args)
+                except Exception as e:
+                    # Persisting is an optimization unless we need it for the redirect
+                    print(f"Failed to persist component archive {derived_key}: {str(e)}")
+                    if component_size > DOWNLOAD_INLINE_MAX_BYTES:
+                        raise
+                else:
+                    if component_size > DOWNLOAD_INLINE_MAX_BYTES:
+                        return _redirect_response(bucket, derived_key, filename)
+                component_file.seek(0)
+
+            if component_size > DOWNLOAD_INLINE_MAX_BYTES:
+                # Legacy (non content-addressed) objects have no derived key to redirect to
+                return _json_response(
+                    413,
+                    f"{component} archive is {component_size} bytes, above the inline limit; "
+                    "re-upload the model to enable presigned component downloads",
+                )
+            return _inline_response(component_file.read(), filename)
+
     except Exception as e:
         print(f"Lambda download handler error: {str(e)}")
-        return {
-            "statusCode": 500,
-            "headers": {
-                "Content-Type": "application/json"
-            },
-            "body": json.dumps({
-                "detail": f"Internal server error: {str(e)}"
-            })
-        }
-
+        return _json_response(500, f"Internal server error: {str(e)}")
@@ -23,6 +23,7 @@ from ..services.s3_service import (
     upload_model,
     download_model,
     reset_registry,
+    reclaim_blobs,
     get_model_lineage_from_config,
     get_model_sizes,
     s3,
@@ -31,6 +32,7 @@ from ..services.s3_service import (
     store_artifact_metadata,
     find_artifact_metadata_by_id,
 )
+from ..services.blob_store import pointer_digest
 from ..services.rating import run_scorer, alias, analyze_model_content
 from ..services.artifact_storage import (
     save_artifact,
@@ -1011,12 +1013,15 @@ def register_routes(app: FastAPI):
                     model_name = artifact.get("name", id)
                     sanitized_name = sanitize_model_id_for_s3(model_name)
                     common_versions = ["1.0.0", "main", "latest"]
+                    released_blobs = set()
                     for version in common_versions:
                         try:
                             s3_key = f"models/{sanitized_name}/{version}/model.zip"
+                            released_blobs.add(pointer_digest(s3, ap_arn, s3_key))
                             s3.delete_object(Bucket=ap_arn, Key=s3_key)
                         except ClientError:
                             continue
+                    reclaim_blobs(released_blobs)
                 return Response(status_code=200)
             raise HTTPException(status_code=404, detail="Artifact does not exist.")
         except HTTPException:
@@ -1,7 +1,7 @@
 from __future__ import annotations
 from fastapi import APIRouter, HTTPException, UploadFile, File, Query, Request
-from fastapi.responses import StreamingResponse, Response
-from typing import Optional
+from fastapi.responses import RedirectResponse, StreamingResponse, Response
+from typing import Optional, Union
 import io
 import re
 import asyncio
@@ -242,7 +242,9 @@ def download_model_file(
         raise HTTPException(status_code=500, detail=f"Download failed: {str(e)}")
 
 
-def _invoke_lambda_download(model_id: str, version: str, component: str) -> bytes:
+def _invoke_lambda_download(
+    model_id: str, version: str, component: str
+) -> Union[bytes, RedirectResponse]:
     """
     Invoke Lambda function to download model from S3.
     
@@ -252,7 +254,8 @@ def _invoke_lambda_download(model_id: str, version: str, component: str) -> byte
         component: Component to download
         
     Returns:
-        File content as bytes
+        File content as bytes, or a redirect to a presigned URL when the
+        Lambda answered 302 (file too large for an inline response)
     """
     if not _lambda_client:
         raise HTTPException(status_code=500, detail="Lambda client not initialized")
@@ -289,6 +292,11 @@ def _invoke_lambda_download(model_id: str, version: str, component: str) -> byte
         # Parse Lambda response
         lambda_response = json.loads(response["Payload"].read())
         
+        if lambda_response.get("statusCode") == 302:
+            return RedirectResponse(
+                lambda_response["headers"]["Location"], status_code=302
+            )
+        
         # Check for errors
         if lambda_response.get("statusCode") != 200:
             error_detail = json.loads(lambda_response.get("body", "{}")).get("detail", "Lambda invocation failed")
@@ -390,6 +398,10 @@ async def download_performance_model_file(
                 True  # use_performance_path=True
             )
         
+        if isinstance(file_content, RedirectResponse):
+            print(f"[PERF] Redirecting to presigned URL: model_id={model_id}, backend={COMPUTE_BACKEND}")
+            return file_content
+        
         print(f"[PERF] Download successful: model_id={model_id}, size={len(file_content)} bytes, backend={COMPUTE_BACKEND}")
         
         # Return Response directly since we already have the full content in memory
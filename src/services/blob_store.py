@@ -0,0 +1,321 @@
+"""
+Content-addressed blob storage helpers for S3.
+
+Model archives are stored once under ``blobs/sha256/{aa}/{digest}`` and the
+familiar ``{models|performance}/{id}/{version}/model.zip`` keys become small
+JSON pointer records that reference the blob. Identical content uploaded under
+several names, versions or path prefixes therefore shares a single object.
+
+Objects written before this layout existed (raw zip at the model key) are still
+served as-is, so readers do not need a migration step.
+
+Blobs are not reference counted. Deleting or resetting artifacts runs
+collect_garbage(), which removes blobs (and their derived objects) that no
+pointer record references any more.
+"""
+import hashlib
+import json
+import logging
+from typing import Callable, Dict, Any, Iterable, Optional, Set, Tuple
+
+from botocore.exceptions import ClientError
+
+logger = logging.getLogger(__name__)
+
+BLOB_PREFIX = "blobs/sha256"
+DERIVED_PREFIX = "derived/sha256"
+# Key prefixes that hold pointer records
+POINTER_PREFIXES = ("models/", "performance/")
+# Pointer records are small JSON bodies; larger objects are raw archives
+MAX_POINTER_BYTES = 4096
+POINTER_CONTENT_TYPE = "application/vnd.acme.blob-pointer+json"
+# S3 returns user metadata keys lowercased, so keep these lowercase
+POINTER_HASH_METADATA_KEY = "blob-sha256"
+POINTER_SIZE_METADATA_KEY = "blob-size"
+
+
+def content_hash(file_content: bytes) -> str:
+    """Return the hex sha256 digest used as the blob identity."""
+    return hashlib.sha256(file_content).hexdigest()
+
+
+def blob_key(digest: str) -> str:
+    """Return the S3 key for a blob digest (fanned out by the first byte)."""
+    return f"{BLOB_PREFIX}/{digest[:2]}/{digest}"
+
+
+def blob_exists(s3, bucket: str, key: str) -> bool:
+    """Check whether a blob is already stored.
+
+    Any client error (404, or 403 when the caller lacks ListBucket) is treated
+    as "absent" so the caller falls back to writing the blob.
+    """
+    try:
+        s3.head_object(Bucket=bucket, Key=key)
+        return True
+    except ClientError:
+        return False
+
+
+def put_blob(
+    s3, bucket: str, file_content: bytes, extra_put_params: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
+    """Store ``file_content`` under its content hash unless it already exists.
+
+    Returns:
+        Dictionary with ``sha256``, ``blob_key``, ``size`` and ``deduplicated``
+        (True when the write was skipped because the blob was already present).
+    """
+    digest = content_hash(file_content)
+    key = blob_key(digest)
+    deduplicated = blob_exists(s3, bucket, key)
+    if not deduplicated:
+        put_params = {
+            "Bucket": bucket,
+            "Key": key,
+            "Body": file_content,
+            "ContentType": "application/zip",
+        }
+        put_params.update(extra_put_params or {})
+        s3.put_object(**put_params)
+    return {
+        "sha256": digest,
+        "blob_key": key,
+        "size": len(file_content),
+        "deduplicated": deduplicated,
+    }
+
+
+def put_pointer(
+    s3,
+    bucket: str,
+    key: str,
+    blob_info: Dict[str, Any],
+    extra_put_params: Optional[Dict[str, Any]] = None,
+) -> None:
+    """Write the pointer record for ``key`` referencing a stored blob."""
+    body = {
+        "sha256": blob_info["sha256"],
+        "blob_key": blob_info["blob_key"],
+        "size": blob_info["size"],
+    }
+    put_params = {
+        "Bucket": bucket,
+        "Key": key,
+        "Body": json.dumps(body).encode("utf-8"),
+        "ContentType": POINTER_CONTENT_TYPE,
+        "Metadata": {
+            POINTER_HASH_METADATA_KEY: blob_info["sha256"],
+            POINTER_SIZE_METADATA_KEY: str(blob_info["size"]),
+        },
+    }
+    put_params.update(extra_put_params or {})
+    s3.put_object(**put_params)
+
+
+def store_content_addressed(
+    s3, bucket: str, key: str, file_content: bytes, extra_put_params: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
+    """Store ``file_content`` as a blob and point ``key`` at it."""
+    blob_info = put_blob(s3, bucket, file_content, extra_put_params)
+    put_pointer(s3, bucket, key, blob_info, extra_put_params)
+    return blob_info
+
+
+def is_pointer(response: Dict[str, Any]) -> bool:
+    """Return True if a get/head_object response describes a pointer record."""
+    return response.get("ContentType") == POINTER_CONTENT_TYPE
+
+
+def resolve_object_key(s3, bucket: str, key: str) -> Tuple[str, int]:
+    """Resolve ``key`` to the object that actually holds the bytes.
+
+    Uses a single HEAD request: pointer records carry the blob hash and size in
+    their object metadata.
+
+    Returns:
+        Tuple of (data key, content length in bytes)
+    """
+    head = s3.head_object(Bucket=bucket, Key=key)
+    if is_pointer(head):
+        metadata = head.get("Metadata") or {}
+        digest = metadata.get(POINTER_HASH_METADATA_KEY)
+        if digest:
+            return blob_key(digest), int(metadata.get(POINTER_SIZE_METADATA_KEY, 0))
+        # Metadata stripped (e.g. copied object): fall back to reading the pointer body
+        pointer = json.loads(s3.get_object(Bucket=bucket, Key=key)["Body"].read())
+        return pointer["blob_key"], int(pointer.get("size", 0))
+    return key, head["ContentLength"]
+
+
+def content_identity(s3, bucket: str, key: str) -> str:
+    """Return a stable identifier for the bytes behind ``key`` from a single HEAD.
+
+    Pointer records yield the blob sha256. Legacy raw objects have no stored
+    hash, so their ETag is used instead (prefixed ``etag-`` to keep the two
+    namespaces apart).
+    """
+    head = s3.head_object(Bucket=bucket, Key=key)
+    if is_pointer(head):
+        digest = (head.get("Metadata") or {}).get(POINTER_HASH_METADATA_KEY)
+        if digest:
+            return digest
+        pointer = json.loads(s3.get_object(Bucket=bucket, Key=key)["Body"].read())
+        return pointer["sha256"]
+    return "etag-" + head["ETag"].strip('"')
+
+
+def read_object(s3, bucket: str, key: str) -> bytes:
+    """Read the bytes stored at ``key``, following a pointer record if present."""
+    response = s3.get_object(Bucket=bucket, Key=key)
+    body = response["Body"].read()
+    if not is_pointer(response):
+        return body
+    pointer = json.loads(body)
+    logger.debug(f"Resolved pointer {key} -> {pointer['blob_key']}")
+    return s3.get_object(Bucket=bucket, Key=pointer["blob_key"])["Body"].read()
+
+
+def derived_key(digest: str, name: str) -> str:
+    """Return the S3 key for an artifact derived from blob ``digest``.
+
+    Derived objects (e.g. component archives) are keyed by the source content
+    hash, so they are shared across names/versions and never go stale when a
+    model key is re-pointed at different content.
+    """
+    return f"{DERIVED_PREFIX}/{digest[:2]}/{digest}/{name}"
+
+
+def read_derived(
+    s3,
+    bucket: str,
+    key: str,
+    name: str,
+    build: Callable[[bytes], bytes],
+    extra_put_params: Optional[Dict[str, Any]] = None,
+) -> bytes:
+    """Read artifact ``name`` derived from the object at ``key``.
+
+    For pointer records the derived object is looked up by the blob hash and,
+    on a miss, built from the full blob with ``build`` and persisted so later
+    requests are a single GET. Legacy raw objects have no stable identity, so
+    ``build`` runs on every call.
+    """
+    response = s3.get_object(Bucket=bucket, Key=key)
+    body = response["Body"].read()
+    if not is_pointer(response):
+        return build(body)
+
+    pointer = json.loads(body)
+    target_key = derived_key(pointer["sha256"], name)
+    try:
+        return s3.get_object(Bucket=bucket, Key=target_key)["Body"].read()
+    except ClientError:
+        # Not built yet (or unreadable, e.g. 403 for a missing key): rebuild below
+        pass
+
+    full_content = s3.get_object(Bucket=bucket, Key=pointer["blob_key"])["Body"].read()
+    result = build(full_content)
+    put_params = {
+        "Bucket": bucket,
+        "Key": target_key,
+        "Body": result,
+        "ContentType": "application/zip",
+    }
+    put_params.update(extra_put_params or {})
+    try:
+        s3.put_object(**put_params)
+    except Exception as e:
+        # Persisting is an optimization; the caller still gets the result
+        logger.warning(f"Failed to persist derived object {target_key}: {e}")
+    return result
+
+
+def pointer_digest(
+    s3, bucket: str, key: str, head: Optional[Dict[str, Any]] = None
+) -> Optional[str]:
+    """Return the blob digest ``key`` points at, or None for raw or missing objects.
+
+    Pass ``head`` when the caller already has the head_object response.
+    """
+    if head is None:
+        try:
+            head = s3.head_object(Bucket=bucket, Key=key)
+        except ClientError:
+            return None
+    if not is_pointer(head):
+        return None
+    digest = (head.get("Metadata") or {}).get(POINTER_HASH_METADATA_KEY)
+    if digest:
+        return digest
+    return json.loads(s3.get_object(Bucket=bucket, Key=key)["Body"].read())["sha256"]
+
+
+def _list_keys(s3, bucket: str, prefix: str) -> Iterable[Dict[str, Any]]:
+    paginator = s3.get_paginator("list_objects_v2")
+    for page in paginator.paginate(Bucket=bucket, Prefix=prefix):
+        yield from page.get("Contents", [])
+
+
+def referenced_digests(s3, bucket: str, prefixes: Iterable[str] = POINTER_PREFIXES) -> Set[str]:
+    """Return the digests of every blob referenced by a pointer under ``prefixes``."""
+    digests = set()
+    for prefix in prefixes:
+        for item in _list_keys(s3, bucket, prefix):
+            # Only model.zip keys can be pointers; skip raw archives without a HEAD
+            if not item["Key"].endswith("/model.zip") or item.get("Size", 0) > MAX_POINTER_BYTES:
+                continue
+            digest = pointer_digest(s3, bucket, item["Key"])
+            if digest:
+                digests.add(digest)
+    return digests
+
+
+def stored_digests(s3, bucket: str) -> Set[str]:
+    """Return the digests of every stored blob and every derived object's source."""
+    digests = {item["Key"].rsplit("/", 1)[-1] for item in _list_keys(s3, bucket, BLOB_PREFIX + "/")}
+    for item in _list_keys(s3, bucket, DERIVED_PREFIX + "/"):
+        # derived/sha256/{aa}/{digest}/{name}
+        digests.add(item["Key"].split("/")[3])
+    return digests
+
+
+def delete_blob(s3, bucket: str, digest: str) -> int:
+    """Delete a blob and everything derived from it; returns the object count."""
+    deleted = 0
+    for item in _list_keys(s3, bucket, f"{DERIVED_PREFIX}/{digest[:2]}/{digest}/"):
+        s3.delete_object(Bucket=bucket, Key=item["Key"])
+        deleted += 1
+    try:
+        s3.head_object(Bucket=bucket, Key=blob_key(digest))
+    except ClientError:
+        return deleted
+    s3.delete_object(Bucket=bucket, Key=blob_key(digest))
+    return deleted + 1
+
+
+def collect_garbage(
+    s3,
+    bucket: str,
+    candidates: Optional[Iterable[str]] = None,
+    prefixes: Iterable[str] = POINTER_PREFIXES,
+) -> int:
+    """Delete blobs and derived objects that no pointer under ``prefixes`` references.
+
+    With ``candidates`` only those digests are considered (e.g. the blobs behind
+    pointers that were just deleted); otherwise every stored blob is. An upload
+    that deduplicates against a blob while it is being collected can lose it,
+    so callers run this after deletes and resets rather than on a schedule.
+
+    Returns:
+        Number of S3 objects deleted
+    """
+    candidates = stored_digests(s3, bucket) if candidates is None else set(candidates)
+    candidates.discard(None)
+    if not candidates:
+        return 0
+    unreferenced = candidates - referenced_digests(s3, bucket, prefixes)
+    deleted = sum(delete_blob(s3, bucket, digest) for digest in unreferenced)
+    if unreferenced:
+        logger.info(f"Reclaimed {len(unreferenced)} unreferenced blobs ({deleted} objects)")
+    return deleted
@@ -0,0 +1,117 @@
+"""
+Compression policy for model archives built at ingest time.
+
+Weight files (.safetensors, .bin, ...) are high-entropy and barely shrink under
+deflate, so compressing them only burns CPU on ingest and again on every
+component extraction. A policy decides, per archive member, which zip method
+and level to use:
+
+- ``adaptive`` (default): store binaries, deflate text with the level scaled
+  down as members get larger
+- ``deflate``: deflate everything at the default level (previous behaviour)
+- ``stored``: no compression at all
+
+The active policy can be selected with the ``ZIP_COMPRESSION_POLICY`` env var.
+"""
+import os
+import zipfile
+from typing import Dict, Optional, Protocol, Tuple
+
+# Formats that are already compressed or are dense binary tensors
+INCOMPRESSIBLE_EXTENSIONS = (
+    ".safetensors",
+    ".bin",
+    ".pt",
+    ".pth",
+    ".ckpt",
+    ".h5",
+    ".onnx",
+    ".msgpack",
+    ".gguf",
+    ".npz",
+    ".zip",
+    ".gz",
+    ".bz2",
+    ".xz",
+    ".zst",
+    ".png",
+    ".jpg",
+    ".jpeg",
+)
+
+# Size thresholds for choosing the deflate level of compressible members
+SMALL_MEMBER_BYTES = 1 * 1024 * 1024
+LARGE_MEMBER_BYTES = 32 * 1024 * 1024
+
+
+class CompressionPolicy(Protocol):
+    """Chooses the zip compression method and level for an archive member."""
+
+    def choose(self, filename: str, size: int) -> Tuple[int, Optional[int]]:
+        """Return (compress_type, compresslevel) for a member of ``size`` bytes."""
+        ...
+
+
+class DeflateAllPolicy:
+    """Deflate every member at zlib's default level."""
+
+    def choose(self, filename: str, size: int) -> Tuple[int, Optional[int]]:
+        return zipfile.ZIP_DEFLATED, None
+
+
+class StoreAllPolicy:
+    """Store every member uncompressed."""
+
+    def choose(self, filename: str, size: int) -> Tuple[int, Optional[int]]:
+        return zipfile.ZIP_STORED, None
+
+
+class AdaptivePolicy:
+    """Store incompressible binaries; deflate text with a size-dependent level.
+
+    Small text files (configs, READMEs) get the best ratio at negligible cost,
+    while large text files (tokenizers, vocabularies) use a faster level.
+    """
+
+    def choose(self, filename: str, size: int) -> Tuple[int, Optional[int]]:
+        if filename.lower().endswith(INCOMPRESSIBLE_EXTENSIONS):
+            return zipfile.ZIP_STORED, None
+        if size < SMALL_MEMBER_BYTES:
+            return zipfile.ZIP_DEFLATED, 9
+        if size < LARGE_MEMBER_BYTES:
+            return zipfile.ZIP_DEFLATED, 6
+        return zipfile.ZIP_DEFLATED, 1
+
+
+POLICIES: Dict[str, CompressionPolicy] = {
+    "adaptive": AdaptivePolicy(),
+    "deflate": DeflateAllPolicy(),
+    "stored": StoreAllPolicy(),
+}
+
+
+def get_compression_policy(name: Optional[str] = None) -> CompressionPolicy:
+    """Return the named policy, defaulting to ``ZIP_COMPRESSION_POLICY`` or 'adaptive'.
+
+    Raises:
+        ValueError: If the policy name is unknown
+    """
+    policy_name = (name or os.getenv("ZIP_COMPRESSION_POLICY", "adaptive")).lower()
+    if policy_name not in POLICIES:
+        raise ValueError(
+            f"Unknown compression policy '{policy_name}'. Expected one of: {', '.join(POLICIES)}"
+        )
+    return POLICIES[policy_name]
+
+
+def write_member(
+    zip_file: zipfile.ZipFile,
+    filename: str,
+    data: bytes,
+    policy: Optional[CompressionPolicy] = None,
+) -> None:
+    """Write ``data`` to ``zip_file`` using the method chosen by ``policy``."""
+    if policy is None:
+        policy = get_compression_policy()
+    compress_type, compresslevel = policy.choose(filename, len(data))
+    zip_file.writestr(filename, data, compress_type=compress_type, compresslevel=compresslevel)
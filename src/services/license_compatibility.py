@@ -75,7 +75,7 @@ def normalize_license(license_str: str) -> str:
 def extract_model_license(model_id: str, version: str = "1.0.0") -> Optional[str]:
     """Extract license from model (S3 or HuggingFace)."""
     try:
-        from .s3_service import list_models, download_model
+        from .s3_service import download_model, resolve_model_key
         from botocore.exceptions import ClientError
         try:
             from .artifact_storage import get_generic_artifact_metadata, get_artifact_from_db
@@ -116,28 +116,12 @@ def extract_model_license(model_id: str, version: str = "1.0.0") -> Optional[str
         model_content = None
         found_version = None
         try:
-            import re
-
-            escaped_name = re.escape(model_id)
-            name_pattern = f"^{escaped_name}$"
-            result = list_models(name_regex=name_pattern, limit=1)
-            if result.get("models"):
-                found_version = result["models"][0]["version"]
-                try:
-                    model_content = download_model(model_id, found_version, "full")
-                except:
-                    pass
-        except:
+            resolved = resolve_model_key(model_id, version)
+            if resolved:
+                key_name, found_version = resolved
+                model_content = download_model(key_name, found_version, "full")
+        except Exception:
             pass
-        if not model_content:
-            for v in [version, "1.0.0", "main", "latest"]:
-                try:
-                    model_content = download_model(model_id, v, "full")
-                    found_version = v
-                    if model_content:
-                        break
-                except:
-                    continue
         
         # Try HuggingFace API - try multiple variations of the model name
         if not model_content:
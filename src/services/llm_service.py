@@ -15,6 +15,8 @@ import time
 from typing import Dict, Any, Optional, List
 import requests
 
+from ..acmecli import http_client
+
 # Try to load .env file if python-dotenv is available
 try:
     from dotenv import load_dotenv
@@ -94,7 +96,7 @@ def _call_llm_api(prompt: str, system_message: Optional[str] = None) -> Optional
     }
     
     try:
-        response = requests.post(
+        response = http_client.post(
             PURDUE_GENAI_API_URL,
             headers=headers,
             json=payload,
@@ -14,13 +14,6 @@ import os
 
 logger = logging.getLogger(__name__)
 
-# RDS credentials (hardcoded from infra/envs/dev/main.tf)
-# These match the Terraform configuration
-RDS_PASSWORD = "acme_rds_password_123"
-RDS_DATABASE = "acme"
-RDS_USERNAME = "acme"
-RDS_PORT = 5432
-
 
 @dataclass
 class Metric:
@@ -220,7 +213,8 @@ class LoadGenerator:
     def _download_from_rds_direct(self, model_id: str, version: str, component: str = "full") -> bytes:
         """
         Directly download model from RDS (bypasses API).
-        Simple implementation that directly queries RDS database.
+        Calls the rds_service.download_model function directly, which
+        reassembles the content-addressed blob behind the model_files row.
         
         Args:
             model_id: Model identifier (sanitized)
@@ -234,53 +228,24 @@ class LoadGenerator:
             raise Exception("RDS endpoint not configured")
         
         try:
-            import psycopg2
+            from ..rds_service import download_model as rds_download_model
         except ImportError:
             raise Exception("psycopg2-binary not installed. Install with: pip install psycopg2-binary")
         
-        path_prefix = "performance" if self.use_performance_path else "models"
-        
-        # Parse endpoint to extract hostname (remove port if included)
-        rds_host = self.rds_endpoint
-        rds_port = RDS_PORT
-        if ":" in rds_host:
-            # Endpoint includes port (e.g., "hostname:5432")
-            parts = rds_host.split(":")
-            rds_host = parts[0]
-            if len(parts) > 1:
-                try:
-                    rds_port = int(parts[1])
-                except ValueError:
-                    # Invalid port, use default
-                    pass
-        
-        # Simple direct connection with shorter timeout for faster fallback
-        # Use connect_timeout to fail quickly if RDS is not accessible
-        conn = psycopg2.connect(
-            host=rds_host,
-            port=rds_port,
-            database=RDS_DATABASE,
-            user=RDS_USERNAME,
-            password=RDS_PASSWORD,
-            connect_timeout=5  # 5 second timeout for connection attempt
-        )
-        
         try:
-            cursor = conn.cursor()
-            cursor.execute("""
-                SELECT file_data, file_size
-                FROM model_files
-                WHERE model_id = %s AND version = %s AND component = %s AND path_prefix = %s
-            """, (model_id, version, component, path_prefix))
-            
-            result = cursor.fetchone()
-            if not result:
+            return rds_download_model(
+                model_id=model_id,
+                version=version,
+                component=component,
+                use_performance_path=self.use_performance_path
+            )
+        except Exception as e:
+            # Convert HTTPException to regular Exception for consistency
+            error_msg = str(e)
+            if "not found" in error_msg.lower():
+                path_prefix = "performance" if self.use_performance_path else "models"
                 raise Exception(f"Model {model_id} version {version} not found in RDS ({path_prefix}/)")
-            
-            file_data, file_size = result
-            return bytes(file_data)
-        finally:
-            conn.close()
+            raise Exception(f"RDS download failed: {error_msg}")
 
     async def _make_request(
         self, client_id: int, session: Optional[aiohttp.ClientSession] = None
@@ -1,5 +1,4 @@
 from __future__ import annotations
-import subprocess
 import time
 import json
 import os
@@ -8,21 +7,39 @@ import zipfile
 import io
 import tempfile
 import glob
+import threading
 import traceback
 import logging
-from pathlib import Path
-from typing import Any, Dict, Optional
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from typing import Any, Dict, Optional, Tuple
 from fastapi import APIRouter, HTTPException, Query
 from pydantic import BaseModel
 from ..services.s3_service import download_model
-from ..acmecli.metrics import METRIC_FUNCTIONS
+from ..acmecli.metrics.context import MetricContext
 from ..acmecli.types import MetricValue
 from ..acmecli.scoring import compute_net_score
 from .rating_config import INGESTIBILITY_THRESHOLD
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
-ROOT = Path(__file__).resolve().parents[2]
+
+# Metrics run concurrently; several of them do network I/O (GitHub, HF, LLM)
+METRIC_WORKERS = int(os.getenv("METRIC_WORKERS", "32"))
+METRIC_TIMEOUT_SECONDS = float(os.getenv("METRIC_TIMEOUT_SECONDS", "20"))
+# Per-metric overrides of METRIC_TIMEOUT_SECONDS, keyed by metric name
+METRIC_TIMEOUTS: Dict[str, float] = {}
+# Score used for a metric that misses its deadline
+METRIC_FALLBACK_SCORE = 0.0
+# Per-metric overrides of METRIC_FALLBACK_SCORE (spec default for Treescore)
+METRIC_FALLBACK_SCORES: Dict[str, float] = {"Treescore": 0.5}
+# Metrics that rate other models run in the calling thread, without a
+# deadline: Treescore rates each parent with analyze_model_content, and those
+# nested ratings would otherwise hold _metric_executor workers while waiting
+# for their own metrics on the same pool
+INLINE_METRICS = frozenset({"Treescore"})
+_metric_executor = ThreadPoolExecutor(
+    max_workers=METRIC_WORKERS, thread_name_prefix="metric"
+)
 
 
 def python_cmd() -> str:
@@ -41,116 +58,51 @@ class RateRequest(BaseModel):
 
 
 def analyze_model_content(
-    target: str, suppress_errors: bool = False
+    target: str, suppress_errors: bool = False, lineage_path: Tuple[str, ...] = ()
 ) -> Optional[Dict[str, Any]]:
+    """Rate a model from S3 (or Hugging Face if it is not uploaded).
+
+    ``lineage_path`` is set when Treescore rates a parent: it lists the
+    registry keys of the descendants being rated, so the parent's own
+    Treescore can stop at cycles and at TREESCORE_MAX_DEPTH.
+    """
     try:
         from ..services.s3_service import (
-            extract_config_from_model,
             download_from_huggingface,
             download_model,
-            list_models,
+            resolve_model_key,
+        )
+        from .blob_store import content_hash
+        from .rating_cache import (
+            get_cached_rating,
+            model_content_hash,
+            put_cached_rating,
         )
         from fastapi import HTTPException
         import re
 
         model_content = None
         clean_model_id = target
+        found_model_name = None
         found_version = None
+        rating_hash = None
 
         # First, try to find the model in S3 (for uploaded models)
-        # Models are stored in S3 with sanitized names (e.g., WinKawaks_vit-tiny-patch16-224)
-        # So we need to search using both the original name and sanitized name
+        # Models are stored in S3 with sanitized names (e.g., WinKawaks_vit-tiny-patch16-224);
+        # resolve_model_key checks those keys directly instead of scanning the registry
         try:
-            # Clean the target name first
-            clean_target = target.replace("https://huggingface.co/", "").replace(
-                "http://huggingface.co/", ""
-            )
-
-            # Try multiple search strategies:
-            # 1. Exact match with original name
-            # 2. Exact match with sanitized name
-            # 3. Partial match (contains) with sanitized name
-            # 4. Try direct S3 key lookup with common versions
-
-            search_patterns = [
-                f"^{re.escape(clean_target)}$",  # Exact match original
-            ]
-
-            # Add sanitized version
-            sanitized_target = (
-                clean_target.replace("/", "_")
-                .replace(":", "_")
-                .replace("\\", "_")
-                .replace("?", "_")
-                .replace("*", "_")
-                .replace('"', "_")
-                .replace("<", "_")
-                .replace(">", "_")
-                .replace("|", "_")
-            )
-            if sanitized_target != clean_target:
-                search_patterns.append(
-                    f"^{re.escape(sanitized_target)}$"
-                )  # Exact match sanitized
-                search_patterns.append(
-                    re.escape(sanitized_target)
-                )  # Partial match sanitized
-
-            result = None
-            for pattern in search_patterns:
-                try:
-                    # Skip patterns that are too long (would fail ReDoS validation)
-                    if len(pattern) > 100:
-                        print(
-                            f"[RATE] Pattern too long ({len(pattern)} chars), skipping: '{pattern[:50]}...'"
-                        )
-                        continue
-                    
-                    result = list_models(
-                        name_regex=pattern, limit=1000
-                    )  # Increase limit to find more models
-                    if result.get("models"):
-                        break
-                except Exception as pattern_error:
-                    print(
-                        f"[RATE] Pattern search failed for '{pattern[:50] if len(pattern) > 50 else pattern}...': {pattern_error}"
-                    )
-                    continue
-
-            # If still not found, try direct S3 key lookup with common versions
-            if not result or not result.get("models"):
-                from botocore.exceptions import ClientError
-
-                common_versions = ["1.0.0", "main", "latest", "v1.0.0"]
-                for version in common_versions:
-                    for model_name_variant in [sanitized_target, clean_target]:
-                        try:
-                            s3_key = f"models/{model_name_variant}/{version}/model.zip"
-                            # Try to check if the file exists
-                            from ..services.s3_service import s3, ap_arn
-
-                            s3.head_object(Bucket=ap_arn, Key=s3_key)
-                            # File exists, create a result structure
-                            result = {
-                                "models": [
-                                    {"name": model_name_variant, "version": version}
-                                ]
-                            }
-                            print(f"[RATE] Found model via direct S3 lookup: {s3_key}")
-                            break
-                        except ClientError:
-                            continue
-                        except Exception as direct_error:
-                            print(f"[RATE] Direct S3 lookup error: {direct_error}")
-                            continue
-                    if result and result.get("models"):
-                        break
-
-            if result and result.get("models"):
-                found_model = result["models"][0]
-                found_version = found_model["version"]
-                # Use the sanitized model name from S3 (this is how it's actually stored)
-                found_model_name = found_model["name"]
+            resolved = resolve_model_key(target)
+            if resolved:
+                found_model_name, found_version = resolved
+                logger.debug(
+                    f"[RATE] Resolved {target} to models/{found_model_name}/{found_version}"
+                )
+                # Repeat ratings of unchanged content are a single lookup
+                rating_hash = model_content_hash(found_model_name, found_version)
+                cached = get_cached_rating(target, rating_hash)
+                if cached:
+                    print(f"[RATE] Using persisted rating for {target} ({rating_hash[:12]})")
+                    return cached
                 try:
                     model_content = download_model(
                         found_model_name, found_version, "full"
@@ -184,6 +136,7 @@ def analyze_model_content(
 
         # If not found in S3, try HuggingFace
         if not model_content:
+            rating_hash = None  # Any S3 hash does not describe this content
             # Check if this looks like a valid HuggingFace model ID (not a file path)
             is_valid_hf_id = (
                 target.startswith("http://") or target.startswith("https://")
@@ -243,6 +196,14 @@ def analyze_model_content(
                 f"No model content found for {target} in S3 or HuggingFace. Cannot compute metrics without model data."
             )
 
+        if rating_hash is None:
+            # Content fetched from Hugging Face has no stored hash
+            rating_hash = content_hash(model_content)
+            cached = get_cached_rating(target, rating_hash)
+            if cached:
+                print(f"[RATE] Using persisted rating for {target} ({rating_hash[:12]})")
+                return cached
+
         # Sanitize model ID for file system (remove path separators, invalid chars)
         safe_model_id = (
             effective_model_id.replace("/", "_")
@@ -256,16 +217,9 @@ def analyze_model_content(
             .replace("|", "_")
             .strip(".")
         )
-        with tempfile.TemporaryDirectory() as temp_dir:
-            zip_path = os.path.join(temp_dir, f"{safe_model_id}.zip")
-            with open(zip_path, "wb") as f:
-                f.write(model_content)
-            with zipfile.ZipFile(zip_path, "r") as zip_ref:
-                zip_ref.extractall(temp_dir)
-            meta = create_metadata_from_files(temp_dir, effective_model_id)
-            config = extract_config_from_model(model_content)
-            if config:
-                meta["config"] = config
+        with ZipRepoView(model_content) as zip_repo:
+            meta = create_metadata_from_zip(zip_repo, effective_model_id)
+            config = meta.get("config")
             zip_size_bytes = len(model_content)
             zip_size_kb = zip_size_bytes / 1024
             meta["size"] = int(zip_size_kb)
@@ -504,40 +458,23 @@ def analyze_model_content(
                     meta["license"] = license_text_lower
             if not meta.get("readme_text"):
                 print(f"[RATE] Warning: No README text found for {target}")
-            from ..acmecli.metrics.license_metric import LicenseMetric
-            from ..acmecli.metrics.ramp_up_metric import RampUpMetric
-            from ..acmecli.metrics.bus_factor_metric import BusFactorMetric
-            from ..acmecli.metrics.performance_claims_metric import (
-                PerformanceClaimsMetric,
-            )
-            from ..acmecli.metrics.size_metric import SizeMetric
-            from ..acmecli.metrics.dataset_and_code_metric import DatasetAndCodeMetric
-            from ..acmecli.metrics.dataset_quality_metric import DatasetQualityMetric
-            from ..acmecli.metrics.code_quality_metric import CodeQualityMetric
-            from ..acmecli.metrics.reproducibility_metric import ReproducibilityMetric
-            from ..acmecli.metrics.reviewedness_metric import ReviewednessMetric
-            from ..acmecli.metrics.treescore_metric import TreescoreMetric
-
-            quick_metrics = {
-                "license": LicenseMetric().score,
-                "ramp_up_time": RampUpMetric().score,
-                "bus_factor": BusFactorMetric().score,
-                "performance_claims": PerformanceClaimsMetric().score,
-                "size_score": SizeMetric().score,
-                "dataset_and_code_score": DatasetAndCodeMetric().score,
-                "dataset_quality": DatasetQualityMetric().score,
-                "code_quality": CodeQualityMetric().score,
-                "Reproducibility": ReproducibilityMetric().score,
-                "Reviewedness": ReviewednessMetric().score,
-                "Treescore": TreescoreMetric().score,
-            }
+            from ..acmecli.metrics import RATING_METRICS, REGISTRY
+
+            quick_metrics = {m.name: m.score for m in REGISTRY.select(RATING_METRICS)}
             # Ensure repo_files exists before accessing
             if "repo_files" not in meta:
                 meta["repo_files"] = set()
             print(
                 f"Running ACME metrics for {target} with {len(meta.get('repo_files', set()))} files"
             )
-            return run_acme_metrics(meta, quick_metrics)
+            meta["lineage_path"] = tuple(lineage_path) + (
+                found_model_name or safe_model_id,
+            )
+            rating = run_acme_metrics(meta, quick_metrics, MetricContext(meta))
+            if not lineage_path:
+                # A parent rated inside a lineage has a depth-limited Treescore
+                put_cached_rating(target, rating_hash, rating)
+            return rating
     except Exception as e:
         if suppress_errors:
             return None
@@ -592,40 +529,251 @@ def create_metadata_from_files(temp_dir: str, model_name: str) -> Dict[str, Any]
     return meta
 
 
+class ZipRepoView(os.PathLike):
+    """
+    Files of a model zip, read in memory.
+
+    Metadata and metrics read members straight from the archive. Code that
+    needs a real directory can use the view as a path (``os.fspath(view)``,
+    ``os.path.join(view, ...)``): the archive is extracted to a temporary
+    directory the first time that happens, and removed by cleanup().
+    """
+
+    def __init__(self, zip_content: bytes):
+        self._zip = zipfile.ZipFile(io.BytesIO(zip_content), "r")
+        # Members by the relative path extractall() would write them to
+        self._files: Dict[str, zipfile.ZipInfo] = {}
+        self._dirs = set()
+        for info in self._zip.infolist():
+            parts = _extracted_parts(info.filename)
+            if not parts:
+                continue
+            if info.is_dir():
+                self._dirs.add("/".join(parts))
+            else:
+                self._files["/".join(parts)] = info
+            for end in range(1, len(parts)):
+                self._dirs.add("/".join(parts[:end]))
+        self._temp_dir: Optional[tempfile.TemporaryDirectory] = None
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> "ZipRepoView":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.cleanup()
+
+    def namelist(self):
+        """Member names as stored in the archive."""
+        return self._zip.namelist()
+
+    def read(self, name: str) -> bytes:
+        """Content of the member stored as ``name``."""
+        return self._zip.read(name)
+
+    def entries(self):
+        """(path, is_file) for every file and directory, "/"-separated."""
+        for path in self._files:
+            yield path, True
+        for path in self._dirs - self._files.keys():
+            yield path, False
+
+    def read_bytes(self, path: str) -> Optional[bytes]:
+        """Content of the file at ``path``, or None if there is none."""
+        info = self._files.get(path)
+        return None if info is None else self._zip.read(info)
+
+    def read_text(self, path: str) -> str:
+        """File content decoded the way open(path, "r", errors="ignore") reads it."""
+        data = self.read_bytes(path)
+        if data is None:
+            raise FileNotFoundError(path)
+        return data.decode("utf-8", errors="ignore").replace("\r\n", "\n").replace("\r", "\n")
+
+    def __fspath__(self) -> str:
+        with self._lock:
+            if self._temp_dir is None:
+                self._temp_dir = tempfile.TemporaryDirectory(prefix="zipview_")
+                self._zip.extractall(self._temp_dir.name)
+            return self._temp_dir.name
+
+    def cleanup(self) -> None:
+        with self._lock:
+            if self._temp_dir is not None:
+                self._temp_dir.cleanup()
+                self._temp_dir = None
+        self._zip.close()
+
+
+def _extracted_parts(name: str) -> list:
+    # Same sanitizing as ZipFile.extractall(): no drive, no "", "." or ".." parts
+    name = name.replace("/", os.sep)
+    if os.altsep:
+        name = name.replace(os.altsep, os.sep)
+    name = os.path.splitdrive(name)[1]
+    return [part for part in name.split(os.sep) if part not in ("", os.curdir, os.pardir)]
+
+
+def create_metadata_from_zip(repo: ZipRepoView, model_name: str) -> Dict[str, Any]:
+    """
+    Metadata for a model zip, built from its member list in one pass.
+
+    Gives the same repo_files, readme_text and license_text as extracting the
+    archive and calling create_metadata_from_files(), plus config from
+    config.json, without writing anything to disk. repo_path is the view
+    itself.
+    """
+    meta = {
+        "repo_files": set(),
+        "readme_text": "",
+        "license_text": "",
+        "repo_path": repo,
+        "repo_name": model_name,
+        "url": f"local://{model_name}",
+    }
+    # The file globs (case-sensitive, skipping hidden paths) used to pick
+    # README and license files, including the directories they match
+    readme_paths, readme_fallback, license_paths, licence_paths = [], [], [], []
+    for path, is_file in repo.entries():
+        if is_file:
+            meta["repo_files"].add(path.replace("\\", "/"))
+        parts = path.split("/")
+        if any(part.startswith(".") for part in parts):
+            continue
+        name = parts[-1]
+        if "readme" in name:
+            readme_paths.append((path, is_file))
+        if name.startswith("README"):
+            readme_fallback.append((path, is_file))
+        if "license" in name:
+            license_paths.append((path, is_file))
+        if "licence" in name:
+            licence_paths.append((path, is_file))
+    if not readme_paths:
+        # A top-level README is matched by both fallback globs
+        readme_paths = readme_fallback + [entry for entry in readme_fallback if "/" not in entry[0]]
+    for path, is_file in readme_paths:
+        if not is_file:
+            continue
+        try:
+            content = repo.read_text(path)
+            if content:
+                meta["readme_text"] += content + "\n"
+        except Exception as e:
+            print(f"Warning: Could not read README file {path}: {e}")
+    for path, is_file in license_paths + licence_paths:
+        if not is_file:
+            continue
+        try:
+            meta["license_text"] += repo.read_text(path) + "\n"
+        except Exception:
+            pass
+    config_names = [name for name in repo.namelist() if name.endswith("config.json")]
+    if config_names:
+        try:
+            config = json.loads(repo.read(config_names[0]).decode("utf-8"))
+        except Exception as e:
+            print(f"Error extracting config.json: {e}")
+            config = None
+        if config:
+            meta["config"] = config
+    return meta
+
+
+def _run_metric(
+    metric_name: str,
+    metric_func: Any,
+    meta: Dict[str, Any],
+    ctx: Optional[MetricContext] = None,
+) -> MetricValue:
+    """Run one metric and normalize its result to a MetricValue."""
+    try:
+        if metric_name in ["dependencies", "pull_requests"]:
+            score, latency = metric_func(meta)
+            return MetricValue(metric_name, score, int(latency))
+        metric_value = metric_func(meta) if ctx is None else metric_func(meta, ctx)
+        if isinstance(metric_value, MetricValue):
+            return metric_value
+        elif isinstance(metric_value, (int, float)):
+            return MetricValue(metric_name, float(metric_value), 0)
+        elif isinstance(metric_value, dict) and metric_name == "size_score":
+            avg_score = (
+                sum(metric_value.values()) / len(metric_value)
+                if metric_value
+                else 0.0
+            )
+            return MetricValue(metric_name, avg_score, 0)
+        else:
+            print(
+                f"Unexpected metric result type for {metric_name}: {type(metric_value)}"
+            )
+            return MetricValue(metric_name, 0.0, 0)
+    except Exception as e:
+        print(f"Error running metric {metric_name}: {e}")
+        traceback.print_exc()
+        return MetricValue(metric_name, 0.0, 0)
+
+
+def _timed_metric(
+    metric_name: str,
+    metric_func: Any,
+    meta: Dict[str, Any],
+    ctx: Optional[MetricContext] = None,
+) -> tuple:
+    start = time.perf_counter()
+    result = _run_metric(metric_name, metric_func, meta, ctx)
+    return result, int((time.perf_counter() - start) * 1000)
+
+
 def run_acme_metrics(
-    meta: Dict[str, Any], metric_functions: Dict[str, Any]
+    meta: Dict[str, Any],
+    metric_functions: Dict[str, Any],
+    ctx: Optional[MetricContext] = None,
 ) -> Dict[str, Any]:
+    """Run metrics concurrently and aggregate them into the rating scores dict.
+
+    If ``ctx`` is given, each metric is called as metric_func(meta, ctx) so
+    they share one preprocessed view of ``meta`` (see MetricContext).
+
+    Each metric gets its own deadline (METRIC_TIMEOUTS, else
+    METRIC_TIMEOUT_SECONDS) counted from submission; a metric that misses it
+    scores METRIC_FALLBACK_SCORES (else METRIC_FALLBACK_SCORE) and keeps
+    running in the background. INLINE_METRICS run in the calling thread while
+    the others are in flight and have no deadline. Wall time per metric is
+    reported under "metric_wall_ms" and the names of metrics that missed
+    their deadline under "metric_timeouts".
+    """
+    submitted_at = time.monotonic()
+    futures = {
+        metric_name: _metric_executor.submit(
+            _timed_metric, metric_name, metric_func, meta, ctx
+        )
+        for metric_name, metric_func in metric_functions.items()
+        if metric_name not in INLINE_METRICS
+    }
     results = {}
+    wall_ms = {}
+    timed_out = []
     for metric_name, metric_func in metric_functions.items():
+        if metric_name in INLINE_METRICS:
+            results[metric_name], wall_ms[metric_name] = _timed_metric(
+                metric_name, metric_func, meta, ctx
+            )
+    for metric_name, future in futures.items():
+        timeout = METRIC_TIMEOUTS.get(metric_name, METRIC_TIMEOUT_SECONDS)
+        remaining = max(0.0, submitted_at + timeout - time.monotonic())
         try:
-            if metric_name in ["dependencies", "pull_requests"]:
-                score, latency = metric_func(meta)
-                results[metric_name] = MetricValue(metric_name, score, int(latency))
-            else:
-                metric_value = metric_func(meta)
-                if isinstance(metric_value, MetricValue):
-                    results[metric_name] = metric_value
-                elif isinstance(metric_value, (int, float)):
-                    results[metric_name] = MetricValue(
-                        metric_name, float(metric_value), 0
-                    )
-                elif isinstance(metric_value, dict) and metric_name == "size_score":
-                    avg_score = (
-                        sum(metric_value.values()) / len(metric_value)
-                        if metric_value
-                        else 0.0
-                    )
-                    results[metric_name] = MetricValue(metric_name, avg_score, 0)
-                else:
-                    print(
-                        f"Unexpected metric result type for {metric_name}: {type(metric_value)}"
-                    )
-                    results[metric_name] = MetricValue(metric_name, 0.0, 0)
-        except Exception as e:
-            print(f"Error running metric {metric_name}: {e}")
-            import traceback
-            traceback.print_exc()
-            results[metric_name] = MetricValue(metric_name, 0.0, 0)
+            results[metric_name], wall_ms[metric_name] = future.result(timeout=remaining)
+        except FutureTimeoutError:
+            future.cancel()
+            print(f"Metric {metric_name} timed out after {timeout:.1f}s, using fallback score")
+            results[metric_name] = MetricValue(
+                metric_name,
+                METRIC_FALLBACK_SCORES.get(metric_name, METRIC_FALLBACK_SCORE),
+                int(timeout * 1000),
+            )
+            wall_ms[metric_name] = int(timeout * 1000)
+            timed_out.append(metric_name)
     try:
         net_score, net_score_latency = compute_net_score(results)
     except Exception as e:
@@ -691,6 +839,9 @@ def run_acme_metrics(
     if "net_score_latency" not in scores:
         scores["net_score_latency"] = int(net_score_latency)
 
+    scores["metric_wall_ms"] = wall_ms
+    scores["metric_timeouts"] = timed_out
+
     return scores
 
 
@@ -698,49 +849,22 @@ def run_scorer(target: str) -> Dict[str, Any]:
     github_token = os.environ.get("GITHUB_TOKEN")
     if not github_token or github_token == "ghp_test_token_placeholder":
         return analyze_model_content(target)
-    urls_file = ROOT / f".tmp_urls_{os.getpid()}_{int(time.time()*1000)}.txt"
-    urls_file.write_text(target + "\n", encoding="utf-8")
+    from dataclasses import asdict
+    from .scorer_pool import ScorerPoolFull, get_scorer_pool
+
     try:
-        env = os.environ.copy()
-        if sys.platform == "win32":
-            proc = subprocess.run(
-                ["bash", "run", str(urls_file)],
-                cwd=str(ROOT),
-                capture_output=True,
-                text=True,
-                timeout=30,
-                env=env,
-            )
-        else:
-            proc = subprocess.run(
-                ["./run", str(urls_file)],
-                cwd=str(ROOT),
-                capture_output=True,
-                text=True,
-                timeout=30,
-                env=env,
-            )
-        if proc.returncode != 0:
-            error_msg = proc.stderr.strip() or proc.stdout.strip() or "Unknown error"
-            raise HTTPException(status_code=502, detail=f"Scoring failed: {error_msg}")
-        line = next(
-            (s for s in (x.strip() for x in proc.stdout.splitlines()) if s), None
-        )
-        if not line:
-            raise HTTPException(
-                status_code=502, detail="No scoring output received from Python tool"
-            )
-        try:
-            return json.loads(line)
-        except json.JSONDecodeError:
-            raise HTTPException(status_code=502, detail="Invalid JSON from scorer")
-    except subprocess.TimeoutExpired:
+        row = get_scorer_pool().score(target)
+    except ScorerPoolFull:
+        raise HTTPException(status_code=503, detail="Scoring is busy, retry later")
+    except FutureTimeoutError:
         raise HTTPException(status_code=502, detail="Scoring tool timed out")
-    finally:
-        try:
-            urls_file.unlink(missing_ok=True)
-        except Exception:
-            pass
+    except Exception as e:
+        raise HTTPException(status_code=502, detail=f"Scoring failed: {e}")
+    if row is None:
+        raise HTTPException(
+            status_code=502, detail=f"No scoring output for target: {target}"
+        )
+    return asdict(row)
 
 
 @router.post("/registry/models/{modelId}/rate")
@@ -0,0 +1,145 @@
+"""
+Persistent cache of model ratings in S3.
+
+Ratings are stored at ``ratings/{scorer_version}/{model}/{content_hash}.json``
+so a repeat rating is a single GET. The key is self-invalidating:
+
+- re-uploading a model changes its content hash (blob sha256, or the ETag for
+  legacy raw objects), so the old entry is simply never read again
+- changing the metric code changes the scorer version, which moves every
+  lookup to a fresh prefix
+
+Entries also expire after RATING_CACHE_TTL_SECONDS, since several metrics use
+live GitHub/Hugging Face data (stars, contributors, activity). Ratings where a
+metric hit its deadline are not stored, so a transient slowdown does not pin a
+fallback score. All cache I/O is best-effort: failures are logged and the
+rating is computed as usual.
+"""
+import hashlib
+import json
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from botocore.exceptions import ClientError
+
+from .blob_store import content_identity
+
+logger = logging.getLogger(__name__)
+
+RATING_CACHE_ENABLED = os.getenv("RATING_CACHE_ENABLED", "true").lower() != "false"
+RATING_CACHE_PREFIX = "ratings"
+RATING_CACHE_TTL_SECONDS = int(os.getenv("RATING_CACHE_TTL_SECONDS", str(7 * 24 * 3600)))
+
+# Sources whose behaviour determines a rating; any edit yields a new scorer version
+_SRC_ROOT = Path(__file__).resolve().parents[1]
+SCORER_SOURCES = (
+    "acmecli/metrics/*.py",
+    "acmecli/scoring.py",
+    "services/rating.py",
+    "services/rating_config.py",
+)
+
+_scorer_version: Optional[str] = None
+
+
+def get_scorer_version() -> str:
+    """Version of the scoring code, from RATING_SCORER_VERSION or a source hash."""
+    global _scorer_version
+    if _scorer_version is None:
+        configured = os.getenv("RATING_SCORER_VERSION")
+        if configured:
+            _scorer_version = configured
+        else:
+            digest = hashlib.sha256()
+            for pattern in SCORER_SOURCES:
+                for path in sorted(_SRC_ROOT.glob(pattern)):
+                    digest.update(path.relative_to(_SRC_ROOT).as_posix().encode())
+                    digest.update(path.read_bytes())
+            _scorer_version = digest.hexdigest()[:12]
+    return _scorer_version
+
+
+def _safe_name(name: str) -> str:
+    for char in '/\\:?*"<>|':
+        name = name.replace(char, "_")
+    return name.strip(".") or "_"
+
+
+def rating_cache_key(name: str, content_hash: str) -> str:
+    return f"{RATING_CACHE_PREFIX}/{get_scorer_version()}/{_safe_name(name)}/{content_hash}.json"
+
+
+def model_content_hash(model_id: str, version: str) -> Optional[str]:
+    """Content hash of an uploaded model from one HEAD, without downloading it."""
+    from .s3_service import s3, ap_arn, aws_available
+
+    if not aws_available:
+        return None
+    try:
+        return content_identity(s3, ap_arn, f"models/{model_id}/{version}/model.zip")
+    except (ClientError, KeyError, ValueError) as e:
+        logger.debug(f"[RATE] Could not resolve content hash for {model_id} v{version}: {e}")
+        return None
+
+
+def get_cached_rating(name: str, content_hash: Optional[str]) -> Optional[Dict[str, Any]]:
+    """Return the stored rating for ``name`` at ``content_hash``, or None on a miss."""
+    if not RATING_CACHE_ENABLED or not content_hash:
+        return None
+    from .s3_service import s3, ap_arn, aws_available
+
+    if not aws_available:
+        return None
+    key = rating_cache_key(name, content_hash)
+    try:
+        entry = json.loads(s3.get_object(Bucket=ap_arn, Key=key)["Body"].read())
+    except ClientError as e:
+        if e.response.get("Error", {}).get("Code") not in ("NoSuchKey", "404"):
+            logger.warning(f"[RATE] Rating cache lookup failed for {key}: {e}")
+        return None
+    except Exception as e:
+        logger.warning(f"[RATE] Rating cache entry {key} is unreadable: {e}")
+        return None
+    if time.time() - entry.get("cached_at", 0) > RATING_CACHE_TTL_SECONDS:
+        return None
+    return entry.get("rating")
+
+
+def put_cached_rating(name: str, content_hash: Optional[str], rating: Dict[str, Any]) -> bool:
+    """Store ``rating`` for ``name`` at ``content_hash``. Returns True if written."""
+    if not RATING_CACHE_ENABLED or not content_hash or not rating:
+        return False
+    if rating.get("metric_timeouts"):
+        return False
+    from .s3_service import s3, ap_arn, aws_available, kms_key_arn
+
+    if not aws_available:
+        return False
+    key = rating_cache_key(name, content_hash)
+    put_params = {
+        "Bucket": ap_arn,
+        "Key": key,
+        "Body": json.dumps(
+            {
+                "name": name,
+                "content_hash": content_hash,
+                "scorer_version": get_scorer_version(),
+                "cached_at": time.time(),
+                "rating": rating,
+            },
+            default=list,
+        ).encode("utf-8"),
+        "ContentType": "application/json",
+    }
+    if kms_key_arn:
+        put_params["ServerSideEncryption"] = "aws:kms"
+        put_params["SSEKMSKeyId"] = kms_key_arn
+    try:
+        s3.put_object(**put_params)
+        return True
+    except Exception as e:
+        logger.warning(f"[RATE] Failed to store rating cache entry {key}: {e}")
+        return False
@@ -0,0 +1,281 @@
+"""
+Bounded scheduler for background rating jobs.
+
+Model ingests used to start one thread per rating, so a burst of ingests meant
+a burst of concurrent downloads and LLM calls. RatingScheduler runs jobs on a
+fixed set of worker threads instead:
+
+- jobs wait in a priority queue; interactive requests (a client blocked on
+  /rate) go ahead of background ingest ratings
+- a job ID is queued at most once; resubmitting a queued job only raises its
+  priority, resubmitting a running job is a no-op
+- queued jobs can be cancelled
+- callers can register on_done callbacks to learn when a job finishes, even
+  if it was already queued or running
+- the queue is bounded; submit() raises QueueFull so callers can push back
+
+Queue depth, counters and wait/run time histograms are exposed via stats().
+"""
+import heapq
+import itertools
+import logging
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .rds_pool import Histogram
+
+logger = logging.getLogger(__name__)
+
+RATING_WORKERS = int(os.getenv("RATING_WORKERS", "4"))
+RATING_QUEUE_MAX = int(os.getenv("RATING_QUEUE_MAX", "500"))
+
+PRIORITY_INTERACTIVE = 0
+PRIORITY_BACKGROUND = 10
+_PRIORITY_NAMES = {PRIORITY_INTERACTIVE: "interactive", PRIORITY_BACKGROUND: "background"}
+
+# Bucket upper bounds in milliseconds; ratings take seconds to minutes
+WAIT_BUCKETS_MS = (10, 100, 1000, 5000, 15000, 30000, 60000, 120000, 300000, 600000)
+
+
+class QueueFull(Exception):
+    """Raised when a job is submitted while the queue is at capacity."""
+
+
+class _Job:
+    __slots__ = ("job_id", "args", "priority", "seq", "enqueued_at")
+
+    def __init__(self, job_id: str, args: Tuple[Any, ...], priority: int, seq: int):
+        self.job_id = job_id
+        self.args = args
+        self.priority = priority
+        self.seq = seq
+        self.enqueued_at = time.monotonic()
+
+
+class RatingScheduler:
+    """Fixed worker pool draining a bounded, deduplicating priority queue.
+
+    Args:
+        handler: Called as handler(job_id, *args) on a worker thread
+        workers: Number of worker threads (started on first submit)
+        max_queue: Maximum number of queued (not running) jobs
+    """
+
+    def __init__(
+        self,
+        handler: Callable[..., Any],
+        workers: int = RATING_WORKERS,
+        max_queue: int = RATING_QUEUE_MAX,
+    ):
+        self._handler = handler
+        self.workers = max(1, workers)
+        self.max_queue = max_queue
+        # Heap entries are (priority, seq, job_id); entries whose seq no longer
+        # matches the queued job (promoted or cancelled) are skipped when popped
+        self._heap: List[Tuple[int, int, str]] = []
+        self._queued: Dict[str, _Job] = {}
+        self._running: Dict[str, float] = {}
+        self._callbacks: Dict[str, List[Callable[[str], Any]]] = {}
+        self._seq = itertools.count()
+        self._cond = threading.Condition()
+        self._threads: List[threading.Thread] = []
+        self._counters = {
+            "submitted_total": 0,
+            "deduplicated_total": 0,
+            "promoted_total": 0,
+            "rejected_total": 0,
+            "cancelled_total": 0,
+            "completed_total": 0,
+            "failed_total": 0,
+        }
+        self.wait_ms = Histogram(WAIT_BUCKETS_MS)
+        self.run_ms = Histogram(WAIT_BUCKETS_MS)
+
+    def submit(
+        self,
+        job_id: str,
+        *args: Any,
+        priority: int = PRIORITY_BACKGROUND,
+        on_done: Optional[Callable[[str], Any]] = None,
+    ) -> bool:
+        """Queue handler(job_id, *args).
+
+        ``on_done(job_id)`` is called once the job has finished or failed (on
+        the worker thread) or has been cancelled. If job_id is already queued
+        or running, it is attached to that job.
+
+        Returns:
+            True if a new job was queued, False if job_id was already queued or
+            running (a queued job is promoted to ``priority`` if that is higher)
+
+        Raises:
+            QueueFull: If the queue is at max_queue
+        """
+        with self._cond:
+            if job_id in self._queued or job_id in self._running:
+                if job_id in self._queued:
+                    self._promote(job_id, priority)
+                self._add_callback(job_id, on_done)
+                self._counters["deduplicated_total"] += 1
+                return False
+            if len(self._queued) >= self.max_queue:
+                self._counters["rejected_total"] += 1
+                raise QueueFull(f"Rating queue is full ({self.max_queue} jobs)")
+            self._add_callback(job_id, on_done)
+            job = _Job(job_id, args, priority, next(self._seq))
+            self._queued[job_id] = job
+            heapq.heappush(self._heap, (priority, job.seq, job_id))
+            self._counters["submitted_total"] += 1
+            self._ensure_workers()
+            self._cond.notify()
+            return True
+
+    def promote(self, job_id: str, priority: int = PRIORITY_INTERACTIVE) -> bool:
+        """Raise a queued job to ``priority``. Returns True if it was queued."""
+        with self._cond:
+            if job_id not in self._queued:
+                return False
+            self._promote(job_id, priority)
+            return True
+
+    def _add_callback(self, job_id: str, on_done: Optional[Callable[[str], Any]]) -> None:
+        # Caller holds self._cond
+        if on_done is not None:
+            self._callbacks.setdefault(job_id, []).append(on_done)
+
+    def _notify_done(self, job_id: str, callbacks: List[Callable[[str], Any]]) -> None:
+        # Callbacks are popped under self._cond in the same critical section
+        # that ends the job, so one registered by a later submit of job_id is
+        # never fired for this job; they are called without the lock held
+        for callback in callbacks:
+            try:
+                callback(job_id)
+            except Exception as e:
+                logger.error(f"Rating job {job_id} callback failed: {e}", exc_info=True)
+
+    def _promote(self, job_id: str, priority: int) -> None:
+        # Caller holds self._cond
+        job = self._queued[job_id]
+        if priority < job.priority:
+            job.priority = priority
+            job.seq = next(self._seq)
+            heapq.heappush(self._heap, (priority, job.seq, job_id))
+            self._counters["promoted_total"] += 1
+
+    def cancel(self, job_id: str) -> bool:
+        """Drop a queued job. Running jobs are not interrupted.
+
+        Returns:
+            True if the job was queued and is now cancelled
+        """
+        with self._cond:
+            if self._queued.pop(job_id, None) is None:
+                return False
+            self._counters["cancelled_total"] += 1
+            callbacks = self._callbacks.pop(job_id, [])
+        self._notify_done(job_id, callbacks)
+        return True
+
+    def detach(self, job_id: str) -> Optional[List[Callable[[str], Any]]]:
+        """Drop a queued job without notifying its callbacks and return them.
+
+        For a caller that runs the job itself instead; it must call each
+        callback with job_id once done.
+
+        Returns:
+            The job's callbacks, or None if it was not queued (a running job
+            keeps its callbacks)
+        """
+        with self._cond:
+            if self._queued.pop(job_id, None) is None:
+                return None
+            self._counters["cancelled_total"] += 1
+            return self._callbacks.pop(job_id, [])
+
+    def cancel_all(self) -> List[str]:
+        """Drop every queued job and return their IDs."""
+        with self._cond:
+            cancelled = list(self._queued)
+            self._queued.clear()
+            self._heap.clear()
+            self._counters["cancelled_total"] += len(cancelled)
+            callbacks = {job_id: self._callbacks.pop(job_id, []) for job_id in cancelled}
+        for job_id in cancelled:
+            self._notify_done(job_id, callbacks[job_id])
+        return cancelled
+
+    def is_queued(self, job_id: str) -> bool:
+        with self._cond:
+            return job_id in self._queued
+
+    def is_saturated(self) -> bool:
+        with self._cond:
+            return len(self._queued) >= self.max_queue
+
+    def stats(self) -> Dict[str, Any]:
+        with self._cond:
+            by_priority: Dict[str, int] = {}
+            for job in self._queued.values():
+                name = _PRIORITY_NAMES.get(job.priority, str(job.priority))
+                by_priority[name] = by_priority.get(name, 0) + 1
+            now = time.monotonic()
+            oldest_ms = max(
+                ((now - job.enqueued_at) * 1000 for job in self._queued.values()),
+                default=0.0,
+            )
+            stats = {
+                "workers": self.workers,
+                "max_queue": self.max_queue,
+                "queue_depth": len(self._queued),
+                "queued_by_priority": by_priority,
+                "oldest_queued_ms": round(oldest_ms, 1),
+                "running": len(self._running),
+                **self._counters,
+            }
+        stats["wait_ms"] = self.wait_ms.snapshot()
+        stats["run_ms"] = self.run_ms.snapshot()
+        return stats
+
+    def _ensure_workers(self) -> None:
+        # Caller holds self._cond
+        while len(self._threads) < self.workers:
+            thread = threading.Thread(
+                target=self._worker,
+                name=f"rating-worker-{len(self._threads)}",
+                daemon=True,
+            )
+            self._threads.append(thread)
+            thread.start()
+
+    def _next_job(self) -> _Job:
+        with self._cond:
+            while True:
+                while self._heap:
+                    _, seq, job_id = heapq.heappop(self._heap)
+                    job = self._queued.get(job_id)
+                    if job is None or job.seq != seq:
+                        continue  # Cancelled or superseded by a promotion
+                    del self._queued[job_id]
+                    self._running[job_id] = time.monotonic()
+                    return job
+                self._cond.wait()
+
+    def _worker(self) -> None:
+        while True:
+            job = self._next_job()
+            started = time.monotonic()
+            self.wait_ms.observe((started - job.enqueued_at) * 1000)
+            try:
+                self._handler(job.job_id, *job.args)
+                outcome = "completed_total"
+            except Exception as e:
+                logger.error(f"Rating job {job.job_id} failed: {e}", exc_info=True)
+                outcome = "failed_total"
+            self.run_ms.observe((time.monotonic() - started) * 1000)
+            with self._cond:
+                self._running.pop(job.job_id, None)
+                self._counters[outcome] += 1
+                callbacks = self._callbacks.pop(job.job_id, [])
+            self._notify_done(job.job_id, callbacks)
@@ -0,0 +1,221 @@
+"""
+Instrumented connection pool for the RDS backend.
+
+psycopg2's ThreadedConnectionPool raises as soon as every connection is
+checked out. InstrumentedConnectionPool puts a bounded semaphore in front of it
+so callers wait (up to a timeout) for a free connection instead, and records:
+
+- acquire wait time histogram and timeout count
+- pool utilization (connections in use / max) sampled at every acquire
+- per-statement latency, grouped by verb and table (via TimedCursor)
+
+The numbers are exposed through stats() so the pool can be sized from data.
+"""
+import threading
+import time
+import logging
+from typing import Any, Dict, List, Optional, Sequence
+
+from psycopg2 import extensions, pool
+
+logger = logging.getLogger(__name__)
+
+# Bucket upper bounds in milliseconds (last bucket is open-ended)
+LATENCY_BUCKETS_MS = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+# Utilization buckets as fractions of max connections
+UTILIZATION_BUCKETS = (0.1, 0.25, 0.5, 0.75, 0.9, 1.0)
+
+_TABLE_KEYWORDS = {"FROM", "INTO", "TABLE", "UPDATE"}
+_SKIP_WORDS = {"IF", "NOT", "EXISTS", "ONLY"}
+
+
+class PoolTimeout(pool.PoolError):
+    """Raised when no connection becomes available within the acquire timeout."""
+
+
+class Histogram:
+    """Thread-safe fixed-bucket histogram with approximate percentiles."""
+
+    def __init__(self, buckets: Sequence[float]):
+        self.buckets = tuple(buckets)
+        self._counts = [0] * (len(self.buckets) + 1)
+        self._count = 0
+        self._sum = 0.0
+        self._max = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        index = len(self.buckets)
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                index = i
+                break
+        with self._lock:
+            self._counts[index] += 1
+            self._count += 1
+            self._sum += value
+            self._max = max(self._max, value)
+
+    def _percentile(self, counts: List[int], total: int, fraction: float) -> float:
+        """Return the upper bound of the bucket holding the given fraction of samples."""
+        target = total * fraction
+        running = 0
+        for i, count in enumerate(counts):
+            running += count
+            if running >= target:
+                return self.buckets[i] if i < len(self.buckets) else self._max
+        return self._max
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            counts = list(self._counts)
+            total = self._count
+            total_sum = self._sum
+            maximum = self._max
+        labels = [f"<={bound:g}" for bound in self.buckets] + [f">{self.buckets[-1]:g}"]
+        snapshot = {
+            "count": total,
+            "mean": total_sum / total if total else 0.0,
+            "max": maximum,
+            "buckets": dict(zip(labels, counts)),
+        }
+        if total:
+            snapshot["p50"] = self._percentile(counts, total, 0.50)
+            snapshot["p95"] = self._percentile(counts, total, 0.95)
+            snapshot["p99"] = self._percentile(counts, total, 0.99)
+        return snapshot
+
+
+class StatementStats:
+    """Latency histograms keyed by statement label (e.g. 'SELECT model_files')."""
+
+    def __init__(self):
+        self._histograms: Dict[str, Histogram] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def label(sql: Any) -> str:
+        """Return 'VERB table' for a statement, e.g. 'INSERT model_chunks'."""
+        if isinstance(sql, bytes):
+            sql = sql.decode("utf-8", "replace")
+        words = str(sql).split()
+        if not words:
+            return "OTHER"
+        verb = words[0].upper()
+        for i, word in enumerate(words):
+            if word.upper() in _TABLE_KEYWORDS and (i > 0 or verb == "UPDATE"):
+                for candidate in words[i + 1:]:
+                    if candidate.upper() not in _SKIP_WORDS:
+                        return f"{verb} {candidate.strip('(),;')}"
+                break
+        return verb
+
+    def observe(self, sql: Any, elapsed_ms: float) -> None:
+        key = self.label(sql)
+        histogram = self._histograms.get(key)
+        if histogram is None:
+            with self._lock:
+                histogram = self._histograms.setdefault(key, Histogram(LATENCY_BUCKETS_MS))
+        histogram.observe(elapsed_ms)
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        with self._lock:
+            items = list(self._histograms.items())
+        return {key: histogram.snapshot() for key, histogram in sorted(items)}
+
+
+statement_stats = StatementStats()
+
+
+class TimedCursor(extensions.cursor):
+    """Cursor that records execute() latency in ``statement_stats``."""
+
+    def execute(self, query, vars=None):
+        start = time.perf_counter()
+        try:
+            return super().execute(query, vars)
+        finally:
+            statement_stats.observe(query, (time.perf_counter() - start) * 1000)
+
+
+class InstrumentedConnectionPool:
+    """ThreadedConnectionPool with blocking acquire and usage metrics.
+
+    Connections are created with TimedCursor as the default cursor factory;
+    callers that pass an explicit ``cursor_factory`` are not timed.
+    """
+
+    def __init__(self, minconn: int, maxconn: int, acquire_timeout: float, **connect_kwargs):
+        connect_kwargs.setdefault("cursor_factory", TimedCursor)
+        self._pool = pool.ThreadedConnectionPool(minconn, maxconn, **connect_kwargs)
+        self.minconn = minconn
+        self.maxconn = maxconn
+        self.acquire_timeout = acquire_timeout
+        self._slots = threading.BoundedSemaphore(maxconn)
+        self._lock = threading.Lock()
+        self._in_use = 0
+        self._peak_in_use = 0
+        self._acquired = 0
+        self._timeouts = 0
+        self.wait_ms = Histogram(LATENCY_BUCKETS_MS)
+        self.utilization = Histogram(UTILIZATION_BUCKETS)
+
+    def getconn(self, key=None, timeout: Optional[float] = None):
+        """Check out a connection, waiting up to ``timeout`` seconds for a free slot.
+
+        Raises:
+            PoolTimeout: If no connection is released in time
+        """
+        wait_timeout = self.acquire_timeout if timeout is None else timeout
+        start = time.perf_counter()
+        if not self._slots.acquire(timeout=wait_timeout):
+            with self._lock:
+                self._timeouts += 1
+            logger.warning(
+                f"RDS pool acquire timed out after {wait_timeout:.1f}s ({self.maxconn} connections in use)"
+            )
+            raise PoolTimeout(f"No RDS connection available within {wait_timeout:.1f}s")
+        self.wait_ms.observe((time.perf_counter() - start) * 1000)
+        try:
+            conn = self._pool.getconn(key)
+        except Exception:
+            self._slots.release()
+            raise
+        with self._lock:
+            self._in_use += 1
+            self._acquired += 1
+            self._peak_in_use = max(self._peak_in_use, self._in_use)
+            in_use = self._in_use
+        self.utilization.observe(in_use / self.maxconn)
+        return conn
+
+    def putconn(self, conn, key=None, close: bool = False) -> None:
+        try:
+            self._pool.putconn(conn, key=key, close=close)
+        finally:
+            with self._lock:
+                self._in_use -= 1
+            self._slots.release()
+
+    def closeall(self) -> None:
+        self._pool.closeall()
+
+    @property
+    def closed(self) -> bool:
+        return self._pool.closed
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            counters = {
+                "min_connections": self.minconn,
+                "max_connections": self.maxconn,
+                "acquire_timeout_seconds": self.acquire_timeout,
+                "in_use": self._in_use,
+                "peak_in_use": self._peak_in_use,
+                "acquired_total": self._acquired,
+                "timeouts_total": self._timeouts,
+            }
+        counters["wait_ms"] = self.wait_ms.snapshot()
+        counters["utilization"] = self.utilization.snapshot()
+        counters["statements_ms"] = statement_stats.snapshot()
+        return counters
@@ -3,17 +3,28 @@ RDS PostgreSQL storage backend for model files.
 
 This module provides RDS-based storage for model files using PostgreSQL BYTEA.
 Designed for simple, non-scalable storage of up to 500 models.
+
+File bytes are content-addressed: each distinct archive is stored once in
+``model_blobs`` keyed by its sha256, and ``model_files`` rows reference it via
+``content_hash``. Blob bytes are split into fixed-size ``model_chunks`` rows
+(``RDS_CHUNK_SIZE``, 1 MiB by default) so uploads are written chunk by chunk
+and downloads can be streamed through a server-side cursor with O(chunk)
+memory. Legacy rows that still carry inline ``file_data`` are served
+unchanged.
 """
 import os
 import json
+import uuid
+import hashlib
 import logging
 import psycopg2
-from psycopg2 import pool
 from psycopg2.extras import RealDictCursor, Json
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Iterator, Optional, Tuple
 from datetime import datetime, timezone
 from fastapi import HTTPException
 
+from .rds_pool import InstrumentedConnectionPool, PoolTimeout
+
 logger = logging.getLogger(__name__)
 
 # RDS connection configuration
@@ -34,15 +45,20 @@ if RDS_ENDPOINT and ":" in RDS_ENDPOINT:
     RDS_ENDPOINT = host
     RDS_PORT = port
 
-# Connection pool configuration
-CONNECTION_POOL_MIN = 5
-CONNECTION_POOL_MAX = 20
+# Connection pool configuration (size from the rds-pool stats on /health/components)
+CONNECTION_POOL_MIN = int(os.getenv("CONNECTION_POOL_MIN", "5"))
+CONNECTION_POOL_MAX = int(os.getenv("CONNECTION_POOL_MAX", "20"))
+# Seconds a request waits for a free connection before failing
+CONNECTION_POOL_ACQUIRE_TIMEOUT = float(os.getenv("CONNECTION_POOL_ACQUIRE_TIMEOUT", "10"))
+
+# Size of each model_chunks row
+CHUNK_SIZE = int(os.getenv("RDS_CHUNK_SIZE", str(1024 * 1024)))
 
 # Global connection pool
-_connection_pool: Optional[pool.ThreadedConnectionPool] = None
+_connection_pool: Optional[InstrumentedConnectionPool] = None
 
 
-def get_connection_pool() -> pool.ThreadedConnectionPool:
+def get_connection_pool() -> InstrumentedConnectionPool:
     """Get or create the RDS connection pool."""
     global _connection_pool
     
@@ -54,9 +70,10 @@ def get_connection_pool() -> pool.ThreadedConnectionPool:
             )
         
         try:
-            _connection_pool = pool.ThreadedConnectionPool(
+            _connection_pool = InstrumentedConnectionPool(
                 minconn=CONNECTION_POOL_MIN,
                 maxconn=CONNECTION_POOL_MAX,
+                acquire_timeout=CONNECTION_POOL_ACQUIRE_TIMEOUT,
                 host=RDS_ENDPOINT,
                 port=RDS_PORT,
                 database=RDS_DATABASE,
@@ -77,6 +94,13 @@ def get_connection_pool() -> pool.ThreadedConnectionPool:
     return _connection_pool
 
 
+def get_pool_stats() -> Optional[Dict[str, Any]]:
+    """Return connection pool and statement latency stats, or None if the pool is not created yet."""
+    if _connection_pool is None:
+        return None
+    return _connection_pool.stats()
+
+
 def _initialize_schema():
     """Initialize database schema if it doesn't exist."""
     conn = None
@@ -99,6 +123,41 @@ def _initialize_schema():
             );
         """)
         
+        # Content-addressed blob table: identical archives share one row
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS model_blobs (
+                content_hash CHAR(64) NOT NULL PRIMARY KEY,
+                file_data BYTEA NOT NULL,
+                file_size BIGINT NOT NULL,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            );
+        """)
+        
+        # model_files rows become pointers into model_blobs
+        cursor.execute("""
+            ALTER TABLE model_files ADD COLUMN IF NOT EXISTS content_hash CHAR(64);
+        """)
+        cursor.execute("""
+            ALTER TABLE model_files ALTER COLUMN file_data DROP NOT NULL;
+        """)
+        
+        # Blob bytes live in fixed-size rows of model_chunks; model_blobs.file_data
+        # is only set for blobs written before chunking existed
+        cursor.execute("""
+            ALTER TABLE model_blobs ALTER COLUMN file_data DROP NOT NULL;
+        """)
+        cursor.execute("""
+            ALTER TABLE model_blobs ADD COLUMN IF NOT EXISTS chunk_size INTEGER;
+        """)
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS model_chunks (
+                model_key CHAR(64) NOT NULL REFERENCES model_blobs(content_hash) ON DELETE CASCADE,
+                seq INTEGER NOT NULL,
+                data BYTEA NOT NULL,
+                PRIMARY KEY (model_key, seq)
+            );
+        """)
+        
         # Create artifact_metadata table for storing metadata (not binary files)
         cursor.execute("""
             CREATE TABLE IF NOT EXISTS artifact_metadata (
@@ -144,6 +203,113 @@ def _initialize_schema():
             pool.putconn(conn)
 
 
+def _store_file(
+    cursor, file_content: bytes, model_id: str, version: str, component: str, path_prefix: str
+) -> Dict[str, Any]:
+    """Store ``file_content`` as a content-addressed blob and upsert its pointer row.
+    
+    Returns:
+        Dictionary with ``sha256`` and ``deduplicated`` (True if the blob already existed)
+    """
+    content_hash = hashlib.sha256(file_content).hexdigest()
+    
+    # Only ship the bytes to the server if this content is not stored yet
+    cursor.execute("""
+        SELECT 1 FROM model_blobs WHERE content_hash = %s
+    """, (content_hash,))
+    deduplicated = cursor.fetchone() is not None
+    if not deduplicated:
+        cursor.execute("""
+            INSERT INTO model_blobs (content_hash, file_data, file_size, chunk_size)
+            VALUES (%s, NULL, %s, %s)
+            ON CONFLICT (content_hash) DO NOTHING
+        """, (content_hash, len(file_content), CHUNK_SIZE))
+        # Write one bounded parameter per statement instead of the whole archive
+        view = memoryview(file_content)
+        for seq, offset in enumerate(range(0, len(file_content), CHUNK_SIZE)):
+            cursor.execute("""
+                INSERT INTO model_chunks (model_key, seq, data)
+                VALUES (%s, %s, %s)
+                ON CONFLICT (model_key, seq) DO NOTHING
+            """, (content_hash, seq, psycopg2.Binary(view[offset:offset + CHUNK_SIZE])))
+    
+    # Insert or update the pointer row
+    cursor.execute("""
+        INSERT INTO model_files (model_id, version, component, path_prefix, file_data, file_size, content_hash)
+        VALUES (%s, %s, %s, %s, NULL, %s, %s)
+        ON CONFLICT (model_id, version, component, path_prefix)
+        DO UPDATE SET
+            file_data = NULL,
+            file_size = EXCLUDED.file_size,
+            content_hash = EXCLUDED.content_hash,
+            created_at = CURRENT_TIMESTAMP
+    """, (model_id, version, component, path_prefix, len(file_content), content_hash))
+    return {"sha256": content_hash, "deduplicated": deduplicated}
+
+
+def _locate_file(cursor, model_id: str, version: str, component: str, path_prefix: str):
+    """Resolve a model row to its storage.
+    
+    Returns:
+        None if the row does not exist, otherwise a tuple of
+        (file_size, content_hash, chunk_size, inline_data). ``chunk_size`` is
+        None for legacy blobs/rows whose bytes are in ``inline_data``.
+    """
+    cursor.execute("""
+        SELECT f.file_size, b.content_hash, b.chunk_size,
+               CASE WHEN b.chunk_size IS NULL THEN COALESCE(b.file_data, f.file_data) END
+        FROM model_files f
+        LEFT JOIN model_blobs b ON b.content_hash = f.content_hash
+        WHERE f.model_id = %s AND f.version = %s AND f.component = %s AND f.path_prefix = %s
+    """, (model_id, version, component, path_prefix))
+    return cursor.fetchone()
+
+
+def _iter_chunks(
+    conn, location, start: int = 0, end: Optional[int] = None
+) -> Iterator[bytes]:
+    """Yield bytes ``start``..``end`` (inclusive) of a located file.
+    
+    Chunked blobs are read through a named (server-side) cursor so only one
+    chunk is held in memory at a time.
+    """
+    file_size, content_hash, chunk_size, inline_data = location
+    if end is None or end >= file_size:
+        end = file_size - 1
+    if start > end:
+        return
+    
+    if chunk_size is None:
+        yield bytes(inline_data[start:end + 1])
+        return
+    
+    first_seq = start // chunk_size
+    last_seq = end // chunk_size
+    cursor = conn.cursor(name=f"model_chunks_{uuid.uuid4().hex}")
+    cursor.itersize = 1
+    try:
+        cursor.execute("""
+            SELECT seq, data FROM model_chunks
+            WHERE model_key = %s AND seq BETWEEN %s AND %s
+            ORDER BY seq
+        """, (content_hash, first_seq, last_seq))
+        for seq, data in cursor:
+            chunk_start = seq * chunk_size
+            lo = max(start - chunk_start, 0)
+            hi = min(end - chunk_start + 1, len(data))
+            yield bytes(data[lo:hi])
+    finally:
+        cursor.close()
+
+
+def _fetch_file(cursor, model_id: str, version: str, component: str, path_prefix: str):
+    """Fetch (file_data, file_size) for a model row, or None if it does not exist."""
+    location = _locate_file(cursor, model_id, version, component, path_prefix)
+    if not location:
+        return None
+    return b"".join(_iter_chunks(cursor.connection, location)), location[0]
+
+
 def upload_model(
     file_content: bytes, model_id: str, version: str, use_performance_path: bool = False
 ) -> Dict[str, str]:
@@ -173,22 +339,30 @@ def upload_model(
         conn = pool.getconn()
         cursor = conn.cursor()
         
-        # Insert or update model file
+        stored = _store_file(cursor, file_content, model_id, version, component, path_prefix)
+        
+        # Component archives split from the previous content are now stale
         cursor.execute("""
-            INSERT INTO model_files (model_id, version, component, path_prefix, file_data, file_size)
-            VALUES (%s, %s, %s, %s, %s, %s)
-            ON CONFLICT (model_id, version, component, path_prefix)
-            DO UPDATE SET
-                file_data = EXCLUDED.file_data,
-                file_size = EXCLUDED.file_size,
-                created_at = CURRENT_TIMESTAMP
-        """, (model_id, version, component, path_prefix, psycopg2.Binary(file_content), len(file_content)))
+            DELETE FROM model_files
+            WHERE model_id = %s AND version = %s AND path_prefix = %s AND component <> 'full'
+        """, (model_id, version, path_prefix))
         
         conn.commit()
+        from .storage_service import invalidate_cached_model
+
+        invalidate_cached_model(model_id, version, use_performance_path)
         logger.info(
-            f"RDS upload successful: {model_id} v{version} ({len(file_content)} bytes) -> {path_prefix}/"
+            f"RDS upload successful: {model_id} v{version} ({len(file_content)} bytes) -> {path_prefix}/ "
+            f"(blob {stored['sha256'][:12]}, {'deduplicated' if stored['deduplicated'] else 'new'})"
         )
-        return {"message": "Upload successful", "path": f"{path_prefix}/{model_id}/{version}"}
+        return {
+            "message": "Upload successful",
+            "path": f"{path_prefix}/{model_id}/{version}",
+            "sha256": stored["sha256"],
+            "deduplicated": stored["deduplicated"],
+        }
+    except PoolTimeout as e:
+        raise HTTPException(status_code=503, detail=f"RDS busy: {str(e)}")
     except Exception as e:
         error_msg = str(e)
         logger.error(f"RDS upload failed for {model_id} v{version}: {error_msg}", exc_info=True)
@@ -205,6 +379,10 @@ def download_model(
 ) -> bytes:
     """Download a model file from RDS.
     
+    Component archives ('weights', 'datasets') are split from the full archive on
+    first request and stored as their own rows, so later requests are a single
+    lookup.
+    
     Args:
         model_id: Model identifier
         version: Model version
@@ -225,14 +403,24 @@ def download_model(
         conn = pool.getconn()
         cursor = conn.cursor()
         
-        # Query model file
-        cursor.execute("""
-            SELECT file_data, file_size
-            FROM model_files
-            WHERE model_id = %s AND version = %s AND component = %s AND path_prefix = %s
-        """, (model_id, version, component, path_prefix))
+        result = _fetch_file(cursor, model_id, version, component, path_prefix)
         
-        result = cursor.fetchone()
+        if not result and component != "full":
+            from .s3_service import MODEL_COMPONENTS, extract_model_component
+            
+            if component in MODEL_COMPONENTS:
+                full = _fetch_file(cursor, model_id, version, "full", path_prefix)
+                if full:
+                    try:
+                        component_content = extract_model_component(bytes(full[0]), component)
+                    except ValueError as e:
+                        raise HTTPException(status_code=400, detail=str(e))
+                    _store_file(cursor, component_content, model_id, version, component, path_prefix)
+                    conn.commit()
+                    result = (component_content, len(component_content))
+            else:
+                # Unknown component: serve the full archive (matches S3 behaviour)
+                result = _fetch_file(cursor, model_id, version, "full", path_prefix)
         
         if not result:
             raise HTTPException(
@@ -248,15 +436,121 @@ def download_model(
         return bytes(file_data)
     except HTTPException:
         raise
+    except PoolTimeout as e:
+        raise HTTPException(status_code=503, detail=f"RDS busy: {str(e)}")
     except Exception as e:
         error_msg = str(e)
         logger.error(f"RDS download failed for {model_id} v{version}: {error_msg}", exc_info=True)
+        if conn:
+            conn.rollback()
         raise HTTPException(status_code=500, detail=f"RDS download failed: {error_msg}")
     finally:
         if conn:
             pool.putconn(conn)
 
 
+class _PooledStream:
+    """Chunk iterator that returns its connection to the pool when finished.
+    
+    The connection is also released on close() or garbage collection, so a
+    response that is never iterated (e.g. client disconnect) does not leak it.
+    """
+    
+    def __init__(self, pool, conn, chunks: Iterator[bytes]):
+        self._pool = pool
+        self._conn = conn
+        self._chunks = chunks
+    
+    def __iter__(self):
+        return self
+    
+    def __next__(self) -> bytes:
+        try:
+            return next(self._chunks)
+        except BaseException:
+            self.close()
+            raise
+    
+    def close(self) -> None:
+        if self._conn is not None:
+            self._chunks.close()
+            self._pool.putconn(self._conn)
+            self._conn = None
+    
+    def __del__(self):
+        self.close()
+
+
+def open_model_stream(
+    model_id: str,
+    version: str,
+    component: str = "full",
+    use_performance_path: bool = False,
+    start: int = 0,
+    end: Optional[int] = None,
+) -> Tuple[int, Iterator[bytes]]:
+    """Open a streaming read of a model file from RDS.
+    
+    The lookup happens eagerly so a missing model raises before any bytes are
+    sent; the returned iterator holds a pooled connection until it is
+    exhausted or closed.
+    
+    Args:
+        model_id: Model identifier
+        version: Model version
+        component: Component to download ('full', 'weights', 'datasets')
+        use_performance_path: If True, use 'performance' path prefix, otherwise 'models'
+        start: First byte offset to return
+        end: Last byte offset to return (inclusive), or None for end of file
+        
+    Returns:
+        Tuple of (total file size in bytes, iterator of byte chunks)
+        
+    Raises:
+        HTTPException: If the model is not found or the lookup fails
+    """
+    path_prefix = "performance" if use_performance_path else "models"
+    
+    pool = get_connection_pool()
+    conn = None
+    try:
+        conn = pool.getconn()
+        cursor = conn.cursor()
+        location = _locate_file(cursor, model_id, version, component, path_prefix)
+        if not location and component != "full":
+            # Let download_model build and persist the component row, then stream it
+            pool.putconn(conn)
+            conn = None
+            download_model(model_id, version, component, use_performance_path)
+            conn = pool.getconn()
+            cursor = conn.cursor()
+            location = _locate_file(cursor, model_id, version, component, path_prefix)
+            if not location:
+                # Unknown components are served as the full archive
+                location = _locate_file(cursor, model_id, version, "full", path_prefix)
+        cursor.close()
+    except HTTPException:
+        if conn:
+            pool.putconn(conn)
+        raise
+    except PoolTimeout as e:
+        raise HTTPException(status_code=503, detail=f"RDS busy: {str(e)}")
+    except Exception as e:
+        logger.error(f"RDS stream open failed for {model_id} v{version}: {e}", exc_info=True)
+        if conn:
+            pool.putconn(conn)
+        raise HTTPException(status_code=500, detail=f"RDS download failed: {str(e)}")
+    
+    if not location:
+        pool.putconn(conn)
+        raise HTTPException(
+            status_code=404,
+            detail=f"Model {model_id} version {version} not found in RDS ({path_prefix}/)",
+        )
+    
+    return location[0], _PooledStream(pool, conn, _iter_chunks(conn, location, start, end))
+
+
 def model_exists(
     model_id: str, version: str, component: str = "full", use_performance_path: bool = False
 ) -> bool:
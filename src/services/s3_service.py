@@ -9,9 +9,8 @@ import logging
 import urllib.request
 import urllib.error
 import requests
-import shutil
 import tempfile
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Iterable, Optional
 from fastapi import HTTPException
 from botocore.exceptions import ClientError
 from botocore.auth import SigV4Auth
@@ -21,7 +20,15 @@ from botocore.session import Session
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from ..acmecli.types import MetricValue
 from ..acmecli.hf_handler import fetch_hf_metadata
-from ..acmecli.metrics import METRIC_FUNCTIONS
+from ..acmecli import http_client
+from .blob_store import (
+    collect_garbage,
+    read_derived,
+    read_object,
+    resolve_object_key,
+    store_content_addressed,
+)
+from .compression_policy import write_member
 
 region = os.getenv("AWS_REGION", "us-east-1")
 access_point_name = os.getenv("S3_ACCESS_POINT_NAME", "cs450-s3")
@@ -137,9 +144,8 @@ def get_model_sizes(model_id: str, version: str) -> Dict[str, Any]:
         from botocore.exceptions import ClientError
 
         s3_key = f"models/{model_id}/{version}/model.zip"
-        response = s3.head_object(Bucket=ap_arn, Key=s3_key)
-        full_size = response["ContentLength"]
-        s3_response = s3.get_object(Bucket=ap_arn, Key=s3_key)
+        data_key, full_size = resolve_object_key(s3, ap_arn, s3_key)
+        s3_response = s3.get_object(Bucket=ap_arn, Key=data_key)
         zip_content = s3_response["Body"].read()
         with zipfile.ZipFile(io.BytesIO(zip_content), "r") as zip_file:
             weight_files = [
@@ -184,6 +190,10 @@ def get_model_sizes(model_id: str, version: str) -> Dict[str, Any]:
         return {"full": 0, "weights": 0, "datasets": 0, "error": str(e)}
 
 
+# Components that can be split out of a full model archive
+MODEL_COMPONENTS = ("weights", "datasets")
+
+
 def extract_model_component(zip_content: bytes, component: str) -> bytes:
     try:
         with zipfile.ZipFile(io.BytesIO(zip_content), "r") as zip_file:
@@ -206,7 +216,7 @@ def extract_model_component(zip_content: bytes, component: str) -> bytes:
             output = io.BytesIO()
             with zipfile.ZipFile(output, "w", zipfile.ZIP_DEFLATED) as new_zip:
                 for file in files:
-                    new_zip.writestr(file, zip_file.read(file))
+                    write_member(new_zip, file, zip_file.read(file))
             return output.getvalue()
     except zipfile.BadZipFile:
         raise ValueError("Invalid ZIP file")
@@ -259,7 +269,11 @@ def get_presigned_upload_url(
 
 
 def upload_model(
-    file_content: bytes, model_id: str, version: str, debloat: bool = False
+    file_content: bytes,
+    model_id: str,
+    version: str,
+    debloat: bool = False,
+    use_performance_path: bool = False,
 ) -> Dict[str, str]:
     if not aws_available:
         raise HTTPException(
@@ -269,38 +283,33 @@ def upload_model(
     if not file_content or len(file_content) == 0:
         raise HTTPException(status_code=400, detail="Cannot upload empty file content")
     try:
+        from .storage_service import invalidate_cached_model, sanitize_model_key
+
         # Sanitize model_id and version for S3 key
-        safe_model_id = (
-            model_id.replace("https://huggingface.co/", "")
-            .replace("http://huggingface.co/", "")
-            .replace("/", "_")
-            .replace(":", "_")
-            .replace("\\", "_")
-            .replace("?", "_")
-            .replace("*", "_")
-            .replace('"', "_")
-            .replace("<", "_")
-            .replace(">", "_")
-            .replace("|", "_")
-        )
-        safe_version = version.replace("/", "_").replace(":", "_").replace("\\", "_")
-        s3_key = f"models/{safe_model_id}/{safe_version}/model.zip"
+        safe_model_id, safe_version = sanitize_model_key(model_id, version)
+        path_prefix = "performance" if use_performance_path else "models"
+        s3_key = f"{path_prefix}/{safe_model_id}/{safe_version}/model.zip"
 
         # Enforce SSE-KMS encryption for tampering protection
-        put_params = {
-            "Bucket": ap_arn,
-            "Key": s3_key,
-            "Body": file_content,
-            "ContentType": "application/zip"
-        }
+        encryption_params = {}
         if kms_key_arn:
-            put_params["ServerSideEncryption"] = "aws:kms"
-            put_params["SSEKMSKeyId"] = kms_key_arn
-        s3.put_object(**put_params)
+            encryption_params["ServerSideEncryption"] = "aws:kms"
+            encryption_params["SSEKMSKeyId"] = kms_key_arn
+        # Content-addressed: the blob is only written if its sha256 is new,
+        # the model key becomes a small pointer record
+        blob_info = store_content_addressed(
+            s3, ap_arn, s3_key, file_content, encryption_params
+        )
+        invalidate_cached_model(model_id, version, use_performance_path)
         print(
-            f"AWS S3 upload successful: {model_id} v{version} ({len(file_content)} bytes) -> {s3_key}"
+            f"AWS S3 upload successful: {model_id} v{version} ({len(file_content)} bytes) -> {s3_key} "
+            f"(blob {blob_info['sha256'][:12]}, {'deduplicated' if blob_info['deduplicated'] else 'new'})"
         )
-        return {"message": "Upload successful"}
+        return {
+            "message": "Upload successful",
+            "sha256": blob_info["sha256"],
+            "deduplicated": blob_info["deduplicated"],
+        }
     except Exception as e:
         error_msg = str(e)
         logger.error(
@@ -341,10 +350,28 @@ def download_model(model_id: str, version: str, component: str = "full", use_per
         # The endpoint receives the sanitized ID directly, so use it as-is
         s3_key = f"{path_prefix}/{model_id}/{version}/model.zip"
 
-        # Measure S3 download latency
+        # Measure S3 download latency (pointer resolution + blob fetch)
         with measure_operation("S3DownloadLatency", {"Component": "S3"}):
-            response = s3.get_object(Bucket=ap_arn, Key=s3_key)
-            zip_content = response["Body"].read()
+            if component in MODEL_COMPONENTS:
+                # Component archives are built once per blob and persisted, so
+                # repeat requests are a plain GET instead of unzip + re-zip
+                encryption_params = {}
+                if kms_key_arn:
+                    encryption_params["ServerSideEncryption"] = "aws:kms"
+                    encryption_params["SSEKMSKeyId"] = kms_key_arn
+                try:
+                    zip_content = read_derived(
+                        s3,
+                        ap_arn,
+                        s3_key,
+                        f"{component}.zip",
+                        lambda content: extract_model_component(content, component),
+                        encryption_params,
+                    )
+                except ValueError as e:
+                    raise HTTPException(status_code=400, detail=str(e))
+            else:
+                zip_content = read_object(s3, ap_arn, s3_key)
 
         # Publish bytes transferred metric
         bytes_transferred = len(zip_content)
@@ -355,17 +382,10 @@ def download_model(model_id: str, version: str, component: str = "full", use_per
             dimensions={"Component": "S3"},
         )
 
-        if component != "full":
-            try:
-                result = extract_model_component(zip_content, component)
-                print(
-                    f"AWS S3 download successful: {model_id} v{version} ({component}) from {path_prefix}/"
-                )
-                return result
-            except ValueError as e:
-                raise HTTPException(status_code=400, detail=str(e))
-        print(f"AWS S3 download successful: {model_id} v{version} (full) from {path_prefix}/")
+        print(f"AWS S3 download successful: {model_id} v{version} ({component}) from {path_prefix}/")
         return zip_content
+    except HTTPException:
+        raise
     except ClientError as e:
         error_code = e.response.get("Error", {}).get("Code", "")
         if error_code == "NoSuchKey":
@@ -406,8 +426,7 @@ def search_model_card_content(model_id: str, version: str, regex_pattern: str) -
         if is_likely_filename:
             try:
                 s3_key = f"models/{model_id}/{version}/model.zip"
-                response = s3.head_object(Bucket=ap_arn, Key=s3_key)
-                file_size = response["ContentLength"]
+                s3_key, file_size = resolve_object_key(s3, ap_arn, s3_key)
                 for tail_size in [32768, 65536, 131072]:  # 32KB, 64KB, 128KB
                     try:
                         range_start = max(0, file_size - tail_size)
@@ -614,6 +633,100 @@ def list_models(
         raise HTTPException(status_code=500, detail=f"Failed to list models: {str(e)}")
 
 
+# Versions preferred, in order, when a caller does not ask for a specific one
+DEFAULT_MODEL_VERSIONS = ("1.0.0", "main", "latest", "v1.0.0")
+
+
+def sanitize_model_name(model_id: str) -> str:
+    """Map a model name or Hugging Face URL to its S3 key segment (as upload_model does)."""
+    name = model_id.replace("https://huggingface.co/", "").replace("http://huggingface.co/", "")
+    for char in '/:\\?*"<>|':
+        name = name.replace(char, "_")
+    return name
+
+
+def _model_key_versions(name: str) -> list:
+    """Versions that have a model.zip under models/{name}/ (one LIST call)."""
+    prefix = f"models/{name}/"
+    versions = []
+    params = {"Bucket": ap_arn, "Prefix": prefix}
+    while True:
+        response = s3.list_objects_v2(**params)
+        for item in response.get("Contents", []):
+            parts = item["Key"][len(prefix):].split("/")
+            if len(parts) == 2 and parts[1] == "model.zip":
+                versions.append(parts[0])
+        if response.get("IsTruncated") is not True:
+            return versions
+        params["ContinuationToken"] = response["NextContinuationToken"]
+
+
+def _preferred_version(versions: list, requested: Optional[str]) -> str:
+    for version in ([requested] if requested else []) + list(DEFAULT_MODEL_VERSIONS):
+        if version in versions:
+            return version
+    # Semantic versions outrank anything else; ties fall back to the name
+    return max(versions, key=lambda v: (parse_version(v) or (-1,), v))
+
+
+def resolve_model_key(target: str, version: Optional[str] = None) -> Optional[tuple]:
+    """Find where a model is stored without scanning the registry.
+
+    ``target`` may be an artifact name, a Hugging Face ID or a Hugging Face
+    URL. Each candidate key name (sanitized, then as given) is checked with a
+    prefix LIST of ``models/{name}/``; the candidates are listed in parallel.
+    When several versions exist, ``version`` wins, then DEFAULT_MODEL_VERSIONS,
+    then the highest version number.
+
+    Returns:
+        (key_name, version) such that models/{key_name}/{version}/model.zip
+        exists, or None if the model is not in the registry
+    """
+    if not aws_available or not target:
+        return None
+    clean = target.replace("https://huggingface.co/", "").replace("http://huggingface.co/", "")
+    candidates = [sanitize_model_name(clean)]
+    if clean not in candidates and "/" not in clean:
+        candidates.append(clean)
+
+    def versions_for(name):
+        try:
+            return _model_key_versions(name)
+        except ClientError as e:
+            logger.debug(f"Model key lookup failed for {name}: {e}")
+            return []
+
+    if len(candidates) == 1:
+        found = [versions_for(candidates[0])]
+    else:
+        with ThreadPoolExecutor(max_workers=len(candidates)) as executor:
+            found = list(executor.map(versions_for, candidates))
+    for name, versions in zip(candidates, found):
+        if versions:
+            return name, _preferred_version(versions, version)
+    return None
+
+
+def reclaim_blobs(digests: Optional[Iterable[str]] = None) -> int:
+    """Delete content-addressed blobs no models/ or performance/ pointer references.
+
+    Args:
+        digests: Only consider these blob digests (e.g. those behind pointers a
+            delete just removed); None sweeps every stored blob.
+
+    Returns:
+        Number of S3 objects deleted. Failures are logged rather than raised,
+        since the delete or reset that triggered this already succeeded.
+    """
+    if not aws_available:
+        return 0
+    try:
+        return collect_garbage(s3, ap_arn, digests)
+    except Exception as e:
+        logger.warning(f"Blob reclamation failed: {e}")
+        return 0
+
+
 def reset_registry() -> Dict[str, str]:
     if not aws_available:
         raise HTTPException(
@@ -627,7 +740,8 @@ def reset_registry() -> Dict[str, str]:
         # Delete ALL artifact types: models, datasets, codes, and packages
         paginator = s3.get_paginator("list_objects_v2")
 
-        # Delete all artifact types
+        # Delete all artifact types. Content-addressed blobs are reclaimed below
+        # unless they still back performance/ pointers.
         prefixes = ["models/", "datasets/", "codes/", "packages/"]
 
         for prefix in prefixes:
@@ -637,11 +751,14 @@ def reset_registry() -> Dict[str, str]:
                     for item in page["Contents"]:
                         s3.delete_object(Bucket=ap_arn, Key=item["Key"])
                         deleted_count += 1
+        deleted_count += reclaim_blobs()
 
         if deleted_count > 0:
             print(f"AWS S3 reset successful: Deleted {deleted_count} objects")
         else:
             print("AWS S3 reset successful: No objects found to delete")
+        from .storage_service import clear_storage_cache
+        clear_storage_cache()
         return {"message": "Reset done successfully"}
     except Exception as e:
         print(f"AWS S3 reset failed: {e}")
@@ -676,8 +793,12 @@ def reset_performance_path() -> Dict[str, Any]:
                 for item in page["Contents"]:
                     s3.delete_object(Bucket=ap_arn, Key=item["Key"])
                     deleted_count += 1
+        reclaimed = reclaim_blobs()
 
-        logger.info(f"Performance path reset: Deleted {deleted_count} objects from performance/")
+        logger.info(
+            f"Performance path reset: Deleted {deleted_count} objects from performance/ "
+            f"and {reclaimed} unreferenced blob objects"
+        )
         return {
             "message": "Performance path reset successful",
             "deleted_count": deleted_count,
@@ -1373,7 +1494,7 @@ def send_request(url, headers, data):
         url, data=data.encode("utf-8"), headers=headers, method="POST"
     )
     try:
-        with urllib.request.urlopen(req) as response:
+        with http_client.urlopen(req) as response:
             return response.read().decode("utf-8")
     except urllib.error.HTTPError as e:
         print(f"HTTP Error: {e.code} - {e.reason}")
@@ -1489,7 +1610,7 @@ def sync_model_lineage_to_neptune():
 
 def download_file(url: str, timeout: int = 120) -> bytes | None:
     try:
-        response = requests.get(url, timeout=timeout)
+        response = http_client.get(url, timeout=timeout)
         if response.status_code == 200:
             return response.content
     except Exception:
@@ -1507,7 +1628,7 @@ def download_from_huggingface(model_id: str, version: str = "main") -> bytes:
 
         api_url = f"https://huggingface.co/api/models/{clean_model_id}"
         try:
-            response = requests.get(api_url, timeout=30)
+            response = http_client.get(api_url, timeout=30)
         except requests.exceptions.Timeout:
             raise HTTPException(
                 status_code=504,
@@ -1580,7 +1701,7 @@ def download_from_huggingface(model_id: str, version: str = "main") -> bytes:
                     try:
                         result = future.result()
                         if result:
-                            zip_file.writestr(filename, result)
+                            write_member(zip_file, filename, result)
                             downloaded_count += 1
                     except Exception as e:
                         print(f"[DOWNLOAD] Warning: Failed to download {filename}: {e}")
@@ -1613,9 +1734,9 @@ def download_from_huggingface(model_id: str, version: str = "main") -> bytes:
 
 
 def model_ingestion(model_id: str, version: str) -> Dict[str, Any]:
-    from ..services.rating import create_metadata_from_files, run_acme_metrics
+    from ..services.rating import ZipRepoView, create_metadata_from_zip, run_acme_metrics
+    from ..acmecli.metrics.context import MetricContext
     import time
-    import tempfile
 
     if not aws_available:
         raise HTTPException(status_code=503, detail="AWS services not available")
@@ -1633,29 +1754,10 @@ def model_ingestion(model_id: str, version: str) -> Dict[str, Any]:
                 detail=f"Invalid model structure. Missing: config.json={not validation.get('has_config')}",
             )
 
-        safe_model_id = (
-            model_id.replace("https://huggingface.co/", "")
-            .replace("http://huggingface.co/", "")
-            .replace("/", "_")
-            .replace(":", "_")
-            .replace("\\", "_")
-            .replace("?", "_")
-            .replace("*", "_")
-            .replace('"', "_")
-            .replace("<", "_")
-            .replace(">", "_")
-            .replace("|", "_")
-        )
-        temp_dir = tempfile.mkdtemp(prefix=f"ingest_{safe_model_id}_{os.getpid()}_")
+        zip_repo = ZipRepoView(zip_content)
         try:
-            os.makedirs(temp_dir, exist_ok=True)
-            with zipfile.ZipFile(io.BytesIO(zip_content), "r") as zip_ref:
-                zip_ref.extractall(temp_dir)
-
-            meta = create_metadata_from_files(temp_dir, model_id)
-            config = extract_config_from_model(zip_content)
-            if config:
-                meta["config"] = config
+            meta = create_metadata_from_zip(zip_repo, model_id)
+            config = meta.get("config")
             zip_size_bytes = len(zip_content)
             zip_size_kb = zip_size_bytes / 1024
             meta["size"] = int(zip_size_kb)
@@ -2030,39 +2132,14 @@ def model_ingestion(model_id: str, version: str) -> Dict[str, Any]:
             print(f"[INGEST] Computing metrics...")
             metrics_start = time.time()
 
-            from ..acmecli.metrics.license_metric import LicenseMetric
-            from ..acmecli.metrics.ramp_up_metric import RampUpMetric
-            from ..acmecli.metrics.bus_factor_metric import BusFactorMetric
-            from ..acmecli.metrics.performance_claims_metric import (
-                PerformanceClaimsMetric,
-            )
-            from ..acmecli.metrics.size_metric import SizeMetric
-            from ..acmecli.metrics.dataset_and_code_metric import DatasetAndCodeMetric
-            from ..acmecli.metrics.dataset_quality_metric import DatasetQualityMetric
-            from ..acmecli.metrics.code_quality_metric import CodeQualityMetric
-            from ..acmecli.metrics.reproducibility_metric import ReproducibilityMetric
-            from ..acmecli.metrics.reviewedness_metric import ReviewednessMetric
-            from ..acmecli.metrics.treescore_metric import TreescoreMetric
-
-            quick_metrics = {
-                "license": LicenseMetric().score,
-                "ramp_up_time": RampUpMetric().score,
-                "bus_factor": BusFactorMetric().score,
-                "performance_claims": PerformanceClaimsMetric().score,
-                "size_score": SizeMetric().score,
-                "dataset_and_code_score": DatasetAndCodeMetric().score,
-                "dataset_quality": DatasetQualityMetric().score,
-                "code_quality": CodeQualityMetric().score,
-                "Reproducibility": ReproducibilityMetric().score,
-                "Reviewedness": ReviewednessMetric().score,
-                "Treescore": TreescoreMetric().score,
-            }
-            metric_results = run_acme_metrics(meta, quick_metrics)
+            from ..acmecli.metrics import RATING_METRICS, REGISTRY
+
+            quick_metrics = {m.name: m.score for m in REGISTRY.select(RATING_METRICS)}
+            metric_results = run_acme_metrics(meta, quick_metrics, MetricContext(meta))
             metrics_time = time.time() - metrics_start
             print(f"[INGEST] Computed metrics in {metrics_time:.2f}s")
         finally:
-            if os.path.exists(temp_dir):
-                shutil.rmtree(temp_dir)
+            zip_repo.cleanup()
 
         REQUIRED_NON_LATENCY_METRICS = [
             "license",
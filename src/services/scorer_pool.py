@@ -0,0 +1,197 @@
+"""
+Warm in-process pool for scoring model URLs with the acmecli metrics.
+
+run_scorer used to write a temporary URL file and spawn ./run for every
+rating, paying interpreter startup and the import of every metric and handler
+each time. ScorerPool keeps that state alive instead:
+
+- metrics and handlers are imported once, when the pool is created
+- one GitHubHandler/HFHandler pair, and so one HTTP cache (see
+  acmecli.cache.open_http_cache, capped at SCORER_CACHE_MAX_ENTRIES) and one
+  connection pool, serves every rating
+- scoring runs on SCORER_WORKERS threads; it is I/O bound, so threads scale
+  as well as pre-forked processes without the pipe protocol
+- results are ReportRow objects, not NDJSON parsed back from stdout
+
+A rating that exceeds its timeout is reported as failed and is cancelled if
+it has not started. One that has started keeps its thread until the request
+finishes (threads cannot be killed) and still counts against the pool, so
+once SCORER_WORKERS ratings are running and SCORER_QUEUE_MAX are waiting,
+submit() raises ScorerPoolFull instead of queueing work behind stragglers.
+"""
+import logging
+import os
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from typing import Any, Dict, Optional
+
+from .rds_pool import Histogram
+
+logger = logging.getLogger(__name__)
+
+SCORER_WORKERS = int(os.getenv("SCORER_WORKERS", "4"))
+SCORER_TIMEOUT_SECONDS = float(os.getenv("SCORER_TIMEOUT_SECONDS", "30"))
+# Ratings allowed to wait for a worker before submit() rejects new ones
+SCORER_QUEUE_MAX = int(os.getenv("SCORER_QUEUE_MAX", "16"))
+# Responses kept by the pool's HTTP cache
+SCORER_CACHE_MAX_ENTRIES = int(os.getenv("SCORER_CACHE_MAX_ENTRIES", "5000"))
+
+# Bucket upper bounds in milliseconds
+SCORE_BUCKETS_MS = (100, 250, 500, 1000, 2500, 5000, 10000, 30000, 60000)
+
+
+class ScorerPoolFull(Exception):
+    """Raised when a target is submitted while the pool's queue is full."""
+
+
+class ScorerPool:
+    """Thread pool scoring URLs against shared, warm acmecli handlers.
+
+    Args:
+        workers: Number of scoring threads
+        cache: HTTP cache for the handlers (default:
+            acmecli.cache.open_http_cache(max_entries=SCORER_CACHE_MAX_ENTRIES))
+        max_queue: Ratings that may wait for a worker
+    """
+
+    def __init__(
+        self, workers: int = SCORER_WORKERS, cache: Any = None, max_queue: int = SCORER_QUEUE_MAX
+    ):
+        from ..acmecli.cache import open_http_cache
+        from ..acmecli.cli import process_url
+        from ..acmecli.github_handler import GitHubHandler
+        from ..acmecli.hf_handler import HFHandler
+
+        self.workers = max(1, workers)
+        self.max_queue = max(0, max_queue)
+        self._process_url = process_url
+        self._cache = (
+            cache if cache is not None else open_http_cache(max_entries=SCORER_CACHE_MAX_ENTRIES)
+        )
+        self._github = GitHubHandler(self._cache)
+        self._hf = HFHandler(self._cache)
+        self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="scorer")
+        self._lock = threading.Lock()
+        self._pending = 0  # Submitted and not yet finished, running or waiting
+        self._rejected = 0
+        self._timeouts = 0
+        self._scored = 0
+        self._no_report = 0
+        self._errors = 0
+        self._score_ms = Histogram(SCORE_BUCKETS_MS)
+
+    def _score(self, target: str):
+        started = time.perf_counter()
+        try:
+            row = self._process_url(target, self._github, self._hf, self._cache)
+        except Exception:
+            with self._lock:
+                self._errors += 1
+            raise
+        with self._lock:
+            if row is None:
+                self._no_report += 1
+            else:
+                self._scored += 1
+            self._score_ms.observe((time.perf_counter() - started) * 1000)
+        return row
+
+    def _finished(self, future: Future) -> None:
+        with self._lock:
+            self._pending -= 1
+
+    def submit(self, target: str) -> Future:
+        """Score ``target`` on a worker; the future resolves to a ReportRow, or
+        None if the URL is not a GitHub/Hugging Face model or has no metadata.
+
+        Raises:
+            ScorerPoolFull: If max_queue ratings are already waiting for a worker
+        """
+        with self._lock:
+            if self._pending >= self.workers + self.max_queue:
+                self._rejected += 1
+                raise ScorerPoolFull(
+                    f"Scorer pool is full ({self.workers} running, {self.max_queue} queued)"
+                )
+            self._pending += 1
+        try:
+            future = self._executor.submit(self._score, target)
+        except BaseException:
+            with self._lock:
+                self._pending -= 1
+            raise
+        future.add_done_callback(self._finished)
+        return future
+
+    def score(self, target: str, timeout: Optional[float] = SCORER_TIMEOUT_SECONDS):
+        """Score ``target`` and wait for the result.
+
+        Raises:
+            concurrent.futures.TimeoutError: If scoring takes longer than
+                ``timeout``; the rating is cancelled if it has not started
+            ScorerPoolFull: See submit()
+            Exception: Whatever scoring raised
+        """
+        future = self.submit(target)
+        try:
+            return future.result(timeout=timeout)
+        except FutureTimeoutError:
+            future.cancel()
+            with self._lock:
+                self._timeouts += 1
+            raise
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "workers": self.workers,
+                "max_queue": self.max_queue,
+                "pending": self._pending,
+                "rejected_total": self._rejected,
+                "timeouts_total": self._timeouts,
+                "scored_total": self._scored,
+                "no_report_total": self._no_report,
+                "errors_total": self._errors,
+                "score_ms": self._score_ms.snapshot(),
+            }
+
+    def shutdown(self, wait: bool = True) -> None:
+        self._executor.shutdown(wait=wait)
+        close = getattr(self._cache, "close", None)
+        if close:
+            close()
+
+
+_pool: Optional[ScorerPool] = None
+_pool_lock = threading.Lock()
+
+
+def get_scorer_pool() -> ScorerPool:
+    """Return the process-wide scorer pool, creating (and warming) it on first use."""
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                started = time.perf_counter()
+                _pool = ScorerPool()
+                logger.info(
+                    "Scorer pool ready with %d worker(s) in %.0f ms",
+                    _pool.workers,
+                    (time.perf_counter() - started) * 1000,
+                )
+    return _pool
+
+
+def get_scorer_pool_stats() -> Optional[Dict[str, Any]]:
+    """Return scorer pool stats, or None if no rating has used the pool yet."""
+    pool = _pool
+    return pool.stats() if pool is not None else None
+
+
+def shutdown_scorer_pool() -> None:
+    global _pool
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.shutdown(wait=False)
@@ -3,10 +3,21 @@ Storage abstraction layer for model file storage backends.
 
 This module provides a unified interface for different storage backends (S3, RDS, etc.)
 while maintaining backward compatibility with existing code.
+
+By default the origin backend is wrapped in a TieredStorageBackend: a small
+in-memory LRU for sub-MB objects, then the origin. STORAGE_DISK_CACHE=on adds
+a local disk tier between them (written on the read path, so only worth it on
+fast local disk); STORAGE_CACHE=none talks to the origin directly. Uploads
+that bypass this module call invalidate_cached_model().
 """
 import os
+import time
+import hashlib
 import logging
-from typing import Dict, Any, Protocol
+import tempfile
+import threading
+from collections import OrderedDict
+from typing import Dict, Any, List, Optional, Protocol, Tuple
 from abc import ABC, abstractmethod
 
 logger = logging.getLogger(__name__)
@@ -14,6 +25,42 @@ logger = logging.getLogger(__name__)
 # Storage backend configuration
 STORAGE_BACKEND = os.getenv("STORAGE_BACKEND", "s3").lower()
 
+# Cache tier configuration
+STORAGE_CACHE = os.getenv("STORAGE_CACHE", "tiered").lower()
+# Entries older than this are refetched, since some writers bypass this module
+STORAGE_CACHE_TTL_SECONDS = float(os.getenv("STORAGE_CACHE_TTL_SECONDS", "300"))
+MEMORY_CACHE_MAX_OBJECT_BYTES = int(os.getenv("MEMORY_CACHE_MAX_OBJECT_BYTES", str(1024 * 1024)))
+MEMORY_CACHE_MAX_BYTES = int(os.getenv("MEMORY_CACHE_MAX_BYTES", str(64 * 1024 * 1024)))
+STORAGE_DISK_CACHE = os.getenv("STORAGE_DISK_CACHE", "off").lower() == "on"
+DISK_CACHE_DIR = os.getenv("DISK_CACHE_DIR", os.path.join(tempfile.gettempdir(), "acme-model-cache"))
+DISK_CACHE_MAX_BYTES = int(os.getenv("DISK_CACHE_MAX_BYTES", str(1024 * 1024 * 1024)))
+
+# Components cached per model version (invalidated together on upload)
+CACHED_COMPONENTS = ("full", "weights", "datasets")
+
+
+def sanitize_model_key(model_id: str, version: str) -> Tuple[str, str]:
+    """Sanitize a model ID and version the way they appear in storage keys.
+
+    Uploads accept raw IDs (e.g. "org/model") while downloads receive the
+    sanitized form ("org_model"), so both must map to the same key.
+    """
+    safe_model_id = (
+        model_id.replace("https://huggingface.co/", "")
+        .replace("http://huggingface.co/", "")
+        .replace("/", "_")
+        .replace(":", "_")
+        .replace("\\", "_")
+        .replace("?", "_")
+        .replace("*", "_")
+        .replace('"', "_")
+        .replace("<", "_")
+        .replace(">", "_")
+        .replace("|", "_")
+    )
+    safe_version = version.replace("/", "_").replace(":", "_").replace("\\", "_")
+    return safe_model_id, safe_version
+
 
 class StorageBackend(Protocol):
     """Protocol defining the interface for storage backends."""
@@ -77,12 +124,12 @@ class S3StorageBackend:
     ) -> Dict[str, str]:
         """Upload model to S3.
         
-        Note: S3 upload_model signature is (file_content, model_id, version, debloat=False)
-        and doesn't support use_performance_path. Performance path uploads are handled
-        separately in populate_registry.py via direct S3 calls.
+        Content is stored once under its sha256 and the models/ or performance/
+        key becomes a pointer, so identical archives share a single blob.
         """
-        # S3 upload_model always uses models/ path, performance/ path is handled separately
-        return self._upload_model(file_content, model_id, version, debloat=False)
+        return self._upload_model(
+            file_content, model_id, version, debloat=False, use_performance_path=use_performance_path
+        )
 
 
 class RDSStorageBackend:
@@ -106,6 +153,253 @@ class RDSStorageBackend:
         return self._upload_model(file_content, model_id, version, use_performance_path)
 
 
+class TierStats:
+    """Hit, latency and byte counters for one storage tier."""
+    
+    def __init__(self, name: str):
+        self.name = name
+        self.hits = 0
+        self.misses = 0
+        self.bytes_read = 0
+        self.bytes_written = 0
+        self.read_ms_total = 0.0
+        self._lock = threading.Lock()
+    
+    def record_read(self, data: Optional[bytes], elapsed_ms: float) -> None:
+        with self._lock:
+            if data is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self.bytes_read += len(data)
+            self.read_ms_total += elapsed_ms
+    
+    def record_write(self, size: int) -> None:
+        with self._lock:
+            self.bytes_written += size
+    
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "tier": self.name,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": self.hits / lookups if lookups else 0.0,
+                "bytes_read": self.bytes_read,
+                "bytes_written": self.bytes_written,
+                "mean_read_ms": self.read_ms_total / lookups if lookups else 0.0,
+            }
+
+
+class MemoryTier:
+    """LRU cache for small objects (configs, metadata-only zips)."""
+    
+    def __init__(
+        self,
+        max_bytes: int = MEMORY_CACHE_MAX_BYTES,
+        max_object_bytes: int = MEMORY_CACHE_MAX_OBJECT_BYTES,
+        ttl_seconds: float = STORAGE_CACHE_TTL_SECONDS,
+    ):
+        self.max_bytes = max_bytes
+        self.max_object_bytes = max_object_bytes
+        self.ttl_seconds = ttl_seconds
+        self.stats = TierStats("memory")
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+    
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            data, stored_at = entry
+            if time.monotonic() - stored_at > self.ttl_seconds:
+                self._remove(key)
+                return None
+            self._entries.move_to_end(key)
+            return data
+    
+    def put(self, key: str, data: bytes) -> None:
+        if len(data) > self.max_object_bytes:
+            return
+        with self._lock:
+            self._remove(key)
+            self._entries[key] = (data, time.monotonic())
+            self._size += len(data)
+            while self._size > self.max_bytes and self._entries:
+                self._remove(next(iter(self._entries)))
+        self.stats.record_write(len(data))
+    
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._remove(key)
+    
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+    
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._size -= len(entry[0])
+
+
+class DiskTier:
+    """Local file cache bounded by total size, evicting least recently used files."""
+    
+    def __init__(
+        self,
+        directory: str = DISK_CACHE_DIR,
+        max_bytes: int = DISK_CACHE_MAX_BYTES,
+        ttl_seconds: float = STORAGE_CACHE_TTL_SECONDS,
+    ):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self.stats = TierStats("disk")
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+    
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, hashlib.sha256(key.encode("utf-8")).hexdigest())
+    
+    def get(self, key: str) -> Optional[bytes]:
+        path = self._path(key)
+        try:
+            if time.time() - os.path.getmtime(path) > self.ttl_seconds:
+                self.delete(key)
+                return None
+            with open(path, "rb") as f:
+                data = f.read()
+            # Refresh access time for LRU eviction (mtime stays the TTL anchor)
+            os.utime(path, (time.time(), os.path.getmtime(path)))
+            return data
+        except OSError:
+            return None
+    
+    def put(self, key: str, data: bytes) -> None:
+        if len(data) > self.max_bytes:
+            return
+        path = self._path(key)
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp_path, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Disk cache write failed for {key}: {e}")
+            return
+        self.stats.record_write(len(data))
+        self._evict()
+    
+    def delete(self, key: str) -> None:
+        try:
+            os.remove(self._path(key))
+        except OSError:
+            pass
+    
+    def clear(self) -> None:
+        for entry in os.scandir(self.directory):
+            try:
+                os.remove(entry.path)
+            except OSError:
+                pass
+    
+    def _evict(self) -> None:
+        with self._lock:
+            files = []
+            total = 0
+            for entry in os.scandir(self.directory):
+                if entry.name.endswith(".tmp"):
+                    continue
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                files.append((stat.st_atime, stat.st_size, entry.path))
+                total += stat.st_size
+            if total <= self.max_bytes:
+                return
+            for _, size, path in sorted(files):
+                try:
+                    os.remove(path)
+                except OSError:
+                    continue
+                total -= size
+                if total <= self.max_bytes:
+                    break
+
+
+class TieredStorageBackend:
+    """StorageBackend that consults cache tiers in order before the origin.
+    
+    Reads fill every faster tier on the way back; uploads write through to the
+    origin first and then refresh the caches for that model version.
+    """
+    
+    def __init__(self, origin: StorageBackend, tiers: List[Any]):
+        self.origin = origin
+        self.tiers = tiers
+        self.origin_stats = TierStats("origin")
+    
+    @staticmethod
+    def _key(model_id: str, version: str, component: str, use_performance_path: bool) -> str:
+        path_prefix = "performance" if use_performance_path else "models"
+        safe_model_id, safe_version = sanitize_model_key(model_id, version)
+        return f"{path_prefix}/{safe_model_id}/{safe_version}/{component}"
+    
+    def download_model(
+        self, model_id: str, version: str, component: str = "full", use_performance_path: bool = False
+    ) -> bytes:
+        """Download model from the first tier that has it."""
+        key = self._key(model_id, version, component, use_performance_path)
+        for i, tier in enumerate(self.tiers):
+            start = time.perf_counter()
+            data = tier.get(key)
+            tier.stats.record_read(data, (time.perf_counter() - start) * 1000)
+            if data is not None:
+                for faster in self.tiers[:i]:
+                    faster.put(key, data)
+                return data
+        
+        start = time.perf_counter()
+        data = self.origin.download_model(model_id, version, component, use_performance_path)
+        self.origin_stats.record_read(data, (time.perf_counter() - start) * 1000)
+        for tier in self.tiers:
+            tier.put(key, data)
+        return data
+    
+    def upload_model(
+        self, file_content: bytes, model_id: str, version: str, use_performance_path: bool = False
+    ) -> Dict[str, str]:
+        """Upload model to the origin, then write the new archive through the tiers."""
+        result = self.origin.upload_model(file_content, model_id, version, use_performance_path)
+        self.origin_stats.record_write(len(file_content))
+        self.invalidate(model_id, version, use_performance_path)
+        key = self._key(model_id, version, "full", use_performance_path)
+        for tier in self.tiers:
+            tier.put(key, file_content)
+        return result
+    
+    def invalidate(self, model_id: str, version: str, use_performance_path: bool = False) -> None:
+        """Drop every cached component of a model version."""
+        for component in CACHED_COMPONENTS:
+            key = self._key(model_id, version, component, use_performance_path)
+            for tier in self.tiers:
+                tier.delete(key)
+    
+    def clear(self) -> None:
+        """Drop all cached entries (e.g. after a registry reset)."""
+        for tier in self.tiers:
+            tier.clear()
+    
+    def stats(self) -> List[Dict[str, Any]]:
+        return [tier.stats.snapshot() for tier in self.tiers] + [self.origin_stats.snapshot()]
+
+
 # Global storage backend instance (lazy initialization)
 _storage_backend: StorageBackend | None = None
 
@@ -114,7 +408,9 @@ def get_storage_backend() -> StorageBackend:
     """Get the configured storage backend instance.
     
     Returns:
-        StorageBackend instance based on STORAGE_BACKEND environment variable
+        StorageBackend instance based on STORAGE_BACKEND environment variable,
+        wrapped in TieredStorageBackend unless STORAGE_CACHE=none (with a disk
+        tier if STORAGE_DISK_CACHE=on)
     """
     global _storage_backend
     
@@ -125,10 +421,48 @@ def get_storage_backend() -> StorageBackend:
         else:
             logger.info("Initializing S3 storage backend (default)")
             _storage_backend = S3StorageBackend()
+        
+        if STORAGE_CACHE == "tiered":
+            tiers = [MemoryTier()]
+            if STORAGE_DISK_CACHE:
+                try:
+                    tiers.append(DiskTier())
+                except OSError as e:
+                    logger.warning(f"Disk cache unavailable ({e}); using memory tier only")
+            logger.info(
+                "Enabling tiered storage cache ("
+                + " -> ".join(tier.stats.name for tier in tiers)
+                + ")"
+            )
+            _storage_backend = TieredStorageBackend(_storage_backend, tiers)
     
     return _storage_backend
 
 
+def clear_storage_cache() -> None:
+    """Drop cached model files if the tiered backend is active."""
+    if isinstance(_storage_backend, TieredStorageBackend):
+        _storage_backend.clear()
+
+
+def invalidate_cached_model(model_id: str, version: str, use_performance_path: bool = False) -> None:
+    """Drop cached components of a model version after it was (re)uploaded.
+
+    Called by the origin upload functions, so uploads that do not go through
+    the tiered backend (e.g. index.py calling s3_service.upload_model) are
+    not served stale.
+    """
+    if isinstance(_storage_backend, TieredStorageBackend):
+        _storage_backend.invalidate(model_id, version, use_performance_path)
+
+
+def get_storage_cache_stats() -> Optional[List[Dict[str, Any]]]:
+    """Return per-tier counters, or None if the tiered backend is not active."""
+    if isinstance(_storage_backend, TieredStorageBackend):
+        return _storage_backend.stats()
+    return None
+
+
 # Convenience functions that match existing S3 function signatures
 def download_model(
     model_id: str, version: str, component: str = "full", use_performance_path: bool = False
@@ -148,8 +482,8 @@ def upload_model(
     """Upload model to configured storage backend.
     
     This function provides a unified interface for uploading models.
-    Note: S3 backend's upload_model doesn't support use_performance_path yet,
-    but RDS backend does.
+    Both backends store content-addressed blobs, so re-uploading identical
+    bytes skips the data write.
     """
     backend = get_storage_backend()
     return backend.upload_model(file_content, model_id, version, use_performance_path)
@@ -1,6 +1,9 @@
 """
 Unit tests for acmecli cache module
 """
+import itertools
+from unittest.mock import patch
+
 import pytest
 from src.acmecli.cache import InMemoryCache
 
@@ -84,3 +87,125 @@ class TestInMemoryCache:
         cache.set("key1", b"")
         assert cache.get("key1") == b""
 
+
+
+class TestDiskCache:
+    """Test the SQLite-backed DiskCache"""
+
+    def test_entries_survive_reopen(self, tmp_path):
+        from src.acmecli.cache import DiskCache
+
+        path = tmp_path / "nested" / "http.sqlite3"
+        cache = DiskCache(path)
+        cache.set("key1", b"data", etag='W/"abc"')
+        cache.close()
+
+        reopened = DiskCache(path)
+        assert reopened.get("key1") == b"data"
+        assert reopened.get_etag("key1") == 'W/"abc"'
+        assert reopened.get("missing") is None
+        assert reopened.get_etag("missing") is None
+
+    def test_overwrite_and_no_etag(self, tmp_path):
+        from src.acmecli.cache import DiskCache
+
+        cache = DiskCache(tmp_path / "http.sqlite3")
+        cache.set("key1", b"old", etag="e1")
+        cache.set("key1", b"new")
+        assert cache.get("key1") == b"new"
+        assert cache.get_etag("key1") is None
+
+    def test_open_http_cache(self, tmp_path, monkeypatch):
+        from src.acmecli.cache import DiskCache, open_http_cache
+
+        monkeypatch.setenv("ACME_HTTP_CACHE", str(tmp_path / "env.sqlite3"))
+        assert isinstance(open_http_cache(), DiskCache)
+        assert (tmp_path / "env.sqlite3").exists()
+        monkeypatch.setenv("ACME_HTTP_CACHE", "off")
+        assert isinstance(open_http_cache(), InMemoryCache)
+        # A path that cannot be created falls back to memory
+        blocker = tmp_path / "file"
+        blocker.write_text("x")
+        assert isinstance(open_http_cache(str(blocker / "http.sqlite3")), InMemoryCache)
+
+    def test_oldest_entries_beyond_limit_are_pruned(self, tmp_path):
+        from src.acmecli import cache as cache_module
+        from src.acmecli.cache import DiskCache
+
+        path = tmp_path / "http.sqlite3"
+        clock = itertools.count(1000.0)
+        with patch.object(cache_module, "PRUNE_EVERY", 2), \
+                patch("src.acmecli.cache.time.time", side_effect=lambda: next(clock)):
+            cache = DiskCache(path, max_entries=2)
+            for i in range(4):
+                cache.set(f"key{i}", b"data", etag="e")
+            assert cache.get("key0") is None
+            assert cache.get("key1") is None
+            assert cache.get("key3") == b"data"
+        cache.close()
+
+    def test_expired_entries_are_not_served_and_pruned(self, tmp_path):
+        from src.acmecli.cache import DiskCache
+
+        path = tmp_path / "http.sqlite3"
+        with patch("src.acmecli.cache.time.time", return_value=1000.0):
+            old = DiskCache(path)
+            old.set("old", b"data", etag="e")
+            old.close()
+        with patch("src.acmecli.cache.time.time", return_value=1000.0 + 61):
+            cache = DiskCache(path, max_age_seconds=60)
+            assert cache.get("old") is None
+            assert cache.get_etag("old") is None
+        count = cache._conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+        assert count == 0
+
+
+class TestRevalidationHelpers:
+    """Test revalidation_headers and store_response"""
+
+    def test_headers_only_with_cached_body(self):
+        from src.acmecli.cache import revalidation_headers, store_response
+
+        headers = {"User-Agent": "ACME-CLI/1.0"}
+        cache = InMemoryCache()
+        assert revalidation_headers(None, "u", headers) is headers
+        assert revalidation_headers(cache, "u", headers) == headers
+
+        store_response(cache, "u", b"{}", '"etag1"')
+        assert revalidation_headers(cache, "u", headers) == {**headers, "If-None-Match": '"etag1"'}
+        assert "If-None-Match" not in headers
+
+    def test_responses_without_etag_are_not_stored(self):
+        from src.acmecli.cache import store_response
+
+        cache = InMemoryCache()
+        store_response(cache, "u", b"{}", None)
+        store_response(None, "u", b"{}", '"etag1"')
+        assert cache.get("u") is None
+
+    def test_responses_are_keyed_by_credentials(self):
+        from src.acmecli.cache import cached_response, revalidation_headers, store_response
+
+        cache = InMemoryCache()
+        token_a = {"Authorization": "Bearer a"}
+        store_response(cache, "u", b"private", '"etag1"', token_a)
+        assert cached_response(cache, "u", token_a) == b"private"
+        assert cached_response(cache, "u", {"Authorization": "Bearer b"}) is None
+        assert cached_response(cache, "u", {}) is None
+        assert revalidation_headers(cache, "u", {}) == {}
+        assert revalidation_headers(cache, "u", token_a)["If-None-Match"] == '"etag1"'
+
+class TestInMemoryCacheLimit:
+    """Test InMemoryCache max_entries"""
+
+    def test_oldest_entries_are_evicted(self):
+        cache = InMemoryCache(max_entries=2)
+        cache.set("key1", b"1", "e1")
+        cache.set("key2", b"2")
+        cache.set("key1", b"1b", "e1b")  # Refreshing moves key1 to the end
+        cache.set("key3", b"3")
+        assert cache.get("key2") is None
+        assert cache.get("key1") == b"1b"
+        assert cache.get_etag("key1") == "e1b"
+        assert cache.get("key3") == b"3"
+
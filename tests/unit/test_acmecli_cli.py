@@ -339,7 +339,7 @@ class TestMain:
     @patch("src.acmecli.cli.Path")
     @patch("src.acmecli.cli.GitHubHandler")
     @patch("src.acmecli.cli.HFHandler")
-    @patch("src.acmecli.cli.InMemoryCache")
+    @patch("src.acmecli.cli.open_http_cache")
     @patch("src.acmecli.cli.process_url")
     @patch("src.acmecli.cli.write_ndjson")
     def test_main_success(
@@ -374,6 +374,7 @@ class TestMain:
         mock_setup_logging.assert_called_once()
         mock_process_url.assert_called_once()
         mock_write_ndjson.assert_called_once()
+        mock_cache.close.assert_called_once()
 
     @patch("src.acmecli.cli.setup_logging")
     def test_main_insufficient_args(self, mock_setup_logging):
@@ -385,7 +386,7 @@ class TestMain:
     @patch("src.acmecli.cli.Path")
     @patch("src.acmecli.cli.GitHubHandler")
     @patch("src.acmecli.cli.HFHandler")
-    @patch("src.acmecli.cli.InMemoryCache")
+    @patch("src.acmecli.cli.open_http_cache")
     @patch("src.acmecli.cli.process_url")
     @patch("src.acmecli.cli.write_ndjson")
     def test_main_skip_unsupported_urls(
@@ -421,7 +422,7 @@ class TestMain:
     @patch("src.acmecli.cli.Path")
     @patch("src.acmecli.cli.GitHubHandler")
     @patch("src.acmecli.cli.HFHandler")
-    @patch("src.acmecli.cli.InMemoryCache")
+    @patch("src.acmecli.cli.open_http_cache")
     @patch("src.acmecli.cli.process_url")
     @patch("src.acmecli.cli.write_ndjson")
     def test_main_empty_file(
@@ -452,3 +453,102 @@ class TestMain:
         mock_process_url.assert_not_called()
         mock_write_ndjson.assert_not_called()
 
+
+
+class TestScoreUrls:
+    """Test the concurrent, order-preserving URL pipeline"""
+
+    def test_results_keep_input_order(self):
+        import time as time_module
+        from src.acmecli.cli import score_urls
+
+        urls = [f"https://huggingface.co/org/m{i}" for i in range(12)]
+
+        def fake_process(url, *_):
+            # Earlier URLs finish last
+            time_module.sleep(0.002 * (12 - int(url.rsplit("m", 1)[1])))
+            return url
+
+        with patch("src.acmecli.cli.process_url", side_effect=fake_process):
+            results = list(score_urls(urls, 4, None, None, None))
+        assert [url for url, _ in results] == urls
+        assert [row for _, row in results] == urls
+
+    def test_failing_url_is_isolated(self):
+        from src.acmecli.cli import score_urls
+
+        def fake_process(url, *_):
+            if url.endswith("bad"):
+                raise RuntimeError("boom")
+            return url
+
+        urls = ["https://github.com/a/ok", "https://github.com/a/bad", "https://github.com/a/ok2"]
+        with patch("src.acmecli.cli.process_url", side_effect=fake_process):
+            results = list(score_urls(urls, 2, None, None, None))
+        assert results == [(urls[0], urls[0]), (urls[1], None), (urls[2], urls[2])]
+
+    def test_concurrency_is_bounded(self):
+        import threading
+        import time as time_module
+        from src.acmecli.cli import score_urls
+
+        lock = threading.Lock()
+        active = peak = 0
+
+        def fake_process(url, *_):
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time_module.sleep(0.01)
+            with lock:
+                active -= 1
+            return url
+
+        urls = [f"https://github.com/a/r{i}" for i in range(20)]
+        with patch("src.acmecli.cli.process_url", side_effect=fake_process):
+            assert len(list(score_urls(urls, 3, None, None, None))) == 20
+        assert 1 < peak <= 3
+
+    def test_repeated_url_is_scored_once(self):
+        from src.acmecli.cli import score_urls
+
+        urls = ["https://github.com/a/r", "https://github.com/a/s", "https://github.com/a/r"]
+        with patch("src.acmecli.cli.process_url", side_effect=lambda url, *_: url) as mock_process:
+            results = list(score_urls(urls, 2, None, None, None))
+        assert [row for _, row in results] == urls
+        assert mock_process.call_count == 2
+
+    def test_results_are_released_after_leaving_window(self):
+        from src.acmecli.cli import score_urls
+
+        urls = [f"https://github.com/a/r{i}" for i in range(5)] + ["https://github.com/a/r0"]
+        with patch("src.acmecli.cli.process_url", side_effect=lambda url, *_: url) as mock_process:
+            results = list(score_urls(urls, 1, None, None, None))
+        assert [row for _, row in results] == urls
+        # r0 left the two-URL window long before it was repeated
+        assert mock_process.call_count == 6
+
+    @patch("src.acmecli.cli.open_http_cache")
+    @patch("src.acmecli.cli.setup_logging")
+    @patch("src.acmecli.cli.GitHubHandler")
+    @patch("src.acmecli.cli.HFHandler")
+    def test_main_jobs_option_and_summary(
+        self, mock_hf, mock_gh, mock_setup, mock_cache, tmp_path, capsys
+    ):
+        from src.acmecli.cli import score_urls
+
+        url_file = tmp_path / "urls.txt"
+        url_file.write_text(
+            "https://github.com/a/r1\nhttps://example.com/x\nhttps://huggingface.co/org/m\n"
+        )
+        rows = {"https://github.com/a/r1": None, "https://huggingface.co/org/m": MagicMock()}
+        with patch("src.acmecli.cli.process_url", side_effect=lambda url, *_: rows[url]):
+            with patch("src.acmecli.cli.write_ndjson") as mock_write:
+                with patch("src.acmecli.cli.score_urls", wraps=score_urls) as mock_score:
+                    assert main(["cli.py", str(url_file), "--jobs", "3"]) == 0
+        assert mock_score.call_args.args[1] == 3
+        mock_write.assert_called_once_with(rows["https://huggingface.co/org/m"])
+        err = capsys.readouterr().err
+        assert "Scored 2 URL(s)" in err
+        assert "1 reported, 1 without report" in err
@@ -0,0 +1,260 @@
+"""
+Unit tests for batched GitHub GraphQL metadata fetching
+"""
+import json
+import os
+from unittest.mock import MagicMock, patch
+from urllib.error import HTTPError
+
+import pytest
+
+from src.acmecli import github_graphql
+from src.acmecli.github_handler import GitHubHandler
+
+
+def repository_node(name="repo", **overrides):
+    node = {
+        "name": name,
+        "nameWithOwner": f"owner/{name}",
+        "description": "A model repo",
+        "stargazerCount": 42,
+        "forkCount": 7,
+        "diskUsage": 1024,
+        "watchers": {"totalCount": 5},
+        "primaryLanguage": {"name": "Python"},
+        "repositoryTopics": {"nodes": [{"topic": {"name": "nlp"}}]},
+        "licenseInfo": {"spdxId": "MIT"},
+        "createdAt": "2020-01-01T00:00:00Z",
+        "updatedAt": "2024-01-01T00:00:00Z",
+        "pushedAt": "2024-01-02T00:00:00Z",
+        "hasWikiEnabled": True,
+        "homepageUrl": "https://owner.github.io/repo",
+        "isArchived": False,
+        "isDisabled": False,
+        "openIssues": {"totalCount": 3},
+        "openPullRequests": {"totalCount": 2},
+        "defaultBranchRef": {
+            "name": "main",
+            "target": {
+                "history": {
+                    "nodes": [
+                        {"additions": 10, "author": {"name": "Alice", "user": {"login": "alice"}}},
+                        {"additions": 20, "author": {"name": "Alice", "user": {"login": "alice"}}},
+                        {"additions": 5, "author": {"name": "Bob", "user": None}},
+                    ]
+                }
+            },
+        },
+        "tree": {
+            "entries": [
+                {"name": "README.md", "path": "README.md", "type": "blob", "object": {}},
+                {"name": "setup.py", "path": "setup.py", "type": "blob", "object": {}},
+                {
+                    "name": "examples",
+                    "path": "examples",
+                    "type": "tree",
+                    "object": {"entries": [{"path": "examples/demo.py", "type": "blob"}]},
+                },
+                {
+                    "name": "docs",
+                    "path": "docs",
+                    "type": "tree",
+                    "object": {"entries": [{"path": "docs/index.md", "type": "blob"}]},
+                },
+            ]
+        },
+        "readmeMd": {"text": "# Repo"},
+        "readmeRst": None,
+        "readmePlain": None,
+        "readmeLower": None,
+        "pullRequests": {
+            "nodes": [
+                {
+                    "number": 1,
+                    "merged": True,
+                    "additions": 15,
+                    "reviews": {"totalCount": 2},
+                    "approvedReviews": {"totalCount": 1},
+                    "files": {"nodes": [{"path": "model.py", "additions": 15}]},
+                }
+            ]
+        },
+    }
+    node.update(overrides)
+    return node
+
+
+def graphql_response(payload):
+    response = MagicMock()
+    response.read.return_value = json.dumps(payload).encode()
+    response.__enter__.return_value = response
+    return response
+
+
+class TestBuildQuery:
+    """Test aliased query construction"""
+
+    def test_one_alias_per_repository(self):
+        query = github_graphql.build_query(3)
+        assert "r0: repository(owner: $owner0, name: $name0)" in query
+        assert "r2: repository(owner: $owner2, name: $name2)" in query
+        assert "r3:" not in query
+        assert "fragment RepoMeta on Repository" in query
+
+
+class TestMetaFromRepository:
+    """Test conversion to the REST metadata shape"""
+
+    def test_repository_fields(self):
+        meta = github_graphql.meta_from_repository(repository_node())
+        assert meta["full_name"] == "owner/repo"
+        assert meta["stars"] == 42
+        assert meta["license"] == "MIT"
+        assert meta["topics"] == ["nlp"]
+        assert meta["open_issues_count"] == 5
+        assert meta["has_pages"] is True
+        assert meta["readme_text"] == "# Repo"
+
+    def test_contributors_from_commit_history(self):
+        meta = github_graphql.meta_from_repository(repository_node())
+        assert meta["contributors"] == {"alice": 2, "Bob": 1}
+
+    def test_repo_files_include_key_directories_only(self):
+        meta = github_graphql.meta_from_repository(repository_node())
+        assert meta["repo_files"] == {"README.md", "setup.py", "examples/demo.py"}
+
+    def test_pull_requests_and_commits(self):
+        meta = github_graphql.meta_from_repository(repository_node())
+        pr = meta["github"]["prs"][0]
+        assert pr == {
+            "merged": True,
+            "approved": True,
+            "review_count": 2,
+            "additions": 15,
+            "files": [{"filename": "model.py", "additions": 15}],
+        }
+        assert [c["additions"] for c in meta["github"]["direct_commits"]] == [10, 20, 5]
+
+    def test_empty_repository(self):
+        meta = github_graphql.meta_from_repository(
+            repository_node(defaultBranchRef=None, tree=None, readmeMd=None, pullRequests=None)
+        )
+        assert meta["contributors"] == {}
+        assert meta["repo_files"] == set()
+        assert meta["readme_text"] == ""
+        assert meta["github"] == {"prs": [], "direct_commits": []}
+
+
+class TestFetchRepositories:
+    """Test the GraphQL request"""
+
+    @patch("src.acmecli.github_graphql.urlopen")
+    def test_missing_repository_is_none(self, mock_urlopen):
+        mock_urlopen.return_value = graphql_response(
+            {
+                "data": {"r0": repository_node(), "r1": None},
+                "errors": [{"type": "NOT_FOUND", "path": ["r1"], "message": "gone"}],
+            }
+        )
+        nodes = github_graphql.fetch_repositories([("owner", "repo"), ("owner", "gone")], {"Authorization": "Bearer t"})
+        assert nodes[0]["name"] == "repo"
+        assert nodes[1] is None
+
+        request = mock_urlopen.call_args.args[0]
+        assert request.get_method() == "POST"
+        body = json.loads(request.data)
+        assert body["variables"] == {"owner0": "owner", "name0": "repo", "owner1": "owner", "name1": "gone"}
+
+    @patch("src.acmecli.github_graphql.urlopen")
+    def test_forbidden_repository_is_unavailable(self, mock_urlopen):
+        mock_urlopen.return_value = graphql_response(
+            {
+                "data": {"r0": None},
+                "errors": [{"type": "FORBIDDEN", "path": ["r0"], "message": "SAML enforcement"}],
+            }
+        )
+        nodes = github_graphql.fetch_repositories([("org", "private")], {})
+        assert nodes == [github_graphql.UNAVAILABLE]
+
+    @patch("src.acmecli.github_graphql.urlopen")
+    def test_http_error_returns_none(self, mock_urlopen):
+        mock_urlopen.side_effect = HTTPError(github_graphql.GITHUB_GRAPHQL_URL, 502, "Bad Gateway", {}, None)
+        assert github_graphql.fetch_repositories([("owner", "repo")], {}) is None
+
+    @patch("src.acmecli.github_graphql.urlopen")
+    def test_query_error_returns_none(self, mock_urlopen):
+        mock_urlopen.return_value = graphql_response({"errors": [{"message": "Something went wrong"}]})
+        assert github_graphql.fetch_repositories([("owner", "repo")], {}) is None
+
+
+class TestGitHubHandlerGraphQL:
+    """Test GitHubHandler batching and REST fallback"""
+
+    URLS = [f"https://github.com/owner/repo{i}" for i in range(3)]
+
+    @pytest.fixture
+    def handler(self):
+        with patch.dict(os.environ, {"GITHUB_TOKEN": "ghp_test123"}):
+            return GitHubHandler()
+
+    def test_repositories_are_batched(self, handler):
+        def fetch(repos, headers):
+            return [repository_node(name) for _, name in repos]
+
+        with patch.object(github_graphql, "GITHUB_GRAPHQL_BATCH_SIZE", 2), patch(
+            "src.acmecli.github_graphql.fetch_repositories", side_effect=fetch
+        ) as mock_fetch:
+            results = handler.fetch_meta_batch(self.URLS)
+        assert mock_fetch.call_count == 2
+        assert [results[url]["name"] for url in self.URLS] == ["repo0", "repo1", "repo2"]
+
+    def test_failed_batch_falls_back_to_rest(self, handler):
+        with patch("src.acmecli.github_graphql.fetch_repositories", return_value=None), patch.object(
+            handler, "_fetch_meta_rest", side_effect=lambda url: {"name": url}
+        ):
+            results = handler.fetch_meta_batch(self.URLS[:1])
+        assert results == {self.URLS[0]: {"name": self.URLS[0]}}
+
+    def test_without_token_uses_rest(self):
+        with patch.dict(os.environ, {}, clear=True):
+            handler = GitHubHandler()
+        with patch("src.acmecli.github_graphql.fetch_repositories") as mock_fetch, patch.object(
+            handler, "_fetch_meta_rest", return_value={"name": "rest"}
+        ):
+            handler.prefetch(self.URLS)
+            assert handler.fetch_meta(self.URLS[0]) == {"name": "rest"}
+        mock_fetch.assert_not_called()
+
+    def test_prefetched_meta_is_served_once(self, handler):
+        with patch("src.acmecli.github_graphql.fetch_repositories", return_value=[repository_node()]) as mock_fetch:
+            handler.prefetch(self.URLS[:1])
+            assert handler.fetch_meta(self.URLS[0])["name"] == "repo"
+            assert handler.fetch_meta(self.URLS[0])["name"] == "repo"
+        assert mock_fetch.call_count == 2
+
+    def test_missing_repository_and_invalid_url(self, handler):
+        with patch("src.acmecli.github_graphql.fetch_repositories", return_value=[None]):
+            results = handler.fetch_meta_batch([self.URLS[0], "https://github.com/owner"])
+        assert results == {self.URLS[0]: {}, "https://github.com/owner": {}}
+
+    def test_unavailable_repository_uses_rest(self, handler):
+        with patch(
+            "src.acmecli.github_graphql.fetch_repositories",
+            return_value=[github_graphql.UNAVAILABLE, repository_node()],
+        ), patch.object(handler, "_fetch_meta_rest", return_value={"name": "rest"}) as mock_rest:
+            results = handler.fetch_meta_batch(self.URLS[:2])
+        assert results[self.URLS[0]] == {"name": "rest"}
+        assert results[self.URLS[1]]["name"] == "repo"
+        mock_rest.assert_called_once_with(self.URLS[0])
+
+    def test_unaliased_readme_name_uses_rest(self, handler):
+        node = repository_node(
+            readmeMd=None,
+            tree={"entries": [{"name": "README.markdown", "path": "README.markdown", "type": "blob"}]},
+        )
+        with patch("src.acmecli.github_graphql.fetch_repositories", return_value=[node]), patch.object(
+            handler, "_get_json", return_value={"content": "IyBSZWFkbWU="}
+        ) as mock_get_json:
+            meta = handler.fetch_meta(self.URLS[0])
+        assert meta["readme_text"] == "# Readme"
+        mock_get_json.assert_called_once_with("https://api.github.com/repos/owner/repo0/readme")
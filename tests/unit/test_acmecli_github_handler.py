@@ -4,6 +4,7 @@ Unit tests for acmecli GitHub handler
 import os
 import json
 import base64
+import time
 from unittest.mock import patch, MagicMock, Mock
 from urllib.error import HTTPError, URLError
 import pytest
@@ -149,6 +150,95 @@ class TestGitHubHandlerGetJson:
         assert result == {}
 
 
+class TestGitHubHandlerEtagCache:
+    """Test ETag revalidation through the response cache"""
+
+    URL = "https://api.github.com/repos/test/repo"
+
+    @staticmethod
+    def _response(body, etag):
+        response = MagicMock()
+        response.read.return_value = body
+        response.headers.get.side_effect = lambda key: etag if key == "ETag" else None
+        response.__enter__.return_value = response
+        return response
+
+    @patch("src.acmecli.github_handler.urlopen")
+    def test_not_modified_is_served_from_cache(self, mock_urlopen, tmp_path):
+        from src.acmecli.cache import DiskCache
+
+        cache = DiskCache(tmp_path / "http.sqlite3")
+        mock_urlopen.return_value = self._response(b'{"name": "test-repo"}', '"v1"')
+        assert GitHubHandler(cache)._get_json(self.URL) == {"name": "test-repo"}
+        assert "If-none-match" not in mock_urlopen.call_args.args[0].headers
+
+        # A later run revalidates instead of downloading again
+        mock_urlopen.side_effect = HTTPError(self.URL, 304, "Not Modified", {}, None)
+        assert GitHubHandler(cache)._get_json(self.URL) == {"name": "test-repo"}
+        assert mock_urlopen.call_args.args[0].headers["If-none-match"] == '"v1"'
+
+    @patch("src.acmecli.github_handler.urlopen")
+    def test_modified_response_replaces_cache_entry(self, mock_urlopen):
+        from src.acmecli.cache import InMemoryCache
+
+        cache = InMemoryCache()
+        cache.set(self.URL, b'{"name": "old"}', '"v1"')
+        mock_urlopen.return_value = self._response(b'{"name": "new"}', '"v2"')
+        assert GitHubHandler(cache)._get_json(self.URL) == {"name": "new"}
+        assert cache.get(self.URL) == b'{"name": "new"}'
+        assert cache.get_etag(self.URL) == '"v2"'
+
+    @patch("src.acmecli.github_handler.urlopen")
+    def test_not_modified_without_cache_entry(self, mock_urlopen):
+        mock_urlopen.side_effect = HTTPError(self.URL, 304, "Not Modified", {}, None)
+        assert GitHubHandler()._get_json(self.URL) == {}
+
+
+class TestGitHubHandlerRateLimit:
+    """Test scheduling through the GitHub rate limiter"""
+
+    URL = "https://api.github.com/repos/test/repo"
+
+    @patch("src.acmecli.github_handler.urlopen")
+    def test_response_headers_update_budget(self, mock_urlopen):
+        from src.acmecli.rate_limit import GitHubRateLimiter
+
+        limiter = GitHubRateLimiter()
+        reset = str(int(time.time()) + 600)
+        headers = {"X-RateLimit-Limit": "5000", "X-RateLimit-Remaining": "4321", "X-RateLimit-Reset": reset}
+        response = MagicMock()
+        response.read.return_value = b'{"name": "test-repo"}'
+        response.headers.get.side_effect = headers.get
+        response.__enter__.return_value = response
+        mock_urlopen.return_value = response
+
+        assert GitHubHandler(limiter=limiter)._get_json(self.URL) == {"name": "test-repo"}
+        assert limiter.stats()["remaining"] == 4321
+
+    @patch("src.acmecli.github_handler.urlopen")
+    def test_exhausted_budget_skips_request(self, mock_urlopen):
+        from src.acmecli.rate_limit import GitHubRateLimiter
+
+        limiter = GitHubRateLimiter(max_wait=1)
+        reset = str(int(time.time()) + 600)
+        limiter.update({"X-RateLimit-Limit": "60", "X-RateLimit-Remaining": "0", "X-RateLimit-Reset": reset})
+
+        assert GitHubHandler(limiter=limiter)._get_json(self.URL) == {}
+        mock_urlopen.assert_not_called()
+        assert limiter.stats()["skipped_total"] == 1
+
+    def test_pulls_and_commits_are_low_priority(self):
+        from src.acmecli.github_handler import _request_priority
+        from src.acmecli.rate_limit import PRIORITY_HIGH, PRIORITY_LOW
+
+        assert _request_priority(self.URL) == PRIORITY_HIGH
+        assert _request_priority(self.URL + "/readme") == PRIORITY_HIGH
+        assert _request_priority(self.URL + "/contents?per_page=100") == PRIORITY_HIGH
+        assert _request_priority(self.URL + "/pulls?state=all&per_page=10") == PRIORITY_LOW
+        assert _request_priority(self.URL + "/pulls/1/reviews") == PRIORITY_LOW
+        assert _request_priority(self.URL + "/commits/abc123") == PRIORITY_LOW
+
+
 class TestGitHubHandlerFetchMeta:
     """Test fetch_meta method"""
 
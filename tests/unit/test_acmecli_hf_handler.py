@@ -206,6 +206,24 @@ class TestHFHandlerGetJson:
 
         assert result == {}
 
+    @patch("src.acmecli.hf_handler.urlopen")
+    def test_get_json_not_modified_uses_cache(self, mock_urlopen):
+        """Test a 304 revalidation is answered from the response cache"""
+        from src.acmecli.cache import InMemoryCache
+
+        url = "https://huggingface.co/api/models/test"
+        cache = InMemoryCache()
+        mock_response = MagicMock()
+        mock_response.read.return_value = b'{"name": "test-model"}'
+        mock_response.headers.get.side_effect = lambda key: '"v1"' if key == "ETag" else None
+        mock_response.__enter__.return_value = mock_response
+        mock_urlopen.return_value = mock_response
+        assert HFHandler(cache)._get_json(url) == {"name": "test-model"}
+
+        mock_urlopen.side_effect = HTTPError(url, 304, "Not Modified", {}, None)
+        assert HFHandler(cache)._get_json(url) == {"name": "test-model"}
+        assert mock_urlopen.call_args.args[0].headers["If-none-match"] == '"v1"'
+
 
 class TestHFHandlerFetchMeta:
     """Test fetch_meta method"""
@@ -807,3 +825,138 @@ class TestFetchHfMetadata:
         assert result == {"modelId": "test-model"}
         mock_handler.fetch_meta.assert_called_once_with("https://huggingface.co/user/model")
 
+
+
+# Model card snippets and the links the original per-pattern extraction
+# (one full-text regex pass per context keyword) returned for them, quirks
+# included: the compiled scanner must categorize links identically
+HYPERLINK_CORPUS = [
+    (
+        "This model is fine-tuned from huggingface.co/bert-base-uncased. "
+        "Code: github.com/google-research/bert",
+        {
+            "github": ["https://github.com/google-research/bert"],
+            "huggingface": ["https://huggingface.co/bert-base-uncased."],
+            "other": [],
+        },
+    ),
+    (
+        "The official repository is available on https://github.com/Org/Repo.",
+        {
+            "github": ["https://github.com/org/repo", "https://github.com/org/repo."],
+            "huggingface": [],
+            "other": [],
+        },
+    ),
+    (
+        "Base model: https://huggingface.co/meta-llama/Llama-2-7b-hf\n"
+        "Training code is at github.com/me/train",
+        {
+            "github": ["https://github.com/me/train"],
+            "huggingface": ["https://huggingface.co/meta-llama/llama-2-7b-hf"],
+            "other": [],
+        },
+    ),
+    (
+        "github.com/owner/my-code repository and https://github.com/owner/other (code)",
+        {
+            "github": ["https://github.com/owner/other", "https://github.com/owner/my-code"],
+            "huggingface": [],
+            "other": [],
+        },
+    ),
+    (
+        "See [the paper](https://arxiv.org/abs/1810.04805) and "
+        "[code](https://github.com/a/b/tree/main).",
+        {
+            "github": ["https://github.com/a/b"],
+            "huggingface": [],
+            "other": ["https://arxiv.org/abs/1810.04805"],
+        },
+    ),
+    (
+        "<a href=\"https://github.com/x/y#readme\">repo</a> "
+        "<a href='https://example.com/page?x=1'>site</a>",
+        {
+            "github": ["https://github.com/x/y"],
+            "huggingface": [],
+            "other": ["https://example.com/page", "https://example.com/page?x=1"],
+        },
+    ),
+    (
+        "Trained on huggingface.co/datasets/squad, demo at huggingface.co/spaces/me/demo, "
+        "model huggingface.co/me/m",
+        {"github": [], "huggingface": ["https://huggingface.co/me/m"], "other": []},
+    ),
+    (
+        "Source code:\n\n\n    GITHUB.COM/Upper/Case",
+        {"github": ["https://github.com/upper/case"], "huggingface": [], "other": []},
+    ),
+    (
+        "within github.com/a/b, Checkpoint = www.huggingface.co/o/m!",
+        {
+            "github": ["https://github.com/a/b"],
+            "huggingface": ["https://huggingface.co/o/m!"],
+            "other": [],
+        },
+    ),
+    (
+        "repo github.com/a/github.com/b/c and model huggingface.co/x/huggingface.co/y",
+        {
+            "github": ["https://github.com/a/github.com"],
+            "huggingface": ["https://huggingface.co/x/huggingface.co"],
+            "other": [],
+        },
+    ),
+    (
+        "Visit https://www.github.com/owner/repo.git?tab=readme, "
+        "cloned from git hub github.com/o/r.",
+        {
+            "github": ["https://github.com/owner/repo.git", "https://github.com/o/r."],
+            "huggingface": [],
+            "other": [],
+        },
+    ),
+    (
+        "weights:" + " " * 300 + "huggingface.co/far/away",
+        {"github": [], "huggingface": ["https://huggingface.co/far/away"], "other": []},
+    ),
+    (
+        "code" + "\n" * 400 + "github.com/long/whitespace",
+        {"github": ["https://github.com/long/whitespace"], "huggingface": [], "other": []},
+    ),
+    (
+        "No links here, just a model card about code and repositories.",
+        {"github": [], "huggingface": [], "other": []},
+    ),
+    (
+        "[docs](https://docs.example.org/en/) https://example.org/path/... http://a.b/c),",
+        {
+            "github": [],
+            "huggingface": [],
+            "other": [
+                "https://docs.example.org/en",
+                "https://example.org/path/",
+                "http://a.b/c",
+            ],
+        },
+    ),
+]
+
+
+class TestHFHandlerExtractHyperlinksCorpus:
+    """Regression corpus for the compiled hyperlink scanner"""
+
+    @pytest.mark.parametrize("text,expected", HYPERLINK_CORPUS)
+    def test_matches_original_extraction(self, text, expected):
+        assert HFHandler()._extract_hyperlinks_from_text(text) == expected
+
+    def test_long_card(self):
+        """Many references in one card keep the per-keyword discovery order"""
+        text = "\n".join(
+            f"Model {i} is based on huggingface.co/org/m{i}; code: github.com/org/r{i}"
+            for i in range(200)
+        )
+        links = HFHandler()._extract_hyperlinks_from_text(text)
+        assert links["github"] == [f"https://github.com/org/r{i}" for i in range(200)]
+        assert links["huggingface"] == [f"https://huggingface.co/org/m{i};" for i in range(200)]
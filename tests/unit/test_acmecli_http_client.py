@@ -0,0 +1,121 @@
+"""
+Unit tests for the shared pooled HTTP client
+"""
+import threading
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.error import HTTPError, URLError
+
+import pytest
+
+from src.acmecli import http_client
+
+
+@pytest.fixture
+def stub_server():
+    """Local keep-alive HTTP server; responses are scripted per path."""
+    state = {"connections": 0, "hits": {}, "script": {}}
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        disable_nagle_algorithm = True
+
+        def setup(self):
+            super().setup()
+            state["connections"] += 1
+
+        def _respond(self):
+            hits = state["hits"][self.path] = state["hits"].get(self.path, 0) + 1
+            statuses = state["script"].get(self.path, [200])
+            status = statuses[min(hits, len(statuses)) - 1]
+            body = b'{"ok": true}' if status == 200 else b""
+            self.send_response(status)
+            self.send_header("ETag", '"v1"')
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_GET(self):
+            self._respond()
+
+        def do_POST(self):
+            self.rfile.read(int(self.headers.get("Content-Length", 0)))
+            self._respond()
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, args=(0.05,), daemon=True).start()
+    state["url"] = f"http://127.0.0.1:{server.server_address[1]}"
+    yield state
+    server.shutdown()
+    server.server_close()
+
+
+class TestPooledSession:
+    """Test connection reuse and retries"""
+
+    def test_connections_are_reused(self, stub_server, monkeypatch):
+        # Start from an empty pool
+        monkeypatch.setattr(http_client, "_adapter", None)
+        monkeypatch.setattr(http_client, "_local", threading.local())
+        for _ in range(5):
+            assert http_client.get(stub_server["url"] + "/a", timeout=5).json() == {"ok": True}
+        assert stub_server["connections"] == 1
+
+    def test_sessions_are_per_thread_with_shared_pool(self):
+        sessions = []
+        thread = threading.Thread(target=lambda: sessions.append(http_client.get_session()))
+        thread.start()
+        thread.join()
+        main = http_client.get_session()
+        assert sessions[0] is not main
+        assert sessions[0].get_adapter("https://x") is main.get_adapter("https://x")
+
+    def test_get_is_retried_on_server_error(self, stub_server, monkeypatch):
+        monkeypatch.setattr("random.uniform", lambda a, b: 0)  # No backoff sleep
+        stub_server["script"]["/flaky"] = [503, 503, 200]
+        response = http_client.get(stub_server["url"] + "/flaky", timeout=5)
+        assert response.status_code == 200
+        assert stub_server["hits"]["/flaky"] == 3
+
+    def test_post_is_not_retried(self, stub_server):
+        stub_server["script"]["/submit"] = [503, 200]
+        response = http_client.post(stub_server["url"] + "/submit", json={}, timeout=5)
+        assert response.status_code == 503
+        assert stub_server["hits"]["/submit"] == 1
+
+
+class TestUrlopen:
+    """Test the urllib-compatible urlopen"""
+
+    def test_success(self, stub_server):
+        request = urllib.request.Request(stub_server["url"] + "/a", headers={"User-Agent": "t"})
+        with http_client.urlopen(request, timeout=5) as response:
+            assert response.status == 200
+            assert response.headers.get("ETag") == '"v1"'
+            assert response.read() == b'{"ok": true}'
+
+    def test_not_modified_raises_http_error(self, stub_server):
+        stub_server["script"]["/cached"] = [304]
+        with pytest.raises(HTTPError) as exc_info:
+            http_client.urlopen(stub_server["url"] + "/cached", timeout=5)
+        assert exc_info.value.code == 304
+
+    def test_not_found_raises_http_error(self, stub_server):
+        stub_server["script"]["/missing"] = [404]
+        with pytest.raises(HTTPError) as exc_info:
+            http_client.urlopen(stub_server["url"] + "/missing", timeout=5)
+        assert exc_info.value.code == 404
+
+    def test_connection_error_raises_url_error(self, monkeypatch):
+        import socket
+
+        monkeypatch.setattr("random.uniform", lambda a, b: 0)
+        with socket.socket() as sock:
+            sock.bind(("127.0.0.1", 0))
+            port = sock.getsockname()[1]  # Nothing listens here once closed
+        with pytest.raises(URLError):
+            http_client.urlopen(f"http://127.0.0.1:{port}/", timeout=2)
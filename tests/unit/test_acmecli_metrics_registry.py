@@ -0,0 +1,108 @@
+"""
+Unit tests for the lazy, deduplicating metric registry
+"""
+import subprocess
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from src.acmecli import metrics
+from src.acmecli.metrics import base
+from src.acmecli.metrics.base import LazyFunctions, MetricRegistry
+
+ROOT = Path(__file__).resolve().parents[2]
+
+
+class FakeMetric:
+    def __init__(self, name):
+        self.name = name
+
+    def score(self, meta):
+        return 1.0
+
+
+class TestMetricRegistry:
+    """Test registration, deduplication and selection"""
+
+    def test_duplicate_registrations_are_ignored(self):
+        registry = MetricRegistry()
+        first = FakeMetric("license")
+        registry.register(first)
+        registry.register(FakeMetric("license"))
+        registry.register_lazy("license", "license_metric:LicenseMetric")
+        assert len(registry) == 1
+        assert registry.get("license") is first
+
+    def test_select_subset_in_registration_order(self):
+        registry = MetricRegistry()
+        for name in ("a", "b", "c"):
+            registry.register(FakeMetric(name))
+        assert [m.name for m in registry.select(["c", "a"])] == ["a", "c"]
+        assert [m.name for m in registry] == ["a", "b", "c"]
+
+    def test_select_unknown_name_raises(self):
+        registry = MetricRegistry()
+        registry.register(FakeMetric("a"))
+        with pytest.raises(KeyError, match="missing"):
+            registry.select(["a", "missing"])
+
+    def test_lazy_entry_point_loads_on_first_use(self):
+        registry = MetricRegistry()
+        registry.register_lazy("license", "license_metric:LicenseMetric")
+        with patch.object(base, "load_entry_point", wraps=base.load_entry_point) as mock_load:
+            assert "license" in registry
+            mock_load.assert_not_called()
+            metric = registry.get("license")
+        assert metric.name == "license"
+        mock_load.assert_called_once_with("license_metric:LicenseMetric")
+
+
+class TestLoadEntryPoint:
+    """Test entry point resolution"""
+
+    def test_class_is_instantiated_once(self):
+        first = base.load_entry_point("license_metric:LicenseMetric")
+        assert first is base.load_entry_point("license_metric:LicenseMetric")
+        assert first.name == "license"
+
+    def test_function_is_returned_as_is(self):
+        function = base.load_entry_point("score_dependencies:score_dependencies_with_latency")
+        assert callable(function)
+        assert not isinstance(function, type)
+
+
+class TestPackageRegistry:
+    """Test the registry populated by acmecli.metrics"""
+
+    def test_each_metric_registered_once(self):
+        names = metrics.REGISTRY.names()
+        assert len(names) == len(set(names)) == 14
+
+    def test_rating_metrics_are_registered(self):
+        selected = metrics.REGISTRY.select(metrics.RATING_METRICS)
+        assert sorted(m.name for m in selected) == sorted(metrics.RATING_METRICS)
+
+    def test_metric_functions_share_registry_instances(self):
+        assert isinstance(metrics.METRIC_FUNCTIONS, LazyFunctions)
+        assert metrics.METRIC_FUNCTIONS["license"].__self__ is metrics.REGISTRY.get("license")
+        assert "dependencies" in metrics.METRIC_FUNCTIONS
+
+    def test_metric_classes_are_exported(self):
+        from src.acmecli.metrics import LicenseMetric
+        from src.acmecli.metrics.license_metric import LicenseMetric as Direct
+
+        assert LicenseMetric is Direct
+        with pytest.raises(AttributeError):
+            metrics.NoSuchMetric
+
+    def test_import_does_not_load_metric_modules(self):
+        code = (
+            "import sys, src.acmecli.metrics; "
+            "print(sorted(m for m in sys.modules if m.endswith('_metric')))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True
+        )
+        assert result.stdout.strip() == "[]"
@@ -0,0 +1,132 @@
+"""
+Unit tests for the GitHub rate limit scheduler
+"""
+import threading
+import time
+
+from src.acmecli.rate_limit import PRIORITY_HIGH, PRIORITY_LOW, GitHubRateLimiter
+
+NOW = 1_700_000_000
+
+
+def budget(remaining, limit=5000, reset_in=3600):
+    return {
+        "X-RateLimit-Limit": str(limit),
+        "X-RateLimit-Remaining": str(remaining),
+        "X-RateLimit-Reset": str(NOW + reset_in),
+    }
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = float(NOW)
+
+    def __call__(self):
+        return self.now
+
+
+class TestBudget:
+    """Test tracking of the reported budget"""
+
+    def test_unknown_budget_is_not_limited(self):
+        limiter = GitHubRateLimiter(clock=FakeClock())
+        assert all(limiter.acquire() for _ in range(100))
+        assert limiter.stats() is None
+
+    def test_grants_consume_budget_until_next_response(self):
+        limiter = GitHubRateLimiter(clock=FakeClock())
+        limiter.update(budget(4000))
+        limiter.acquire()
+        limiter.acquire()
+        assert limiter.stats()["remaining"] == 3998
+        limiter.update(budget(3999))  # Server count wins (e.g. a 304 was free)
+        assert limiter.stats()["remaining"] == 3999
+
+    def test_window_reset_clears_budget(self):
+        clock = FakeClock()
+        limiter = GitHubRateLimiter(clock=clock, max_wait=0)
+        limiter.update(budget(0, reset_in=60))
+        assert limiter.acquire() is False
+        clock.now += 60
+        assert limiter.acquire() is True
+        assert limiter.stats()["remaining"] is None
+
+    def test_unparseable_headers_are_ignored(self):
+        limiter = GitHubRateLimiter(clock=FakeClock())
+        limiter.update({"X-RateLimit-Remaining": "n/a", "X-RateLimit-Reset": None})
+        limiter.update(None)
+        assert limiter.stats() is None
+
+    def test_retry_after_pauses_requests(self):
+        clock = FakeClock()
+        limiter = GitHubRateLimiter(clock=clock, max_wait=0)
+        limiter.update({"Retry-After": "30"})  # Ignored on a success
+        assert limiter.acquire() is True
+        limiter.update({"Retry-After": "30"}, status=403)
+        assert limiter.acquire() is False
+        clock.now += 30
+        assert limiter.acquire() is True
+
+
+class TestPacing:
+    """Test spreading the last part of the budget until the reset"""
+
+    def test_no_pacing_above_threshold(self):
+        limiter = GitHubRateLimiter(clock=FakeClock(), pace_fraction=0.2, max_wait=0)
+        limiter.update(budget(2000, limit=5000))
+        assert all(limiter.acquire() for _ in range(10))
+        assert limiter.stats()["paced"] is False
+
+    def test_requests_are_spaced_below_threshold(self):
+        clock = FakeClock()
+        limiter = GitHubRateLimiter(clock=clock, pace_fraction=0.2, reserve=0, max_wait=0)
+        limiter.update(budget(100, limit=5000, reset_in=1000))
+        assert limiter.acquire() is True
+        # 100 tokens over 1000 seconds: one every 10 seconds
+        assert limiter.acquire() is False
+        clock.now += 9.9
+        assert limiter.acquire() is False
+        clock.now += 0.1
+        assert limiter.acquire() is True
+        assert limiter.stats()["paced"] is True
+
+    def test_exhausted_budget_waits_for_reset(self):
+        limiter = GitHubRateLimiter(clock=FakeClock(), max_wait=10)
+        limiter.update(budget(0, reset_in=3600))
+        assert limiter.acquire() is False
+        assert limiter.stats()["skipped_total"] == 1
+
+
+class TestPriority:
+    """Test the reserve and priority ordering"""
+
+    def test_reserve_is_for_high_priority(self):
+        limiter = GitHubRateLimiter(clock=FakeClock(), reserve=10, max_wait=0)
+        limiter.update(budget(10, limit=60, reset_in=600))
+        assert limiter.acquire(PRIORITY_LOW) is False
+        assert limiter.acquire(PRIORITY_HIGH) is True
+
+    def test_high_priority_waiter_is_served_first(self):
+        limiter = GitHubRateLimiter(pace_fraction=0, reserve=0, max_wait=900)
+        reset = int(time.time()) + 600
+        limiter.update({"X-RateLimit-Limit": "60", "X-RateLimit-Remaining": "0", "X-RateLimit-Reset": str(reset)})
+
+        low = threading.Thread(target=limiter.acquire, args=(PRIORITY_LOW,), daemon=True)
+        low.start()
+        while limiter.stats()["waiting"] < 1:
+            time.sleep(0.01)
+        high = threading.Thread(target=limiter.acquire, args=(PRIORITY_HIGH,), daemon=True)
+        high.start()
+        while limiter.stats()["waiting"] < 2:
+            time.sleep(0.01)
+
+        # One token frees up: the later high-priority request gets it
+        limiter.update({"X-RateLimit-Remaining": "1", "X-RateLimit-Reset": str(reset)})
+        high.join(timeout=5)
+        assert not high.is_alive()
+        assert low.is_alive()
+
+        limiter.update({"X-RateLimit-Remaining": "1", "X-RateLimit-Reset": str(reset)})
+        low.join(timeout=5)
+        assert not low.is_alive()
+        assert limiter.stats()["granted_total"] == 2
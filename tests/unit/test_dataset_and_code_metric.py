@@ -11,3 +11,10 @@ def test_dataset_and_code_missing():
     # Implementation may return minimum 0.5
     assert mv.value >= 0.0
     assert mv.latency_ms >= 0
+
+def test_dataset_and_code_counts_links():
+    metric = DatasetAndCodeMetric()
+    base = "dataset: imagenet. code on github, see the example usage"
+    linked = metric.score({"readme_text": base + " https://example.com/data"})
+    unlinked = metric.score({"readme_text": base + " over an http api"})
+    assert linked.value == round(unlinked.value + 0.1, 2)
@@ -308,7 +308,9 @@ class TestIndexHelperFunctions:
 
     def test_get_artifact_cost_with_dependency(self, mock_auth):
         """Test get artifact cost with dependency=true"""
-        with patch("src.index.get_generic_artifact_metadata") as mock_get:
+        with patch("src.index.get_generic_artifact_metadata") as mock_get, patch(
+            "src.index.resolve_model_key", return_value=("test-id", "1.0.0")
+        ):
             with patch("src.index.get_model_sizes") as mock_sizes:
                 with patch("src.index.get_model_lineage_from_config") as mock_lineage:
                     mock_get.return_value = {"type": "model", "id": "test-id"}
@@ -530,7 +532,7 @@ class TestHelperFunctions:
         except ImportError:
             pass  # UNSKIPPED: pytest.skip("_parse_dependencies not available")
         with patch("os.getenv", return_value="test-api-key"):
-            with patch("requests.post") as mock_post:
+            with patch("src.acmecli.http_client.post") as mock_post:
                 mock_post.return_value.status_code = 200
                 mock_post.return_value.json.return_value = {
                     "choices": [{
@@ -573,7 +575,7 @@ class TestHelperFunctions:
         except ImportError:
             pass  # UNSKIPPED: pytest.skip("_parse_dependencies not available")
         with patch("os.getenv", return_value="test-api-key"):
-            with patch("requests.post", side_effect=Exception("Timeout")):
+            with patch("src.acmecli.http_client.post", side_effect=Exception("Timeout")):
                 text = "Trained on https://huggingface.co/datasets/coco"
                 result = _parse_dependencies(text, "test-model")
                 assert "datasets" in result  # Should fallback to patterns
@@ -596,7 +598,7 @@ class TestHelperFunctions:
                     "name": "test-dataset",
                     "url": "https://example.com/dataset.zip"
                 }
-                with patch("requests.head") as mock_head:
+                with patch("src.acmecli.http_client.head") as mock_head:
                     # 10MB
                     mock_head.return_value.headers = {"Content-Length": "10485760"}
                     size = _get_artifact_size_mb("dataset", "test-id")
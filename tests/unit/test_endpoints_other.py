@@ -422,7 +422,7 @@ class TestAdditionalCoverage:
                         "id": "test-id",
                         "url": "https://huggingface.co/test-model"
                     }
-                    with patch("requests.head") as mock_head:
+                    with patch("src.acmecli.http_client.head") as mock_head:
                         mock_head.return_value.headers = {"Content-Length": "10485760"}
                         response = client.get("/artifact/model/test-id/cost")
                         assert response.status_code == 200
@@ -437,7 +437,7 @@ class TestAdditionalCoverage:
                         "id": "test-id",
                         "url": "https://huggingface.co/test-model"
                     }
-                    with patch("requests.head", side_effect=Exception("Network error")):
+                    with patch("src.acmecli.http_client.head", side_effect=Exception("Network error")):
                         response = client.get("/artifact/model/test-id/cost")
                         assert response.status_code == 404
 
@@ -707,7 +707,7 @@ class TestAdditionalCoverage:
                     "url": "https://example.com/dataset.zip"
                 }
                 mock_db.return_value = None
-                with patch("requests.head", side_effect=Exception("Network error")):
+                with patch("src.acmecli.http_client.head", side_effect=Exception("Network error")):
                     with patch("src.index.s3") as mock_s3:
                         mock_s3.head_object.return_value = {"ContentLength": 10485760}
                         size = _get_artifact_size_mb("dataset", "test-id")
@@ -722,7 +722,7 @@ class TestAdditionalCoverage:
             pass  # UNSKIPPED: pytest.skip("_parse_dependencies not available")
 
         with patch("os.getenv", return_value="test-api-key"):
-            with patch("requests.post") as mock_post:
+            with patch("src.acmecli.http_client.post") as mock_post:
                 mock_post.return_value.status_code = 500
                 text = "Trained on https://huggingface.co/datasets/coco"
                 result = _parse_dependencies(text, "test-model")
@@ -737,7 +737,7 @@ class TestAdditionalCoverage:
             pass  # UNSKIPPED: pytest.skip("_parse_dependencies not available")
 
         with patch("os.getenv", return_value="test-api-key"):
-            with patch("requests.post") as mock_post:
+            with patch("src.acmecli.http_client.post") as mock_post:
                 mock_post.return_value.status_code = 200
                 mock_post.return_value.json.return_value = {
                     "choices": [{
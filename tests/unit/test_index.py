@@ -104,7 +104,8 @@ def reset_rating_state():
         _rating_status,
         _rating_locks,
         _rating_results,
-        _rating_start_times
+        _rating_start_times,
+        _rating_snapshots,
     )
     
     # Store original state
@@ -112,12 +113,14 @@ def reset_rating_state():
     original_locks = _rating_locks.copy()
     original_results = _rating_results.copy()
     original_start_times = _rating_start_times.copy()
+    original_snapshots = _rating_snapshots.copy()
     
     # Clear state before test
     _rating_status.clear()
     _rating_locks.clear()
     _rating_results.clear()
     _rating_start_times.clear()
+    _rating_snapshots.clear()
     
     yield
     
@@ -130,6 +133,8 @@ def reset_rating_state():
     _rating_results.update(original_results)
     _rating_start_times.clear()
     _rating_start_times.update(original_start_times)
+    _rating_snapshots.clear()
+    _rating_snapshots.update(original_snapshots)
 
 def test_sanitize_model_id_for_s3():
     """Test sanitize_model_id_for_s3 helper function"""
@@ -1176,7 +1181,9 @@ class TestIndexHelperFunctions:
 
     def test_get_artifact_cost_with_dependency(self, mock_auth):
         """Test get artifact cost with dependency=true"""
-        with patch("src.index.get_generic_artifact_metadata") as mock_get:
+        with patch("src.index.get_generic_artifact_metadata") as mock_get, patch(
+            "src.index.resolve_model_key", return_value=("test-id", "1.0.0")
+        ):
             with patch("src.index.get_model_sizes") as mock_sizes:
                 with patch("src.index.get_model_lineage_from_config") as mock_lineage:
                     mock_get.return_value = {"type": "model", "id": "test-id"}
@@ -1314,6 +1321,46 @@ class TestIndexHelperFunctions:
         assert response.status_code == 200
         assert response.json()["net_score"] == 0.85
 
+    def _rate_after_wait_timeout(self, test_id, **analyze):
+        """Request a pending rating whose wait times out while its job is still queued"""
+        from src.index import _rating_status, _rating_locks, _rating_lock
+
+        event = MagicMock()
+        event.wait.return_value = False
+        with _rating_lock:
+            _rating_status[test_id] = RATING_STATUS_PENDING
+            _rating_locks[test_id] = event
+        seen = []
+
+        def batch_callback(job_id):
+            seen.append((job_id, _rating_status.get(job_id)))
+
+        with patch("src.index.get_generic_artifact_metadata",
+                   return_value={"type": "model", "id": test_id, "name": "test-model"}), \
+                patch("src.index._rating_scheduler") as mock_scheduler, \
+                patch("src.index.analyze_model_content", **analyze):
+            mock_scheduler.detach.return_value = [batch_callback]
+            response = client.get(f"/artifact/model/{test_id}/rate")
+        mock_scheduler.cancel.assert_not_called()
+        mock_scheduler.detach.assert_called_once_with(test_id)
+        event.set.assert_called()
+        return response, seen
+
+    def test_get_model_rate_timeout_hands_result_to_queued_waiters(self, mock_auth):
+        """A batch waiting on the queued job gets the synchronous rating, not a cancellation"""
+        response, seen = self._rate_after_wait_timeout(
+            "sync-takeover-id", return_value={"net_score": 0.8}
+        )
+        assert response.status_code == 200
+        assert seen == [("sync-takeover-id", RATING_STATUS_COMPLETED)]
+
+    def test_get_model_rate_timeout_reports_failed_takeover(self, mock_auth):
+        response, seen = self._rate_after_wait_timeout(
+            "sync-takeover-fail-id", side_effect=Exception("boom")
+        )
+        assert response.status_code == 500
+        assert seen == [("sync-takeover-fail-id", RATING_STATUS_FAILED)]
+
     def test_get_model_lineage_with_dependencies(self, mock_auth):
         """Test get model lineage with dependencies"""
         with patch("src.index.get_generic_artifact_metadata") as mock_get:
@@ -1524,9 +1571,205 @@ class TestDeleteArtifact:
                 response = client.delete("/artifacts/model/test-id")
                 assert response.status_code == 200
 
+    def test_delete_artifact_model_reclaims_pointed_blob(self, mock_auth):
+        """Test deleting a model pointer releases the blob it referenced"""
+        from src.services.blob_store import POINTER_CONTENT_TYPE
+
+        pointer_head = {"ContentType": POINTER_CONTENT_TYPE, "Metadata": {"blob-sha256": "ab" * 32}}
+        with patch("src.index.get_artifact_from_db", return_value=None):
+            with patch("src.index.s3") as mock_s3:
+                with patch("src.index.reclaim_blobs") as mock_reclaim:
+                    mock_s3.head_object.return_value = pointer_head
+                    response = client.delete("/artifacts/model/test-id")
+                    assert response.status_code == 200
+                    assert "ab" * 32 in mock_reclaim.call_args[0][0]
+
 
 # Tests for previously untested functions
 
+class TestRateModelsBatch:
+    """Tests for POST /artifact/model/rate/batch"""
+
+    RATING = {"net_score": 0.8, "ramp_up": 0.7, "license": 1.0}
+
+    @staticmethod
+    def _lines(response):
+        import json
+
+        return [json.loads(line) for line in response.text.splitlines() if line]
+
+    def test_requires_auth(self):
+        with patch("src.index.verify_auth_token", return_value=False):
+            response = client.post("/artifact/model/rate/batch", json={"ids": ["a"]})
+        assert response.status_code == 403
+
+    def test_rejects_empty_batch(self, mock_auth):
+        response = client.post("/artifact/model/rate/batch", json={"ids": [" ", ""]})
+        assert response.status_code == 400
+
+    def test_streams_one_line_per_item(self, mock_auth):
+        from src.index import _rating_results, _rating_status
+
+        def artifact(artifact_type, artifact_id):
+            if artifact_id == "dataset-1":
+                return {"type": "dataset", "name": "squad"}
+            return {"type": "model", "name": f"name-{artifact_id}"}
+
+        _rating_status["cached-1"] = RATING_STATUS_COMPLETED
+        _rating_results["cached-1"] = {"net_score": 0.9}
+        with patch("src.index.get_generic_artifact_metadata", side_effect=artifact):
+            with patch("src.index.analyze_model_content") as mock_analyze:
+                mock_analyze.side_effect = (
+                    lambda name: {"net_score": 0.2} if name == "name-low" else self.RATING
+                )
+                response = client.post(
+                    "/artifact/model/rate/batch",
+                    json={
+                        "ids": [
+                            "m1", "m2", "low", "cached-1", "dataset-1", "m1",
+                            "https://huggingface.co/org/model/tree/main",
+                            "https://example.com/org/model",
+                        ],
+                        "concurrency": 2,
+                    },
+                )
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        results = {line["id"]: line for line in self._lines(response)}
+        assert len(results) == 7  # Duplicate ids are rated once
+        assert results["m1"]["status"] == "completed"
+        assert results["m1"]["rating"]["net_score"] == 0.8
+        assert results["m1"]["rating"]["name"] == "name-m1"
+        assert results["low"]["status"] == "disqualified"
+        assert results["low"]["rating"]["net_score"] == 0.2
+        assert results["cached-1"]["cached"] is True
+        assert results["cached-1"]["rating"]["net_score"] == 0.9
+        assert results["dataset-1"]["status"] == "invalid"
+        assert results["https://example.com/org/model"]["status"] == "invalid"
+        assert results["https://huggingface.co/org/model/tree/main"]["name"] == "org/model"
+        rated = sorted(call.args[0] for call in mock_analyze.call_args_list)
+        assert rated == ["name-low", "name-m1", "name-m2", "org/model"]
+        assert _rating_results["m2"] == self.RATING
+
+    def test_failed_rating_is_reported(self, mock_auth):
+        with patch("src.index.get_generic_artifact_metadata", return_value=None):
+            with patch("src.index.get_artifact_from_db", return_value=None):
+                with patch("src.index.analyze_model_content", side_effect=Exception("boom")):
+                    response = client.post(
+                        "/artifact/model/rate/batch", json={"ids": ["org/missing"]}
+                    )
+        [line] = self._lines(response)
+        assert line["status"] == "failed"
+        assert "rating" not in line
+
+    def test_refresh_ignores_memory_cache(self, mock_auth):
+        from src.index import _rating_results, _rating_status
+
+        _rating_status["m1"] = RATING_STATUS_COMPLETED
+        _rating_results["m1"] = {"net_score": 0.9}
+        with patch("src.index.get_generic_artifact_metadata", return_value=None):
+            with patch("src.index.get_artifact_from_db", return_value=None):
+                with patch("src.index.analyze_model_content", return_value=self.RATING):
+                    response = client.post(
+                        "/artifact/model/rate/batch", json={"ids": ["m1"], "refresh": True}
+                    )
+        [line] = self._lines(response)
+        assert line["cached"] is False
+        assert line["rating"]["net_score"] == 0.8
+
+
+class TestRatingStaleWhileRevalidate:
+    """Tests for serving the last known rating from GET /artifact/model/{id}/rate"""
+
+    ARTIFACT = {"type": "model", "id": TEST_MODEL_ID, "name": TEST_MODEL_NAME, "version": "main"}
+
+    @staticmethod
+    def _snapshot(rating, age=0.0, changed=False):
+        from src.index import _rating_lock, _rating_snapshots
+
+        with _rating_lock:
+            _rating_snapshots[TEST_MODEL_ID] = {
+                "rating": rating,
+                "rated_at": time.time() - age,
+                "changed": changed,
+                "revalidated_at": 0.0,
+            }
+
+    def _get(self):
+        with patch("src.index.get_generic_artifact_metadata", return_value=self.ARTIFACT):
+            return client.get(f"/artifact/model/{TEST_MODEL_ID}/rate")
+
+    def test_fresh_rating_is_served_without_rerating(self, mock_auth):
+        self._snapshot({"net_score": 0.9}, age=30)
+        with patch("src.index.analyze_model_content") as mock_analyze:
+            with patch("src.index._enqueue_rating") as mock_enqueue:
+                response = self._get()
+        assert response.status_code == 200
+        assert response.json()["net_score"] == 0.9
+        assert response.json()["name"] == TEST_MODEL_NAME
+        assert 30 <= int(response.headers["Age"]) <= 31
+        assert response.headers["X-Rating-Stale"] == "false"
+        mock_analyze.assert_not_called()
+        mock_enqueue.assert_not_called()
+
+    def test_expired_rating_is_served_and_rerated_once(self, mock_auth):
+        from src.index import RATING_TTL_SECONDS, _rating_status
+
+        self._snapshot({"net_score": 0.9}, age=RATING_TTL_SECONDS + 5)
+        with patch("src.index._enqueue_rating") as mock_enqueue:
+            first = self._get()
+            second = self._get()
+        assert first.json()["net_score"] == 0.9
+        assert first.headers["X-Rating-Stale"] == "true"
+        assert second.json()["net_score"] == 0.9
+        # The second request sees the pending re-rate instead of queueing another
+        mock_enqueue.assert_called_once_with(TEST_MODEL_ID, TEST_MODEL_NAME, "main")
+        assert _rating_status[TEST_MODEL_ID] == RATING_STATUS_PENDING
+
+    def test_updated_artifact_is_rerated(self, mock_auth):
+        from src.index import _mark_rating_changed
+
+        self._snapshot({"net_score": 0.9})
+        _mark_rating_changed(TEST_MODEL_ID)
+        with patch("src.index._enqueue_rating") as mock_enqueue:
+            response = self._get()
+        assert response.headers["X-Rating-Stale"] == "true"
+        mock_enqueue.assert_called_once()
+
+    def test_rerate_replaces_served_rating(self, mock_auth):
+        from src.index import RATING_TTL_SECONDS, _rating_locks
+
+        self._snapshot({"net_score": 0.9}, age=RATING_TTL_SECONDS + 5)
+        with patch("src.index.analyze_model_content", return_value={"net_score": 0.6}):
+            assert self._get().json()["net_score"] == 0.9
+            assert _rating_locks[TEST_MODEL_ID].wait(timeout=5)
+        response = self._get()
+        assert response.json()["net_score"] == 0.6
+        assert response.headers["X-Rating-Stale"] == "false"
+
+    def test_disqualified_rerate_is_not_served_stale(self, mock_auth):
+        from src.index import RATING_TTL_SECONDS, _rating_locks
+
+        self._snapshot({"net_score": 0.9}, age=RATING_TTL_SECONDS + 5)
+        with patch("src.index.analyze_model_content", return_value={"net_score": 0.3}):
+            assert self._get().json()["net_score"] == 0.9
+            assert _rating_locks[TEST_MODEL_ID].wait(timeout=5)
+        # /rate re-rates a disqualified model instead of serving a snapshot
+        with patch("src.index.analyze_model_content", return_value={"net_score": 0.4}) as mock_analyze:
+            response = self._get()
+        assert response.json()["net_score"] == 0.4
+        assert "Age" not in response.headers
+        mock_analyze.assert_called_once()
+
+    def test_synchronous_rating_is_kept_for_next_request(self, mock_auth):
+        with patch("src.index.analyze_model_content", return_value={"net_score": 0.7}) as mock_analyze:
+            assert self._get().json()["net_score"] == 0.7
+            response = self._get()
+        assert response.json()["net_score"] == 0.7
+        assert "Age" in response.headers
+        mock_analyze.assert_called_once()
+
+
 class TestGetPackageRate:
     """Test get_package_rate function"""
 
@@ -1827,7 +2070,7 @@ class TestHelperFunctions:
         except ImportError:
             pass  # UNSKIPPED: pytest.skip("_parse_dependencies not available")
         with patch("os.getenv", return_value="test-api-key"):
-            with patch("requests.post") as mock_post:
+            with patch("src.acmecli.http_client.post") as mock_post:
                 mock_post.return_value.status_code = 200
                 mock_post.return_value.json.return_value = {
                     "choices": [{
@@ -1870,7 +2113,7 @@ class TestHelperFunctions:
         except ImportError:
             pass  # UNSKIPPED: pytest.skip("_parse_dependencies not available")
         with patch("os.getenv", return_value="test-api-key"):
-            with patch("requests.post", side_effect=Exception("Timeout")):
+            with patch("src.acmecli.http_client.post", side_effect=Exception("Timeout")):
                 text = "Trained on https://huggingface.co/datasets/coco"
                 result = _parse_dependencies(text, "test-model")
                 assert "datasets" in result  # Should fallback to patterns
@@ -1893,7 +2136,7 @@ class TestHelperFunctions:
                     "name": "test-dataset",
                     "url": "https://example.com/dataset.zip"
                 }
-                with patch("requests.head") as mock_head:
+                with patch("src.acmecli.http_client.head") as mock_head:
                     # 10MB
                     mock_head.return_value.headers = {"Content-Length": "10485760"}
                     size = _get_artifact_size_mb("dataset", "test-id")
@@ -2206,6 +2449,17 @@ class TestHealthComponents:
             assert perf_component is not None
             assert perf_component["status"] == "unknown"
 
+    def test_health_components_github_rate_limit_low(self):
+        """Test GitHub budget component is degraded once only the reserve is left"""
+        stats = {"limit": 5000, "remaining": 3, "reserve": 10, "reset_in_seconds": 120.0}
+        with patch("src.acmecli.rate_limit.get_rate_limit_stats", return_value=stats):
+            response = client.get("/health/components?windowMinutes=60")
+        assert response.status_code == 200
+        component = next(c for c in response.json()["components"] if c["id"] == "github-rate-limit")
+        assert component["status"] == "degraded"
+        assert component["metrics"]["remaining"] == 3
+        assert component["issues"][0]["code"] == "GITHUB_RATE_LIMIT_LOW"
+
 
 class TestVerifyAuthToken:
     """Additional tests for verify_auth_token"""
@@ -2579,7 +2833,7 @@ class TestAdditionalCoverage:
                         "id": "test-id",
                         "url": "https://huggingface.co/test-model"
                     }
-                    with patch("requests.head") as mock_head:
+                    with patch("src.acmecli.http_client.head") as mock_head:
                         mock_head.return_value.headers = {"Content-Length": "10485760"}
                         response = client.get("/artifact/model/test-id/cost")
                         assert response.status_code == 200
@@ -2594,7 +2848,7 @@ class TestAdditionalCoverage:
                         "id": "test-id",
                         "url": "https://huggingface.co/test-model"
                     }
-                    with patch("requests.head", side_effect=Exception("Network error")):
+                    with patch("src.acmecli.http_client.head", side_effect=Exception("Network error")):
                         response = client.get("/artifact/model/test-id/cost")
                         assert response.status_code == 404
 
@@ -2864,7 +3118,7 @@ class TestAdditionalCoverage:
                     "url": "https://example.com/dataset.zip"
                 }
                 mock_db.return_value = None
-                with patch("requests.head", side_effect=Exception("Network error")):
+                with patch("src.acmecli.http_client.head", side_effect=Exception("Network error")):
                     with patch("src.index.s3") as mock_s3:
                         mock_s3.head_object.return_value = {"ContentLength": 10485760}
                         size = _get_artifact_size_mb("dataset", "test-id")
@@ -2879,7 +3133,7 @@ class TestAdditionalCoverage:
             pass  # UNSKIPPED: pytest.skip("_parse_dependencies not available")
 
         with patch("os.getenv", return_value="test-api-key"):
-            with patch("requests.post") as mock_post:
+            with patch("src.acmecli.http_client.post") as mock_post:
                 mock_post.return_value.status_code = 500
                 text = "Trained on https://huggingface.co/datasets/coco"
                 result = _parse_dependencies(text, "test-model")
@@ -2894,7 +3148,7 @@ class TestAdditionalCoverage:
             pass  # UNSKIPPED: pytest.skip("_parse_dependencies not available")
 
         with patch("os.getenv", return_value="test-api-key"):
-            with patch("requests.post") as mock_post:
+            with patch("src.acmecli.http_client.post") as mock_post:
                 mock_post.return_value.status_code = 200
                 mock_post.return_value.json.return_value = {
                     "choices": [{
@@ -4049,7 +4303,7 @@ def test_get_artifact_size_mb_error_handling():
     # Test with exception in requests.head
     with patch("src.index.get_generic_artifact_metadata") as mock_get:
         mock_get.return_value = {"url": "https://example.com/model.zip"}
-        with patch("requests.head", side_effect=Exception("Network error")):
+        with patch("src.acmecli.http_client.head", side_effect=Exception("Network error")):
             result = _get_artifact_size_mb("model", "test-id")
             assert result == 0.0
     
@@ -4073,7 +4327,7 @@ def test_get_artifact_size_mb_s3_fallback():
             "name": "test-model",
             "url": "https://example.com/model.zip"
         }
-        with patch("requests.head") as mock_head:
+        with patch("src.acmecli.http_client.head") as mock_head:
             # Mock head to not return Content-Length
             mock_response = MagicMock()
             mock_response.headers = {}
@@ -4256,12 +4510,12 @@ def test_parse_dependencies_llm_error():
     text = "B" * 1000  # Long enough to trigger LLM
     
     # Test with LLM timeout
-    with patch("requests.post", side_effect=Exception("Timeout")):
+    with patch("src.acmecli.http_client.post", side_effect=Exception("Timeout")):
         result = _parse_dependencies(text, "test-model")
         assert "datasets" in result
     
     # Test with LLM invalid response
-    with patch("requests.post") as mock_post:
+    with patch("src.acmecli.http_client.post") as mock_post:
         mock_response = MagicMock()
         mock_response.status_code = 500
         mock_post.return_value = mock_response
@@ -4279,7 +4533,7 @@ def test_parse_dependencies_llm_json_error():
     
     text = "C" * 1000
     
-    with patch("requests.post") as mock_post:
+    with patch("src.acmecli.http_client.post") as mock_post:
         mock_response = MagicMock()
         mock_response.status_code = 200
         mock_response.json.return_value = {
@@ -4439,7 +4693,7 @@ def test_get_artifact_size_mb_code_artifact():
             "url": "https://example.com/code.zip"
         }
         
-        with patch("requests.head") as mock_head:
+        with patch("src.acmecli.http_client.head") as mock_head:
             mock_response = MagicMock()
             mock_response.headers = {"Content-Length": "1048576"}  # 1 MB
             mock_head.return_value = mock_response
@@ -4463,7 +4717,7 @@ def test_get_artifact_size_mb_dataset_s3_metadata_fallback():
         }
         
         # URL HEAD request fails
-        with patch("requests.head", side_effect=Exception("Network error")):
+        with patch("src.acmecli.http_client.head", side_effect=Exception("Network error")):
             # Try S3 fallback
             with patch("src.index.s3") as mock_s3:
                 mock_s3.head_object.return_value = {"ContentLength": 2097152}  # 2 MB
@@ -4621,7 +4875,7 @@ def test_parse_dependencies_llm_markdown_code_block():
     text = "A" * 1000
 
     with patch.dict(os.environ, {"GEN_AI_STUDIO_API_KEY": "test-key"}):
-        with patch("requests.post") as mock_post:
+        with patch("src.acmecli.http_client.post") as mock_post:
             mock_response = MagicMock()
             mock_response.status_code = 200
             mock_response.json.return_value = {
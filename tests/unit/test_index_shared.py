@@ -100,7 +100,8 @@ def reset_rating_state():
         _rating_status,
         _rating_locks,
         _rating_results,
-        _rating_start_times
+        _rating_start_times,
+        _rating_snapshots,
     )
     
     # Store original state
@@ -108,12 +109,14 @@ def reset_rating_state():
     original_locks = _rating_locks.copy()
     original_results = _rating_results.copy()
     original_start_times = _rating_start_times.copy()
+    original_snapshots = _rating_snapshots.copy()
     
     # Clear state before test
     _rating_status.clear()
     _rating_locks.clear()
     _rating_results.clear()
     _rating_start_times.clear()
+    _rating_snapshots.clear()
     
     yield
     
@@ -126,4 +129,6 @@ def reset_rating_state():
     _rating_results.update(original_results)
     _rating_start_times.clear()
     _rating_start_times.update(original_start_times)
+    _rating_snapshots.clear()
+    _rating_snapshots.update(original_snapshots)
 
@@ -1,8 +1,10 @@
 """
 Unit tests for Lambda download handler
 """
+import io
 import json
 import base64
+import zipfile
 import os
 import importlib.util
 from pathlib import Path
@@ -18,6 +20,42 @@ spec.loader.exec_module(download_handler_module)
 lambda_handler = download_handler_module.lambda_handler
 
 
+def _s3_object(content, content_type="application/zip"):
+    """Build a get_object response for ``content``"""
+    return {
+        "Body": io.BytesIO(content),
+        "ContentLength": len(content),
+        "ContentType": content_type,
+        "Metadata": {},
+    }
+
+
+def _model_zip():
+    """Small model archive with one weights file and one config file"""
+    output = io.BytesIO()
+    with zipfile.ZipFile(output, "w") as zip_file:
+        zip_file.writestr("model.safetensors", b"\x00" * 1000)
+        zip_file.writestr("config.json", b'{"model_type": "test"}', zipfile.ZIP_DEFLATED)
+    return output.getvalue()
+
+
+def _ranged_get(objects, content_types=None):
+    """get_object side effect serving ``objects`` with Range support"""
+    content_types = content_types or {}
+
+    def get_object(Bucket, Key, Range=None):
+        if Key not in objects:
+            raise ClientError({"Error": {"Code": "NoSuchKey"}}, "GetObject")
+        content = objects[Key]
+        if Range:
+            start, end = Range[len("bytes="):].split("-")
+            content = content[int(start):int(end) + 1]
+            return _s3_object(content)
+        return _s3_object(content, content_types.get(Key, "application/zip"))
+
+    return get_object
+
+
 class TestLambdaDownloadHandler:
     """Test lambda_handler function"""
 
@@ -29,11 +67,7 @@ class TestLambdaDownloadHandler:
         mock_sts.get_caller_identity.return_value = {"Account": "123456789012"}
         
         # Mock S3 response
-        mock_response = MagicMock()
-        mock_response.__getitem__.return_value = MagicMock()
-        mock_response["Body"].read.return_value = b"test file content"
-        
-        mock_s3.get_object.return_value = mock_response
+        mock_s3.get_object.return_value = _s3_object(b"test file content")
         
         event = {
             "pathParameters": {
@@ -208,10 +242,7 @@ class TestLambdaDownloadHandler:
         """Test handler with default version"""
         mock_sts.get_caller_identity.return_value = {"Account": "123456789012"}
         
-        mock_response = MagicMock()
-        mock_response.__getitem__.return_value = MagicMock()
-        mock_response["Body"].read.return_value = b"test content"
-        mock_s3.get_object.return_value = mock_response
+        mock_s3.get_object.return_value = _s3_object(b"test content")
         
         event = {
             "pathParameters": {
@@ -234,10 +265,8 @@ class TestLambdaDownloadHandler:
         """Test handler with custom component parameter"""
         mock_sts.get_caller_identity.return_value = {"Account": "123456789012"}
         
-        mock_response = MagicMock()
-        mock_response.__getitem__.return_value = MagicMock()
-        mock_response["Body"].read.return_value = b"test content"
-        mock_s3.get_object.return_value = mock_response
+        objects = {"performance/test_model/v1.0/model.zip": _model_zip()}
+        mock_s3.get_object.side_effect = _ranged_get(objects)
         
         event = {
             "pathParameters": {
@@ -254,6 +283,8 @@ class TestLambdaDownloadHandler:
         
         assert result["statusCode"] == 200
         assert "weights" in result["headers"]["Content-Disposition"]
+        with zipfile.ZipFile(io.BytesIO(base64.b64decode(result["body"]))) as zip_file:
+            assert zip_file.namelist() == ["model.safetensors"]
 
     @patch.object(download_handler_module, "s3")
     @patch.object(download_handler_module, "sts")
@@ -261,10 +292,7 @@ class TestLambdaDownloadHandler:
         """Test handler with custom path_prefix"""
         mock_sts.get_caller_identity.return_value = {"Account": "123456789012"}
         
-        mock_response = MagicMock()
-        mock_response.__getitem__.return_value = MagicMock()
-        mock_response["Body"].read.return_value = b"test content"
-        mock_s3.get_object.return_value = mock_response
+        mock_s3.get_object.return_value = _s3_object(b"test content")
         
         event = {
             "pathParameters": {
@@ -314,10 +342,7 @@ class TestLambdaDownloadHandler:
         mock_sts.get_caller_identity.return_value = {"Account": "123456789012"}
         
         file_content = b"binary file content \x00\x01\x02"
-        mock_response = MagicMock()
-        mock_response.__getitem__.return_value = MagicMock()
-        mock_response["Body"].read.return_value = file_content
-        mock_s3.get_object.return_value = mock_response
+        mock_s3.get_object.return_value = _s3_object(file_content)
         
         event = {
             "pathParameters": {
@@ -342,10 +367,7 @@ class TestLambdaDownloadHandler:
         mock_sts.get_caller_identity.return_value = {"Account": "123456789012"}
         
         file_content = b"test content"
-        mock_response = MagicMock()
-        mock_response.__getitem__.return_value = MagicMock()
-        mock_response["Body"].read.return_value = file_content
-        mock_s3.get_object.return_value = mock_response
+        mock_s3.get_object.return_value = _s3_object(file_content)
         
         event = {
             "pathParameters": {
@@ -361,3 +383,83 @@ class TestLambdaDownloadHandler:
         assert result["statusCode"] == 200
         assert result["headers"]["Content-Length"] == str(len(file_content))
 
+
+
+class TestLambdaDownloadHandlerLargeObjects:
+    """Presigned redirects, pointer records and component persistence"""
+
+    @patch.object(download_handler_module, "DOWNLOAD_INLINE_MAX_BYTES", 10)
+    @patch.object(download_handler_module, "s3")
+    @patch.object(download_handler_module, "ap_arn", "arn:aws:s3:us-east-1:1:accesspoint/ap")
+    def test_large_object_redirects_to_presigned_url(self, mock_s3):
+        mock_s3.get_object.side_effect = _ranged_get(
+            {"performance/test_model/main/model.zip": b"x" * 100}
+        )
+        mock_s3.generate_presigned_url.return_value = "https://signed.example/model.zip"
+
+        event = {"pathParameters": {"model_id": "test_model"}, "queryStringParameters": {}}
+        result = lambda_handler(event, MagicMock())
+
+        assert result["statusCode"] == 302
+        assert result["headers"]["Location"] == "https://signed.example/model.zip"
+        params = mock_s3.generate_presigned_url.call_args.kwargs["Params"]
+        assert params["Key"] == "performance/test_model/main/model.zip"
+
+    @patch.object(download_handler_module, "s3")
+    @patch.object(download_handler_module, "ap_arn", "arn:aws:s3:us-east-1:1:accesspoint/ap")
+    def test_pointer_is_followed_to_blob(self, mock_s3):
+        pointer = json.dumps({"sha256": "ab" * 32, "blob_key": "blobs/sha256/ab/blob", "size": 4})
+        mock_s3.get_object.side_effect = _ranged_get(
+            {
+                "performance/test_model/main/model.zip": pointer.encode(),
+                "blobs/sha256/ab/blob": b"blob",
+            },
+            {"performance/test_model/main/model.zip": download_handler_module.POINTER_CONTENT_TYPE},
+        )
+
+        event = {"pathParameters": {"model_id": "test_model"}, "queryStringParameters": {}}
+        result = lambda_handler(event, MagicMock())
+
+        assert result["statusCode"] == 200
+        assert base64.b64decode(result["body"]) == b"blob"
+
+    @patch.object(download_handler_module, "s3")
+    @patch.object(download_handler_module, "ap_arn", "arn:aws:s3:us-east-1:1:accesspoint/ap")
+    def test_component_of_pointer_is_persisted(self, mock_s3):
+        digest = "cd" * 32
+        archive = _model_zip()
+        pointer = json.dumps({"sha256": digest, "blob_key": "blobs/sha256/cd/blob", "size": len(archive)})
+        mock_s3.get_object.side_effect = _ranged_get(
+            {
+                "performance/test_model/main/model.zip": pointer.encode(),
+                "blobs/sha256/cd/blob": archive,
+            },
+            {"performance/test_model/main/model.zip": download_handler_module.POINTER_CONTENT_TYPE},
+        )
+
+        event = {
+            "pathParameters": {"model_id": "test_model"},
+            "queryStringParameters": {"component": "datasets"},
+        }
+        result = lambda_handler(event, MagicMock())
+
+        assert result["statusCode"] == 200
+        args = mock_s3.upload_fileobj.call_args.args
+        assert args[2] == f"derived/sha256/{digest[:2]}/{digest}/datasets.zip"
+        with zipfile.ZipFile(io.BytesIO(base64.b64decode(result["body"]))) as zip_file:
+            assert zip_file.namelist() == ["config.json"]
+
+    @patch.object(download_handler_module, "s3")
+    @patch.object(download_handler_module, "sts")
+    @patch.object(download_handler_module, "ap_arn", None)
+    def test_account_taken_from_function_arn(self, mock_sts, mock_s3):
+        mock_s3.get_object.return_value = _s3_object(b"zip")
+        context = MagicMock()
+        context.invoked_function_arn = "arn:aws:lambda:us-east-1:123456789012:function:download"
+
+        event = {"pathParameters": {"model_id": "test_model"}, "queryStringParameters": {}}
+        result = lambda_handler(event, context)
+
+        assert result["statusCode"] == 200
+        mock_sts.get_caller_identity.assert_not_called()
+        assert "123456789012" in mock_s3.get_object.call_args.kwargs["Bucket"]
@@ -178,7 +178,7 @@ class TestLLMService:
         
         assert result is None
 
-    @patch('src.services.llm_service.requests.post')
+    @patch('src.services.llm_service.http_client.post')
     @patch('src.services.llm_service.PURDUE_GENAI_API_KEY', 'test-key')
     @patch('src.services.llm_service.time.time')
     @patch('src.services.llm_service.time.sleep')
@@ -198,7 +198,7 @@ class TestLLMService:
         mock_post.assert_called_once()
         assert "Authorization" in mock_post.call_args[1]["headers"]
 
-    @patch('src.services.llm_service.requests.post')
+    @patch('src.services.llm_service.http_client.post')
     @patch('src.services.llm_service.PURDUE_GENAI_API_KEY', None)
     def test_call_llm_api_no_key(self, mock_post):
         """Test LLM API call returns None when API key is not set."""
@@ -207,7 +207,7 @@ class TestLLMService:
         assert result is None
         mock_post.assert_not_called()
 
-    @patch('src.services.llm_service.requests.post')
+    @patch('src.services.llm_service.http_client.post')
     @patch('src.services.llm_service.PURDUE_GENAI_API_KEY', 'test-key')
     @patch('src.services.llm_service.time.time')
     @patch('src.services.llm_service.time.sleep')
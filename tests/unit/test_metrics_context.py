@@ -0,0 +1,85 @@
+"""
+Unit tests for MetricContext
+"""
+from unittest.mock import patch
+
+from src.acmecli.metrics import keywords
+from src.acmecli.metrics.context import MetricContext, normalize_path
+from src.acmecli.types import MetricValue
+
+
+class TestMetricContext:
+    def test_readme_is_lowercased_once(self):
+        ctx = MetricContext({"readme_text": "Install With PIP"})
+        assert ctx.readme == "install with pip"
+        assert ctx.readme is ctx.readme
+
+    def test_missing_readme(self):
+        assert MetricContext({"readme_text": None}).readme == ""
+        assert MetricContext({}).keywords == frozenset()
+
+    def test_urls(self):
+        ctx = MetricContext(
+            {"readme_text": "See [docs](https://example.com/docs). Also https://example.com/docs, ok"}
+        )
+        assert ctx.urls == ("https://example.com/docs",)
+        assert MetricContext({"readme_text": "An HTTP API"}).urls == ()
+
+    def test_files_are_normalized(self):
+        ctx = MetricContext({"repo_files": {"./Src\\Train.py", "README.md"}})
+        assert ctx.files == {"src/train.py", "readme.md"}
+
+    def test_has_file_ending_with(self):
+        files = {"src/train.py", "examples/run.py", "readme.md", "a.py"}
+        ctx = MetricContext({"repo_files": files})
+        for suffix in ("train.py", "src/train.py", "ain.py", "run.py", "examples/run.py",
+                       "a.py", "missing.py", "xsrc/train.py", "md", ""):
+            expected = any(f.endswith(suffix) for f in files)
+            assert ctx.has_file_ending_with(suffix) is expected, suffix
+        assert MetricContext({}).has_file_ending_with("train.py") is False
+
+    def test_config_parsing(self):
+        assert MetricContext({"config": {"a": 1}}).config == {"a": 1}
+        assert MetricContext({"config": '{"a": 1}'}).config == {"a": 1}
+        assert MetricContext({"config": "not json"}).config == {}
+        assert MetricContext({}).config == {}
+
+    def test_normalize_path(self):
+        assert normalize_path(".\\Examples\\Run.PY") == "examples/run.py"
+
+    def test_ensure_reuses_context(self):
+        ctx = MetricContext({})
+        assert MetricContext.ensure({}, ctx) is ctx
+        assert isinstance(MetricContext.ensure({}, None), MetricContext)
+
+
+class TestSharedContext:
+    def test_metrics_share_one_readme_pass(self):
+        from src.acmecli.metrics import (
+            CodeQualityMetric,
+            DatasetQualityMetric,
+            RampUpMetric,
+            ReproducibilityMetric,
+        )
+
+        meta = {"readme_text": "```python\nimport torch\n```\npytest, ImageNet", "repo_files": set()}
+        ctx = MetricContext(meta)
+        with patch("src.acmecli.metrics.context.match_keywords",
+                   wraps=keywords.match_keywords) as match:
+            for metric in (CodeQualityMetric(), DatasetQualityMetric(), RampUpMetric(),
+                           ReproducibilityMetric()):
+                assert isinstance(metric.score(meta, ctx), MetricValue)
+        assert match.call_count == 1
+
+    def test_run_acme_metrics_passes_context(self):
+        from src.services.rating import run_acme_metrics
+
+        seen = []
+
+        def metric(meta, ctx):
+            seen.append(ctx)
+            return MetricValue("license", 1.0, 0)
+
+        ctx = MetricContext({})
+        run_acme_metrics({}, {"license": metric, "bus_factor": metric}, ctx)
+        assert seen == [ctx, ctx]
@@ -0,0 +1,58 @@
+"""
+Unit tests for the shared README keyword matcher
+"""
+import pytest
+
+from src.acmecli.metrics import keywords
+from src.acmecli.metrics.keywords import KEYWORD_TABLES, keyword_table, match_keywords
+
+
+@pytest.fixture
+def isolated_tables():
+    saved = list(KEYWORD_TABLES)
+    KEYWORD_TABLES.clear()
+    keywords._compiled = None
+    match_keywords.cache_clear()
+    yield
+    KEYWORD_TABLES[:] = saved
+    keywords._compiled = None
+    match_keywords.cache_clear()
+
+
+class TestMatchKeywords:
+    def test_matches_like_substring_search(self, isolated_tables):
+        table = keyword_table("unit", "unit test", "test", "tests", "est", "pytest", "ci")
+        text = "run the unit tests with pytest; no circleci here"
+        assert match_keywords(text) == {k for k in table if k in text}
+
+    def test_overlapping_and_nested_keywords(self, isolated_tables):
+        keyword_table("abc", "bcd", "b", "abcd")
+        assert match_keywords("abcd") == {"abc", "bcd", "b", "abcd"}
+        assert match_keywords("xbx") == {"b"}
+
+    def test_special_characters_are_literal(self, isolated_tables):
+        keyword_table("```python", "c++", "code:", ".py")
+        assert match_keywords("```python\nimport x\n```") == {"```python"}
+        assert match_keywords("c++ code: main.py") == {"c++", "code:", ".py"}
+        assert match_keywords("cpp code copy") == frozenset()
+
+    def test_tables_registered_later_are_matched(self, isolated_tables):
+        first = keyword_table("alpha")
+        assert match_keywords("alpha beta") == first
+        second = keyword_table("beta")
+        assert match_keywords("alpha beta") & second == {"beta"}
+
+    def test_empty_text(self, isolated_tables):
+        keyword_table("alpha")
+        assert match_keywords("") == frozenset()
+
+    def test_registered_metric_tables_match_substring_search(self):
+        from src.acmecli import metrics  # noqa: F401 - registers every table
+
+        text = (
+            "## Installation\npip install transformers\n```python\nfrom transformers import "
+            "pipeline\n```\nEvaluated on GLUE and SQuAD 2.0 (accuracy 91.2%). Trained with "
+            "CUDA on ImageNet-21k; see the paper on arXiv. Unit tests run on GitHub Actions."
+        ).lower()
+        expected = {k for table in KEYWORD_TABLES for k in table if k in text}
+        assert match_keywords(text) == expected
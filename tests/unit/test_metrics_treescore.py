@@ -6,6 +6,15 @@ from unittest.mock import patch, MagicMock
 from src.acmecli.types import MetricValue
 
 
+@pytest.fixture(autouse=True)
+def _clear_parent_scores():
+    from src.acmecli.metrics.treescore_metric import clear_parent_scores
+
+    clear_parent_scores()
+    yield
+    clear_parent_scores()
+
+
 class TestTreescoreMetric:
     """Test treescore metric"""
 
@@ -102,18 +111,15 @@ class TestTreescoreMetric:
         
         metric = TreescoreMetric()
         
-        with patch('src.services.s3_service.list_models') as mock_list:
+        with patch('src.services.s3_service.resolve_model_key') as mock_resolve:
             with patch('src.services.rating.analyze_model_content') as mock_analyze:
-                # The code searches with underscores, so return model with underscores
-                mock_list.return_value = {
-                    "models": [{"name": "test_model", "version": "1.0.0"}]
-                }
+                mock_resolve.return_value = ("test_model", "1.0.0")
                 mock_analyze.return_value = {"net_score": 0.8}
                 
-                # Use underscore format to match the search pattern
                 result = metric._lookup_parent_score("test/model")
-                # The matching logic converts / to _ and checks if model_name ends with the last part
                 assert result == 0.8
+                mock_resolve.assert_called_once_with("test/model")
+                assert mock_analyze.call_args[0][0] == "test/model"
 
     def test_lookup_parent_score_github_url(self):
         """Test looking up parent score from GitHub URL"""
@@ -121,11 +127,9 @@ class TestTreescoreMetric:
         
         metric = TreescoreMetric()
         
-        with patch('src.services.s3_service.list_models') as mock_list:
+        with patch('src.services.s3_service.resolve_model_key') as mock_resolve:
             with patch('src.services.rating.analyze_model_content') as mock_analyze:
-                mock_list.return_value = {
-                    "models": [{"name": "owner_repo", "version": "1.0.0"}]
-                }
+                mock_resolve.return_value = ("owner_repo", "1.0.0")
                 mock_analyze.return_value = {"net_score": 0.7}
                 
                 result = metric._lookup_parent_score("https://github.com/owner/repo")
@@ -137,11 +141,11 @@ class TestTreescoreMetric:
         
         metric = TreescoreMetric()
         
-        with patch('src.services.s3_service.list_models') as mock_list:
-            mock_list.return_value = {"models": []}
-            
-            result = metric._lookup_parent_score("nonexistent-model")
-            assert result is None
+        with patch('src.services.s3_service.resolve_model_key', return_value=None):
+            with patch('src.services.rating.analyze_model_content') as mock_analyze:
+                result = metric._lookup_parent_score("nonexistent-model")
+                assert result is None
+                mock_analyze.assert_not_called()
 
     def test_extract_parents_from_config(self):
         """Test extracting parents from config fields"""
@@ -255,18 +259,14 @@ class TestTreescoreMetric:
         
         metric = TreescoreMetric()
         
-        with patch('src.services.s3_service.list_models') as mock_list:
+        with patch('src.services.s3_service.resolve_model_key') as mock_resolve:
             with patch('src.services.rating.analyze_model_content') as mock_analyze:
-                # First call returns empty, second call returns model
-                mock_list.side_effect = [
-                    {"models": []},
-                    {"models": [{"name": "test_model", "version": "1.0.0"}]}
-                ]
+                mock_resolve.return_value = ("test-model", "main")
                 mock_analyze.return_value = {"net_score": 0.75}
                 
-                result = metric._lookup_parent_score("test-model")
-                # May return None or score depending on matching logic
-                assert result is None or (isinstance(result, float) and 0.0 <= result <= 1.0)
+                result = metric._lookup_parent_score("https://huggingface.co/test-model")
+                assert result == 0.75
+                mock_resolve.assert_called_once_with("test-model")
 
     def test_lookup_parent_score_http_huggingface(self):
         """Test looking up parent score from HTTP HuggingFace URL"""
@@ -274,18 +274,15 @@ class TestTreescoreMetric:
         
         metric = TreescoreMetric()
         
-        with patch('src.services.s3_service.list_models') as mock_list:
+        with patch('src.services.s3_service.resolve_model_key') as mock_resolve:
             with patch('src.services.rating.analyze_model_content') as mock_analyze:
-                # First call returns empty, second call returns model
-                mock_list.side_effect = [
-                    {"models": []},
-                    {"models": [{"name": "test_model", "version": "1.0.0"}]}
-                ]
+                # Uploaded without its organisation prefix
+                mock_resolve.side_effect = [None, ("model", "1.0.0")]
                 mock_analyze.return_value = {"net_score": 0.8}
                 
                 result = metric._lookup_parent_score("http://huggingface.co/test/model")
-                # May return None or score depending on matching logic
-                assert result is None or (isinstance(result, float) and 0.0 <= result <= 1.0)
+                assert result == 0.8
+                assert [c[0][0] for c in mock_resolve.call_args_list] == ["test/model", "model"]
 
     def test_lookup_parent_score_invalid_github_url(self):
         """Test looking up parent score with invalid GitHub URL"""
@@ -302,14 +299,9 @@ class TestTreescoreMetric:
         
         metric = TreescoreMetric()
         
-        # Test with exception in list_models
-        try:
-            with patch('src.acmecli.metrics.treescore_metric.list_models', side_effect=Exception("Error")):
-                result = metric._lookup_parent_score("test-model")
-                assert result is None
-        except Exception:
-            # Exception may be caught internally
-            pass
+        with patch('src.services.s3_service.resolve_model_key', side_effect=Exception("Error")):
+            result = metric._lookup_parent_score("test-model")
+            assert result is None
 
     def test_score_with_mixed_parent_types(self):
         """Test scoring with mixed parent types (dict, string, numeric)"""
@@ -511,3 +503,125 @@ class TestTreescoreMetric:
         result = metric._has_lineage_indicators(meta)
         assert result is True
 
+
+
+class TestTreescoreLineage:
+    """Memoized, depth-bounded parent scoring across the lineage graph"""
+
+    def _rate(self, graph, scores, calls):
+        """Fake analyze_model_content: rates parents first via Treescore"""
+        from src.acmecli.metrics.treescore_metric import TreescoreMetric
+
+        def analyze(model_id, suppress_errors=False, lineage_path=()):
+            calls.append(model_id)
+            meta = {
+                "parents": graph.get(model_id, []),
+                "lineage_path": tuple(lineage_path) + (model_id,),
+            }
+            tree = TreescoreMetric().score(meta).value
+            return {"net_score": round((scores[model_id] + tree) / 2, 2)}
+
+        return analyze
+
+    def _patches(self, graph, scores, calls):
+        return (
+            patch('src.services.s3_service.resolve_model_key',
+                  side_effect=lambda name: (name, "1.0.0") if name in scores else None),
+            patch('src.services.rating.analyze_model_content',
+                  side_effect=self._rate(graph, scores, calls)),
+        )
+
+    def test_shared_ancestor_rated_once(self):
+        from src.acmecli.metrics.treescore_metric import TreescoreMetric
+
+        graph = {"child": ["left", "right"], "left": ["root"], "right": ["root"]}
+        scores = {"left": 0.6, "right": 0.8, "root": 1.0}
+        calls = []
+        resolve, analyze = self._patches(graph, scores, calls)
+        with resolve, analyze:
+            result = TreescoreMetric().score({"parents": graph["child"], "lineage_path": ("child",)})
+        assert calls.count("root") == 1
+        # root = (1.0 + 0.5) / 2; left = (0.6 + 0.75) / 2; right = (0.8 + 0.75) / 2
+        assert result.value == round((0.68 + 0.78) / 2, 2)
+
+    def test_cycle_is_cut(self):
+        from src.acmecli.metrics.treescore_metric import TreescoreMetric
+
+        graph = {"a": ["b"], "b": ["a"]}
+        scores = {"a": 0.4, "b": 0.8}
+        calls = []
+        resolve, analyze = self._patches(graph, scores, calls)
+        with resolve, analyze:
+            result = TreescoreMetric().score({"parents": ["b"], "lineage_path": ("a",)})
+        assert calls == ["b"]
+        assert result.value == round((0.8 + 0.5) / 2, 2)
+
+    def test_depth_is_bounded(self):
+        from src.acmecli.metrics import treescore_metric
+
+        chain = [f"m{i}" for i in range(6)]
+        graph = {chain[i]: [chain[i + 1]] for i in range(5)}
+        scores = {name: 1.0 for name in chain}
+        calls = []
+        resolve, analyze = self._patches(graph, scores, calls)
+        with resolve, analyze, patch.object(treescore_metric, "TREESCORE_MAX_DEPTH", 2):
+            treescore_metric.TreescoreMetric().score(
+                {"parents": ["m1"], "lineage_path": ("m0",)}
+            )
+        assert calls == ["m1", "m2"]
+
+    def test_depth_limited_score_is_not_reused_at_shallower_depth(self):
+        from src.acmecli.metrics import treescore_metric
+
+        chain = ["m0", "m1", "m2", "m3"]
+        graph = {chain[i]: [chain[i + 1]] for i in range(3)}
+        scores = {"m0": 1.0, "m1": 1.0, "m2": 0.2, "m3": 1.0}
+        calls = []
+        resolve, analyze = self._patches(graph, scores, calls)
+        with resolve, analyze, patch.object(treescore_metric, "TREESCORE_MAX_DEPTH", 2):
+            treescore_metric.TreescoreMetric().score({"parents": ["m1"], "lineage_path": ("m0",)})
+            # m3 was cut off below m2 above; from m1 the full lineage fits the limit
+            shallow = treescore_metric.TreescoreMetric().score(
+                {"parents": ["m2"], "lineage_path": ("m1",)}
+            )
+            treescore_metric.clear_parent_scores()
+            fresh = treescore_metric.TreescoreMetric().score(
+                {"parents": ["m2"], "lineage_path": ("m1",)}
+            )
+        assert calls.count("m2") == 3
+        # m3 = (1.0 + 0.5) / 2; m2 = (0.2 + 0.75) / 2, not the cut-off (0.2 + 0.5) / 2
+        assert shallow.value == fresh.value == round((0.2 + 0.75) / 2, 2)
+
+    def test_llm_prompt_uses_resolved_parents(self):
+        from src.acmecli.metrics.treescore_metric import TreescoreMetric
+
+        response = MagicMock(status_code=200)
+        response.json.return_value = {"treescore": 0.9}
+        with patch.dict('os.environ', {"PURDUE_LLM_GENAI_URL": "http://llm"}), \
+                patch('src.services.s3_service.list_models') as mock_list, \
+                patch('src.services.s3_service.resolve_model_key',
+                      side_effect=lambda name: ("org_base", "1.0.0") if name == "org/base" else None), \
+                patch('src.services.rating.analyze_model_content', return_value={"net_score": 0.7}), \
+                patch('src.acmecli.http_client.post', return_value=response) as mock_post:
+            result = TreescoreMetric().score({"parents": ["org/base", "not/uploaded"]})
+        assert result.value == 0.9
+        mock_list.assert_not_called()
+        payload = mock_post.call_args.kwargs["json"]
+        assert payload["uploaded_models"] == ["org_base"]
+        assert payload["parent_scores_lookup"] == {"org/base": 0.7}
+
+    def test_llm_prompt_rates_limited_parents(self):
+        from src.acmecli.metrics import treescore_metric
+
+        response = MagicMock(status_code=200)
+        response.json.return_value = {"treescore": 0.9}
+        parents = [f"org/p{i}" for i in range(10)]
+        with patch.dict('os.environ', {"PURDUE_LLM_GENAI_URL": "http://llm"}), \
+                patch.object(treescore_metric, "TREESCORE_LLM_MAX_PARENTS", 3), \
+                patch('src.services.s3_service.resolve_model_key',
+                      side_effect=lambda name: (name, "1.0.0")), \
+                patch('src.services.rating.analyze_model_content',
+                      return_value={"net_score": 0.7}) as mock_analyze, \
+                patch('src.acmecli.http_client.post', return_value=response):
+            treescore_metric.TreescoreMetric().score({"parents": parents})
+        assert mock_analyze.call_count == 3
@@ -445,6 +445,40 @@ class TestLoadGeneratorClass:
         assert metric.status_code == 0
         assert metric.bytes_transferred == 0
 
+    @pytest.mark.asyncio
+    async def test_make_request_direct_rds_reads_through_rds_service(self):
+        """Test direct RDS downloads go through rds_service instead of the model_files column"""
+        generator = LoadGenerator(
+            run_id="test-run-1",
+            model_id="test/model",
+            use_performance_path=True,
+            rds_endpoint="rds.example.com",
+            storage_backend="rds",
+        )
+        
+        with patch(
+            "src.services.rds_service.download_model", return_value=b"blob content"
+        ) as mock_download:
+            metric = await generator._make_request(1)
+        
+        mock_download.assert_called_once_with(
+            model_id="test_model", version="main", component="full", use_performance_path=True
+        )
+        assert metric.status_code == 200
+        assert metric.bytes_transferred == len(b"blob content")
+
+    def test_download_from_rds_direct_not_found(self):
+        """Test a missing model surfaces as a not-found error"""
+        from fastapi import HTTPException
+        
+        generator = LoadGenerator(run_id="test-run-1", rds_endpoint="rds.example.com")
+        with patch(
+            "src.services.rds_service.download_model",
+            side_effect=HTTPException(status_code=404, detail="Model not found"),
+        ):
+            with pytest.raises(Exception, match="not found in RDS"):
+                generator._download_from_rds_direct("test_model", "main")
+
     @pytest.mark.asyncio
     async def test_run_client_single_request(self):
         """Test _run_client without duration (single request)"""
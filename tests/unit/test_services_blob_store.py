@@ -0,0 +1,273 @@
+"""
+Unit tests for src/services/blob_store.py
+"""
+import hashlib
+import io
+import json
+from unittest.mock import MagicMock
+
+from botocore.exceptions import ClientError
+
+from src.services.blob_store import (
+    POINTER_CONTENT_TYPE,
+    blob_key,
+    collect_garbage,
+    content_hash,
+    content_identity,
+    derived_key,
+    pointer_digest,
+    put_blob,
+    read_derived,
+    read_object,
+    resolve_object_key,
+    store_content_addressed,
+)
+
+
+class FakeS3:
+    """Minimal in-memory S3 supporting the calls blob_store makes"""
+
+    def __init__(self):
+        self.objects = {}
+        self.put_calls = []
+
+    def head_object(self, Bucket, Key):
+        if Key not in self.objects:
+            raise ClientError({"Error": {"Code": "404"}}, "HeadObject")
+        obj = self.objects[Key]
+        return {
+            "ContentLength": len(obj["Body"]),
+            "ContentType": obj.get("ContentType"),
+            "Metadata": obj.get("Metadata", {}),
+            "ETag": '"%s"' % hashlib.md5(obj["Body"]).hexdigest(),
+        }
+
+    def get_object(self, Bucket, Key, **kwargs):
+        if Key not in self.objects:
+            raise ClientError({"Error": {"Code": "NoSuchKey"}}, "GetObject")
+        obj = self.objects[Key]
+        return {
+            "Body": io.BytesIO(obj["Body"]),
+            "ContentType": obj.get("ContentType"),
+            "Metadata": obj.get("Metadata", {}),
+        }
+
+    def put_object(self, Bucket, Key, Body, **kwargs):
+        self.put_calls.append(Key)
+        self.objects[Key] = {"Body": Body, **kwargs}
+
+    def delete_object(self, Bucket, Key):
+        self.objects.pop(Key, None)
+
+    def get_paginator(self, operation):
+        paginator = MagicMock()
+        paginator.paginate.side_effect = lambda Bucket, Prefix: [
+            {
+                "Contents": [
+                    {"Key": key, "Size": len(obj["Body"])}
+                    for key, obj in sorted(self.objects.items())
+                    if key.startswith(Prefix)
+                ]
+            }
+        ]
+        return paginator
+
+
+class TestBlobKeys:
+    def test_blob_key_fans_out_by_prefix(self):
+        digest = content_hash(b"hello")
+        assert blob_key(digest) == f"blobs/sha256/{digest[:2]}/{digest}"
+
+
+class TestPutBlob:
+    def test_new_blob_is_written(self):
+        s3 = FakeS3()
+        info = put_blob(s3, "bucket", b"zip bytes")
+        assert info["deduplicated"] is False
+        assert s3.put_calls == [info["blob_key"]]
+
+    def test_existing_blob_is_skipped(self):
+        s3 = FakeS3()
+        put_blob(s3, "bucket", b"zip bytes")
+        info = put_blob(s3, "bucket", b"zip bytes")
+        assert info["deduplicated"] is True
+        assert len(s3.put_calls) == 1
+
+    def test_extra_params_applied(self):
+        s3 = FakeS3()
+        info = put_blob(s3, "bucket", b"zip", {"ServerSideEncryption": "aws:kms"})
+        assert s3.objects[info["blob_key"]]["ServerSideEncryption"] == "aws:kms"
+
+
+class TestStoreContentAddressed:
+    def test_identical_content_shares_one_blob(self):
+        s3 = FakeS3()
+        store_content_addressed(s3, "bucket", "models/a/1.0.0/model.zip", b"same")
+        info = store_content_addressed(s3, "bucket", "performance/a/main/model.zip", b"same")
+        assert info["deduplicated"] is True
+        blob_keys = [k for k in s3.objects if k.startswith("blobs/")]
+        assert blob_keys == [info["blob_key"]]
+
+    def test_pointer_record_contents(self):
+        s3 = FakeS3()
+        info = store_content_addressed(s3, "bucket", "models/a/1.0.0/model.zip", b"data")
+        pointer = s3.objects["models/a/1.0.0/model.zip"]
+        assert pointer["ContentType"] == POINTER_CONTENT_TYPE
+        assert json.loads(pointer["Body"])["blob_key"] == info["blob_key"]
+        assert pointer["Metadata"]["blob-sha256"] == info["sha256"]
+
+
+class TestReadObject:
+    def test_read_follows_pointer(self):
+        s3 = FakeS3()
+        store_content_addressed(s3, "bucket", "models/a/1.0.0/model.zip", b"payload")
+        assert read_object(s3, "bucket", "models/a/1.0.0/model.zip") == b"payload"
+
+    def test_read_legacy_object(self):
+        s3 = FakeS3()
+        s3.put_object(Bucket="bucket", Key="models/a/1.0.0/model.zip", Body=b"raw zip")
+        assert read_object(s3, "bucket", "models/a/1.0.0/model.zip") == b"raw zip"
+
+
+class TestResolveObjectKey:
+    def test_resolve_pointer_uses_metadata(self):
+        s3 = FakeS3()
+        info = store_content_addressed(s3, "bucket", "models/a/1.0.0/model.zip", b"12345")
+        key, size = resolve_object_key(s3, "bucket", "models/a/1.0.0/model.zip")
+        assert key == info["blob_key"]
+        assert size == 5
+
+    def test_resolve_pointer_without_metadata(self):
+        s3 = FakeS3()
+        info = store_content_addressed(s3, "bucket", "models/a/1.0.0/model.zip", b"12345")
+        s3.objects["models/a/1.0.0/model.zip"]["Metadata"] = {}
+        key, size = resolve_object_key(s3, "bucket", "models/a/1.0.0/model.zip")
+        assert key == info["blob_key"]
+        assert size == 5
+
+    def test_resolve_legacy_object(self):
+        s3 = MagicMock()
+        s3.head_object.return_value = {"ContentLength": 42}
+        assert resolve_object_key(s3, "bucket", "models/a/1.0.0/model.zip") == (
+            "models/a/1.0.0/model.zip",
+            42,
+        )
+
+
+class TestContentIdentity:
+    def test_pointer_identity_is_blob_digest(self):
+        s3 = FakeS3()
+        store_content_addressed(s3, "bucket", "models/a/1.0.0/model.zip", b"zip")
+        assert content_identity(s3, "bucket", "models/a/1.0.0/model.zip") == content_hash(b"zip")
+
+    def test_legacy_identity_changes_with_content(self):
+        s3 = FakeS3()
+        s3.put_object(Bucket="bucket", Key="k", Body=b"one")
+        first = content_identity(s3, "bucket", "k")
+        s3.put_object(Bucket="bucket", Key="k", Body=b"two")
+        assert first.startswith("etag-")
+        assert content_identity(s3, "bucket", "k") != first
+
+
+class TestReadDerived:
+    def test_derived_object_built_once_and_persisted(self):
+        s3 = FakeS3()
+        info = store_content_addressed(s3, "bucket", "models/a/1.0.0/model.zip", b"full")
+        build = MagicMock(side_effect=lambda data: data + b"-weights")
+
+        first = read_derived(s3, "bucket", "models/a/1.0.0/model.zip", "weights.zip", build)
+        second = read_derived(s3, "bucket", "models/a/1.0.0/model.zip", "weights.zip", build)
+
+        assert first == second == b"full-weights"
+        assert build.call_count == 1
+        assert derived_key(info["sha256"], "weights.zip") in s3.objects
+
+    def test_derived_object_shared_across_keys(self):
+        s3 = FakeS3()
+        store_content_addressed(s3, "bucket", "models/a/1.0.0/model.zip", b"full")
+        store_content_addressed(s3, "bucket", "performance/a/main/model.zip", b"full")
+        build = MagicMock(return_value=b"part")
+
+        read_derived(s3, "bucket", "models/a/1.0.0/model.zip", "weights.zip", build)
+        read_derived(s3, "bucket", "performance/a/main/model.zip", "weights.zip", build)
+
+        assert build.call_count == 1
+
+    def test_legacy_object_built_every_time(self):
+        s3 = FakeS3()
+        s3.put_object(Bucket="bucket", Key="models/a/1.0.0/model.zip", Body=b"raw")
+        build = MagicMock(return_value=b"part")
+
+        read_derived(s3, "bucket", "models/a/1.0.0/model.zip", "weights.zip", build)
+        read_derived(s3, "bucket", "models/a/1.0.0/model.zip", "weights.zip", build)
+
+        assert build.call_count == 2
+        assert not any(k.startswith("derived/") for k in s3.objects)
+
+    def test_persist_failure_still_returns_result(self):
+        s3 = FakeS3()
+        store_content_addressed(s3, "bucket", "models/a/1.0.0/model.zip", b"full")
+        original_put = s3.put_object
+
+        def failing_put(Bucket, Key, Body, **kwargs):
+            if Key.startswith("derived/"):
+                raise ClientError({"Error": {"Code": "AccessDenied"}}, "PutObject")
+            original_put(Bucket=Bucket, Key=Key, Body=Body, **kwargs)
+
+        s3.put_object = failing_put
+        result = read_derived(
+            s3, "bucket", "models/a/1.0.0/model.zip", "weights.zip", lambda data: b"part"
+        )
+        assert result == b"part"
+
+
+class TestPointerDigest:
+    def test_pointer_digest(self):
+        s3 = FakeS3()
+        info = store_content_addressed(s3, "bucket", "models/a/1.0.0/model.zip", b"full")
+        assert pointer_digest(s3, "bucket", "models/a/1.0.0/model.zip") == info["sha256"]
+
+    def test_legacy_and_missing_objects_have_no_digest(self):
+        s3 = FakeS3()
+        s3.put_object(Bucket="bucket", Key="models/a/1.0.0/model.zip", Body=b"raw")
+        assert pointer_digest(s3, "bucket", "models/a/1.0.0/model.zip") is None
+        assert pointer_digest(s3, "bucket", "models/b/1.0.0/model.zip") is None
+
+
+class TestCollectGarbage:
+    def _store_with_derived(self, s3, key, content):
+        info = store_content_addressed(s3, "bucket", key, content)
+        read_derived(s3, "bucket", key, "weights.zip", lambda data: data + b"-weights")
+        return info["sha256"]
+
+    def test_unreferenced_blob_and_derived_objects_are_deleted(self):
+        s3 = FakeS3()
+        kept = self._store_with_derived(s3, "models/a/1.0.0/model.zip", b"a")
+        dropped = self._store_with_derived(s3, "models/b/1.0.0/model.zip", b"b")
+        s3.delete_object(Bucket="bucket", Key="models/b/1.0.0/model.zip")
+
+        assert collect_garbage(s3, "bucket") == 2
+        assert blob_key(dropped) not in s3.objects
+        assert derived_key(dropped, "weights.zip") not in s3.objects
+        assert blob_key(kept) in s3.objects
+        assert derived_key(kept, "weights.zip") in s3.objects
+
+    def test_blob_shared_with_another_pointer_is_kept(self):
+        s3 = FakeS3()
+        digest = self._store_with_derived(s3, "models/a/1.0.0/model.zip", b"same")
+        store_content_addressed(s3, "bucket", "performance/a/main/model.zip", b"same")
+        s3.delete_object(Bucket="bucket", Key="models/a/1.0.0/model.zip")
+
+        assert collect_garbage(s3, "bucket", [digest]) == 0
+        assert blob_key(digest) in s3.objects
+
+    def test_candidates_limit_the_sweep(self):
+        s3 = FakeS3()
+        first = self._store_with_derived(s3, "models/a/1.0.0/model.zip", b"a")
+        second = self._store_with_derived(s3, "models/b/1.0.0/model.zip", b"b")
+        s3.delete_object(Bucket="bucket", Key="models/a/1.0.0/model.zip")
+        s3.delete_object(Bucket="bucket", Key="models/b/1.0.0/model.zip")
+
+        collect_garbage(s3, "bucket", [first, None])
+        assert blob_key(first) not in s3.objects
+        assert blob_key(second) in s3.objects
@@ -0,0 +1,56 @@
+"""
+Unit tests for src/services/compression_policy.py
+"""
+import io
+import zipfile
+
+import pytest
+
+from src.services.compression_policy import (
+    LARGE_MEMBER_BYTES,
+    SMALL_MEMBER_BYTES,
+    AdaptivePolicy,
+    DeflateAllPolicy,
+    get_compression_policy,
+    write_member,
+)
+
+
+class TestAdaptivePolicy:
+    def test_weights_are_stored(self):
+        policy = AdaptivePolicy()
+        assert policy.choose("model.safetensors", 10)[0] == zipfile.ZIP_STORED
+        assert policy.choose("pytorch_model.BIN", 10)[0] == zipfile.ZIP_STORED
+
+    def test_text_level_scales_with_size(self):
+        policy = AdaptivePolicy()
+        assert policy.choose("config.json", 100) == (zipfile.ZIP_DEFLATED, 9)
+        assert policy.choose("tokenizer.json", SMALL_MEMBER_BYTES) == (zipfile.ZIP_DEFLATED, 6)
+        assert policy.choose("vocab.txt", LARGE_MEMBER_BYTES) == (zipfile.ZIP_DEFLATED, 1)
+
+
+class TestGetCompressionPolicy:
+    def test_default_is_adaptive(self, monkeypatch):
+        monkeypatch.delenv("ZIP_COMPRESSION_POLICY", raising=False)
+        assert isinstance(get_compression_policy(), AdaptivePolicy)
+
+    def test_env_selects_policy(self, monkeypatch):
+        monkeypatch.setenv("ZIP_COMPRESSION_POLICY", "deflate")
+        assert isinstance(get_compression_policy(), DeflateAllPolicy)
+
+    def test_unknown_policy_raises(self):
+        with pytest.raises(ValueError):
+            get_compression_policy("brotli")
+
+
+class TestWriteMember:
+    def test_members_round_trip_with_chosen_method(self):
+        output = io.BytesIO()
+        with zipfile.ZipFile(output, "w", zipfile.ZIP_DEFLATED) as zip_file:
+            write_member(zip_file, "model.safetensors", b"\x00" * 1000, AdaptivePolicy())
+            write_member(zip_file, "README.md", b"# Model\n" * 100, AdaptivePolicy())
+
+        with zipfile.ZipFile(io.BytesIO(output.getvalue()), "r") as zip_file:
+            assert zip_file.getinfo("model.safetensors").compress_type == zipfile.ZIP_STORED
+            assert zip_file.getinfo("README.md").compress_type == zipfile.ZIP_DEFLATED
+            assert zip_file.read("README.md") == b"# Model\n" * 100
@@ -193,17 +193,17 @@ class TestLicenseCompatibility:
         assert len(result) <= 20
         assert "-" in result or result == "custom-license-v1.0"
 
-    @patch('src.services.s3_service.list_models')
+    @patch('src.services.s3_service.resolve_model_key')
     @patch('src.services.s3_service.download_model')
     @patch('src.services.s3_service.extract_config_from_model')
-    def test_extract_model_license_from_s3(self, mock_extract, mock_download, mock_list):
+    def test_extract_model_license_from_s3(self, mock_extract, mock_download, mock_resolve):
         """Test extracting license from S3 model"""
         from src.services.license_compatibility import extract_model_license
         import json
         import zipfile
         import io
         
-        mock_list.return_value = {"models": [{"name": "test-model", "version": "1.0.0"}]}
+        mock_resolve.return_value = ("test-model", "1.0.0")
         # Create a valid zip file with config.json
         zip_buffer = io.BytesIO()
         with zipfile.ZipFile(zip_buffer, 'w') as zip_file:
@@ -213,17 +213,18 @@ class TestLicenseCompatibility:
         
         result = extract_model_license("test-model", "1.0.0")
         assert result == "mit"
+        mock_download.assert_called_once_with("test-model", "1.0.0", "full")
 
-    @patch('src.services.s3_service.list_models')
+    @patch('src.services.s3_service.resolve_model_key')
     @patch('src.services.s3_service.download_model')
     @patch('src.services.s3_service.extract_config_from_model')
-    def test_extract_model_license_from_readme(self, mock_extract, mock_download, mock_list):
+    def test_extract_model_license_from_readme(self, mock_extract, mock_download, mock_resolve):
         """Test extracting license from README in zip"""
         from src.services.license_compatibility import extract_model_license
         import zipfile
         import io
         
-        mock_list.return_value = {"models": [{"name": "test-model", "version": "1.0.0"}]}
+        mock_resolve.return_value = ("test-model", "1.0.0")
         mock_extract.return_value = None
         
         # Create a minimal zip with README
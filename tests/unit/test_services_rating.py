@@ -4,11 +4,12 @@ Focusing on core functions to improve coverage from 43% to 70%+
 """
 import pytest
 import os
+import time
 import tempfile
 import zipfile
 import io
 import json
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch
 from fastapi import HTTPException
 from botocore.exceptions import ClientError
 
@@ -17,10 +18,12 @@ from src.services.rating import (
     alias,
     analyze_model_content,
     create_metadata_from_files,
+    create_metadata_from_zip,
     run_acme_metrics,
     run_scorer,
     rate_model,
     RateRequest,
+    ZipRepoView,
 )
 from src.acmecli.types import MetricValue
 
@@ -135,6 +138,69 @@ class TestCreateMetadataFromFiles:
             assert "src/utils.py" in result["repo_files"]
 
 
+def _zip_bytes(files):
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as zip_file:
+        for name, content in files.items():
+            zip_file.writestr(name, content)
+    return buffer.getvalue()
+
+
+class TestCreateMetadataFromZip:
+    """Test create_metadata_from_zip and ZipRepoView"""
+
+    FILES = {
+        "README.md": "# Test Model\r\nThis is a test model.",
+        "license.txt": "MIT License",
+        "LICENSE": "Apache",
+        "src/utils.py": "def util(): pass",
+        ".github/readme.md": "hidden",
+        "config.json": json.dumps({"model_type": "bert"}),
+        "requirements.txt": "torch\n# comment\nnumpy\n",
+    }
+
+    def test_matches_extracted_metadata(self):
+        """Same metadata as extracting the zip and calling create_metadata_from_files"""
+        content = _zip_bytes(self.FILES)
+        with tempfile.TemporaryDirectory() as temp_dir:
+            with zipfile.ZipFile(io.BytesIO(content)) as zip_file:
+                zip_file.extractall(temp_dir)
+            expected = create_metadata_from_files(temp_dir, "test-model")
+        with ZipRepoView(content) as repo:
+            result = create_metadata_from_zip(repo, "test-model")
+            assert result["repo_path"] is repo
+        for key in ("repo_files", "readme_text", "license_text", "repo_name", "url"):
+            assert result[key] == expected[key]
+        assert result["readme_text"].startswith("# Test Model\nThis is a test model.\n")
+        assert result["config"] == {"model_type": "bert"}
+
+    def test_fallback_readme_and_bad_config(self):
+        """Uppercase READMEs are found by the fallback globs; bad config.json is skipped"""
+        content = _zip_bytes({"docs/README.rst": "Docs", "config.json": "{bad"})
+        with ZipRepoView(content) as repo:
+            result = create_metadata_from_zip(repo, "test-model")
+        assert result["readme_text"] == "Docs\n"
+        assert "config" not in result
+
+    def test_nothing_written_until_used_as_path(self):
+        """The view is only extracted when code needs a real directory"""
+        from src.acmecli.metrics.score_dependencies import score_dependencies
+
+        content = _zip_bytes(self.FILES)
+        with patch.object(zipfile.ZipFile, "extractall") as mock_extract:
+            with ZipRepoView(content) as repo:
+                meta = create_metadata_from_zip(repo, "test-model")
+                assert score_dependencies(meta) == 0.9
+            mock_extract.assert_not_called()
+
+        with ZipRepoView(content) as repo:
+            path = os.fspath(repo)
+            assert os.fspath(repo) == path
+            with open(os.path.join(repo, "src", "utils.py")) as f:
+                assert f.read() == "def util(): pass"
+        assert not os.path.exists(path)
+
+
 class TestRunAcmeMetrics:
     """Test run_acme_metrics function"""
 
@@ -192,6 +258,82 @@ class TestRunAcmeMetrics:
         result = run_acme_metrics(meta, metric_functions)
         assert "net_score" in result
 
+    def test_run_acme_metrics_runs_concurrently(self):
+        """Test that metrics run at the same time"""
+        intervals = {}
+
+        def slow_metric(name):
+            def score(meta):
+                start = time.monotonic()
+                time.sleep(0.2)
+                intervals[name] = (start, time.monotonic())
+                return MetricValue(name, 0.5, 200)
+            return score
+
+        metric_functions = {
+            "license": slow_metric("license"),
+            "bus_factor": slow_metric("bus_factor"),
+            "ramp_up_time": slow_metric("ramp_up_time"),
+        }
+
+        result = run_acme_metrics({}, metric_functions)
+        # Every metric started before any of them finished
+        assert max(start for start, _ in intervals.values()) < min(
+            end for _, end in intervals.values()
+        )
+        assert set(result["metric_wall_ms"]) == set(metric_functions)
+        assert result["metric_wall_ms"]["license"] >= 200
+
+    def test_run_acme_metrics_timeout_uses_fallback(self):
+        """Test that a metric missing its deadline gets the fallback score"""
+        metric_functions = {
+            "license": lambda m: MetricValue("license", 0.9, 1),
+            "Reviewedness": lambda m: time.sleep(1) or MetricValue("Reviewedness", 1.0, 1000),
+        }
+
+        with patch("src.services.rating.METRIC_TIMEOUTS", {"Reviewedness": 0.05}):
+            result = run_acme_metrics({}, metric_functions)
+
+        assert result["license"] == 0.9
+        assert result["reviewedness"] == 0.0
+        assert result["reviewedness_latency"] == 50
+
+    def test_run_acme_metrics_treescore_timeout_uses_spec_default(self):
+        """Test that Treescore falls back to 0.5 if it runs with a deadline"""
+        metric_functions = {
+            "Treescore": lambda m: time.sleep(1) or MetricValue("Treescore", 1.0, 1000),
+        }
+
+        with patch("src.services.rating.INLINE_METRICS", frozenset()), \
+                patch("src.services.rating.METRIC_TIMEOUTS", {"Treescore": 0.05}):
+            result = run_acme_metrics({}, metric_functions)
+
+        assert result["treescore"] == 0.5
+
+    def test_run_acme_metrics_treescore_runs_inline_without_deadline(self):
+        """Test that Treescore's nested ratings do not occupy metric workers"""
+        import threading
+
+        caller = threading.current_thread()
+        threads = {}
+
+        def treescore(meta):
+            threads["Treescore"] = threading.current_thread()
+            time.sleep(0.2)
+            return MetricValue("Treescore", 0.8, 200)
+
+        def license_metric(meta):
+            threads["license"] = threading.current_thread()
+            return MetricValue("license", 0.9, 1)
+
+        with patch("src.services.rating.METRIC_TIMEOUT_SECONDS", 0.05):
+            result = run_acme_metrics({}, {"Treescore": treescore, "license": license_metric})
+
+        assert threads["Treescore"] is caller
+        assert threads["license"] is not caller
+        assert result["treescore"] == 0.8
+        assert result["metric_timeouts"] == []
+
 
 class TestRunScorer:
     """Test run_scorer function"""
@@ -215,57 +357,46 @@ class TestRunScorer:
         mock_analyze.assert_called_once_with("test-model")
 
     @patch.dict(os.environ, {"GITHUB_TOKEN": "real_token"})
-    @patch("src.services.rating.subprocess.run")
-    @patch("src.services.rating.Path")
-    def test_run_scorer_with_subprocess_success(self, mock_path_class, mock_subprocess):
-        """Test run_scorer with successful subprocess"""
-        mock_urls_file = MagicMock()
-        mock_path_class.return_value = mock_urls_file
-        mock_urls_file.__truediv__ = lambda self, other: self
-        mock_urls_file.write_text = MagicMock()
-
-        mock_proc = MagicMock()
-        mock_proc.returncode = 0
-        mock_proc.stdout = '{"net_score": 0.8, "license": 0.9}\n'
-        mock_proc.stderr = ""
-        mock_subprocess.return_value = mock_proc
-
-        result = run_scorer("test-model")
+    @patch("src.services.scorer_pool.get_scorer_pool")
+    def test_run_scorer_with_pool_success(self, mock_get_pool):
+        """Test run_scorer returns the scorer's report row as a dict"""
+        from src.acmecli.types import ReportRow
+
+        row = ReportRow(
+            name="bert", category="MODEL", net_score=0.8, net_score_latency=5,
+            ramp_up_time=0.5, ramp_up_time_latency=1, bus_factor=0.5, bus_factor_latency=1,
+            performance_claims=0.5, performance_claims_latency=1, license=0.9, license_latency=1,
+            size_score={"aws_server": 1.0}, size_score_latency=1,
+            dataset_and_code_score=0.5, dataset_and_code_score_latency=1,
+            dataset_quality=0.5, dataset_quality_latency=1, code_quality=0.5, code_quality_latency=1,
+            reproducibility=0.5, reproducibility_latency=1, reviewedness=0.5, reviewedness_latency=1,
+            treescore=0.5, treescore_latency=1,
+        )
+        mock_get_pool.return_value.score.return_value = row
+
+        result = run_scorer("https://huggingface.co/bert")
         assert result["net_score"] == 0.8
         assert result["license"] == 0.9
+        mock_get_pool.return_value.score.assert_called_once_with("https://huggingface.co/bert")
 
     @patch.dict(os.environ, {"GITHUB_TOKEN": "real_token"})
-    @patch("src.services.rating.subprocess.run")
-    @patch("src.services.rating.Path")
-    def test_run_scorer_subprocess_failure(self, mock_path_class, mock_subprocess):
-        """Test run_scorer with subprocess failure"""
-        mock_urls_file = MagicMock()
-        mock_path_class.return_value = mock_urls_file
-        mock_urls_file.__truediv__ = lambda self, other: self
-        mock_urls_file.write_text = MagicMock()
-
-        mock_proc = MagicMock()
-        mock_proc.returncode = 1
-        mock_proc.stdout = ""
-        mock_proc.stderr = "Error occurred"
-        mock_subprocess.return_value = mock_proc
+    @patch("src.services.scorer_pool.get_scorer_pool")
+    def test_run_scorer_failure(self, mock_get_pool):
+        """Test run_scorer when scoring raises"""
+        mock_get_pool.return_value.score.side_effect = RuntimeError("Error occurred")
 
         with pytest.raises(HTTPException) as exc:
             run_scorer("test-model")
         assert exc.value.status_code == 502
+        assert "Error occurred" in exc.value.detail
 
     @patch.dict(os.environ, {"GITHUB_TOKEN": "real_token"})
-    @patch("src.services.rating.subprocess.run")
-    @patch("src.services.rating.Path")
-    def test_run_scorer_timeout(self, mock_path_class, mock_subprocess):
+    @patch("src.services.scorer_pool.get_scorer_pool")
+    def test_run_scorer_timeout(self, mock_get_pool):
         """Test run_scorer with timeout"""
-        import subprocess
-        mock_urls_file = MagicMock()
-        mock_path_class.return_value = mock_urls_file
-        mock_urls_file.__truediv__ = lambda self, other: self
-        mock_urls_file.write_text = MagicMock()
+        from concurrent.futures import TimeoutError as FutureTimeoutError
 
-        mock_subprocess.side_effect = subprocess.TimeoutExpired("cmd", 30)
+        mock_get_pool.return_value.score.side_effect = FutureTimeoutError()
 
         with pytest.raises(HTTPException) as exc:
             run_scorer("test-model")
@@ -273,48 +404,26 @@ class TestRunScorer:
         assert "timed out" in exc.value.detail.lower()
 
     @patch.dict(os.environ, {"GITHUB_TOKEN": "real_token"})
-    @patch("src.services.rating.subprocess.run")
-    @patch("src.services.rating.Path")
-    def test_run_scorer_invalid_json(self, mock_path_class, mock_subprocess):
-        """Test run_scorer with invalid JSON output"""
-        mock_urls_file = MagicMock()
-        mock_path_class.return_value = mock_urls_file
-        mock_urls_file.__truediv__ = lambda self, other: self
-        mock_urls_file.write_text = MagicMock()
-
-        mock_proc = MagicMock()
-        mock_proc.returncode = 0
-        mock_proc.stdout = "not json\n"
-        mock_proc.stderr = ""
-        mock_subprocess.return_value = mock_proc
+    @patch("src.services.scorer_pool.get_scorer_pool")
+    def test_run_scorer_pool_full(self, mock_get_pool):
+        """Test run_scorer when the scorer pool rejects the rating"""
+        from src.services.scorer_pool import ScorerPoolFull
+
+        mock_get_pool.return_value.score.side_effect = ScorerPoolFull("full")
 
         with pytest.raises(HTTPException) as exc:
             run_scorer("test-model")
-        assert exc.value.status_code == 502
+        assert exc.value.status_code == 503
 
     @patch.dict(os.environ, {"GITHUB_TOKEN": "real_token"})
-    @patch("src.services.rating.subprocess.run")
-    @patch("src.services.rating.Path")
-    @patch("sys.platform", "win32")
-    def test_run_scorer_windows_path(self, mock_path_class, mock_subprocess):
-        """Test run_scorer with Windows platform"""
-        mock_urls_file = MagicMock()
-        mock_path_class.return_value = mock_urls_file
-        mock_urls_file.__truediv__ = lambda self, other: self
-        mock_urls_file.write_text = MagicMock()
-
-        mock_proc = MagicMock()
-        mock_proc.returncode = 0
-        mock_proc.stdout = '{"net_score": 0.8}\n'
-        mock_proc.stderr = ""
-        mock_subprocess.return_value = mock_proc
+    @patch("src.services.scorer_pool.get_scorer_pool")
+    def test_run_scorer_no_report(self, mock_get_pool):
+        """Test run_scorer when the target produces no report"""
+        mock_get_pool.return_value.score.return_value = None
 
-        result = run_scorer("test-model")
-        assert result["net_score"] == 0.8
-        # Verify bash command was used on Windows
-        mock_subprocess.assert_called_once()
-        call_args = mock_subprocess.call_args[0][0]
-        assert "bash" in call_args or "run" in call_args
+        with pytest.raises(HTTPException) as exc:
+            run_scorer("https://example.com/not-a-model")
+        assert exc.value.status_code == 502
 
 
 class TestAnalyzeModelContent:
@@ -338,17 +447,17 @@ class TestAnalyzeModelContent:
     @patch("src.services.rating.create_metadata_from_files")
     @patch("src.services.s3_service.extract_config_from_model")
     @patch("src.services.s3_service.download_model")
-    @patch("src.services.s3_service.list_models")
-    def test_analyze_model_content_s3_pattern_search_found(self, mock_list, mock_download_model, 
-                                                           mock_extract_config, mock_create_meta, mock_metrics):
-        """Test S3 model found via pattern search"""
+    @patch("src.services.s3_service.resolve_model_key")
+    def test_analyze_model_content_s3_resolved(self, mock_resolve, mock_download_model,
+                                               mock_extract_config, mock_create_meta, mock_metrics):
+        """Test S3 model found via direct key resolution"""
         # Create minimal ZIP content
         zip_buffer = io.BytesIO()
         with zipfile.ZipFile(zip_buffer, "w") as zip_file:
             zip_file.writestr("config.json", json.dumps({"model_type": "test"}))
         zip_content = zip_buffer.getvalue()
 
-        mock_list.return_value = {"models": [{"name": "test-model", "version": "1.0.0"}]}
+        mock_resolve.return_value = ("test-model", "1.0.0")
         mock_download_model.return_value = zip_content
         mock_extract_config.return_value = {"model_type": "test"}
         mock_create_meta.return_value = {"repo_files": set(["config.json"]), "readme_text": ""}
@@ -356,8 +465,8 @@ class TestAnalyzeModelContent:
 
         result = analyze_model_content("test-model")
         assert result is not None
-        mock_list.assert_called()
-        mock_download_model.assert_called_once()
+        mock_resolve.assert_called_once_with("test-model")
+        mock_download_model.assert_called_once_with("test-model", "1.0.0", "full")
 
     @patch("src.services.rating.run_acme_metrics")
     @patch("src.services.rating.create_metadata_from_files")
@@ -385,15 +494,18 @@ class TestAnalyzeModelContent:
     def test_analyze_model_content_s3_direct_lookup(self, mock_s3, mock_list,
                                                      mock_download_model, mock_extract_config,
                                                      mock_create_meta, mock_metrics):
-        """Test S3 direct key lookup"""
+        """Test S3 direct key lookup without a registry scan"""
         zip_buffer = io.BytesIO()
         with zipfile.ZipFile(zip_buffer, "w") as zip_file:
             zip_file.writestr("config.json", json.dumps({"model_type": "test"}))
         zip_content = zip_buffer.getvalue()
 
-        with patch("src.services.s3_service.ap_arn", "test-bucket"):
-            mock_list.return_value = {"models": []}
-            mock_s3.head_object.return_value = {}  # File exists
+        with patch("src.services.s3_service.ap_arn", "test-bucket"), patch(
+            "src.services.s3_service.aws_available", True
+        ):
+            mock_s3.list_objects_v2.return_value = {
+                "Contents": [{"Key": "models/test_model/1.0.0/model.zip"}]
+            }
             mock_download_model.return_value = zip_content
             mock_extract_config.return_value = {"model_type": "test"}
             mock_create_meta.return_value = {
@@ -404,7 +516,8 @@ class TestAnalyzeModelContent:
 
             result = analyze_model_content("test_model")
             assert result is not None
-            mock_s3.head_object.assert_called()
+            mock_list.assert_not_called()
+            mock_download_model.assert_called_once_with("test_model", "1.0.0", "full")
 
     @patch("src.services.rating.run_acme_metrics")
     @patch("src.services.rating.create_metadata_from_files")
@@ -0,0 +1,86 @@
+"""
+Unit tests for src/services/rating_cache.py
+"""
+import io
+import json
+from unittest.mock import patch
+
+import pytest
+from botocore.exceptions import ClientError
+
+from src.services import rating_cache
+
+
+class FakeS3:
+    def __init__(self):
+        self.objects = {}
+
+    def get_object(self, Bucket, Key):
+        if Key not in self.objects:
+            raise ClientError({"Error": {"Code": "NoSuchKey"}}, "GetObject")
+        return {"Body": io.BytesIO(self.objects[Key])}
+
+    def put_object(self, Bucket, Key, Body, **kwargs):
+        self.objects[Key] = Body
+
+
+@pytest.fixture
+def fake_s3():
+    s3 = FakeS3()
+    with patch("src.services.s3_service.s3", s3), patch(
+        "src.services.s3_service.ap_arn", "bucket"
+    ), patch("src.services.s3_service.aws_available", True), patch.object(
+        rating_cache, "_scorer_version", "v1"
+    ):
+        yield s3
+
+
+RATING = {"net_score": 0.75, "license": 1.0, "metric_timeouts": []}
+
+
+class TestRatingCacheKey:
+    def test_key_layout(self, fake_s3):
+        key = rating_cache.rating_cache_key("org/model", "abc")
+        assert key == "ratings/v1/org_model/abc.json"
+
+    def test_scorer_version_is_stable(self):
+        with patch.object(rating_cache, "_scorer_version", None):
+            first = rating_cache.get_scorer_version()
+        with patch.object(rating_cache, "_scorer_version", None):
+            assert rating_cache.get_scorer_version() == first
+        assert len(first) == 12
+
+
+class TestRatingCache:
+    def test_round_trip(self, fake_s3):
+        assert rating_cache.get_cached_rating("org/model", "abc") is None
+        assert rating_cache.put_cached_rating("org/model", "abc", RATING) is True
+        assert rating_cache.get_cached_rating("org/model", "abc") == RATING
+
+    def test_new_content_misses(self, fake_s3):
+        rating_cache.put_cached_rating("org/model", "abc", RATING)
+        assert rating_cache.get_cached_rating("org/model", "def") is None
+
+    def test_new_scorer_version_misses(self, fake_s3):
+        rating_cache.put_cached_rating("org/model", "abc", RATING)
+        with patch.object(rating_cache, "_scorer_version", "v2"):
+            assert rating_cache.get_cached_rating("org/model", "abc") is None
+
+    def test_expired_entry_misses(self, fake_s3):
+        rating_cache.put_cached_rating("org/model", "abc", RATING)
+        key = rating_cache.rating_cache_key("org/model", "abc")
+        entry = json.loads(fake_s3.objects[key])
+        entry["cached_at"] -= rating_cache.RATING_CACHE_TTL_SECONDS + 1
+        fake_s3.objects[key] = json.dumps(entry).encode()
+        assert rating_cache.get_cached_rating("org/model", "abc") is None
+
+    def test_rating_with_timed_out_metric_not_stored(self, fake_s3):
+        rating = dict(RATING, metric_timeouts=["bus_factor"])
+        assert rating_cache.put_cached_rating("org/model", "abc", rating) is False
+        assert fake_s3.objects == {}
+
+    def test_s3_failure_is_a_miss(self, fake_s3):
+        with patch.object(fake_s3, "get_object", side_effect=ClientError(
+            {"Error": {"Code": "AccessDenied"}}, "GetObject"
+        )):
+            assert rating_cache.get_cached_rating("org/model", "abc") is None
@@ -0,0 +1,164 @@
+"""
+Unit tests for src/services/rating_queue.py
+"""
+import threading
+
+import pytest
+
+from src.services.rating_queue import (
+    PRIORITY_INTERACTIVE,
+    QueueFull,
+    RatingScheduler,
+)
+
+
+class RecordingHandler:
+    """Handler that records job order; the first job blocks until released"""
+
+    def __init__(self, expected):
+        self.order = []
+        self.release = threading.Event()
+        self.started = threading.Event()
+        self.done = threading.Event()
+        self.expected = expected
+
+    def __call__(self, job_id, *args):
+        self.started.set()
+        self.release.wait(5)
+        self.order.append((job_id, args))
+        if len(self.order) == self.expected:
+            self.done.set()
+
+
+def _blocked_scheduler(expected, max_queue=10):
+    handler = RecordingHandler(expected)
+    scheduler = RatingScheduler(handler, workers=1, max_queue=max_queue)
+    scheduler.submit("blocker")
+    assert handler.started.wait(5)
+    return scheduler, handler
+
+
+class TestRatingScheduler:
+    def test_runs_jobs_with_args(self):
+        handler = RecordingHandler(1)
+        handler.release.set()
+        scheduler = RatingScheduler(handler, workers=2)
+        assert scheduler.submit("a", "model", "main") is True
+        assert handler.done.wait(5)
+        assert handler.order == [("a", ("model", "main"))]
+
+    def test_interactive_jobs_run_first(self):
+        scheduler, handler = _blocked_scheduler(expected=4)
+        scheduler.submit("bg-1")
+        scheduler.submit("bg-2")
+        scheduler.submit("ui", priority=PRIORITY_INTERACTIVE)
+        handler.release.set()
+        assert handler.done.wait(5)
+        assert [job_id for job_id, _ in handler.order] == ["blocker", "ui", "bg-1", "bg-2"]
+
+    def test_duplicate_submit_is_promoted_not_requeued(self):
+        scheduler, handler = _blocked_scheduler(expected=3)
+        scheduler.submit("bg-1")
+        scheduler.submit("bg-2")
+        assert scheduler.submit("bg-2", priority=PRIORITY_INTERACTIVE) is False
+        assert scheduler.submit("blocker") is False  # Already running
+        handler.release.set()
+        assert handler.done.wait(5)
+        assert [job_id for job_id, _ in handler.order] == ["blocker", "bg-2", "bg-1"]
+        stats = scheduler.stats()
+        assert stats["deduplicated_total"] == 2
+        assert stats["promoted_total"] == 1
+
+    def test_cancelled_job_does_not_run(self):
+        scheduler, handler = _blocked_scheduler(expected=2)
+        scheduler.submit("cancel-me")
+        scheduler.submit("keep")
+        assert scheduler.cancel("cancel-me") is True
+        assert scheduler.cancel("cancel-me") is False
+        handler.release.set()
+        assert handler.done.wait(5)
+        assert [job_id for job_id, _ in handler.order] == ["blocker", "keep"]
+
+    def test_detached_job_hands_over_its_callbacks(self):
+        scheduler, handler = _blocked_scheduler(expected=2)
+        done = []
+        scheduler.submit("take-over", on_done=done.append)
+        scheduler.submit("keep")
+        callbacks = scheduler.detach("take-over")
+        assert done == []
+        assert callbacks == [done.append]
+        assert scheduler.detach("take-over") is None
+        assert scheduler.detach("blocker") is None  # Running jobs keep their callbacks
+        handler.release.set()
+        assert handler.done.wait(5)
+        assert [job_id for job_id, _ in handler.order] == ["blocker", "keep"]
+        assert done == []
+
+    def test_full_queue_rejects(self):
+        scheduler, handler = _blocked_scheduler(expected=2, max_queue=1)
+        scheduler.submit("queued")
+        assert scheduler.is_saturated()
+        with pytest.raises(QueueFull):
+            scheduler.submit("overflow")
+        stats = scheduler.stats()
+        assert stats["queue_depth"] == 1
+        assert stats["queued_by_priority"] == {"background": 1}
+        assert stats["rejected_total"] == 1
+        handler.release.set()
+
+    def test_failed_job_is_counted(self):
+        done = threading.Event()
+
+        def handler(job_id):
+            done.set()
+            raise RuntimeError("boom")
+
+        scheduler = RatingScheduler(handler, workers=1)
+        scheduler.submit("a")
+        assert done.wait(5)
+        for _ in range(100):
+            if scheduler.stats()["failed_total"]:
+                break
+            threading.Event().wait(0.01)
+        stats = scheduler.stats()
+        assert stats["failed_total"] == 1
+        assert stats["wait_ms"]["count"] == 1
+
+    def test_on_done_callbacks(self):
+        scheduler, handler = _blocked_scheduler(expected=2)
+        done = []
+        scheduler.submit("a", on_done=done.append)
+        scheduler.submit("a", on_done=lambda job_id: done.append(job_id.upper()))
+        scheduler.submit("blocker", on_done=done.append)  # Attached to the running job
+        scheduler.submit("cancel-me", on_done=done.append)
+        scheduler.cancel("cancel-me")
+        assert done == ["cancel-me"]
+        handler.release.set()
+        assert handler.done.wait(5)
+        for _ in range(100):
+            if len(done) == 4:
+                break
+            threading.Event().wait(0.01)
+        assert done == ["cancel-me", "blocker", "a", "A"]
+
+    def test_resubmit_while_finishing_keeps_its_callback(self):
+        """A job resubmitted as the previous run finishes gets its own on_done"""
+        runs = []
+        first, second = [], []
+        finished = threading.Event()
+
+        class ResubmittingScheduler(RatingScheduler):
+            def _notify_done(self, job_id, callbacks):
+                if len(runs) == 1:
+                    # Lands after the first run ended, before its callbacks fire
+                    self.submit("a", on_done=second.append)
+                super()._notify_done(job_id, callbacks)
+                if len(runs) == 2:
+                    finished.set()
+
+        scheduler = ResubmittingScheduler(lambda job_id: runs.append(job_id), workers=1)
+        scheduler.submit("a", on_done=first.append)
+        assert finished.wait(5)
+        assert runs == ["a", "a"]
+        assert first == ["a"]
+        assert second == ["a"]
@@ -0,0 +1,83 @@
+"""
+Unit tests for src/services/rds_pool.py
+"""
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.services.rds_pool import (
+    Histogram,
+    InstrumentedConnectionPool,
+    PoolTimeout,
+    StatementStats,
+)
+
+
+@pytest.fixture
+def instrumented_pool():
+    with patch("src.services.rds_pool.pool.ThreadedConnectionPool") as threaded_pool:
+        threaded_pool.return_value.getconn.side_effect = lambda key=None: MagicMock()
+        yield InstrumentedConnectionPool(minconn=1, maxconn=2, acquire_timeout=0.05, host="db")
+
+
+class TestHistogram:
+    def test_buckets_and_percentiles(self):
+        histogram = Histogram((1, 10, 100))
+        for value in (0.5, 5, 5, 50, 500):
+            histogram.observe(value)
+        snapshot = histogram.snapshot()
+        assert snapshot["count"] == 5
+        assert snapshot["buckets"] == {"<=1": 1, "<=10": 2, "<=100": 1, ">100": 1}
+        assert snapshot["p50"] == 10
+        assert snapshot["p99"] == 500
+
+    def test_empty_snapshot(self):
+        snapshot = Histogram((1,)).snapshot()
+        assert snapshot["count"] == 0
+        assert "p50" not in snapshot
+
+
+class TestStatementLabel:
+    @pytest.mark.parametrize(
+        "sql,label",
+        [
+            ("SELECT 1 FROM model_blobs WHERE content_hash = %s", "SELECT model_blobs"),
+            ("\n  INSERT INTO model_chunks (model_key) VALUES (%s)", "INSERT model_chunks"),
+            ("UPDATE artifact_metadata SET name = %s", "UPDATE artifact_metadata"),
+            ("CREATE TABLE IF NOT EXISTS model_files (", "CREATE model_files"),
+            ("CREATE INDEX IF NOT EXISTS idx ON t(a)", "CREATE"),
+            ("", "OTHER"),
+        ],
+    )
+    def test_label(self, sql, label):
+        assert StatementStats.label(sql) == label
+
+
+class TestInstrumentedConnectionPool:
+    def test_acquire_and_release_track_usage(self, instrumented_pool):
+        conn = instrumented_pool.getconn()
+        assert instrumented_pool.stats()["in_use"] == 1
+        instrumented_pool.putconn(conn)
+        stats = instrumented_pool.stats()
+        assert stats["in_use"] == 0
+        assert stats["acquired_total"] == 1
+        assert stats["wait_ms"]["count"] == 1
+
+    def test_exhausted_pool_times_out(self, instrumented_pool):
+        instrumented_pool.getconn()
+        instrumented_pool.getconn()
+        with pytest.raises(PoolTimeout):
+            instrumented_pool.getconn()
+        stats = instrumented_pool.stats()
+        assert stats["timeouts_total"] == 1
+        assert stats["peak_in_use"] == 2
+
+    def test_waiter_gets_released_connection(self, instrumented_pool):
+        first = instrumented_pool.getconn()
+        instrumented_pool.getconn()
+        timer = threading.Timer(0.01, instrumented_pool.putconn, args=(first,))
+        timer.start()
+        assert instrumented_pool.getconn(timeout=1) is not None
+        timer.join()
+        assert instrumented_pool.stats()["timeouts_total"] == 0
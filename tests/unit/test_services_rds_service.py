@@ -0,0 +1,106 @@
+"""
+Unit tests for chunked storage in src/services/rds_service.py
+"""
+from unittest.mock import MagicMock, patch
+
+from src.services import rds_service
+
+
+class FakeChunkCursor:
+    """Cursor that answers the model_chunks range query from a dict"""
+
+    def __init__(self, chunks):
+        self.chunks = chunks
+        self.rows = []
+        self.closed = False
+
+    def execute(self, sql, params):
+        model_key, first_seq, last_seq = params
+        self.rows = [
+            (seq, data)
+            for seq, data in sorted(self.chunks.items())
+            if first_seq <= seq <= last_seq
+        ]
+
+    def __iter__(self):
+        return iter(self.rows)
+
+    def close(self):
+        self.closed = True
+
+
+def _chunked_location(content, chunk_size):
+    chunks = {
+        i: content[offset:offset + chunk_size]
+        for i, offset in enumerate(range(0, len(content), chunk_size))
+    }
+    conn = MagicMock()
+    cursor = FakeChunkCursor(chunks)
+    conn.cursor.return_value = cursor
+    return conn, cursor, (len(content), "a" * 64, chunk_size, None)
+
+
+class TestIterChunks:
+    def test_full_read_reassembles_content(self):
+        content = bytes(range(256)) * 10
+        conn, cursor, location = _chunked_location(content, 100)
+        assert b"".join(rds_service._iter_chunks(conn, location)) == content
+        assert cursor.closed
+
+    def test_range_read_spans_chunks(self):
+        content = bytes(range(256)) * 10
+        conn, cursor, location = _chunked_location(content, 100)
+        result = b"".join(rds_service._iter_chunks(conn, location, 150, 420))
+        assert result == content[150:421]
+        assert [seq for seq, _ in cursor.rows] == [1, 2, 3, 4]
+
+    def test_open_ended_range(self):
+        content = b"x" * 250
+        conn, _, location = _chunked_location(content, 100)
+        assert b"".join(rds_service._iter_chunks(conn, location, 240)) == b"x" * 10
+
+    def test_legacy_inline_data(self):
+        location = (5, None, None, memoryview(b"hello"))
+        assert b"".join(rds_service._iter_chunks(MagicMock(), location, 1, 3)) == b"ell"
+
+
+class TestStoreFile:
+    def test_new_blob_written_in_chunks(self):
+        cursor = MagicMock()
+        cursor.fetchone.return_value = None
+        with patch.object(rds_service, "CHUNK_SIZE", 4):
+            result = rds_service._store_file(cursor, b"0123456789", "m", "1.0.0", "full", "models")
+
+        chunk_inserts = [
+            c.args[1] for c in cursor.execute.call_args_list if "model_chunks" in c.args[0]
+        ]
+        assert [(seq, bytes(data.adapted)) for _, seq, data in chunk_inserts] == [
+            (0, b"0123"),
+            (1, b"4567"),
+            (2, b"89"),
+        ]
+        assert result["deduplicated"] is False
+
+    def test_existing_blob_skips_chunks(self):
+        cursor = MagicMock()
+        cursor.fetchone.return_value = (1,)
+        result = rds_service._store_file(cursor, b"data", "m", "1.0.0", "full", "models")
+        assert not any("model_chunks" in c.args[0] for c in cursor.execute.call_args_list)
+        assert result["deduplicated"] is True
+
+
+class TestPooledStream:
+    def test_connection_returned_when_exhausted(self):
+        pool = MagicMock()
+        conn = MagicMock()
+        stream = rds_service._PooledStream(pool, conn, (c for c in [b"a", b"b"]))
+        assert list(stream) == [b"a", b"b"]
+        pool.putconn.assert_called_once_with(conn)
+
+    def test_connection_returned_on_close_without_iteration(self):
+        pool = MagicMock()
+        conn = MagicMock()
+        stream = rds_service._PooledStream(pool, conn, (c for c in [b"a"]))
+        stream.close()
+        stream.close()
+        pool.putconn.assert_called_once_with(conn)
@@ -311,9 +311,11 @@ class TestS3ServiceWithMocks:
         file_content = b"test zip content"
         mock_s3.put_object.return_value = {}
 
-        result = upload_model(file_content, "test-model", "1.0.0")
+        with patch("src.services.storage_service.invalidate_cached_model") as mock_invalidate:
+            result = upload_model(file_content, "test-model", "1.0.0")
         assert result["message"] == "Upload successful"
         mock_s3.put_object.assert_called_once()
+        mock_invalidate.assert_called_once_with("test-model", "1.0.0", False)
 
     @patch("src.services.s3_service.aws_available", False)
     def test_upload_model_aws_unavailable(self):
@@ -495,6 +497,27 @@ class TestS3ServiceWithMocks:
             reset_registry()
         assert exc.value.status_code == 503
 
+    @patch("src.services.s3_service.aws_available", True)
+    @patch("src.services.s3_service.ap_arn", "test-bucket")
+    def test_reset_registry_reclaims_blobs(self):
+        """Test reset_registry deletes blobs unless a performance/ pointer still uses them"""
+        from src.services.blob_store import blob_key, derived_key, read_derived, store_content_addressed
+        from tests.unit.test_services_blob_store import FakeS3
+
+        fake_s3 = FakeS3()
+        gone = store_content_addressed(fake_s3, "test-bucket", "models/a/1.0.0/model.zip", b"a")
+        read_derived(fake_s3, "test-bucket", "models/a/1.0.0/model.zip", "weights.zip", lambda d: d)
+        kept = store_content_addressed(fake_s3, "test-bucket", "models/b/1.0.0/model.zip", b"b")
+        store_content_addressed(fake_s3, "test-bucket", "performance/b/main/model.zip", b"b")
+
+        with patch("src.services.s3_service.s3", fake_s3):
+            reset_registry()
+
+        assert blob_key(gone["sha256"]) not in fake_s3.objects
+        assert derived_key(gone["sha256"], "weights.zip") not in fake_s3.objects
+        assert blob_key(kept["sha256"]) in fake_s3.objects
+        assert not any(key.startswith("models/") for key in fake_s3.objects)
+
     @patch("src.services.s3_service.aws_available", True)
     @patch("src.services.s3_service.s3")
     @patch("src.services.s3_service.ap_arn", "test-bucket")
@@ -812,7 +835,7 @@ class TestDownloadFile:
 
     def test_download_file_success(self):
         """Test successful file download"""
-        with patch("src.services.s3_service.requests.get") as mock_get:
+        with patch("src.services.s3_service.http_client.get") as mock_get:
             mock_response = MagicMock()
             mock_response.status_code = 200
             mock_response.content = b"test content"
@@ -824,7 +847,7 @@ class TestDownloadFile:
 
     def test_download_file_non_200_status(self):
         """Test download_file with non-200 status code"""
-        with patch("src.services.s3_service.requests.get") as mock_get:
+        with patch("src.services.s3_service.http_client.get") as mock_get:
             mock_response = MagicMock()
             mock_response.status_code = 404
             mock_get.return_value = mock_response
@@ -834,7 +857,7 @@ class TestDownloadFile:
 
     def test_download_file_timeout(self):
         """Test download_file with timeout"""
-        with patch("src.services.s3_service.requests.get") as mock_get:
+        with patch("src.services.s3_service.http_client.get") as mock_get:
             import requests
             mock_get.side_effect = requests.exceptions.Timeout()
             
@@ -843,7 +866,7 @@ class TestDownloadFile:
 
     def test_download_file_connection_error(self):
         """Test download_file with connection error"""
-        with patch("src.services.s3_service.requests.get") as mock_get:
+        with patch("src.services.s3_service.http_client.get") as mock_get:
             import requests
             mock_get.side_effect = requests.exceptions.ConnectionError()
             
@@ -852,7 +875,7 @@ class TestDownloadFile:
 
     def test_download_file_custom_timeout(self):
         """Test download_file with custom timeout"""
-        with patch("src.services.s3_service.requests.get") as mock_get:
+        with patch("src.services.s3_service.http_client.get") as mock_get:
             mock_response = MagicMock()
             mock_response.status_code = 200
             mock_response.content = b"content"
@@ -867,7 +890,7 @@ class TestDownloadFromHuggingface:
 
     def test_download_from_huggingface_success(self):
         """Test successful download from HuggingFace"""
-        with patch("src.services.s3_service.requests.get") as mock_get:
+        with patch("src.services.s3_service.http_client.get") as mock_get:
             # Mock API response
             api_response = MagicMock()
             api_response.status_code = 200
@@ -900,7 +923,7 @@ class TestDownloadFromHuggingface:
 
     def test_download_from_huggingface_timeout(self):
         """Test download_from_huggingface with timeout"""
-        with patch("src.services.s3_service.requests.get") as mock_get:
+        with patch("src.services.s3_service.http_client.get") as mock_get:
             import requests
             mock_get.side_effect = requests.exceptions.Timeout()
             
@@ -910,7 +933,7 @@ class TestDownloadFromHuggingface:
 
     def test_download_from_huggingface_connection_error(self):
         """Test download_from_huggingface with connection error"""
-        with patch("src.services.s3_service.requests.get") as mock_get:
+        with patch("src.services.s3_service.http_client.get") as mock_get:
             import requests
             mock_get.side_effect = requests.exceptions.RequestException("Connection failed")
             
@@ -920,7 +943,7 @@ class TestDownloadFromHuggingface:
 
     def test_download_from_huggingface_model_not_found(self):
         """Test download_from_huggingface with model not found"""
-        with patch("src.services.s3_service.requests.get") as mock_get:
+        with patch("src.services.s3_service.http_client.get") as mock_get:
             mock_response = MagicMock()
             mock_response.status_code = 404
             mock_get.return_value = mock_response
@@ -931,7 +954,7 @@ class TestDownloadFromHuggingface:
 
     def test_download_from_huggingface_invalid_json(self):
         """Test download_from_huggingface with invalid JSON response"""
-        with patch("src.services.s3_service.requests.get") as mock_get:
+        with patch("src.services.s3_service.http_client.get") as mock_get:
             mock_response = MagicMock()
             mock_response.status_code = 200
             mock_response.json.side_effect = ValueError("Invalid JSON")
@@ -943,7 +966,7 @@ class TestDownloadFromHuggingface:
 
     def test_download_from_huggingface_with_url(self):
         """Test download_from_huggingface with full URL"""
-        with patch("src.services.s3_service.requests.get") as mock_get:
+        with patch("src.services.s3_service.http_client.get") as mock_get:
             mock_response = MagicMock()
             mock_response.status_code = 200
             mock_response.json.return_value = {"siblings": []}
@@ -985,7 +1008,7 @@ class TestSendRequest:
 
     def test_send_request_success(self):
         """Test successful request sending"""
-        with patch("src.services.s3_service.urllib.request.urlopen") as mock_urlopen:
+        with patch("src.services.s3_service.http_client.urlopen") as mock_urlopen:
             mock_response = MagicMock()
             mock_response.read.return_value = b'{"result": "success"}'
             mock_urlopen.return_value.__enter__.return_value = mock_response
@@ -995,7 +1018,7 @@ class TestSendRequest:
 
     def test_send_request_http_error(self):
         """Test send_request with HTTP error"""
-        with patch("src.services.s3_service.urllib.request.urlopen") as mock_urlopen:
+        with patch("src.services.s3_service.http_client.urlopen") as mock_urlopen:
             import urllib.error
             mock_error = urllib.error.HTTPError("https://example.com", 500, "Internal Error", None, None)
             mock_error.read.return_value = b'{"error": "server error"}'
@@ -1314,10 +1337,63 @@ class TestUploadModelCodePaths:
                     call_args = mock_s3.put_object.call_args
                     assert "test_model" in call_args[1]["Key"]
 
+    def test_upload_model_writes_blob_and_pointer(self):
+        """Test upload_model stores a new blob and points the model key at it"""
+        with patch("src.services.s3_service.aws_available", True):
+            with patch("src.services.s3_service.s3") as mock_s3:
+                with patch("src.services.s3_service.ap_arn", "test-bucket"):
+                    mock_s3.head_object.side_effect = ClientError(
+                        {"Error": {"Code": "404"}}, "HeadObject"
+                    )
+
+                    result = upload_model(
+                        b"content", "test-model", "main", use_performance_path=True
+                    )
+
+                    keys = [c[1]["Key"] for c in mock_s3.put_object.call_args_list]
+                    assert keys[0].startswith("blobs/sha256/")
+                    assert keys[1] == "performance/test-model/main/model.zip"
+                    assert result["deduplicated"] is False
+
+    def test_upload_model_skips_existing_blob(self):
+        """Test upload_model only writes the pointer when the blob exists"""
+        with patch("src.services.s3_service.aws_available", True):
+            with patch("src.services.s3_service.s3") as mock_s3:
+                with patch("src.services.s3_service.ap_arn", "test-bucket"):
+                    mock_s3.head_object.return_value = {"ContentLength": 7}
+
+                    result = upload_model(b"content", "test-model", "1.0.0")
+
+                    mock_s3.put_object.assert_called_once()
+                    assert (
+                        mock_s3.put_object.call_args[1]["Key"]
+                        == "models/test-model/1.0.0/model.zip"
+                    )
+                    assert result["deduplicated"] is True
+
 
 class TestDownloadModelCodePaths:
     """Additional tests for download_model code paths"""
 
+    def test_download_model_follows_pointer(self):
+        """Test download_model resolves a pointer record to its blob"""
+        from src.services.blob_store import POINTER_CONTENT_TYPE
+
+        pointer = json.dumps({"blob_key": "blobs/sha256/ab/abc", "size": 4}).encode()
+        responses = {
+            "models/test-model/1.0.0/model.zip": {
+                "Body": io.BytesIO(pointer),
+                "ContentType": POINTER_CONTENT_TYPE,
+            },
+            "blobs/sha256/ab/abc": {"Body": io.BytesIO(b"blob")},
+        }
+        with patch("src.services.s3_service.aws_available", True):
+            with patch("src.services.s3_service.s3") as mock_s3:
+                with patch("src.services.s3_service.ap_arn", "test-bucket"):
+                    mock_s3.get_object.side_effect = lambda Bucket, Key: responses[Key]
+
+                    assert download_model("test-model", "1.0.0") == b"blob"
+
     def test_download_model_component_extraction_error(self):
         """Test download_model with component extraction error"""
         with patch("src.services.s3_service.aws_available", True):
@@ -1513,3 +1589,47 @@ class TestListModelsCodePaths:
                         # or validation may not occur when Contents is empty
                             pass  # UNSKIPPED: pytest.skip(f"Function handles invalid regex differently: {type(e).__name__}: {e}")
 
+
+
+class TestResolveModelKey:
+    """Tests for resolve_model_key direct key resolution"""
+
+    @staticmethod
+    def _listing(keys_by_prefix):
+        def list_objects_v2(Bucket, Prefix, **kwargs):
+            return {"Contents": [{"Key": key} for key in keys_by_prefix.get(Prefix, [])]}
+        return list_objects_v2
+
+    def _resolve(self, keys_by_prefix, target, version=None):
+        from src.services.s3_service import resolve_model_key
+
+        with patch("src.services.s3_service.aws_available", True), patch(
+            "src.services.s3_service.ap_arn", "test-bucket"
+        ), patch("src.services.s3_service.s3") as mock_s3:
+            mock_s3.list_objects_v2.side_effect = self._listing(keys_by_prefix)
+            return resolve_model_key(target, version), mock_s3
+
+    def test_hf_url_resolves_to_sanitized_key(self):
+        result, mock_s3 = self._resolve(
+            {"models/org_model/": ["models/org_model/main/model.zip", "models/org_model/main/metadata.json"]},
+            "https://huggingface.co/org/model",
+        )
+        assert result == ("org_model", "main")
+        assert mock_s3.list_objects_v2.call_count == 1
+
+    def test_version_preference(self):
+        keys = {"models/m/": ["models/m/2.0.0/model.zip", "models/m/main/model.zip", "models/m/10.1.0/model.zip"]}
+        assert self._resolve(keys, "m")[0] == ("m", "main")
+        assert self._resolve(keys, "m", "2.0.0")[0] == ("m", "2.0.0")
+        del keys["models/m/"][1]
+        assert self._resolve(keys, "m")[0] == ("m", "10.1.0")
+
+    def test_missing_model_returns_none(self):
+        result, _ = self._resolve({}, "unknown-model")
+        assert result is None
+
+    def test_unavailable_aws_returns_none(self):
+        from src.services.s3_service import resolve_model_key
+
+        with patch("src.services.s3_service.aws_available", False):
+            assert resolve_model_key("m") is None
@@ -0,0 +1,140 @@
+"""
+Unit tests for the in-process scorer pool
+"""
+import threading
+import time
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.acmecli.cache import InMemoryCache
+from src.services import scorer_pool
+from src.services.scorer_pool import ScorerPool, ScorerPoolFull
+
+
+@pytest.fixture
+def process_url():
+    with patch("src.acmecli.cli.process_url") as mock_process_url:
+        yield mock_process_url
+
+
+class TestScorerPool:
+    """Test scoring on warm workers"""
+
+    def test_score_returns_row(self, process_url):
+        row = MagicMock(name="row")
+        process_url.return_value = row
+        pool = ScorerPool(workers=2, cache=InMemoryCache())
+        try:
+            assert pool.score("https://huggingface.co/org/model") is row
+            stats = pool.stats()
+            assert stats["scored_total"] == 1
+            assert stats["score_ms"]["count"] == 1
+        finally:
+            pool.shutdown()
+
+    def test_handlers_and_cache_are_shared(self, process_url):
+        cache = InMemoryCache()
+        pool = ScorerPool(workers=2, cache=cache)
+        try:
+            pool.score("https://huggingface.co/org/a")
+            pool.score("https://github.com/org/b")
+        finally:
+            pool.shutdown()
+        first, second = (call.args for call in process_url.call_args_list)
+        assert first[1] is second[1]  # GitHubHandler
+        assert first[2] is second[2]  # HFHandler
+        assert first[3] is second[3] is cache
+
+    def test_no_report_and_errors_are_counted(self, process_url):
+        pool = ScorerPool(workers=1, cache=InMemoryCache())
+        try:
+            process_url.return_value = None
+            assert pool.score("https://example.com/x") is None
+            process_url.side_effect = RuntimeError("boom")
+            with pytest.raises(RuntimeError):
+                pool.score("https://huggingface.co/org/model")
+            stats = pool.stats()
+            assert stats["no_report_total"] == 1
+            assert stats["errors_total"] == 1
+        finally:
+            pool.shutdown()
+
+    def test_timeout(self, process_url):
+        release = threading.Event()
+        process_url.side_effect = lambda *args: release.wait(5)
+        pool = ScorerPool(workers=1, cache=InMemoryCache())
+        try:
+            with pytest.raises(FutureTimeoutError):
+                pool.score("https://huggingface.co/org/slow", timeout=0.05)
+        finally:
+            release.set()
+            pool.shutdown()
+
+    def test_timed_out_rating_is_cancelled_if_waiting(self, process_url):
+        release = threading.Event()
+        process_url.side_effect = lambda *args: release.wait(5)
+        pool = ScorerPool(workers=1, max_queue=1, cache=InMemoryCache())
+        try:
+            running = pool.submit("https://huggingface.co/org/slow")
+            with pytest.raises(FutureTimeoutError):
+                pool.score("https://huggingface.co/org/waiting", timeout=0.05)
+            stats = pool.stats()
+            assert stats["timeouts_total"] == 1
+            assert stats["pending"] == 1  # Only the running rating is left
+        finally:
+            release.set()
+            pool.shutdown()
+        assert running.result() is True
+        assert process_url.call_count == 1
+
+    def test_full_queue_rejects(self, process_url):
+        release = threading.Event()
+        process_url.side_effect = lambda *args: release.wait(5)
+        pool = ScorerPool(workers=1, max_queue=1, cache=InMemoryCache())
+        try:
+            pool.submit("https://huggingface.co/org/a")
+            pool.submit("https://huggingface.co/org/b")
+            with pytest.raises(ScorerPoolFull):
+                pool.submit("https://huggingface.co/org/c")
+            assert pool.stats()["rejected_total"] == 1
+        finally:
+            release.set()
+            pool.shutdown()
+        assert pool.stats()["pending"] == 0
+
+    def test_default_cache_is_bounded(self, process_url, monkeypatch):
+        monkeypatch.setenv("ACME_HTTP_CACHE", "off")
+        pool = ScorerPool(workers=1)
+        try:
+            assert pool._cache.max_entries == scorer_pool.SCORER_CACHE_MAX_ENTRIES
+        finally:
+            pool.shutdown()
+
+    def test_concurrent_scores_run_in_parallel(self, process_url):
+        process_url.side_effect = lambda *args: time.sleep(0.2)
+        pool = ScorerPool(workers=4, cache=InMemoryCache())
+        try:
+            started = time.perf_counter()
+            futures = [pool.submit(f"https://huggingface.co/org/m{i}") for i in range(4)]
+            for future in futures:
+                future.result(timeout=5)
+            assert time.perf_counter() - started < 0.6
+        finally:
+            pool.shutdown()
+
+
+class TestGetScorerPool:
+    """Test the process-wide pool"""
+
+    def test_created_once_and_shut_down(self, monkeypatch):
+        monkeypatch.setattr(scorer_pool, "_pool", None)
+        with patch("src.services.scorer_pool.ScorerPool") as mock_pool_class:
+            assert scorer_pool.get_scorer_pool_stats() is None
+            pool = scorer_pool.get_scorer_pool()
+            assert scorer_pool.get_scorer_pool() is pool
+            mock_pool_class.assert_called_once_with()
+            scorer_pool.shutdown_scorer_pool()
+        pool.shutdown.assert_called_once_with(wait=False)
+        assert scorer_pool._pool is None
@@ -0,0 +1,139 @@
+"""
+Unit tests for the tiered backend in src/services/storage_service.py
+"""
+import os
+import time
+from unittest.mock import MagicMock, patch
+
+from src.services import storage_service
+from src.services.storage_service import DiskTier, MemoryTier, TieredStorageBackend
+
+
+def _tiered(tmp_path, origin_content=b"zip-bytes", **memory_kwargs):
+    origin = MagicMock()
+    origin.download_model.return_value = origin_content
+    origin.upload_model.return_value = {"message": "Upload successful"}
+    memory = MemoryTier(**memory_kwargs)
+    disk = DiskTier(directory=str(tmp_path))
+    return TieredStorageBackend(origin, [memory, disk]), origin, memory, disk
+
+
+class TestMemoryTier:
+    def test_large_objects_are_not_cached(self):
+        tier = MemoryTier(max_object_bytes=4)
+        tier.put("k", b"12345")
+        assert tier.get("k") is None
+
+    def test_lru_eviction(self):
+        tier = MemoryTier(max_bytes=8)
+        tier.put("a", b"1234")
+        tier.put("b", b"1234")
+        tier.get("a")
+        tier.put("c", b"1234")
+        assert tier.get("a") == b"1234"
+        assert tier.get("b") is None
+
+    def test_expired_entry_is_dropped(self):
+        tier = MemoryTier(ttl_seconds=0)
+        tier.put("a", b"x")
+        time.sleep(0.01)
+        assert tier.get("a") is None
+
+
+class TestDiskTier:
+    def test_round_trip(self, tmp_path):
+        tier = DiskTier(directory=str(tmp_path))
+        tier.put("models/a/1.0.0/full", b"data")
+        assert tier.get("models/a/1.0.0/full") == b"data"
+
+    def test_eviction_keeps_total_under_limit(self, tmp_path):
+        tier = DiskTier(directory=str(tmp_path), max_bytes=10)
+        tier.put("a", b"123456")
+        tier.put("b", b"123456")
+        total = sum(os.path.getsize(entry.path) for entry in os.scandir(tmp_path))
+        assert total <= 10
+        assert tier.get("b") == b"123456"
+
+
+class TestTieredStorageBackend:
+    def test_origin_read_once_then_served_from_memory(self, tmp_path):
+        backend, origin, memory, disk = _tiered(tmp_path)
+        assert backend.download_model("m", "1.0.0") == b"zip-bytes"
+        assert backend.download_model("m", "1.0.0") == b"zip-bytes"
+        origin.download_model.assert_called_once()
+        assert memory.stats.hits == 1
+        assert disk.stats.hits == 0
+
+    def test_disk_hit_refills_memory(self, tmp_path):
+        backend, origin, memory, disk = _tiered(tmp_path)
+        backend.download_model("m", "1.0.0")
+        memory.clear()
+        backend.download_model("m", "1.0.0")
+        assert disk.stats.hits == 1
+        backend.download_model("m", "1.0.0")
+        assert memory.stats.hits == 1
+        origin.download_model.assert_called_once()
+
+    def test_large_objects_skip_memory(self, tmp_path):
+        backend, origin, memory, disk = _tiered(tmp_path, b"x" * 100, max_object_bytes=10)
+        backend.download_model("m", "1.0.0")
+        backend.download_model("m", "1.0.0")
+        assert memory.stats.hits == 0
+        assert disk.stats.hits == 1
+
+    def test_upload_writes_through_and_drops_components(self, tmp_path):
+        backend, origin, memory, disk = _tiered(tmp_path)
+        backend.download_model("m", "1.0.0", "weights")
+        backend.upload_model(b"new", "m", "1.0.0")
+
+        origin.upload_model.assert_called_once_with(b"new", "m", "1.0.0", False)
+        assert backend.download_model("m", "1.0.0") == b"new"
+        backend.download_model("m", "1.0.0", "weights")
+        assert origin.download_model.call_count == 2
+
+    def test_reupload_of_raw_id_refreshes_sanitized_download(self, tmp_path):
+        backend, origin, _, _ = _tiered(tmp_path, b"v1")
+        backend.upload_model(b"v1", "org/model", "1.0.0")
+        assert backend.download_model("org_model", "1.0.0") == b"v1"
+
+        backend.upload_model(b"v2", "org/model", "1.0.0")
+        assert backend.download_model("org_model", "1.0.0") == b"v2"
+        origin.download_model.assert_not_called()
+
+    def test_paths_are_cached_separately(self, tmp_path):
+        backend, origin, _, _ = _tiered(tmp_path)
+        backend.download_model("m", "main", use_performance_path=True)
+        backend.download_model("m", "main", use_performance_path=False)
+        assert origin.download_model.call_count == 2
+
+    def test_stats_include_origin(self, tmp_path):
+        backend, _, _, _ = _tiered(tmp_path)
+        backend.download_model("m", "1.0.0")
+        stats = {tier["tier"]: tier for tier in backend.stats()}
+        assert stats["origin"]["hits"] == 1
+        assert stats["memory"]["misses"] == 1
+
+
+class TestGetStorageBackend:
+    def test_disk_tier_is_off_by_default(self, monkeypatch):
+        monkeypatch.setattr(storage_service, "_storage_backend", None)
+        with patch.object(storage_service, "S3StorageBackend"):
+            backend = storage_service.get_storage_backend()
+        assert [type(tier) for tier in backend.tiers] == [MemoryTier]
+
+    def test_disk_tier_opt_in(self, monkeypatch, tmp_path):
+        monkeypatch.setattr(storage_service, "_storage_backend", None)
+        monkeypatch.setattr(storage_service, "STORAGE_DISK_CACHE", True)
+        monkeypatch.setattr(storage_service, "DiskTier", lambda: DiskTier(directory=str(tmp_path)))
+        with patch.object(storage_service, "S3StorageBackend"):
+            backend = storage_service.get_storage_backend()
+        assert [type(tier) for tier in backend.tiers] == [MemoryTier, DiskTier]
+
+    def test_invalidate_cached_model(self, monkeypatch, tmp_path):
+        backend, origin, _, _ = _tiered(tmp_path)
+        monkeypatch.setattr(storage_service, "_storage_backend", backend)
+        backend.download_model("m", "1.0.0")
+        storage_service.invalidate_cached_model("m", "1.0.0")
+        backend.download_model("m", "1.0.0")
+        assert origin.download_model.call_count == 2
+